@@ -36,6 +36,15 @@ Single interface to brcdapi. Intended for all applications using brcddb apps
 | results_action        | Updates the brcddb database for an API request response. Typically only called by         |
 |                       | get_rest() and get_batch() so making this public was a future consideration.              |
 +-----------------------+-------------------------------------------------------------------------------------------+
+| set_instrumentation   | Enables or disables recording request statistics in the project object.                   |
++-----------------------+-------------------------------------------------------------------------------------------+
+
+Request instrumentation: Unless disabled with set_instrumentation(), every request made through get_rest() and
+get_batch() is recorded in the project object with ProjectObj.s_add_request_stat(). See
+brcddb.brcddb_project.request_summary() for the definition of the recorded dictionary and for summarizing it. The
+response size is not recorded by default. brcdapi.brcdapi_rest.get_request() only returns the parsed response so the
+size can only be determined by serializing the response again, which is expensive for large port and statistics
+responses. Use set_instrumentation(True, count_bytes=True) to record it.
 
 ToDo in get_batch() - All raw output for CLI goes to the switch object which is fine for now. This will have to be
 modified if CLI commands are used for data that should be associated with an object other than the switch
@@ -63,17 +72,36 @@ modified if CLI commands are used for data that should be associated with an obj
 +-----------+---------------+---------------------------------------------------------------------------------------+
 | 4.0.8     | 20 Feb 2026   | Updated copyright notice.                                                             |
 +-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.9     | 18 Oct 2026   | Added request instrumentation. See set_instrumentation() and                          |
+|           |               | brcddb_project.request_summary()                                                      |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.0     | 18 Oct 2026   | Clear the project FICON lookup tables when port data is added                         |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.1     | 18 Oct 2026   | results_action() records data changes in the project. See brcddb.brcddb_analysis      |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.2     | 18 Oct 2026   | Clear the port classification when port data is added                                 |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.3     | 18 Oct 2026   | Removed the port classification reset. The project data generation handles it         |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.4     | 18 Oct 2026   | Removed clearing the FICON lookup tables. They are keyed on the project data          |
+|           |               | generation                                                                            |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.5     | 18 Oct 2026   | The response size is only counted when enabled with count_bytes in                    |
+|           |               | set_instrumentation()                                                                 |
++-----------+---------------+---------------------------------------------------------------------------------------+
 """
 __author__ = 'Jack Consoli'
 __copyright__ = 'Copyright 2024, 2025, 2026 Jack Consoli'
-__date__ = '20 Feb 2026'
+__date__ = '18 Oct 2026'
 __license__ = 'Apache License, Version 2.0'
 __email__ = 'jack_consoli@yahoo.com'
 __maintainer__ = 'Jack Consoli'
 __status__ = 'Released'
-__version__ = '4.0.8'
+__version__ = '4.1.5'
 
 import http.client
+import json
+import time
 import brcdapi.brcdapi_rest as brcdapi_rest
 import brcdapi.fos_auth as fos_auth
 import brcdapi.util as brcdapi_util
@@ -97,6 +125,8 @@ _default_ip_list = (  # List of keys that are IP addresses. Used to determine if
     'dns-servers',
 )
 _ip_list = _default_ip_list
+_instrumentation = True  # See set_instrumentation()
+_count_bytes = False  # See set_instrumentation()
 _parse_cli_ref = dict(  # Used in get_batch() for CLI commands
     portcfgshow=parse_cli.portcfgshow,
     portbuffershow=parse_cli.portbuffershow,
@@ -148,6 +178,78 @@ def _process_errors(session, uri, obj, wobj, e=None):
     proj_obj.s_add_alert(al.AlertTable.alertTbl, al_num, None, p0, p1)
 
 
+def set_instrumentation(state, count_bytes=False):
+    """Enables or disables recording request statistics in the project object.
+
+    :param state: If True, record the statistics for each request in the project object.
+    :type state: bool
+    :param count_bytes: If True, also record the size of each response. The size is the length of the compact JSON of
+        the response so the response is serialized again.
+    :type count_bytes: bool
+    """
+    global _instrumentation, _count_bytes
+
+    _instrumentation, _count_bytes = bool(state), bool(count_bytes)
+
+
+def _get_request(session, uri, wobj, fid=None):
+    """Performs brcdapi.brcdapi_rest.get_request() and, if enabled, records the request statistics in the project.
+
+    :param session: Session object returned from brcdapi.fos_auth.login()
+    :type session: dict
+    :param uri: URI, less the prefix
+    :type uri: str
+    :param wobj: Working object. Used to find the project object. Statistics are not recorded if None.
+    :type wobj: ProjectObj, FabricObj, SwitchObj, ChassisObj, None
+    :param fid: Fabric ID
+    :type fid: int, None
+    :return obj: Object returned from brcdapi.brcdapi_rest.get_request()
+    :rtype obj: dict
+    :return stat_d: Request statistics. See brcddb.brcddb_project.request_summary(). None if not recorded.
+    :rtype stat_d: dict, None
+    """
+    global _instrumentation, _count_bytes
+
+    start = time.time()
+    obj = brcdapi_rest.get_request(session, uri, fid)
+    end = time.time()
+    if not _instrumentation or wobj is None:
+        return obj, None
+
+    num_bytes = None
+    if _count_bytes:
+        try:
+            num_bytes = len(json.dumps(obj, separators=(',', ':')))
+        except (TypeError, ValueError):
+            pass
+    chassis = session.get('chassis_wwn')
+    stat_d = dict(
+        uri=uri,
+        fid=fid,
+        chassis=brcdapi_util.mask_ip_addr(session.get('ip_addr'), keep_last=True) if chassis is None else chassis,
+        start=start,
+        end=end,
+        bytes=num_bytes,
+        status=fos_auth.obj_status(obj) if fos_auth.is_error(obj) else 200,
+        ingest=0,
+    )
+    wobj.r_project_obj().s_add_request_stat(stat_d)
+    return obj, stat_d
+
+
+def _results_action(session, brcddb_obj, fos_obj, kpi, stat_d):
+    """Calls results_action() and adds the time to add the response to the brcddb database, "ingest", to stat_d
+
+    :param stat_d: Request statistics returned from _get_request()
+    :type stat_d: dict, None
+    All other parameters are as in results_action()
+    """
+    start = time.time()
+    results_action(session, brcddb_obj, fos_obj, kpi)
+    if isinstance(stat_d, dict):
+        stat_d['ingest'] = time.time() - start
+
+
 def get_chassis(session, proj_obj):
     """Gets the  chassis object and objects for all logical switches in the chassis.
 
@@ -167,26 +269,28 @@ def get_chassis(session, proj_obj):
 
     # Go get it
     uri = 'running/' + brcdapi_util.bcc_uri
-    obj = brcdapi_rest.get_request(session, uri, None)
+    obj, stat_d = _get_request(session, uri, proj_obj)
     if fos_auth.is_error(obj):
         return None
     try:
         wwn = obj['chassis']['chassis-wwn']
+        if isinstance(stat_d, dict):
+            stat_d['chassis'] = wwn  # The chassis WWN isn't known until the response is received
         chassis_obj = proj_obj.s_add_chassis(wwn)
-        results_action(session, chassis_obj, obj, uri)
+        _results_action(session, chassis_obj, obj, uri, stat_d)
         session.update(chassis_wwn=wwn)
         # Get all the switches in this chassis
         if chassis_obj.r_is_vf_enabled():  # Get all the logical switches in this chassis
             uri = 'running/' + brcdapi_util.bfls_uri
-            obj = brcdapi_rest.get_request(session, uri, None)
+            obj, stat_d = _get_request(session, uri, chassis_obj)
             _process_errors(session, uri, obj, chassis_obj)
-            results_action(session, chassis_obj, obj, uri)
+            _results_action(session, chassis_obj, obj, uri, stat_d)
         # Get the logical switch configurations
         for fid in chassis_obj.r_fid_list():
             uri = 'running/' + brcdapi_util.bfsw_uri
-            obj = brcdapi_rest.get_request(session, uri, fid)
+            obj, stat_d = _get_request(session, uri, chassis_obj, fid)
             _process_errors(session, uri, obj, chassis_obj)
-            results_action(session, chassis_obj, obj, uri)
+            _results_action(session, chassis_obj, obj, uri, stat_d)
     except BaseException as e:
         _process_errors(session, uri, session, proj_obj, str(type(e)) + ': ' + str(e))
 
@@ -252,6 +356,14 @@ def logout(session):
     return rl
 
 
+def _get_rest(session, uri, wobj=None, fid=None):
+    """Same as get_rest() but also returns the request statistics. See _get_request()"""
+    brcdapi_log.log('GET: ' + uri + brcdapi_util.vfid_to_str(fid), echo=True)
+    obj, stat_d = _get_request(session, uri, wobj, fid)
+    _process_errors(session, uri, obj, wobj)
+    return obj, stat_d
+
+
 def get_rest(session, uri, wobj=None, fid=None):
     """Wraps logging around a call to brcdapi.brcdapi_rest.get_request() and adds responses to the associated object.
 
@@ -266,10 +378,7 @@ def get_rest(session, uri, wobj=None, fid=None):
     :return: obj
     :rtype: dict
     """
-    brcdapi_log.log('GET: ' + uri + brcdapi_util.vfid_to_str(fid), echo=True)
-    obj = brcdapi_rest.get_request(session, uri, fid)
-    _process_errors(session, uri, obj, wobj)
-    return obj
+    return _get_rest(session, uri, wobj, fid)[0]
 
 
 # Below is used in _switch_port_case(), see _port_case_case, to determine what port object (GE port, FC port, media) to
@@ -697,6 +806,7 @@ def results_action(session, brcddb_obj, fos_obj, kpi):
                 _custom_rest_methods[kpi](brcddb_obj, fos_obj, kpi)
             else:
                 _rest_methods[brcdapi_util.uri_d(session, kpi)['area']](brcddb_obj, fos_obj, kpi)
+            brcddb_obj.r_project_obj().s_data_changed(brcddb_obj, kpi)  # See brcddb.brcddb_analysis
         except (TypeError, ValueError, KeyError):
             buf = 'Could not add ' + kpi + ' to ' + str(type(brcddb_obj)) + '. This typically occurs when something '
             buf += 'for the fabric was polled but the fabric WWN is unknown.'
@@ -750,8 +860,8 @@ def get_batch(session, proj_obj, uri_l, fid=None, no_mask=False):
 
     # Get all the chassis data
     for uri in chassis_uri_l:
-        obj = get_rest(session, uri, chassis_obj)
-        results_action(session, chassis_obj, obj, uri)
+        obj, stat_d = _get_rest(session, uri, chassis_obj)
+        _results_action(session, chassis_obj, obj, uri, stat_d)
 
     # Figure out which logical switches to poll switch level data from.
     if chassis_obj.r_is_vf_enabled() and fid is not None:
@@ -768,8 +878,8 @@ def get_batch(session, proj_obj, uri_l, fid=None, no_mask=False):
     # Now process all the switch (FID) level commands.
     for switch_obj in switch_list:
         for uri in switch_uri_l:
-            obj = get_rest(session, uri, switch_obj, brcddb_switch.switch_fid(switch_obj))
-            results_action(session, switch_obj, obj, uri)
+            obj, stat_d = _get_rest(session, uri, switch_obj, brcddb_switch.switch_fid(switch_obj))
+            _results_action(session, switch_obj, obj, uri, stat_d)
 
     # Process any CLI commands. $ToDo - I'm assuming all these commands are switch level, but it could be chassis
     for switch_obj in chassis_obj.r_switch_objects():
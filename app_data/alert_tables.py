@@ -37,15 +37,17 @@ Adding lookup_d was an afterthought.
 +-----------+---------------+---------------------------------------------------------------------------------------+
 | 4.0.6     | 20 Feb 2026   | Updated copyright notice.                                                             |
 +-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.7     | 18 Oct 2026   | Compile alert messages when imported                                                  |
++-----------+---------------+---------------------------------------------------------------------------------------+
 """
 __author__ = 'Jack Consoli'
 __copyright__ = 'Copyright 2023, 2024, 2025, 2026 Jack Consoli'
-__date__ = '20 Feb 2026'
+__date__ = '18 Oct 2026'
 __license__ = 'Apache License, Version 2.0'
 __email__ = 'jack_consoli@yahoo.com'
 __maintainer__ = 'Jack Consoli'
 __status__ = 'Released'
-__version__ = '4.0.6'
+__version__ = '4.0.7'
 
 import brcddb.classes.alert as al
 
@@ -425,6 +427,8 @@ class AlertTable:
     maps_alerts = (ALERT_NUM.MAPS_DASH_INFO, ALERT_NUM.MAPS_DASH_WARN, ALERT_NUM.MAPS_DASH_ERROR)
 
 
+al.compile_alert_tbl(AlertTable.alertTbl)  # Compile the messages once, when this module is imported
+
 lookup_d = dict(
     # MAPS
     MAPS_DASH_ERROR=ALERT_NUM.MAPS_DASH_ERROR,
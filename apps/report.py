@@ -21,6 +21,12 @@ details.
 +=======================+===========================================================================================+
 | report                | Creates an Excel report. Sort of a SAN Health like report.                                |
 +-----------------------+-------------------------------------------------------------------------------------------+
+| sheet_types           | Returns the sheet types that can be selected or skipped in report()                       |
++-----------------------+-------------------------------------------------------------------------------------------+
+| shard_jobs            | Returns the report jobs for batch_report() with one workbook per fabric or per group.     |
++-----------------------+-------------------------------------------------------------------------------------------+
+| batch_report          | Creates multiple Excel reports in parallel worker processes.                              |
++-----------------------+-------------------------------------------------------------------------------------------+
 
 **Version Control**
 
@@ -49,24 +55,66 @@ details.
 +-----------+---------------+---------------------------------------------------------------------------------------+
 | 4.1.0     | 10 Mar 2026   | Added error handling for excel_util.save_report().                                    |
 +-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.1     | 18 Oct 2026   | Added the Request Timing page.                                                        |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.2     | 18 Oct 2026   | Added the streaming parameter to report() for write-only workbooks.                   |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.3     | 18 Oct 2026   | Added fab_l to report(). Added shard_jobs() and batch_report()                        |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.4     | 18 Oct 2026   | Added sheet selection, switch_l, and sheet timing to report(). Added sheet_types()    |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.5     | 18 Oct 2026   | report() logs the number of names resolved and returned from the name cache           |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.6     | 18 Oct 2026   | Added cache_dir to report() and batch_report(). Unchanged workbooks are copied from   |
+|           |               | the cache                                                                             |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.7     | 18 Oct 2026   | Batch workers no longer clear the frozen flag                                         |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.8     | 18 Oct 2026   | Sheet names from a previous report() are cleared so objects outside the scope are not |
+|           |               | linked                                                                                |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.9     | 18 Oct 2026   | Port, login, zone, and alias links from a previous report() are cleared               |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.2.0     | 18 Oct 2026   | Sheet hashes only include displayed data. The table of contents, about, and request   |
+|           |               | timing pages are rebuilt in the cached workbook                                       |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.2.1     | 18 Oct 2026   | The module version and the write mode are part of the sheet name hash for the cached  |
+|           |               | workbook                                                                              |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.2.2     | 18 Oct 2026   | Batch workers only record Exception as a job error. Ctrl-C terminates the worker      |
+|           |               | pool.                                                                                 |
++-----------+---------------+---------------------------------------------------------------------------------------+
 """
 __author__ = 'Jack Consoli'
 __copyright__ = 'Copyright 2023, 2024, 2025, 2026 Jack Consoli'
-__date__ = '10 Mar 2026'
+__date__ = '18 Oct 2026'
 __license__ = 'Apache License, Version 2.0'
 __email__ = 'jack_consoli@yahoo.com'
 __maintainer__ = 'Jack Consoli'
 __status__ = 'Released'
-__version__ = '4.1.0'
+__version__ = '4.2.2'
 
 import os
+import re
+import sys
+import time
 import collections
 import copy
+import json
+import shutil
+import hashlib
+import multiprocessing
+try:
+    import resource  # Not available on Windows. Used to report the peak memory of each worker in batch_report()
+except ImportError:
+    resource = None
 import openpyxl.utils.cell as xl
 import brcdapi.log as brcdapi_log
+import brcdapi.file as brcdapi_file
 import brcdapi.gen_util as gen_util
 import brcdapi.util as brcdapi_util
 import brcdapi.excel_util as excel_util
+import brcddb.report.sink as report_sink
 import brcdapi.excel_fonts as excel_fonts
 import brcddb.util.util as brcddb_util
 import brcddb.app_data.report_tables as rt
@@ -80,6 +128,7 @@ import brcddb.report.fabric as report_fabric
 import brcddb.report.iocp as report_iocp
 import brcddb.report.login as report_login
 import brcddb.report.port as report_port
+import brcddb.report.request as report_request
 import brcddb.report.switch as report_switch
 import brcddb.report.zone as report_zone
 import brcddb.report.utils as report_utils
@@ -110,6 +159,8 @@ dictionaries defined as follows:
 +-----------+-------+-----------+-----------------------------------------------------------------------------------+
 |           | dup   | Project   | Duplicate WWNs                                                                    |
 +-----------+-------+-----------+-----------------------------------------------------------------------------------+
+|           | rq    | Project   | Request timing. Only added if request statistics were recorded.                   |
++-----------+-------+-----------+-----------------------------------------------------------------------------------+
 |           | fab   | Fabric    | Fabric summary sheet                                                              |
 +-----------+-------+-----------+-----------------------------------------------------------------------------------+
 |           | db    | Project   | Dashboard.                                                                        |
@@ -147,6 +198,8 @@ dictionaries defined as follows:
 +-----------+-------+-----------+-----------------------------------------------------------------------------------+
 |           | dup   | Project   | Duplicate WWNs                                                                    |
 +-----------+-------+-----------+-----------------------------------------------------------------------------------+
+|           | rq    | Project   | Request timing. Only added if request statistics were recorded.                   |
++-----------+-------+-----------+-----------------------------------------------------------------------------------+
 |           | fab   | Fabric    | Fabric summary sheet                                                              |
 +-----------+-------+-----------+-----------------------------------------------------------------------------------+
 |           | db    | Project   | Dashboard.                                                                        |
@@ -174,6 +227,38 @@ dictionaries defined as follows:
 +-----------+-------+-----------+-----------------------------------------------------------------------------------+
 """
 _MAX_DB_SIZE = 10  # Set the top xx dashboard size
+_cache_skip_keys = ('report_app',)  # Report bookkeeping, such as sheet names, is not part of the sheet content hash
+# Data that changes with every collection. Key is the key in a chassis, switch, or port object. Value is the sheet types
+# that display it. The data is only included in the content hash of those sheet types. See _sheet_hashes()
+_cache_volatile_d = {
+    'fibrechannel-statistics': ('ps', 'db'),
+    brcdapi_util.sfp_power_on: ('sfp',),
+    brcdapi_util.sfp_tx_pwr: ('sfp',),
+    brcdapi_util.sfp_rx_pwr: ('sfp',),
+    'media-rdp/remote-media-tx-power': ('sfp',),
+    'media-rdp/remote-media-rx-power': ('sfp',),
+    'media-rdp/temperature': ('sfp',),
+    'media-rdp/remote-media-temperature': ('sfp',),
+    'media-rdp/current': ('sfp',),
+    'media-rdp/remote-media-current': ('sfp',),
+    'media-rdp/voltage': ('sfp',),
+    'media-rdp/remote-media-voltage': ('sfp',),
+    brcdapi_util.bfc_up_time: ('switch',),
+    brcdapi_util.bc_date: ('chassis',),
+    brcdapi_util.bc_https_sys_uptime: ('chassis',),
+    brcdapi_util.fru_blade + '/time-alive': ('chassis',),
+    brcdapi_util.fru_blade + '/time-awake': ('chassis',),
+    brcdapi_util.fru_fan + '/time-alive': ('chassis',),
+    brcdapi_util.fru_fan + '/time-awake': ('chassis',),
+    brcdapi_util.fru_ps + '/time-alive': ('chassis',),
+    brcdapi_util.fru_ps + '/time-awake': ('chassis',),
+}
+# Project pages that display the collection date, the request timing, or this module's version. They are not hashed.
+# When the cached workbook is used, they are rebuilt. Rebuilt in this order because the table of contents checks for the
+# request timing page. See _refresh_pages()
+_cache_refresh_l = ('rq', 'ab', 'tc')
+_MAX_CHANGE_LOG = 10  # Maximum number of changed sheets to log when the cached workbook can't be used
+_report_run_keys = ('control', 'hyperlink')  # Keys in report_app set for each report. See _clear_report_app()
 _unique_index = 0  # The openpyxl library appends a number if necessary to make worksheet names unique; however, this
 # module creates all worksheet names in advance so that links to them can be added before the worksheet has been
 # created. _unique_index therefore is used to ensure all worksheet names are unique before they are created.
@@ -227,6 +312,8 @@ _about_buf_l = (
     '  *   Analyzing enclosure usage (typically storage arrays)',
 )
 
+_batch_proj_obj = None  # The project shared with the worker processes in batch_report(). See _batch_init()
+
 _zc_comment = 'Zone cleanup for $fab. Copy this zone cleanup worksheet to a zone configuration workbook. See '\
               '"zone_config_sample.xlsx" and zone_config.py.'
 
@@ -246,7 +333,7 @@ def _dashboard(obj, wb, sheet_index):
     dashboard_item['crc-errors'] = dict(title='Top ' + str(_MAX_DB_SIZE) + ' CRC', port_list=list())
     dashboard_item['loss-of-signal'] = dict(title='Top ' + str(_MAX_DB_SIZE) + ' Loss of Signal', port_list=list())
     dashboard_item['bb-credit-zero'] = dict(title='Top ' + str(_MAX_DB_SIZE) + ' BB Credit Zero', port_list=list())
-    port_list = obj.r_port_objects()
+    port_list = [port_obj for port_obj in obj.r_port_objects() if _in_report(port_obj.r_switch_obj())]
     for k, db in dashboard_item.items():
         db_list = brcddb_search.test_threshold(port_list, 'fibrechannel-statistics/' + k, '>', 0)
         db_list = gen_util.sort_obj_num(db_list, 'fibrechannel-statistics/' + k, True)
@@ -337,7 +424,8 @@ def _add_port_page(fab_obj, wb, sheet_index, control_d, config_tbl, login_flag,
                           control_d['sn'],
                           sheet_index,
                           control_d['t'],
-                          brcddb_util.sort_ports(fab_obj.r_all_port_objects()),
+                          brcddb_util.sort_ports([port_obj for port_obj in fab_obj.r_all_port_objects()
+                                                  if _in_report(port_obj.r_switch_obj())]),
                           in_display=config_tbl,
                           in_port_display_tbl=rt.Port.port_display_tbl,
                           login_flag=login_flag,
@@ -538,6 +626,23 @@ def _add_project_dup(proj_obj, wb, sheet_index):
     return 0
 
 
+def _add_project_request(proj_obj, wb, sheet_index):
+    """Adds the request timing page if request statistics were recorded. See _add_fabric_summary() for parameters"""
+    if len(proj_obj.r_request_stats()) == 0:
+        return 0
+
+    control_d = proj_obj.r_get('report_app/control/rq')
+    brcdapi_log.log('    Adding ' + control_d['sn'], echo=True)
+    report_request.request_page(
+        wb,
+        proj_obj.r_get('report_app/hyperlink/tc'),
+        control_d['sn'],
+        sheet_index,
+        control_d['t'],
+        proj_obj)
+    return 1
+
+
 def _add_zone_by_group(proj_obj, wb, sheet_index):
     """Adds the zone by groups page. See _add_fabric_summary() for parameter definitions"""
     if len(proj_obj.r_get('report_app/group_d', dict())) == 0:
@@ -582,96 +687,104 @@ def _add_project_tc(proj_obj, wb, sheet_index):
     control_d = proj_obj.r_get('report_app/control')
     hyper_d = proj_obj.r_get('report_app/hyperlink')
     sheet = wb.create_sheet(index=sheet_index, title=control_d['tc']['sn'])
-    sheet.page_setup.paperSize = sheet.PAPERSIZE_LETTER
-    sheet.page_setup.orientation = sheet.ORIENTATION_PORTRAIT
+    sheet.page_setup.paperSize = report_sink.PAPERSIZE_LETTER
+    sheet.page_setup.orientation = report_sink.ORIENTATION_PORTRAIT
     row = col = 1
     for i in (4, 20, 62):
         sheet.column_dimensions[xl.get_column_letter(col)].width = i
         col += 1
 
     # Add the title
-    sheet.merge_cells(start_row=row, start_column=1, end_row=row, end_column=col-1)
+    report_sink.merge_cells(sheet, start_row=row, start_column=1, end_row=row, end_column=col-1)
     col = 1
-    excel_util.cell_update(sheet, row, col, control_d['tc']['t'], font=_hdr1_font, align=_align_wrap,
-                           fill=excel_fonts.fill_type('lightblue'))
+    report_sink.cell_update(sheet, row, col, control_d['tc']['t'], font=_hdr1_font, align=_align_wrap,
+                            fill=excel_fonts.fill_type('lightblue'))
 
     # Add the project description and date
     row += 2
     for d in (dict(t='Description', c=proj_obj.c_description(), f=excel_fonts.font_type('cli')),
               dict(t='Data collected', c=proj_obj.r_date(), f=_std_font)):
-        sheet.merge_cells(start_row=row, start_column=1, end_row=row, end_column=2)
-        excel_util.cell_update(sheet, row, 1, d['t'], font=_std_font, align=_align_wrap)
-        excel_util.cell_update(sheet, row, 3, d['c'], font=d['f'], align=_align_wrap)
+        report_sink.merge_cells(sheet, start_row=row, start_column=1, end_row=row, end_column=2)
+        report_sink.cell_update(sheet, row, 1, d['t'], font=_std_font, align=_align_wrap)
+        report_sink.cell_update(sheet, row, 3, d['c'], font=d['f'], align=_align_wrap)
         row += 1
 
     # Figure out what to add to the table of contents. Start with basic project stuff & chassis
     # control_d and hyper_d are set to the 'report_app/control' and 'report_app/hyperlink' of the project object.
     # contents_l is a list of dictionaries. 't' is the section title for the table of contents and cl is a list of
     # dictionaries that describes the subsections. In cl, 't' is the subsection title and 'l' is the link
-    dup_d = dict(t=control_d['dup']['tc'], l=hyper_d['dup']) if control_d['dup']['sn'] in wb.sheetnames \
-        else dict(t='No Duplicate WWNs Found')
-
-    contents_l = [
-        dict(t='About', cl=[dict(t=control_d['ab']['tc'], l=hyper_d['ab'])]),
-        dict(t='Zone Groups', zg=True, cl=[dict(t=control_d['zg']['tc'], l=hyper_d['zg'])]),
-        dict(t='Best Practice Violations', cl=[dict(t=control_d['bp']['tc'], l=hyper_d['bp'])]),
-        dict(t='Duplicate WWNs', cl=[dup_d]),
-        dict(t=control_d['db']['tc'], cl=[dict(t=control_d['db']['tc'], l=hyper_d['db'])]),
-        dict(t='Chassis',
-             cl=[dict(t=brcddb_chassis.best_chassis_name(obj), l=obj.r_get('report_app/hyperlink/chassis'))
-                 for obj in proj_obj.r_chassis_objects()]),
-    ]
+    # Sheet types not selected are not in control_d. See sheet_l and skip_l in report(). In proj_toc_l, 'k' is the key
+    # in control_d, 't' is the section title (None: use the table of contents title), and 'nt' is the subsection title
+    # to use if the sheet was selected but not added.
+    proj_toc_l = (
+        dict(k='ab', t='About'),
+        dict(k='zg', t='Zone Groups', zg=True),
+        dict(k='bp', t='Best Practice Violations'),
+        dict(k='dup', t='Duplicate WWNs', nt='No Duplicate WWNs Found'),
+        dict(k='rq', t='Request Timing', nt='No Request Statistics Recorded'),
+        dict(k='db', t=None),
+    )
+    contents_l = list()
+    for d in [d for d in proj_toc_l if d['k'] in control_d]:
+        key = d['k']
+        sub_content_d = dict(t=control_d[key]['tc'], l=hyper_d[key])
+        if 'nt' in d and control_d[key]['sn'] not in wb.sheetnames:
+            sub_content_d = dict(t=d['nt'])
+        contents_l.append(dict(t=control_d[key]['tc'] if d['t'] is None else d['t'],
+                               zg=d.get('zg', False),
+                               cl=[sub_content_d]))
+    contents_l.append(dict(t='Chassis',
+                           cl=[dict(t=brcddb_chassis.best_chassis_name(obj),
+                                    l=obj.r_get('report_app/hyperlink/chassis'))
+                               for obj in proj_obj.r_chassis_objects()
+                               if obj.r_get('report_app/control/chassis') is not None]))
 
     # Add the fabrics. See notes above with how table of contents was built for the project
-    for fab_obj in proj_obj.r_fabric_objects():
+    for fab_obj in [obj for obj in proj_obj.r_fabric_objects() if _in_report(obj)]:
         control_d = fab_obj.r_get('report_app/control')
         hyper_d = fab_obj.r_get('report_app/hyperlink')
-        sub_content_l = [dict(t=control_d[key]['tc'], l=hyper_d[key]) for key in ('fab', 'db')]
-        sub_content_l.extend(
-            [dict(t=control_d[key]['tc'], l=hyper_d[key]) for key in ('pl', 'za', 'zt', 'znt', 'zc', 'ali', 'log')]
-        )
+        sub_content_l = [dict(t=control_d[key]['tc'], l=hyper_d[key])
+                         for key in ('fab', 'db', 'pl', 'za', 'zt', 'znt', 'zc', 'ali', 'log') if key in control_d]
         contents_l.append(dict(t=brcddb_fabric.best_fab_name(fab_obj, wwn=True, fid=True), cl=sub_content_l))
 
     # Add the IOCPs
-    temp_l = proj_obj.r_iocp_objects()
+    temp_l = [obj for obj in proj_obj.r_iocp_objects() if obj.r_get('report_app/control/iocp') is not None]
     if len(temp_l) > 0:
-        cl = [dict(t=obj.r_get('report_app/control/iocp/tc'), l=obj.r_get('report_app/hyperlink/iocp')) for
-              obj in proj_obj.r_iocp_objects()]
         contents_l.append(dict(t='IOCPs',
                                cl=[dict(t=obj.r_get('report_app/control/iocp/t'),
                                         l=obj.r_get('report_app/hyperlink/iocp'))
-                                   for obj in proj_obj.r_iocp_objects()]))
+                                   for obj in temp_l]))
 
     # Add all the Table of Contents items
     for d in contents_l:
         row += 1
-        sheet.merge_cells(start_row=row, start_column=1, end_row=row, end_column=3)
-        excel_util.cell_update(sheet, row, 1, d['t'], font=_hdr2_font, align=_align_wrap)
+        report_sink.merge_cells(sheet, start_row=row, start_column=1, end_row=row, end_column=3)
+        report_sink.cell_update(sheet, row, 1, d['t'], font=_hdr2_font, align=_align_wrap)
         row += 1
         for obj in d['cl']:
             if d.get('zg', False) and len(proj_obj.r_get('report_app/group_d')) == 0:
                 continue
-            sheet.merge_cells(start_row=row, start_column=2, end_row=row, end_column=3)
-            excel_util.cell_update(sheet, row, 2, obj['t'], font=_link_font if 'l' in obj else _std_font,
-                                   align=_align_wrap, link=obj.get('l'))
+            report_sink.merge_cells(sheet, start_row=row, start_column=2, end_row=row, end_column=3)
+            report_sink.cell_update(sheet, row, 2, obj['t'], font=_link_font if 'l' in obj else _std_font,
+                                    align=_align_wrap, link=obj.get('l'))
             row += 1
 
     # Add chassis not polled
-    temp_l = [obj for obj in proj_obj.r_chassis_objects() if obj.r_get('brocade-chassis') is None]
+    temp_l = [obj for obj in proj_obj.r_chassis_objects() if obj.r_get('brocade-chassis') is None and _in_report(obj)]
     if len(temp_l) > 0:
         row += 1
-        sheet.merge_cells(start_row=row, start_column=1, end_row=row, end_column=3)
-        excel_util.cell_update(sheet, row, 1, 'Missing chassis (discovered in fabrics but not polled)',
-                               font=_hdr2_font, align=_align_wrap)
+        report_sink.merge_cells(sheet, start_row=row, start_column=1, end_row=row, end_column=3)
+        report_sink.cell_update(sheet, row, 1, 'Missing chassis (discovered in fabrics but not polled)',
+                                font=_hdr2_font, align=_align_wrap)
         row += 1
     for obj in temp_l:
-        sheet.merge_cells(start_row=row, start_column=2, end_row=row, end_column=3)
+        report_sink.merge_cells(sheet, start_row=row, start_column=2, end_row=row, end_column=3)
         buf = brcddb_chassis.best_chassis_name(obj, wwn=True) + '. Known logical switches:'
-        excel_util.cell_update(sheet, row, 2, buf, font=_std_font, align=_align_wrap)
+        report_sink.cell_update(sheet, row, 2, buf, font=_std_font, align=_align_wrap)
         row += 1
         for switch_obj in obj.r_switch_objects():
-            excel_util.cell_update(sheet, row, 3, brcddb_switch.best_switch_name(switch_obj, wwn=True),
-                                   font=_std_font, align=_align_wrap)
+            report_sink.cell_update(sheet, row, 3, brcddb_switch.best_switch_name(switch_obj, wwn=True),
+                                    font=_std_font, align=_align_wrap)
             row += 1
 
     return 1
@@ -730,6 +843,7 @@ _proj_control_d = dict(
     db=dict(p='proj_dashboard', tc='Project Dashboard', t='Project Dashboard', a=_dashboard),
     bp=dict(p='Best_Practice', tc='Best Practice Violations', t='Best Practice Violations', a=_add_project_bp),
     dup=dict(p='dup_wwns', tc='Duplicate WWNs', t='Duplicate WWNs', a=_add_project_dup),
+    rq=dict(p='request_timing', tc='Request Timing', t='Request Timing', a=_add_project_request),
     zg=dict(p='Zone_Groups', tc='Zone Groups', t='Zone Groups', a=_add_zone_by_group),
 )
 _fab_control_d = dict(
@@ -775,27 +889,150 @@ _switch_ports_summary_control_d = dict(
     switch=dict(a=_add_switch_port_summary)
 )
 
-def _add_sheet_names(proj_obj):
+def _in_report(obj):
+    """Determines if an object is included in the report. Only objects included in the report are given sheet names by
+    _add_sheet_names().
+
+    :param obj: Chassis, fabric, or switch object
+    :type obj: brcddb.classes.chassis.ChassisObj, brcddb.classes.fabric.FabricObj, brcddb.classes.switch.SwitchObj, None
+    :return: True if the object is included in the report
+    :rtype: bool
+    """
+    return obj is not None and obj.r_get('report_app/control') is not None
+
+
+def sheet_types():
+    """Returns the sheet types that can be selected or skipped in report(). The sheet types are the keys in the
+    _xxx_control_d tables. The table of contents, 'tc', is always added.
+
+    :return: Key is the sheet type. Value is the table of contents description
+    :rtype: dict
+    """
+    global _proj_control_d, _fab_control_d, _chassis_control_d, _iocp_control_d, _switch_control_d
+
+    rd = dict()
+    for control_d in (_proj_control_d, _fab_control_d, _chassis_control_d, _iocp_control_d, _switch_control_d):
+        for k, d in control_d.items():
+            if k != 'tc' and d.get('tc') is not None and k not in rd:
+                rd[k] = d['tc']
+    rd['db'] = 'Project and Fabric Dashboards'
+    rd['switch'] = 'Switch Detail'
+
+    return rd
+
+
+def _sheet_scope(sheet_l, skip_l):
+    """Returns the sheet types to include in the report. See report()
+
+    :param sheet_l: Sheet types to include. None: All sheet types
+    :type sheet_l: None, str, list, tuple
+    :param skip_l: Sheet types to skip. Takes precedence over sheet_l.
+    :type skip_l: None, str, list, tuple
+    :return: Sheet types to include
+    :rtype: list
+    """
+    all_l = list(sheet_types().keys())
+    in_l = all_l if sheet_l is None else gen_util.convert_to_list(sheet_l)
+    skip_l = gen_util.convert_to_list(skip_l)
+    for k in [k for k in in_l + skip_l if k not in all_l]:
+        brcdapi_log.log('Unknown sheet type: ' + str(k) + '. Valid sheet types are: ' + ', '.join(all_l), echo=True)
+    rl = [k for k in in_l if k in all_l and k not in skip_l]
+    if 'chassis' in rl:
+        rl.append('chassis_p')  # The chassis port map is built from the hidden chassis port page
+
+    return ['tc'] + rl
+
+
+def _report_scope(proj_obj, fab_l, switch_l=None, sheet_l=None, skip_l=None):
+    """Determines the chassis, switches, fabrics, and sheet types to include in the report
+
+    :param proj_obj: Project object
+    :type proj_obj: brcddb.classes.project.ProjectObj
+    :param fab_l: Fabric keys (principal switch WWN) to include. None: include everything in the project
+    :type fab_l: None, list, tuple
+    :param switch_l: Switch WWNs to include. None: All switches in the fabrics to include
+    :type switch_l: None, str, list, tuple
+    :param sheet_l: Sheet types to include. See _sheet_scope()
+    :type sheet_l: None, str, list, tuple
+    :param skip_l: Sheet types to skip. See _sheet_scope()
+    :type skip_l: None, str, list, tuple
+    :return: Dictionary with chassis_l, switch_l, and fab_l, the lists of objects to include in the report, and
+        sheet_l, the sheet types to include.
+    :rtype: dict
+    """
+    fab_key_l = None if fab_l is None else gen_util.convert_to_list(fab_l)
+    switch_key_l = None if switch_l is None else gen_util.convert_to_list(switch_l)
+    if fab_key_l is None and switch_key_l is None:
+        return dict(chassis_l=proj_obj.r_chassis_objects(),
+                    switch_l=proj_obj.r_switch_objects(),
+                    fab_l=proj_obj.r_fabric_objects(),
+                    sheet_l=_sheet_scope(sheet_l, skip_l))
+
+    switch_obj_l = [switch_obj for switch_obj in proj_obj.r_switch_objects()
+                    if (fab_key_l is None or switch_obj.r_fabric_key() in fab_key_l) and
+                    (switch_key_l is None or switch_obj.r_obj_key() in switch_key_l)]
+    if fab_key_l is None:
+        fab_key_l = [switch_obj.r_fabric_key() for switch_obj in switch_obj_l]
+    fab_obj_l = [fab_obj for fab_obj in proj_obj.r_fabric_objects() if fab_obj.r_obj_key() in fab_key_l]
+    chassis_key_l = [switch_obj.r_chassis_key() for switch_obj in switch_obj_l]
+    chassis_obj_l = [chassis_obj for chassis_obj in proj_obj.r_chassis_objects()
+                     if chassis_obj.r_obj_key() in chassis_key_l]
+    return dict(chassis_l=chassis_obj_l, switch_l=switch_obj_l, fab_l=fab_obj_l, sheet_l=_sheet_scope(sheet_l, skip_l))
+
+
+def _clear_report_app(proj_obj):
+    """Removes the sheet names and links added to objects by a previous call to report(). Otherwise, objects not in
+    the scope of this report would still appear to be in the report, see _in_report(), and links would point to sheets
+    skipped in this report. Port, login, zone, and alias links are added when the sheets they link to are created.
+
+    :param proj_obj: Project object
+    :type proj_obj: brcddb.classes.project.ProjectObj
+    :rtype: None
+    """
+    global _report_run_keys
+
+    obj_l = [proj_obj] + proj_obj.r_chassis_objects() + proj_obj.r_switch_objects() + proj_obj.r_fabric_objects() + \
+        proj_obj.r_iocp_objects() + proj_obj.r_all_port_objects(ve=True) + proj_obj.r_login_objects() + \
+        proj_obj.r_fdmi_node_objects() + proj_obj.r_fdmi_port_objects()
+    for iocp_obj in proj_obj.r_iocp_objects():
+        obj_l.extend(iocp_obj.r_path_objects())
+    for fab_obj in proj_obj.r_fabric_objects():
+        obj_l.extend(fab_obj.r_zonecfg_objects() + fab_obj.r_zone_objects() + fab_obj.r_alias_objects())
+    for obj in obj_l:
+        report_app_d = obj.r_get('report_app')
+        if isinstance(report_app_d, dict):
+            for k in _report_run_keys:
+                report_app_d.pop(k, None)
+
+
+def _add_sheet_names(proj_obj, scope_d):
     """Adds sheet names to the major objects so that pages can be created with links to pages not yet created.
 
     :param proj_obj: Project object
     :type proj_obj: brcddb.classes.project.ProjectObj
+    :param scope_d: Objects to include in the report. See _report_scope()
+    :type scope_d: dict
     :rtype: None
     """
     global _proj_control_d, _chassis_control_d, _fab_control_d, _switch_control_d, _unique_index
 
+    _clear_report_app(proj_obj)
+    # Sheet names only need to be unique within a workbook. Starting over for each workbook means the same objects always
+    # get the same sheet names so the links in a cached workbook are still valid. See _sheet_hashes()
+    _unique_index = 0
+
     # Set up the control data structures.
     add_l = (
         dict(obj_l=[proj_obj],  # List of objects to create worksheets for.
              control_d=_proj_control_d,  # Data structure that controls how to set up the worksheet.
              name_m=''),  # Sheet title and sheet name prefix or pointer to function to supply the same.
-        dict(obj_l=proj_obj.r_chassis_objects(),
+        dict(obj_l=scope_d['chassis_l'],
              control_d=_chassis_control_d,
              name_m=brcddb_chassis.best_chassis_name),
-        dict(obj_l=proj_obj.r_switch_objects(),
+        dict(obj_l=scope_d['switch_l'],
              control_d=_switch_control_d,
              name_m=brcddb_switch.best_switch_name),
-        dict(obj_l=proj_obj.r_fabric_objects(),
+        dict(obj_l=scope_d['fab_l'],
              control_d=_fab_control_d,
              name_m=brcddb_fabric.best_fab_name),
         dict(obj_l=proj_obj.r_iocp_objects(),
@@ -803,10 +1040,10 @@ def _add_sheet_names(proj_obj):
              name_m=_iocp_name),
     )
 
-    # Create unique sheet names and add to the associated objects
+    # Create unique sheet names and add to the associated objects. Sheet types not selected are not added.
     for obj_d in add_l:
         for obj in obj_d['obj_l']:
-            control_d = copy.deepcopy(obj_d['control_d'])
+            control_d = dict((k, copy.deepcopy(d)) for k, d in obj_d['control_d'].items() if k in scope_d['sheet_l'])
             for d in control_d.values():
                 d.pop('a', None)  # Remove the pointer to the action method
             if callable(obj_d['name_m']):
@@ -860,21 +1097,345 @@ def _switch_name(obj):
     return brcddb_switch.best_switch_name(obj, wwn=True, did=True, fid=True)
 
 
-def report(proj_obj, outf, group_d=None):
+#################################################
+#                                               #
+#   Sheet content hashes for the report cache   #
+#                                               #
+#################################################
+
+def _canonical(v):
+    """Returns v in a form that json.dumps() serializes the same way every time. brcddb objects are replaced with their
+    keys. See _hash()"""
+    if isinstance(v, dict):
+        return [[str(k), _canonical(v1)] for k, v1 in sorted(v.items(), key=lambda x: str(x[0]))]
+    if isinstance(v, (list, tuple)):
+        return [_canonical(v1) for v1 in v]
+    if isinstance(v, (set, frozenset)):
+        return sorted([str(v1) for v1 in v])
+    if v is None or isinstance(v, (str, int, float, bool)):
+        return v
+    if hasattr(v, 'r_obj_key'):
+        return str(v.r_obj_key())
+    return str(v)
+
+
+def _hash(v):
+    """Returns the SHA-256 hex digest of v. See _canonical()"""
+    return hashlib.sha256(json.dumps(_canonical(v)).encode()).hexdigest()
+
+
+def _strip(v, key_l):
+    """Returns v without the value for a key. Lists are searched element by element. v is not modified.
+
+    :param v: Value as read from an object
+    :type v: dict, list, tuple, str, int, float, bool, None
+    :param key_l: Key, split on '/'
+    :type key_l: list
+    :return: v with the key removed
+    :rtype: dict, list, tuple, str, int, float, bool, None
+    """
+    if isinstance(v, dict):
+        if key_l[0] not in v:
+            return v
+        rd = dict(v)
+        if len(key_l) == 1:
+            rd.pop(key_l[0])
+        else:
+            rd[key_l[0]] = _strip(v[key_l[0]], key_l[1:])
+        return rd
+    if isinstance(v, (list, tuple)):
+        return [_strip(v1, key_l) for v1 in v]
+    return v
+
+
+def _obj_digest(obj, digest_d):
+    """Returns the content hash of a single object: the data added to it except the data in _cache_volatile_d, the
+    alerts, and, for zones, aliases, and zone configurations, the members.
+
+    :param obj: Any brcddb object
+    :type obj: brcddb.classes.*
+    :param digest_d: Previously calculated hashes. Key is id(obj). Updated with the hash for obj.
+    :type digest_d: dict
+    :return: Hash
+    :rtype: str
+    """
+    global _cache_skip_keys, _cache_volatile_d
+
+    digest = digest_d.get(id(obj))
+    if digest is None:
+        data_d = dict((k, obj.r_get(k)) for k in obj.r_keys() if k not in _cache_skip_keys)
+        for key_l in [k.split('/') for k in _cache_volatile_d.keys()]:
+            data_d = _strip(data_d, key_l)
+        v = [str(obj.r_obj_key()), data_d, [alert_obj.fmt_msg() for alert_obj in obj.r_alert_objects()]]
+        for k in ('r_members', 'r_pmembers'):
+            if hasattr(obj, k):
+                v.append(getattr(obj, k)())
+        digest = _hash(v)
+        digest_d[id(obj)] = digest
+    return digest
+
+
+def _group_digest(obj_l, digest_d, sheet=None):
+    """Returns the content hash of a list of objects for a sheet type. The data in _cache_volatile_d is only included
+    for the sheet types that display it.
+
+    :param obj_l: Objects the sheet is built from
+    :type obj_l: list
+    :param digest_d: See _obj_digest()
+    :type digest_d: dict
+    :param sheet: Sheet type. See sheet_types()
+    :type sheet: str, None
+    :return: Hash
+    :rtype: str
+    """
+    global _cache_volatile_d
+
+    v = [_obj_digest(obj, digest_d) for obj in obj_l]
+    # The volatile data may be in lists, which r_get() can't dereference, so the entire branch is included
+    key_l = gen_util.remove_duplicates([k.split('/')[0] for k, sheet_l in _cache_volatile_d.items() if sheet in sheet_l])
+    if len(key_l) > 0:
+        v.append([[obj.r_get(k) for k in key_l] for obj in obj_l])
+    return _hash(v)
+
+
+def _fab_objects(fab_obj):
+    """Returns the objects a fabric's sheets are built from: the fabric, its switches, ports, logins, and zoning"""
+    return [fab_obj] + fab_obj.r_switch_objects() + fab_obj.r_port_objects() + fab_obj.r_login_objects() + \
+        fab_obj.r_fdmi_node_objects() + fab_obj.r_fdmi_port_objects() + fab_obj.r_zonecfg_objects() + \
+        fab_obj.r_zone_objects() + fab_obj.r_alias_objects()
+
+
+def _switch_objects(switch_obj):
+    """Returns the objects a switch's sheets are built from: the switch, its ports, and logins"""
+    return [switch_obj] + switch_obj.r_port_objects() + switch_obj.r_login_objects()
+
+
+def _chassis_objects(chassis_obj):
+    """Returns the objects a chassis' sheets are built from: the chassis, its switches, and ports"""
+    return [chassis_obj] + chassis_obj.r_switch_objects() + chassis_obj.r_port_objects()
+
+
+def _iocp_objects(iocp_obj):
+    """Returns the objects an IOCP sheet is built from: the IOCP and its CHPIDs"""
+    return [iocp_obj] + iocp_obj.r_path_objects()
+
+
+def _sheet_names(obj):
+    """Returns the sheet names assigned to an object by _add_sheet_names(). Key is the sheet type."""
+    return dict((k, d.get('sn')) for k, d in obj.r_get('report_app/control', dict()).items())
+
+
+def _sheet_hashes(proj_obj, group_d, scope_d, streaming=False):
+    """Returns a content hash for each sheet in the report whose content is used to decide if the cached workbook can be
+    used. The hash is calculated from the objects the sheet is built from so that it only changes when the content of
+    the sheet changes. Sheets for a fabric, switch, chassis, or IOCP are hashed from that object and the objects in it.
+    The best practice and duplicate WWN pages are not filtered so they are hashed from all objects in the project. Data
+    that changes with every collection, such as port statistics, is only hashed for the sheets that display it. See
+    _cache_volatile_d. The pages in _cache_refresh_l are not hashed. They are rebuilt when the cached workbook is used.
+    The sheet names are hashed because the sheets link to each other by name. The module version and the write mode are
+    hashed with them so that a workbook cached by a different version of this module, or in the other write mode, is not
+    used. Must be called after _add_sheet_names()
+
+    :param proj_obj: Project object
+    :type proj_obj: brcddb.classes.project.ProjectObj
+    :param group_d: Zone groups. See report()
+    :type group_d: None, dict
+    :param scope_d: Objects and sheet types to include in the report. See _report_scope()
+    :type scope_d: dict
+    :param streaming: Write mode. See report()
+    :type streaming: bool
+    :return: Key is the sheet type and object key. Value is the hash.
+    :rtype: dict
+    """
+    global _fab_control_d, _switch_control_d, _chassis_control_d, _iocp_control_d, _proj_control_d, _cache_refresh_l
+    global __version__
+
+    rd, digest_d, scope_l, sheet_l, name_l = dict(), dict(), list(), scope_d['sheet_l'], list()
+    for control_d, obj_l, obj_m in ((_fab_control_d, scope_d['fab_l'], _fab_objects),
+                                    (_switch_control_d, scope_d['switch_l'], _switch_objects),
+                                    (_chassis_control_d, scope_d['chassis_l'], _chassis_objects),
+                                    (_iocp_control_d, proj_obj.r_iocp_objects(), _iocp_objects)):
+        for obj in obj_l:
+            group_l = obj_m(obj)
+            scope_l.extend(group_l)
+            name_l.append(_sheet_names(obj))
+            for k in [k for k in control_d.keys() if k != 'tc' and k in sheet_l]:
+                rd[k + ' ' + str(obj.r_obj_key())] = _hash([k, _group_digest(group_l, digest_d, sheet=k)])
+
+    # The project level pages
+    project_l = [proj_obj]
+    for obj_l, obj_m in ((proj_obj.r_fabric_objects(), _fab_objects),
+                         (proj_obj.r_switch_objects(), _switch_objects),
+                         (proj_obj.r_chassis_objects(), _chassis_objects)):
+        for obj in obj_l:
+            project_l.extend(obj_m(obj))
+    input_d = dict(
+        db=_group_digest(scope_l, digest_d, sheet='db'),
+        bp=_group_digest(project_l, digest_d, sheet='bp'),
+        dup=_group_digest(project_l, digest_d, sheet='dup'),
+        rq=len(proj_obj.r_request_stats()) > 0,  # The page is rebuilt but whether it is in the workbook is not
+        zg=[group_d, _group_digest(scope_l, digest_d, sheet='zg')],
+    )
+    for k in [k for k in _proj_control_d.keys() if k in sheet_l and k not in _cache_refresh_l]:
+        rd[k + ' ' + str(proj_obj.r_obj_key())] = _hash([k, input_d[k]])
+    name_l.append(_sheet_names(proj_obj))
+    rd['sheet names'] = _hash([__version__, streaming, name_l])
+
+    return rd
+
+
+def _refresh_pages(proj_obj, wb):
+    """Rebuilds the project pages in _cache_refresh_l in a cached workbook. Each page is replaced at the same index.
+
+    :param proj_obj: Project object
+    :type proj_obj: brcddb.classes.project.ProjectObj
+    :param wb: Cached workbook. See report_sink.load_report()
+    :type wb: openpyxl.Workbook
+    :return: Number of pages rebuilt
+    :rtype: int
+    """
+    global _proj_control_d, _cache_refresh_l
+
+    rv, control_d = 0, proj_obj.r_get('report_app/control')
+    for k in [k for k in _cache_refresh_l if k in control_d]:
+        sheet_name = control_d[k]['sn']
+        if sheet_name in wb.sheetnames:
+            sheet_index = wb.sheetnames.index(sheet_name)
+            wb.remove(wb[sheet_name])
+            rv += _proj_control_d[k]['a'](proj_obj, wb, sheet_index)
+    return rv
+
+
+def _cache_files(outf, cache_dir):
+    """Returns the names of the cached copy of the workbook and the file with its sheet hashes. See report()"""
+    wb_file = os.path.join(cache_dir, os.path.basename(outf))
+    return wb_file, wb_file + '.json'
+
+
+def _cache_read(outf, cache_dir):
+    """Returns the sheet hashes of the cached copy of outf. See _sheet_hashes()
+
+    :param outf: Output file name
+    :type outf: str
+    :param cache_dir: Folder with the cached workbooks
+    :type cache_dir: str
+    :return: Sheet hashes. None if there is no cached copy or it was created by a different version of this module.
+    :rtype: dict, None
+    """
+    wb_file, hash_file = _cache_files(outf, cache_dir)
+    if not os.path.isfile(wb_file) or not os.path.isfile(hash_file):
+        return None
+    try:
+        cache_d = brcdapi_file.read_dump(hash_file)
+    except (OSError, ValueError):
+        brcdapi_log.log('Could not read ' + hash_file + '. The report will be rebuilt.', echo=True)
+        return None
+    if not isinstance(cache_d, dict) or cache_d.get('version') != __version__:
+        return None
+    return cache_d.get('sheet_d')
+
+
+def _cache_write(outf, cache_dir, sheet_d):
+    """Copies outf and the sheet hashes to the cache folder. See _cache_read() for parameters"""
+    wb_file, hash_file = _cache_files(outf, cache_dir)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        shutil.copyfile(outf, wb_file)
+        brcdapi_file.write_dump(dict(version=__version__, sheet_d=sheet_d), hash_file)
+    except OSError as e:
+        brcdapi_log.log(['Could not add ' + outf + ' to the report cache ' + cache_dir, str(e)], echo=True)
+
+
+def report(proj_obj, outf, group_d=None, streaming=False, fab_l=None, switch_l=None, sheet_l=None, skip_l=None,
+           cache_dir=None):
     """Creates an Excel report. Sort of a SAN Health like report.
 
+    When fab_l is specified, only the fabrics in fab_l and the switches and chassis in those fabrics are included. When
+    switch_l is specified, only those switches, the chassis they are in, and their ports are included. The project
+    level best practice, duplicate WWN, and request timing pages are not filtered.
+
+    sheet_l and skip_l select the sheet types. See sheet_types(). Sheets that are not selected are never built so the
+    data they are built from, such as the zoned-to lists, port statistics, and alert summaries, are not gathered. Links
+    to sheets that were not selected are not added.
+
+    When cache_dir is specified, a content hash of the data each sheet displays is calculated. If the hash of every
+    sheet matches the hashes saved with the copy of the workbook in cache_dir, the cached workbook is used. Only the
+    table of contents, about, and request timing pages, which display the collection date, module version, and request
+    timing, are rebuilt. Otherwise, the sheets that changed are logged, the workbook is built, and a copy is saved in
+    cache_dir with the new hashes. Sheets reference each other by sheet name and the strings and styles are shared by
+    all sheets in a workbook so individual fabric sheets are not copied from a cached workbook.
+
+    Port statistics, SFP readings, switch up time, and chassis times change with every collection. They are only
+    hashed for the sheets that display them: ps and db, sfp, switch, and chassis respectively. Skip those sheet types
+    with skip_l for the cached workbook to be used when only those values changed. The best practice and duplicate WWN
+    pages are hashed from the entire project. When creating one workbook per fabric, see shard_jobs(), skip bp and dup
+    as well so that a workbook is only rebuilt when its own fabric changed.
+
     :param proj_obj: Project object
     :type proj_obj: brcddb.classes.project.ProjectObj
     :param outf: Output file name
     :type outf: str
     :param group_d: Zone groups. Key: Group name. Value: list of port objects
     :type group_d: None, dict
+    :param streaming: If True, use a write-only workbook. Rows are written to the file as the port, login, and zone
+        pages are built rather than holding the entire workbook in memory. See brcddb.report.sink
+    :type streaming: bool
+    :param fab_l: Fabric keys (principal switch WWN) to include in the report. None: Include all fabrics
+    :type fab_l: None, list, tuple
+    :param switch_l: Switch WWNs to include in the report. None: Include all switches in the included fabrics
+    :type switch_l: None, str, list, tuple
+    :param sheet_l: Sheet types to include. None: Include all sheet types. See sheet_types()
+    :type sheet_l: None, str, list, tuple
+    :param skip_l: Sheet types to skip. Takes precedence over sheet_l. See sheet_types()
+    :type skip_l: None, str, list, tuple
+    :param cache_dir: Folder for cached copies of the workbook. None: Always build the workbook
+    :type cache_dir: None, str
+    :return: Time, in seconds, to build each sheet. Key is the sheet type. Value is a dictionary with n, the number of
+        sheets, and time. The time to save the workbook is in key 'save'. The time to calculate the sheet hashes is in
+        key 'hash'. If the cached workbook was used, the time to read it, rebuild the project pages, and save it is in
+        key 'cache'.
+    :rtype: dict
     """
-    global _fab_control_d
+    global _fab_control_d, _MAX_CHANGE_LOG
 
     # Set up the workbook and give all the major objects (Project, Chassis, Fabric, and Switch) sheet names
-    sheet_index, wb, working_group_d = 0, excel_util.new_report(), dict() if group_d is None else group_d
-    _add_sheet_names(proj_obj)
+    sheet_index, wb, timing_d = 0, report_sink.new_report(streaming=streaming), dict()
+    brcddb_class_util.name_cache_stats(reset=True)
+    working_group_d = dict() if group_d is None else group_d
+    if group_d is not None or proj_obj.r_get('report_app/group_d') is None:
+        brcddb_util.add_to_obj(proj_obj, 'report_app/group_d', working_group_d)
+    scope_d = _report_scope(proj_obj, fab_l, switch_l=switch_l, sheet_l=sheet_l, skip_l=skip_l)
+    _add_sheet_names(proj_obj, scope_d)
+
+    # If nothing changed since the cached copy was created, use it.
+    sheet_hash_d = None
+    if cache_dir is not None:
+        start = time.time()
+        sheet_hash_d, cache_d = _sheet_hashes(proj_obj, working_group_d, scope_d, streaming=streaming), \
+            _cache_read(outf, cache_dir)
+        timing_d['hash'] = dict(n=len(sheet_hash_d), time=time.time() - start)
+        if cache_d is None:
+            brcdapi_log.log('No cached copy of ' + outf + ' in ' + cache_dir, echo=True)
+        else:
+            change_l = [k for k, v in sheet_hash_d.items() if cache_d.get(k) != v]
+            change_l.extend([k for k in cache_d.keys() if k not in sheet_hash_d])
+            if len(change_l) == 0:
+                start = time.time()
+                cached_wb = report_sink.load_report(_cache_files(outf, cache_dir)[0])
+                if cached_wb is not None:
+                    num_sheets = _refresh_pages(proj_obj, cached_wb)
+                    if report_sink.save_report(cached_wb, outf):
+                        timing_d['cache'] = dict(n=len(sheet_hash_d), time=time.time() - start)
+                        brcdapi_log.log('No changes. Used the copy of ' + outf + ' in ' + cache_dir + ' and rebuilt ' +
+                                        str(num_sheets) + ' project pages.', echo=True)
+                        return timing_d
+                    brcdapi_log.log('Could not save ' + outf + ' from ' + cache_dir + '. Rebuilding.', echo=True)
+            else:
+                buf_l = [str(len(change_l)) + ' of ' + str(len(sheet_hash_d)) + ' sheets changed in ' + outf + ':']
+                buf_l.extend(['  ' + buf for buf in change_l[0:_MAX_CHANGE_LOG]])
+                if len(change_l) > _MAX_CHANGE_LOG:
+                    buf_l.append('  ...')
+                brcdapi_log.log(buf_l, echo=True)
 
     """report_l is a list of dictionaries in the order they are to be processed. The dictionaries control sheet creation
     as follows:
@@ -899,7 +1460,7 @@ def report(proj_obj, outf, group_d=None):
     +-----------+-----------+---------------------------------------------------------------------------------------+
     """
     report_l = (
-        dict(obj_l=proj_obj.r_fabric_objects(),
+        dict(obj_l=scope_d['fab_l'],
              add_name=('pc', 'ps', 'pz', 'pr', 'sfp', 'pl', 'za', 'zt', 'znt', 'zc', 'ali', 'log', 'db', 'fab'),
              order=('pc', 'ps', 'pz', 'pr', 'sfp', 'pl', 'za', 'zt', 'znt', 'zc', 'ali', 'log', 'db', 'fab'),
              feedback='Processing fabric: ',
@@ -911,35 +1472,35 @@ def report(proj_obj, outf, group_d=None):
              feedback='Processing IOCP: ',
              control=_iocp_control_d,
              obj_name=_iocp_name),
-        dict(obj_l=proj_obj.r_switch_objects(),
+        dict(obj_l=scope_d['switch_l'],
              add_name=('switch',),
              order=('switch',),
              feedback='Processing switch: ',
              control=_switch_control_d,
              obj_name=_switch_name,
              rs=True),
-        dict(obj_l=proj_obj.r_chassis_objects(),
+        dict(obj_l=scope_d['chassis_l'],
              add_name=('chassis', 'chassis_p'),
              order=('chassis', 'chassis_p'),
              feedback='Processing chassis: ',
              control=_chassis_control_d,
              obj_name=_chassis_name,
              rs=True),
-        dict(obj_l=proj_obj.r_chassis_objects(),
+        dict(obj_l=scope_d['chassis_l'],
              add_name=('chassis',),
              order=('chassis',),
              feedback='Adding port map to chassis: ',
              control=_chassis_ports_control_d,
              obj_name=_chassis_name,
              rs=True),
-        dict(obj_l=proj_obj.r_switch_objects(),
+        dict(obj_l=scope_d['switch_l'],
              add_name=('switch',),
              order=('switch',),
              feedback='Adding port map to switch: ',
              control=_switch_ports_control_d,
              obj_name=_switch_name,
              rs=True),
-        dict(obj_l=proj_obj.r_switch_objects(),
+        dict(obj_l=scope_d['switch_l'],
              add_name=('switch',),
              order=('switch',),
              feedback='Adding port summary to switch: ',
@@ -948,7 +1509,7 @@ def report(proj_obj, outf, group_d=None):
              rs=True),
         dict(obj_l=[proj_obj],
              add_name=(),
-             order=('zg', 'dup', 'bp', 'db', 'ab', 'tc'),
+             order=('zg', 'dup', 'bp', 'rq', 'db', 'ab', 'tc'),
              feedback='Processing: ',
              control=_proj_control_d,
              obj_name=_project_name,
@@ -963,18 +1524,239 @@ def report(proj_obj, outf, group_d=None):
             start_i = sheet_index
             obj_name = report_d['obj_name'](obj)
             control_d = obj.r_get('report_app/control')
-            if isinstance(control_d, dict):  # It should always be a dict. This is just belt and suspenders
-                for ctl_d in [control_d[k] for k in report_d['add_name']]:  # Add the object name to the titles
-                    ctl_d['t'] += obj_name
+            if not isinstance(control_d, dict):  # It should always be a dict. This is just belt and suspenders
+                continue
+            key_l = [k for k in report_d['order'] if k in control_d]  # Sheet types not selected are not in control_d
+            if len(key_l) == 0:
+                continue
+            for ctl_d in [control_d[k] for k in report_d['add_name'] if k in control_d]:  # Add the object name
+                ctl_d['t'] += obj_name
             brcdapi_log.log(report_d['feedback'] + obj_name, echo=True)
-            for ctl_d in [report_d['control'][k] for k in report_d['order']]:
-                sheet_index += ctl_d['a'](obj,
-                                          wb,
-                                          start_i if 'sf' in ctl_d and ctl_d['sf'] else sheet_index)
+            for k in key_l:
+                ctl_d, start = report_d['control'][k], time.time()
+                num_sheets = ctl_d['a'](obj, wb, start_i if 'sf' in ctl_d and ctl_d['sf'] else sheet_index)
+                sheet_index += num_sheets
+                k_timing_d = timing_d.get(k, dict(n=0, time=0.0))
+                k_timing_d['n'] += num_sheets
+                k_timing_d['time'] += time.time() - start
+                timing_d[k] = k_timing_d
 
     # Save the report.
     brcdapi_log.log('Saving ' + outf, echo=True)
-    if not excel_util.save_report(wb, outf):
+    start = time.time()
+    if not report_sink.save_report(wb, outf):
         proj_obj.s_error_flag()
+    elif sheet_hash_d is not None:
+        _cache_write(outf, cache_dir, sheet_hash_d)
+    timing_d['save'] = dict(n=1, time=time.time() - start)
 
-    return
+    # Report the time spent on each sheet type, longest first
+    buf_l = ['Sheet timing for ' + outf + ':']
+    for k, d in sorted(timing_d.items(), key=lambda x: x[1]['time'], reverse=True):
+        buf_l.append('  ' + k.ljust(10) + str(d['n']).rjust(5) + ' ' + '{:.3f}'.format(d['time']).rjust(10) + ' sec')
+    name_d = brcddb_class_util.name_cache_stats()
+    buf_l.append('Names resolved: ' + str(name_d['miss']) + ', returned from cache: ' + str(name_d['hit']))
+    brcdapi_log.log(buf_l, echo=True)
+
+    return timing_d
+
+
+def _file_name(base, ext, name):
+    """Returns a file name with an object or group name appended to the base name. See shard_jobs()"""
+    return base + '_' + gen_util.remove_duplicate_char(re.sub(r'[^\w\-]', '_', name), '_') + ext
+
+
+def shard_jobs(proj_obj, outf, group_d=None):
+    """Returns the report jobs for batch_report(). The object or group name is appended to the base name of outf for
+    each workbook.
+
+    :param proj_obj: Project object
+    :type proj_obj: brcddb.classes.project.ProjectObj
+    :param outf: Output file name. For example, "report.xlsx" becomes "report_fabric_name.xlsx"
+    :type outf: str
+    :param group_d: Zone groups, as returned from brcddb.report.utils.groups(). If None, one workbook is created for
+        each fabric. Otherwise, one workbook is created for each group with the fabrics the group has ports in.
+    :type group_d: None, dict
+    :return: List of jobs for batch_report(). Each job is a dictionary with name, outf, fab_l, and group_d
+    :rtype: list
+    """
+    base, ext = os.path.splitext(outf)
+    rl = list()
+    if group_d is None:
+        for fab_obj in proj_obj.r_fabric_objects():
+            name = brcddb_fabric.best_fab_name(fab_obj, wwn=True)
+            rl.append(dict(name=name, outf=_file_name(base, ext, name), fab_l=[fab_obj.r_obj_key()], group_d=None))
+    else:
+        for name, sub_group_d in group_d.items():
+            port_obj_l = sub_group_d.get('port_obj_l', list()) if isinstance(sub_group_d, dict) else list()
+            fab_l = gen_util.remove_duplicates([port_obj.r_fabric_key() for port_obj in port_obj_l
+                                                if port_obj.r_fabric_key() is not None])
+            rl.append(dict(name=name, outf=_file_name(base, ext, name), fab_l=fab_l, group_d={name: sub_group_d}))
+    return rl
+
+
+def _group_to_keys(group_d):
+    """Replaces the port objects in group_d with (switch WWN, port) so that a job can be passed to a worker process
+    without pickling the project with it. See _group_from_keys()
+
+    :param group_d: Zone groups as returned from brcddb.report.utils.groups()
+    :type group_d: None, dict
+    :return: Copy of group_d with the port objects in port_obj_l replaced with the tuple (switch WWN, port)
+    :rtype: None, dict
+    """
+    if group_d is None:
+        return None
+    rd = dict()
+    for name, sub_group_d in group_d.items():
+        if isinstance(sub_group_d, dict):
+            sub_group_d = sub_group_d.copy()
+            sub_group_d['port_obj_l'] = [(port_obj.r_switch_key(), port_obj.r_obj_key())
+                                         for port_obj in sub_group_d.get('port_obj_l', list())]
+        rd[name] = sub_group_d
+    return rd
+
+
+def _group_from_keys(proj_obj, group_d):
+    """Converts a group dictionary from _group_to_keys() back to port objects in proj_obj
+
+    :param proj_obj: Project object
+    :type proj_obj: brcddb.classes.project.ProjectObj
+    :param group_d: Zone groups returned from _group_to_keys()
+    :type group_d: None, dict
+    :return: Zone groups as returned from brcddb.report.utils.groups()
+    :rtype: None, dict
+    """
+    if group_d is None:
+        return None
+    rd = dict()
+    for name, sub_group_d in group_d.items():
+        if isinstance(sub_group_d, dict):
+            port_obj_l = list()
+            for switch_wwn, port in sub_group_d['port_obj_l']:
+                switch_obj = proj_obj.r_switch_obj(switch_wwn)
+                port_obj = None if switch_obj is None else switch_obj.r_port_obj(port)
+                if port_obj is not None:
+                    port_obj_l.append(port_obj)
+            sub_group_d = sub_group_d.copy()
+            sub_group_d['port_obj_l'] = port_obj_l
+        rd[name] = sub_group_d
+    return rd
+
+
+def _peak_memory():
+    """Returns the peak resident memory of this process in bytes. None if not available (Windows). ru_maxrss is
+    platform dependent: KB on Linux and bytes on macOS. It is converted to bytes here."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024  # Linux reports KB, macOS reports bytes
+
+
+def _batch_init(proj_obj):
+    """Initializes a worker process for batch_report(). When processes are forked, the project is inherited from the
+    parent. Otherwise, it is pickled once for each worker process.
+
+    :param proj_obj: Project object
+    :type proj_obj: brcddb.classes.project.ProjectObj
+    """
+    global _batch_proj_obj
+
+    _batch_proj_obj = proj_obj
+
+
+def _batch_worker(job_d):
+    """Creates one workbook in a worker process. See batch_report()
+
+    :param job_d: Job. See shard_jobs(). group_d has been converted with _group_to_keys()
+    :type job_d: dict
+    :return: Dictionary with name, outf, time (seconds), peak_mem (bytes or None), and err_msg (None if no errors)
+    :rtype: dict
+    """
+    global _batch_proj_obj
+
+    start, proj_obj = time.time(), _batch_proj_obj
+    rd = dict(name=job_d.get('name'), outf=job_d['outf'], time=0, peak_mem=None, err_msg=None)
+    try:
+        error_flag = proj_obj.r_is_error()
+        report(proj_obj,
+               job_d['outf'],
+               group_d=_group_from_keys(proj_obj, job_d.get('group_d')),
+               streaming=job_d.get('streaming', False),
+               fab_l=job_d.get('fab_l'),
+               switch_l=job_d.get('switch_l'),
+               sheet_l=job_d.get('sheet_l'),
+               skip_l=job_d.get('skip_l'),
+               cache_dir=job_d.get('cache_dir'))
+        if not error_flag and proj_obj.r_is_error():
+            rd['err_msg'] = 'Error saving ' + job_d['outf']
+    except Exception as e:  # KeyboardInterrupt and SystemExit are not job errors
+        rd['err_msg'] = str(type(e)) + ': ' + str(e)
+    rd['time'], rd['peak_mem'] = time.time() - start, _peak_memory()
+
+    return rd
+
+
+def batch_report(proj_obj, job_l, max_workers=None, streaming=False, cache_dir=None):
+    """Creates multiple Excel reports in parallel. Each workbook is created with report() in its own worker process.
+
+    Call brcddb.brcddb_project.freeze() first so that the lookup tables are built once, in this process, rather than in
+    each worker. Where processes are forked (Linux), the workers share the project pages with this process. Otherwise,
+    the project is pickled for each worker. Each worker process creates a single workbook so that the peak memory
+    reported is for that workbook.
+
+    :param proj_obj: Project object
+    :type proj_obj: brcddb.classes.project.ProjectObj
+    :param job_l: Jobs. Each job is a dictionary with outf and, optionally, name, fab_l, group_d, switch_l, sheet_l,
+        and skip_l. See shard_jobs() and report()
+    :type job_l: list, tuple, dict
+    :param max_workers: Maximum number of worker processes. None: Use the number of processors
+    :type max_workers: int, None
+    :param streaming: Passed to report()
+    :type streaming: bool
+    :param cache_dir: Passed to report(). Only the workbooks with sheets that changed are rebuilt. See report()
+    :type cache_dir: None, str
+    :return: List of dictionaries, one for each job in job_l, with name, outf, time (seconds to create the workbook),
+        peak_mem (peak memory of the worker process in bytes, None if not available), and err_msg (None if no errors)
+    :rtype: list
+    """
+    job_l = gen_util.convert_to_list(job_l)
+    num_jobs, start = len(job_l), time.time()
+
+    # Port objects can't be passed to the workers without pickling the entire project so send keys instead.
+    worker_job_l = list()
+    for job_d in job_l:
+        worker_job_d = job_d.copy()
+        worker_job_d.update(group_d=_group_to_keys(job_d.get('group_d')), streaming=streaming, cache_dir=cache_dir)
+        worker_job_l.append(worker_job_d)
+
+    # Newer versions of Python don't fork by default so ask for it where it's safe to do so
+    ctx = multiprocessing.get_context('fork') if sys.platform.startswith('linux') else multiprocessing.get_context()
+    pool = ctx.Pool(processes=max_workers, initializer=_batch_init, initargs=(proj_obj,), maxtasksperchild=1)
+    try:
+        async_l = [pool.apply_async(_batch_worker, (job_d,)) for job_d in worker_job_l]
+        result_l = list()
+        for i in range(0, num_jobs):
+            try:
+                rd = async_l[i].get()
+            except Exception as e:  # Typically a worker process that terminated abruptly
+                rd = dict(name=job_l[i].get('name'), outf=job_l[i]['outf'], time=0, peak_mem=None,
+                          err_msg=str(type(e)) + ': ' + str(e))
+            result_l.append(rd)
+            buf = 'Created ' + str(i + 1) + ' of ' + str(num_jobs) + ': ' + rd['outf'] + ' in ' + \
+                  str(round(rd['time'], 2)) + ' sec'
+            if rd['peak_mem'] is not None:
+                buf += ', peak memory ' + str(round(rd['peak_mem'] / 1048576, 1)) + ' MB'
+            brcdapi_log.log(buf, echo=True)
+            if rd['err_msg'] is not None:
+                brcdapi_log.exception(['Error creating ' + rd['outf'], rd['err_msg']], echo=True)
+                proj_obj.s_error_flag()
+        pool.close()
+    except BaseException:
+        pool.terminate()  # Typically Ctrl-C. Don't wait for the remaining jobs.
+        raise
+    finally:
+        pool.join()
+    brcdapi_log.log('Created ' + str(num_jobs) + ' reports in ' + str(round(time.time() - start, 2)) + ' sec',
+                    echo=True)
+
+    return result_l
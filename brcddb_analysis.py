@@ -0,0 +1,356 @@
+"""
+Copyright 2023, 2024, 2025, 2026 Jack Consoli.  All rights reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+the License. You may also obtain a copy of the License at https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the specific
+language governing permissions and limitations under the License.
+
+The license is free for single customer use (internal applications). Use of this module in the production,
+redistribution, or service delivery for commerce requires an additional license. Contact jack_consoli@yahoo.com for
+details.
+
+**Description**
+
+Incremental re-analysis of a project. Instead of running build_xref(), zone_analysis(), best_practice(), and
+maps_dashboard_alerts() over the entire project every time data is added or refreshed, only the analysis affected by
+the data that changed is re-run.
+
+Every analyzer in _analyzer_d is declared with:
+
+    * The scope it is run for: the project, each chassis, each fabric, or each switch.
+    * The URIs it reads. None means any URI.
+
+brcddb.api.interface.results_action() records every URI added to a chassis or switch object in the project. See
+brcddb.classes.project.ProjectObj.s_data_changed(). When run() is called, an analyzer is re-run for a scope only if
+one of the URIs it reads changed for a switch in that scope. Data added to a chassis object affects all the logical
+switches in the chassis. A fabric is also re-analyzed when the switches in the fabric change.
+
+While an analyzer runs, the alerts it adds are recorded. Before an analyzer is re-run for a scope, the alerts it
+previously added for that scope are removed. Since alerts are only removed and added for the scopes re-analyzed, the
+alerts for everything else in the project are left as is.
+
+The dependencies are declared, not traced. Zone analysis looks for zone members in other fabrics so a login that moved
+from one fabric to another is only reflected in the zone analysis of a fabric whose own data changed. Use run(full=True)
+to re-analyze everything.
+
+AnalysisScheduler is for applications that keep a project in memory and add data to it repeatedly. The applications in
+brcddb.apps read or capture the data once and analyze it once so they still run the full analysis.
+
+**WARNING**
+
+This module imports brcddb.brcddb_bp. To avoid circular imports, this module should only be imported by applications.
+
+**Public Methods & Data**
+
++-----------------------+-------------------------------------------------------------------------------------------+
+| Method                | Description                                                                               |
++=======================+===========================================================================================+
+| AnalysisScheduler     | Runs the analyzers for a project and re-runs only those affected by data changes.         |
++-----------------------+-------------------------------------------------------------------------------------------+
+
+**Version Control**
+
++-----------+---------------+---------------------------------------------------------------------------------------+
+| Version   | Last Edit     | Description                                                                           |
++===========+===============+=======================================================================================+
+| 4.0.0     | 18 Oct 2026   | Initial launch                                                                        |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.1     | 18 Oct 2026   | Chassis and project best practices are checked in their own chassis and project       |
+|           |               | scopes                                                                                |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.2     | 18 Oct 2026   | Documented that AnalysisScheduler is for applications that add data to a project      |
+|           |               | repeatedly                                                                            |
++-----------+---------------+---------------------------------------------------------------------------------------+
+"""
+__author__ = 'Jack Consoli'
+__copyright__ = 'Copyright 2024, 2025, 2026 Jack Consoli'
+__date__ = '18 Oct 2026'
+__license__ = 'Apache License, Version 2.0'
+__email__ = 'jack_consoli@yahoo.com'
+__maintainer__ = 'Jack Consoli'
+__status__ = 'Released'
+__version__ = '4.0.2'
+
+import time
+import brcdapi.log as brcdapi_log
+import brcdapi.gen_util as gen_util
+import brcddb.classes.util as class_util
+import brcddb.brcddb_project as brcddb_project
+import brcddb.brcddb_fabric as brcddb_fabric
+import brcddb.util.maps as brcddb_maps
+import brcddb.brcddb_bp as brcddb_bp
+
+
+def _xref(proj_obj, param_d):
+    brcddb_project.build_xref(proj_obj)
+
+
+def _custom_search_terms(proj_obj, param_d):
+    brcddb_project.add_custom_search_terms(proj_obj)
+
+
+def _zone_analysis(fab_obj, param_d):
+    brcddb_fabric.zone_analysis(fab_obj)
+
+
+def _maps_dashboard(switch_obj, param_d):
+    brcddb_maps.maps_dashboard_alerts(switch_obj.r_project_obj(), switch_obj_l=[switch_obj])
+
+
+def _bp_check(proj_obj, param_d, **kwargs):
+    """Checks best practices for a subset of the project. Keyword arguments are the objects to check by simple class
+    type. See obj_d in brcddb.brcddb_bp.best_practice(). Class types not specified are not checked."""
+    obj_d = dict(ProjectObj=list(), ChassisObj=list(), FabricObj=list(), SwitchObj=list(), PortObj=list(),
+                 LoginObj=list())
+    obj_d.update(kwargs)
+    brcddb_bp.best_practice(param_d['bp_file'], param_d['sfp_file'], param_d['a_tbl'], proj_obj,
+                            bp_sheet=param_d['bp_sheet'], obj_d=obj_d)
+
+
+def _best_practice(fab_obj, param_d):
+    """Checks best practices for the fabric, switch, port, and login objects in a fabric. The zone analysis and MAPS
+    dashboard alerts for the fabric are done in brcddb.brcddb_bp.best_practice(). Chassis and project best practices
+    are checked by _best_practice_chassis() and _best_practice_project() so that their alerts don't belong to a fabric.
+    """
+    _bp_check(fab_obj.r_project_obj(),
+              param_d,
+              FabricObj=[fab_obj],
+              SwitchObj=fab_obj.r_switch_objects(),
+              PortObj=fab_obj.r_port_objects(),
+              LoginObj=fab_obj.r_login_objects())
+
+
+def _best_practice_chassis(chassis_obj, param_d):
+    """Checks best practices for a chassis"""
+    _bp_check(chassis_obj.r_project_obj(), param_d, ChassisObj=[chassis_obj])
+
+
+def _best_practice_project(proj_obj, param_d):
+    """Checks best practices for the project"""
+    _bp_check(proj_obj, param_d, ProjectObj=[proj_obj])
+
+
+# The analyzers in the order they are run. Key is the analyzer name. Value is a dict as follows:
+#   s       Scope. Simple class type, see brcddb.classes.util.get_simple_class_type(), of the object passed to 'a'
+#   a       Action. Called with the object for the scope and the dict passed as param_d to AnalysisScheduler
+#   u       URIs read by the analyzer. A URI matches if it begins with any of these. None matches all URIs
+#   bp      True: Only used when a best practice file is specified. False: Only used when it is not. None: Always used
+_zone_uri_l = ('brocade-zone/', 'brocade-name-server/', 'brocade-fdmi/', 'brocade-fabric/', 'brocade-interface/',
+               'brocade-fibrechannel-switch/', 'brocade-ficon/')
+_analyzer_d = dict(
+    xref=dict(s='ProjectObj', a=_xref, u=('brocade-name-server/', 'brocade-interface/', 'brocade-fabric/',
+                                          'brocade-fibrechannel-switch/'), bp=None),
+    custom_search_terms=dict(s='ProjectObj', a=_custom_search_terms, u=('brocade-interface/', 'brocade-media/'),
+                             bp=None),
+    zone_analysis=dict(s='FabricObj', a=_zone_analysis, u=_zone_uri_l, bp=False),
+    maps_dashboard=dict(s='SwitchObj', a=_maps_dashboard, u=('brocade-maps/',), bp=False),
+    best_practice=dict(s='FabricObj', a=_best_practice, u=None, bp=True),
+    best_practice_chassis=dict(s='ChassisObj', a=_best_practice_chassis, u=None, bp=True),
+    best_practice_project=dict(s='ProjectObj', a=_best_practice_project, u=None, bp=True),
+)
+
+
+def _uri_match(uri, uri_l):
+    """Determines if a URI matches any of the URIs read by an analyzer.
+
+    :param uri: URI (KPI) recorded in brcddb.classes.project.ProjectObj.s_data_changed()
+    :type uri: str
+    :param uri_l: URI prefixes. See 'u' in _analyzer_d
+    :type uri_l: list, tuple, None
+    :return: True if uri matches
+    :rtype: bool
+    """
+    if uri_l is None:
+        return True
+    buf = uri[len('running/'):] if uri.startswith('running/') else uri
+    for prefix in uri_l:
+        if buf.startswith(prefix):
+            return True
+    return False
+
+
+class AnalysisScheduler:
+    """Runs the analyzers for a project and re-runs only those affected by data changes.
+
+    Args:
+        * proj_obj (brcddb.classes.project.ProjectObj): Project object
+        * bp_file (str, None): Name of best practice file. If None, best practices are not checked. The zone analysis
+            and MAPS dashboard alerts are run by themselves instead.
+        * sfp_file (str, None): Name of file with SFP thresholds. See brcddb.brcddb_bp.best_practice()
+        * a_tbl (dict, None): Alert table. See brcddb.brcddb_bp.best_practice()
+        * bp_sheet (str, None): Name of sheet in bp_file to read. See brcddb.brcddb_bp.best_practice()
+
+    Attributes:
+        _proj_obj (ProjectObj): Project object
+        _param_d (dict): Passed to every analyzer
+        _analyzer_l (list): Names of the analyzers, keys in _analyzer_d, to run in the order they are run.
+        _alert_d (dict): Key is the tuple (analyzer name, scope key). Value is the list of (object, alert ID) tuples
+            for the alerts added when the analyzer was last run for the scope.
+        _member_d (dict): Key is the tuple (analyzer name, fabric key) for fabric scoped analyzers. Value is the tuple
+            of switch WWNs in the fabric when the analyzer was last run.
+        _run_d (dict): Key is the tuple (analyzer name, scope key). Value is the time the analyzer was last run.
+    """
+
+    def __init__(self, proj_obj, bp_file=None, sfp_file=None, a_tbl=None, bp_sheet=None):
+        global _analyzer_d
+
+        self._proj_obj = proj_obj
+        self._param_d = dict(bp_file=bp_file, sfp_file=sfp_file, a_tbl=a_tbl, bp_sheet=bp_sheet)
+        self._analyzer_l = [k for k, d in _analyzer_d.items() if d['bp'] is None or d['bp'] == bool(bp_file)]
+        self._alert_d = dict()
+        self._member_d = dict()
+        self._run_d = dict()
+
+    def _scope_objects(self, scope):
+        """Returns all the objects in the project for a scope
+
+        :param scope: Simple class type. See 's' in _analyzer_d
+        :type scope: str
+        :return: List of ProjectObj, ChassisObj, FabricObj, or SwitchObj
+        :rtype: list
+        """
+        if scope == 'ProjectObj':
+            return [self._proj_obj]
+        if scope == 'ChassisObj':
+            return self._proj_obj.r_chassis_objects()
+        if scope == 'FabricObj':
+            return self._proj_obj.r_fabric_objects()
+        return self._proj_obj.r_switch_objects()
+
+    def _scope_obj(self, scope, key):
+        """Returns the object for a scope key. See _scope_objects() for parameters. Returns None if it doesn't exist."""
+        if scope == 'ProjectObj':
+            return self._proj_obj
+        if scope == 'ChassisObj':
+            return self._proj_obj.r_chassis_obj(key)
+        if scope == 'FabricObj':
+            return self._proj_obj.r_fabric_obj(key)
+        return self._proj_obj.r_switch_obj(key)
+
+    def _changed_units(self, change_d):
+        """Determines which analyzers need to be re-run for which scopes
+
+        :param change_d: Data changes. See brcddb.classes.project.ProjectObj.r_data_changes()
+        :type change_d: dict
+        :return: Set of (analyzer name, scope key) tuples
+        :rtype: set
+        """
+        global _analyzer_d
+
+        rs = set()
+        proj_key = self._proj_obj.r_obj_key()
+        for obj, uri_l in change_d.items():
+            obj_type = class_util.get_simple_class_type(obj)
+            if obj_type == 'ChassisObj':
+                switch_obj_l = obj.r_switch_objects()
+            elif obj_type == 'SwitchObj':
+                switch_obj_l = [obj]
+            else:
+                switch_obj_l = list()
+            for name in self._analyzer_l:
+                analyzer_d = _analyzer_d[name]
+                if not any(_uri_match(uri, analyzer_d['u']) for uri in uri_l):
+                    continue
+                if analyzer_d['s'] == 'ProjectObj':
+                    rs.add((name, proj_key))
+                elif analyzer_d['s'] == 'ChassisObj':
+                    rs.update([(name, key) for key in
+                               gen_util.remove_none([obj.r_chassis_key() for obj in switch_obj_l if obj is not None])])
+                    if obj_type == 'ChassisObj':
+                        rs.add((name, obj.r_obj_key()))
+                for switch_obj in gen_util.remove_none(switch_obj_l):
+                    if analyzer_d['s'] == 'FabricObj':
+                        if switch_obj.r_fabric_key() is not None:
+                            rs.add((name, switch_obj.r_fabric_key()))
+                    elif analyzer_d['s'] == 'SwitchObj':
+                        rs.add((name, switch_obj.r_obj_key()))
+
+        # Fabrics whose switches changed and scopes that no longer exist
+        for name, key in self._run_d.keys():
+            scope_obj = self._scope_obj(_analyzer_d[name]['s'], key)
+            if scope_obj is None or \
+                    ((name, key) in self._member_d and self._member_d[(name, key)] != self._members(scope_obj)):
+                rs.add((name, key))
+
+        return rs
+
+    @staticmethod
+    def _members(fab_obj):
+        return tuple(sorted(fab_obj.r_switch_keys()))
+
+    def run(self, full=False):
+        """Runs the analyzers. The first time run() is called, all analyzers are run for everything in the project.
+        After that, only the analyzers affected by data changes are re-run.
+
+        :param full: If True, clear all alerts added by the analyzers and re-run everything.
+        :type full: bool
+        :return: List of (analyzer name, scope key) tuples for the analyzers run in the order they were run.
+        :rtype: list
+        """
+        global _analyzer_d
+
+        start_time = time.time()
+        change_d = self._proj_obj.s_clear_data_changes()
+        if full or len(self._run_d) == 0:
+            unit_s = set(self._run_d.keys())
+            for name in self._analyzer_l:
+                scope = _analyzer_d[name]['s']
+                for scope_obj in self._scope_objects(scope):
+                    unit_s.add((name, scope_obj.r_obj_key()))
+        else:
+            unit_s = self._changed_units(change_d)
+
+        # Remove the alerts added the last time the analyzers were run for the scopes that changed
+        del_l = list()
+        for unit in unit_s:
+            del_l.extend(self._alert_d.pop(unit, list()))
+            self._member_d.pop(unit, None)
+            self._run_d.pop(unit, None)
+        class_util.s_del_alerts(self._proj_obj, del_l)
+
+        # Run the analyzers
+        rl, alert_tbl = list(), self._proj_obj.r_alert_tbl()
+        for name in self._analyzer_l:
+            analyzer_d = _analyzer_d[name]
+            for key in sorted([unit[1] for unit in unit_s if unit[0] == name]):
+                scope_obj = self._scope_obj(analyzer_d['s'], key)
+                if scope_obj is None:
+                    continue  # The fabric or switch is no longer in the project
+                record_l = list()
+                prev_record_l = alert_tbl.s_record_alerts(record_l)
+                try:
+                    analyzer_d['a'](scope_obj, self._param_d)
+                finally:
+                    alert_tbl.s_record_alerts(prev_record_l)
+                self._alert_d[(name, key)] = record_l
+                if analyzer_d['s'] == 'FabricObj':
+                    self._member_d[(name, key)] = self._members(scope_obj)
+                self._run_d[(name, key)] = time.time()
+                rl.append((name, key))
+
+        brcdapi_log.log('Analysis: ' + str(len(rl)) + ' analyzers run, ' + str(len(del_l)) + ' alerts removed, ' +
+                        str(round(time.time() - start_time, 3)) + ' seconds.', echo=True)
+        return rl
+
+    def r_alerts(self, name, key):
+        """Returns the alerts added the last time an analyzer was run for a scope
+
+        :param name: Analyzer name. See _analyzer_d
+        :type name: str
+        :param key: Scope key. Project name, chassis WWN, fabric WWN, or switch WWN
+        :type key: str
+        :return: List of (object, alert ID) tuples. Empty if the analyzer hasn't been run for the scope.
+        :rtype: list
+        """
+        return self._alert_d.get((name, key), list())
+
+    def r_last_run(self, name, key):
+        """Returns the time an analyzer was last run for a scope. See r_alerts() for parameters
+
+        :return: Time as returned from time.time(). None if the analyzer hasn't been run for the scope.
+        :rtype: float, None
+        """
+        return self._run_d.get((name, key))
@@ -59,17 +59,29 @@ imported by applications uses the brcddb libraries not no any of the library mod
 +-----------+---------------+---------------------------------------------------------------------------------------+
 | 4.0.7     | 20 Feb 2026   | Updated copyright notice.                                                             |
 +-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.8     | 18 Oct 2026   | ISL rules read from the fabric ISL topology                                           |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.9     | 18 Oct 2026   | Added obj_d to best_practice(). The best practice and SFP rule files are only read    |
+|           |               | when they change. Identical alerts are not added twice.                               |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.0     | 18 Oct 2026   | _isl_num_links() counts the ISLs in each trunk group. SWITCH_ISL_IMBALANCE alerts are |
+|           |               | now raised when trunk groups between two switches are not balanced                    |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.1     | 18 Oct 2026   | Duplicate alerts are only skipped when obj_d is specified. The rules cache is keyed   |
+|           |               | by file and sheet.                                                                    |
++-----------+---------------+---------------------------------------------------------------------------------------+
 """
 __author__ = 'Jack Consoli'
 __copyright__ = 'Copyright 2024, 2025, 2026 Jack Consoli'
-__date__ = '20 Feb 2026'
+__date__ = '18 Oct 2026'
 __license__ = 'Apache License, Version 2.0'
 __email__ = 'jack_consoli@yahoo.com'
 __maintainer__ = 'Jack Consoli'
 __status__ = 'Released'
-__version__ = '4.0.7'
+__version__ = '4.1.1'
 
 import collections
+import os
 import brcdapi.log as brcdapi_log
 import brcdapi.gen_util as gen_util
 import brcdapi.util as brcdapi_util
@@ -87,8 +99,10 @@ import brcddb.brcddb_fabric as brcddb_fabric
 import brcddb.util.compare as brcddb_compare
 
 _high_temp_error, _high_temp_warn = 1000, 1000  # Default. Effectively disables high temp checking.
-_sfp_rules, _sfp_file = None, None
+_sfp_rules, _sfp_file, _sfp_time = None, None, None
 _alert_tbl_d = dict()
+_bp_rules_d = dict()  # Key is (bp_file, bp_sheet). Value is (modification time, list from _read_bp_workbook())
+_incremental = False  # True when best_practice() is called for a subset of the project. See obj_d in best_practice()
 
 is_no_light = dict(k=brcdapi_util.fc_state, t='exact', v='no_light')
 is_asn = dict(k=brcdapi_util.fc_auto_neg, t='bool', v=True)
@@ -199,27 +213,22 @@ _remote_rule_template = {
 }
 
 
-def _amp_in_switch_pair(switch_pair):
-    """Determines if either switch in a switch pair from FabricObj.r_isl_map() is an AMP
+def _amp_in_switch_pair(isl_topology, switch_wwn, ds_wwn):
+    """Determines if either switch in a switch pair is an AMP
 
     There is no guarantee that each switch was polled, so you can't rely on knowing the switch type. In fact, AMP
     probably isn't ever polled. brcddb_fabric.zone_analysis() adds an alert to logins if the login is to an AMP
     unit. So we spin through all the logins associated with the ports to determine if any of them are an AMP.
-    :param switch_pair: Dictionary of switches and trunks as returned from brcddb.classes.switch.c_trunk_map()
-    :type switch_pair: dict
+    :param isl_topology: ISL topology for the fabric. See brcddb.classes.fabric.FabricObj.r_isl_topology()
+    :type isl_topology: brcddb.classes.isl.IslTopology
+    :param switch_wwn: Switch WWN
+    :type switch_wwn: str
+    :param ds_wwn: Neighbor switch WWN
+    :type ds_wwn: str
     :return: True if any of the ports are connected to an AMP
     :rtype: bool
     """
-    for k in switch_pair.keys():
-        tl = switch_pair.get(k)
-        for i in range(0, len(tl)):
-            for x in range(0, 2):
-                if tl[i][x] is not None:
-                    for login_obj in tl[i][x].r_login_objects():
-                        for alert_obj in login_obj.r_alert_objects():
-                            if alert_obj.alert_num() == al.ALERT_NUM.LOGIN_AMP:
-                                return True
-    return False
+    return isl_topology.r_is_amp(switch_wwn, ds_wwn, al.ALERT_NUM.LOGIN_AMP)
 
 
 ############################################################
@@ -230,6 +239,9 @@ def _amp_in_switch_pair(switch_pair):
 def _isl_num_links(rule, switch_obj_l, t_obj):
     """Check to see if the number of ISL in each trunk group is the same (balanced)
 
+    Prior to version 4.0.8, each ISL was counted as a trunk group with 2 links so SWITCH_ISL_IMBALANCE was never
+    raised. It is now raised whenever the trunk groups between two switches have a different number of ISLs.
+
     :param rule: Rule name or alert number
     :type rule: str, int
     :param switch_obj_l: List of switch objects
@@ -240,19 +252,12 @@ def _isl_num_links(rule, switch_obj_l, t_obj):
     global _alert_tbl_d
 
     for switch_obj in switch_obj_l:
-
-        proj_obj = switch_obj.r_project_obj()
-        isl_map = switch_obj.c_trunk_map()
-        for k in isl_map.keys():
-            switch_pair = isl_map.get(k)
-            if _amp_in_switch_pair(switch_pair):
+        proj_obj, switch_wwn, isl_topology = switch_obj.r_project_obj(), switch_obj.r_obj_key(), \
+            switch_obj.r_isl_topology()
+        for k in isl_topology.r_neighbor_keys(switch_wwn):
+            if _amp_in_switch_pair(isl_topology, switch_wwn, k):
                 continue
-            isls_per_trunk = list()
-            for k1 in switch_pair.keys():
-                tl = switch_pair.get(k1)
-                for trunk in tl:
-                    isls_per_trunk.append(len(trunk))
-            if len(gen_util.remove_duplicates(isls_per_trunk)) > 1:
+            if len(gen_util.remove_duplicates(isl_topology.r_links_per_trunk(switch_wwn, k))) > 1:
                 switch_obj.s_add_alert(_alert_tbl_d,
                                        al.ALERT_NUM.SWITCH_ISL_IMBALANCE,
                                        key='trunk',
@@ -265,22 +270,12 @@ def _isl_bw(rule, switch_obj_l, t_obj):
     global _alert_tbl_d
 
     for switch_obj in switch_obj_l:
-
-        proj_obj = switch_obj.r_project_obj()
-        isl_map = switch_obj.c_trunk_map()
-        for k in isl_map.keys():
-            switch_pair = isl_map.get(k)
-            if _amp_in_switch_pair(switch_pair):
+        proj_obj, switch_wwn, isl_topology = switch_obj.r_project_obj(), switch_obj.r_obj_key(), \
+            switch_obj.r_isl_topology()
+        for k in isl_topology.r_neighbor_keys(switch_wwn):
+            if _amp_in_switch_pair(isl_topology, switch_wwn, k):
                 continue
-            speeds = list()
-            for k1 in switch_pair.keys():
-                try:
-                    s = switch_pair.get(k1)[0][0].r_get('fibrechannel/speed')
-                    if s is not None:
-                        speeds.append(s)
-                except TypeError:
-                    pass  # We get here if all switches in the project were not polled
-            if len(gen_util.remove_duplicates(speeds)) > 1:
+            if len(gen_util.remove_duplicates(isl_topology.r_master_speeds(switch_wwn, k))) > 1:
                 switch_obj.s_add_alert(_alert_tbl_d,
                                        al.ALERT_NUM.SWITCH_ISL_BW,
                                        key='trunk',
@@ -294,19 +289,13 @@ def _isl_fru(rule, obj_l, t_obj):
     global _alert_tbl_d
 
     for switch_obj in obj_l:
-        proj_obj = switch_obj.r_project_obj()
-        isl_map = switch_obj.c_trunk_map()
-        for k in isl_map.keys():
-            switch_pair = isl_map.get(k)
-            if _amp_in_switch_pair(switch_pair):
+        proj_obj, switch_wwn, isl_topology = switch_obj.r_project_obj(), switch_obj.r_obj_key(), \
+            switch_obj.r_isl_topology()
+        for k in isl_topology.r_neighbor_keys(switch_wwn):
+            if _amp_in_switch_pair(isl_topology, switch_wwn, k):
                 continue
-            slots = list()
-            for k1 in switch_pair.keys():
-                tl = switch_pair.get(k1)
-                for trunk in tl:
-                    if trunk[0] is not None:
-                        slots.append(trunk[0].r_obj_key().split('/')[0])
-            if len(gen_util.remove_duplicates(slots)) == 1 and slots[0] != '0':
+            slots = isl_topology.r_frus(switch_wwn, k)
+            if len(slots) == 1 and slots[0] != '0':
                 switch_obj.s_add_alert(_alert_tbl_d,
                                        al.ALERT_NUM.SWITCH_ISL_FRU,
                                        key='trunk',
@@ -319,16 +308,15 @@ def _isl_redundant(rule, switch_obj_l, t_obj):
     global _alert_tbl_d
 
     for switch_obj in switch_obj_l:
-        proj_obj = switch_obj.r_project_obj()
-        isl_map = switch_obj.c_trunk_map()
-        for k in isl_map.keys():
-            switch_pair = isl_map.get(k)
-            if _amp_in_switch_pair(switch_pair):
+        proj_obj, switch_wwn, isl_topology = switch_obj.r_project_obj(), switch_obj.r_obj_key(), \
+            switch_obj.r_isl_topology()
+        for k in isl_topology.r_neighbor_keys(switch_wwn):
+            if _amp_in_switch_pair(isl_topology, switch_wwn, k):
                 continue
-            if len(list(switch_pair.keys())) == 1:
+            if len(isl_topology.r_trunk_groups(switch_wwn, k)) == 1:
                 switch_obj.s_add_alert(_alert_tbl_d,
                                        al.ALERT_NUM.SWITCH_ISL_REDUNDANT,
-                                       k='trunk',
+                                       key='trunk',
                                        p0=brcddb_switch.best_switch_name(switch_obj),
                                        p1=brcddb_switch.best_switch_name(proj_obj.r_switch_obj(k)))
 
@@ -591,7 +579,8 @@ def _set_high_temp_warn(rule, obj_list, test_list):
 def _group_speed(rule, obj_l, test_list):
     """Make sure all ports of a group logged in at the same speed. See _isl_num_links() for parameters"""
 
-    global _alert_tbl_d
+    global _alert_tbl_d, _incremental
+
     for proj_obj in obj_l:  # When written, there could only be one project in this list.
         for group_name, sub_group_d in proj_obj.r_get('report_app/group_d', dict()).items():
             max_group_speed_l = [obj.r_get(brcdapi_util.fc_speed) for obj in sub_group_d['port_obj_l']]
@@ -599,13 +588,17 @@ def _group_speed(rule, obj_l, test_list):
                 max_group_speed = max(max_group_speed_l)
                 for port_obj in sub_group_d['port_obj_l']:
                     port_speed = port_obj.r_get(brcdapi_util.fc_speed)
-                    if port_speed != max_group_speed:
-                        port_obj.s_add_alert(
-                            _alert_tbl_d,
-                            al.ALERT_NUM.GROUP_SPEED_NOT_MAX,
-                            p0=port_speed,
-                            p1=group_name
-                        )
+                    if port_speed == max_group_speed:
+                        continue
+                    if _incremental and brcddb_util.has_alert(port_obj, al.ALERT_NUM.GROUP_SPEED_NOT_MAX, None,
+                                                              port_speed, group_name):
+                        continue  # Already added when this port was checked in a previous incremental call
+                    port_obj.s_add_alert(
+                        _alert_tbl_d,
+                        al.ALERT_NUM.GROUP_SPEED_NOT_MAX,
+                        p0=port_speed,
+                        p1=group_name
+                    )
 
 
 def _max_zone_participation(rule, obj_l, t_obj):
@@ -620,7 +613,7 @@ def _max_zone_participation(rule, obj_l, t_obj):
 
 def _check_best_practice(rule, obj_l, t_obj):
     """Simple best practice check. See _isl_num_links() for parameters."""
-    global _alert_tbl_d
+    global _alert_tbl_d, _incremental
 
     for obj in brcddb_search.match_test(obj_l, t_obj.get('l'), t_obj.get('logic')):
         px_d = dict(p0=None, p1=None)
@@ -642,7 +635,10 @@ def _check_best_practice(rule, obj_l, t_obj):
                               'Object key: ' + obj.r_obj_key() + ', Object type: ' + str(type(obj))]
                         brcdapi_log.exception(ml, echo=True)
 
-        obj.s_add_alert(_alert_tbl_d, rule, key=t_obj.get('key'), p0=px_d['p0'], p1=px_d['p1'])
+        # Objects such as a chassis can be checked more than once when best_practice() is called for a subset of the
+        # project. See obj_d in best_practice()
+        if not (_incremental and brcddb_util.has_alert(obj, rule, t_obj.get('key'), px_d['p0'], px_d['p1'])):
+            obj.s_add_alert(_alert_tbl_d, rule, key=t_obj.get('key'), p0=px_d['p0'], p1=px_d['p1'])
 
 
 def _fdmi_enabled(rule, obj_l, t_obj):
@@ -896,7 +892,15 @@ _bp_tbl_d = {
 }
 
 
-def best_practice(bp_file, sfp_file, a_tbl, proj_obj, bp_sheet=None):
+def _file_time(file):
+    """Returns the modification time of a file. None if the file is None or doesn't exist"""
+    try:
+        return None if file is None else os.path.getmtime(file)
+    except OSError:
+        return None
+
+
+def best_practice(bp_file, sfp_file, a_tbl, proj_obj, bp_sheet=None, obj_d=None):
     """Checks for defined conditions and adds an alert for every out of bounds condition.
 
     :param bp_file: Name of best practice file
@@ -909,24 +913,37 @@ def best_practice(bp_file, sfp_file, a_tbl, proj_obj, bp_sheet=None):
     :type proj_obj: brcddb.classes.project.ProjectObj
     :param bp_sheet: Name of sheet in bp_file to read. If None, defaults to "active"
     :type bp_sheet: str, None
+    :param obj_d: Objects to check. Key is the simple class type, 'ProjectObj', 'ChassisObj', 'FabricObj', 'SwitchObj',
+        'PortObj', and 'LoginObj'. Value is the list of objects. If None, all objects in proj_obj are checked. Used by
+        brcddb.brcddb_analysis to check only the objects whose data changed. Alerts already added to an object are
+        not added again only when obj_d is specified.
+    :type obj_d: dict, None
     """
-    global _alert_tbl_d, _bp_tbl_d, _sfp_file, _sfp_rules
+    global _alert_tbl_d, _bp_tbl_d, _sfp_file, _sfp_rules, _sfp_time, _bp_rules_d, _incremental
 
     _alert_tbl_d = a_tbl  # I could have handled this better, but I'm not fixing working code.
-    if sfp_file is not None:
-        _sfp_file = sfp_file
+    _incremental = obj_d is not None
+
+    # When called for a subset of the project, best_practice() is called repeatedly so only read the files if they
+    # changed.
+    if sfp_file is not None and (sfp_file != _sfp_file or _file_time(sfp_file) != _sfp_time):
+        _sfp_file, _sfp_time = sfp_file, _file_time(sfp_file)
         _sfp_rules = report_utils.parse_sfp_file(sfp_file)
-    obj_d = dict(
-        ProjectObj=[proj_obj],
-        ChassisObj=proj_obj.r_chassis_objects(),
-        FabricObj=proj_obj.r_fabric_objects(),
-        SwitchObj=proj_obj.r_switch_objects(),
-        PortObj=proj_obj.r_port_objects(),
-        LoginObj=proj_obj.r_login_objects(),
-    )
+    bp_key, bp_time = (bp_file, bp_sheet), _file_time(bp_file)
+    if bp_key not in _bp_rules_d or _bp_rules_d[bp_key][0] != bp_time:
+        _bp_rules_d[bp_key] = (bp_time, _read_bp_workbook(bp_file, bp_sheet))
+    if obj_d is None:
+        obj_d = dict(
+            ProjectObj=[proj_obj],
+            ChassisObj=proj_obj.r_chassis_objects(),
+            FabricObj=proj_obj.r_fabric_objects(),
+            SwitchObj=proj_obj.r_switch_objects(),
+            PortObj=proj_obj.r_port_objects(),
+            LoginObj=proj_obj.r_login_objects(),
+        )
 
     brcdapi_log.log('Checking best practices', echo=True)
-    for rule in _read_bp_workbook(bp_file, bp_sheet):
+    for rule in _bp_rules_d[bp_key][1]:
         rule_d = _bp_tbl_d[rule.split('(')[0]] if isinstance(rule, str) else _bp_tbl_d[rule]
         try:
             rule_d['a'](rule, obj_d[rule_d['d']], rule_d.get('t'))
@@ -934,4 +951,4 @@ def best_practice(bp_file, sfp_file, a_tbl, proj_obj, bp_sheet=None):
             brcdapi_log.exception('Programming error. Improperly formatted rule, ' + rule + ', in _bp_tbl_d.',
                                   echo=True)
 
-    brcddb_maps.maps_dashboard_alerts(proj_obj)
+    brcddb_maps.maps_dashboard_alerts(proj_obj, switch_obj_l=obj_d['SwitchObj'])
@@ -70,19 +70,22 @@ Methods and tables to support the class ChassisObj.
 +-----------+---------------+---------------------------------------------------------------------------------------+
 | 4.0.9     | 20 Feb 2026   | Updated copyright notice.                                                             |
 +-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.0     | 18 Oct 2026   | best_chassis_name() caches the name in the chassis object                             |
++-----------+---------------+---------------------------------------------------------------------------------------+
 """
 __author__ = 'Jack Consoli'
 __copyright__ = 'Copyright 2024, 2025, 2026 Jack Consoli'
-__date__ = '20 Feb 2026'
+__date__ = '18 Oct 2026'
 __license__ = 'Apache License, Version 2.0'
 __email__ = 'jack_consoli@yahoo.com'
 __maintainer__ = 'Jack Consoli'
 __status__ = 'Released'
-__version__ = '4.0.9'
+__version__ = '4.1.0'
 
 import time
 import brcdapi.log as brcdapi_log
 import brcdapi.util as brcdapi_util
+import brcddb.classes.util as class_util
 
 
 class Found(Exception):
@@ -476,7 +479,8 @@ def blade_name(blade_id):
 
 
 def best_chassis_name(chassis_obj, wwn=False):
-    """Returns the chassis name, if available. Otherwise, the WWN for the chassis
+    """Returns the chassis name, if available. Otherwise, the WWN for the chassis. The name is cached in the chassis
+    object until data in the project changes.
 
     :param chassis_obj: Chassis Object
     :type chassis_obj: brcddb_classes.chassis.ChassisObj
@@ -487,8 +491,13 @@ def best_chassis_name(chassis_obj, wwn=False):
     """
     if chassis_obj is None:
         return 'Unknown'
-    buf = chassis_obj.r_get(brcdapi_util.bc_user_name)
-    return chassis_obj.r_obj_key() if buf is None else buf + ' (' + chassis_obj.r_obj_key() + ')' if wwn else buf
+    k = bool(wwn)
+    rbuf = class_util.r_cached_name(chassis_obj, k)
+    if rbuf is None:
+        buf = chassis_obj.r_get(brcdapi_util.bc_user_name)
+        rbuf = chassis_obj.r_obj_key() if buf is None else buf + ' (' + chassis_obj.r_obj_key() + ')' if wwn else buf
+        class_util.s_cached_name(chassis_obj, k, rbuf)
+    return rbuf
 
 
 def chassis_type(chassis_obj, type_num=False, oem='brcd'):
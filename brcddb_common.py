@@ -38,15 +38,17 @@ associated with.
 +-----------+---------------+---------------------------------------------------------------------------------------+
 | 4.0.6     | 20 Feb 2026   | Updated copyright notice.                                                             |
 +-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.7     | 18 Oct 2026   | Added project_frozen                                                                  |
++-----------+---------------+---------------------------------------------------------------------------------------+
 """
 __author__ = 'Jack Consoli'
 __copyright__ = 'Copyright 2024, 2025, 2026 Jack Consoli'
-__date__ = '04 Dec 2025'
+__date__ = '18 Oct 2026'
 __license__ = 'Apache License, Version 2.0'
 __email__ = 'jack_consoli@yahoo.com'
 __maintainer__ = 'Jack Consoli'
 __status__ = 'Released'
-__version__ = '4.0.6'
+__version__ = '4.0.7'
 
 import brcdapi.util as brcdapi_util
 
@@ -67,8 +69,10 @@ project_user_error = project_api_error << 1   # Encountered a non-recoverable er
 # If you add any warn or error flags, add it to project_error_warn_mask. The copy utility
 project_error_warn_mask = project_warn | project_api_warn | project_user_warn | project_error | project_api_error \
     | project_user_error
+# project_frozen is not a warn or error flag. It is set by ProjectObj.freeze() and is not copied by the copy utility
+project_frozen = project_user_error << 1
 # WARNING: If you add a new flag, make sure you update _project_next_avail
-project_next_avail = project_user_error << 1
+project_next_avail = project_frozen << 1
 
 # Exit codes - see _user_friendly_exit_codes
 EXIT_STATUS_OK = 0
@@ -46,6 +46,8 @@ details.
 +-----------------------+-------------------------------------------------------------------------------------------+
 | zone_merge_group      | Determines all logins that would be effected a result of removing a WWN from a fabric     |
 +-----------------------+-------------------------------------------------------------------------------------------+
+| zone_merge_groups     | Determines the zone merge groups for all zones in a fabric                                |
++-----------------------+-------------------------------------------------------------------------------------------+
 | zone_by_target        | Finds all servers in the effective zone that are zoned to each target, does a speed check,|
 |                       | and adds _zoned_servers to each target login object. _zoned_servers is a dictionary.      |
 |                       | Key = server WWN, value = list of zones that server and target are in.                    |
@@ -78,15 +80,32 @@ details.
 +-----------+---------------+---------------------------------------------------------------------------------------+
 | 4.0.9     | 20 Feb 2026   | Added additional debug information for exceptions.                                    |
 +-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.0     | 18 Oct 2026   | Added zone_merge_groups(). zone_merge_group() uses the zone merge groups instead of   |
+|           |               | recursion.                                                                            |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.1     | 18 Oct 2026   | alias_analysis() and zone_analysis() use reverse reference tables instead of scanning |
+|           |               | all zones and aliases                                                                 |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.2     | 18 Oct 2026   | check_ficon_zoning() uses the FICON lookup tables                                     |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.3     | 18 Oct 2026   | Use the project alert index in login speed checks                                     |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.4     | 18 Oct 2026   | best_fab_name() caches the name in the fabric object                                  |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.5     | 18 Oct 2026   | Documented the zone_merge_group() output change                                       |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.6     | 18 Oct 2026   | zone_merge_groups() and zone_merge_group() only use the effective zones unless        |
+|           |               | defined is True                                                                       |
++-----------+---------------+---------------------------------------------------------------------------------------+
 """
 __author__ = 'Jack Consoli'
 __copyright__ = 'Copyright 2023, 2024, 2025, 2026 Jack Consoli'
-__date__ = '20 Feb 2026'
+__date__ = '18 Oct 2026'
 __license__ = 'Apache License, Version 2.0'
 __email__ = 'jack_consoli@yahoo.com'
 __maintainer__ = 'Jack Consoli'
 __status__ = 'Released'
-__version__ = '4.0.9'
+__version__ = '4.1.6'
 
 import brcdapi.log as brcdapi_log
 import brcdapi.util as brcdapi_util
@@ -100,6 +119,7 @@ import brcddb.brcddb_port as brcddb_port
 import brcddb.util.iocp as brcddb_iocp
 import brcddb.brcddb_zone as brcddb_zone
 import brcddb.brcddb_fabric as brcddb_fabric
+import brcddb.classes.util as class_util
 
 _check_d = dict(peer_property=False,
                 zone_mismatch=False,
@@ -140,7 +160,7 @@ def set_bp_check(key, val):
 
 def best_fab_name(fab_obj, wwn=False, fid=False):
     """Returns the user-friendly fabric name, optionally with the WWN of just the WWN if a user-friendly name wasn't
-    defined.
+    defined. The name is cached in the fabric object until data in the project changes.
 
     :param fab_obj: Fabric object
     :type fab_obj: FabricObj
@@ -153,6 +173,10 @@ def best_fab_name(fab_obj, wwn=False, fid=False):
     """
     if fab_obj is None:
         return 'Unknown'
+    k = (bool(wwn), bool(fid))
+    rbuf = class_util.r_cached_name(fab_obj, k)
+    if rbuf is not None:
+        return rbuf
     rbuf = fab_obj.r_obj_key()
     for switch_obj in fab_obj.r_switch_objects():  # The fabric information is stored with the switch
         buf = switch_obj.r_get(brcdapi_util.bfs_fab_user_name)
@@ -161,7 +185,7 @@ def best_fab_name(fab_obj, wwn=False, fid=False):
             break
     rbuf += ' (' + ', '.join([str(i) for i in fab_fids(fab_obj)]) + ')' if fid else ''
 
-    return rbuf
+    return class_util.s_cached_name(fab_obj, k, rbuf)
 
 
 def switch_for_did(fab_obj, did):
@@ -184,7 +208,54 @@ def switch_for_did(fab_obj, did):
     return None
 
 
-def alias_analysis(fabric_obj):
+def _zone_ref_d(fab_obj):
+    """Internal for zone_analysis() and alias_analysis(). Builds the reverse reference tables for the defined zoning in
+    a single pass so that the analysis doesn't have to scan every zone or alias for each member.
+
+    :param fab_obj: brcddb fabric object
+    :type fab_obj: brcddb.classes.fabric.FabricObj
+    :return: alias_zone_d: Key is the alias name. Value is the list of zone objects using the alias.
+             mem_alias_d: Key is an alias member (WWN or d,i). Value is the list of alias names the member is in.
+             zoned_d: Key is a zone member (WWN or d,i) used in a zone directly or by alias. Value is always True.
+             zone_cfg_d: Key is the zone name. Value is the list of defined zone configuration names using the zone.
+    :rtype: dict
+    """
+    alias_zone_d = {alias: list() for alias in fab_obj.r_alias_keys()}
+    mem_alias_d, zoned_d, zone_cfg_d = dict(), dict(), dict()
+
+    for alias_obj in fab_obj.r_alias_objects():
+        for mem in alias_obj.r_members():
+            alias_l = mem_alias_d.get(mem)
+            if alias_l is None:
+                mem_alias_d[mem] = [alias_obj.r_obj_key()]
+            else:
+                alias_l.append(alias_obj.r_obj_key())
+
+    for zone_obj in fab_obj.r_zone_objects():
+        for mem in gen_util.remove_duplicates(zone_obj.r_members() + zone_obj.r_pmembers()):
+            zoned_d[mem] = True
+            zone_l = alias_zone_d.get(mem)
+            if zone_l is not None:
+                zone_l.append(zone_obj)
+
+    for alias_obj in fab_obj.r_alias_objects():
+        if len(alias_zone_d[alias_obj.r_obj_key()]) > 0:
+            for mem in alias_obj.r_members():
+                zoned_d[mem] = True
+
+    for zonecfg_obj in fab_obj.r_zonecfg_objects():
+        if zonecfg_obj.r_obj_key() != '_effective_zone_cfg':
+            for zone in zonecfg_obj.r_members():
+                cfg_l = zone_cfg_d.get(zone)
+                if cfg_l is None:
+                    zone_cfg_d[zone] = [zonecfg_obj.r_obj_key()]
+                else:
+                    cfg_l.append(zonecfg_obj.r_obj_key())
+
+    return dict(alias_zone_d=alias_zone_d, mem_alias_d=mem_alias_d, zoned_d=zoned_d, zone_cfg_d=zone_cfg_d)
+
+
+def alias_analysis(fabric_obj, ref_d=None):
     """Analyzes the aliases in each fabric and adds an alert if any of the following conditions exist:
     * There are multiple identical aliases
     * The alias is not used
@@ -192,11 +263,26 @@ def alias_analysis(fabric_obj):
 
     :param fabric_obj: brcddb fabric object
     :type fabric_obj: brcddb.classes.fabric.FabricObj
+    :param ref_d: Reverse reference tables returned from _zone_ref_d(). If None, they are built here.
+    :type ref_d: dict, None
     """
+    alias_zone_d = (_zone_ref_d(fabric_obj) if ref_d is None else ref_d)['alias_zone_d']
     alias_list = fabric_obj.r_alias_objects()
+
+    # Group the single member aliases by member. Keeping it simple by only checking 1 member per alias
+    dup_d = dict()
     for a_obj in alias_list:
         alias_members = a_obj.r_members()
-        zone_list = a_obj.r_zone_objects()
+        if len(alias_members) == 1:
+            name_l = dup_d.get(alias_members[0])
+            if name_l is None:
+                dup_d[alias_members[0]] = [a_obj.r_obj_key()]
+            else:
+                name_l.append(a_obj.r_obj_key())
+
+    for a_obj in alias_list:
+        alias_members = a_obj.r_members()
+        zone_list = alias_zone_d[a_obj.r_obj_key()]
         if len(zone_list) == 0:  # is the alias used?
             a_obj.s_add_alert(al.AlertTable.alertTbl, al.ALERT_NUM.ZONE_ALIAS_NOT_USED, None, None, None)
         if len(alias_members) == 0:  # Does the alias have any members?
@@ -205,13 +291,9 @@ def alias_analysis(fabric_obj):
             else:
                 a_obj.s_add_alert(al.AlertTable.alertTbl, al.ALERT_NUM.ZONE_NULL_ALIAS_USED, None,
                                   ', '.join([zone_obj.r_obj_key() for zone_obj in zone_list]), None)
-        elif len(alias_members) == 1:  # Duplicate alias? Keeping it simple by only checking 1 member per alias
+        elif len(alias_members) == 1:  # Duplicate alias?
             alias_name = a_obj.r_obj_key()
-            bl = list()
-            for c_obj in alias_list:
-                if c_obj.r_obj_key() != alias_name and len(c_obj.r_members()) == 1 and \
-                        alias_members[0] == c_obj.r_members()[0]:
-                    bl.append(c_obj.r_obj_key())
+            bl = [name for name in dup_d[alias_members[0]] if name != alias_name]
             if len(bl) > 0:
                 a_obj.s_add_alert(al.AlertTable.alertTbl, al.ALERT_NUM.ZONE_DUP_ALIAS, None, ', '.join(bl),
                                   a_obj.r_members()[0])
@@ -223,6 +305,9 @@ def check_ficon_zoning(fabric_obj):
     :param fabric_obj: brcddb fabric object
     :type fabric_obj: brcddb.classes.fabric.FabricObj
     """
+    # When there is only one switch in the fabric, the DID is used to convert link addresses to FC addresses
+    did = fabric_obj.r_switch_objects()[0].r_did() if len(fabric_obj.r_switch_keys()) == 1 else None
+
     for iocp_obj in fabric_obj.r_project_obj().r_iocp_objects():
         cec_sn = iocp_obj.r_obj_key()  # The SN is always the same for each IOCP
         for chpid_obj in iocp_obj.r_path_objects():  # For every defined path
@@ -243,7 +328,6 @@ def check_ficon_zoning(fabric_obj):
                             continue  # It's CUP which is a virtual port so skip it.
 
                 # Get the FC address
-                did = fabric_obj.r_switch_objects()[0].r_did() if len(fabric_obj.r_switch_keys()) == 1 else None
                 switch_id = chpid_obj.r_switch_id() if did is None else None
                 fc_addr = brcddb_iocp.link_addr_to_fc_addr(link_addr, switch_id=switch_id, did=did, leading_0x=True)
 
@@ -312,14 +396,13 @@ def zone_by_target(fab_obj):
                 s_speed_l.append(dict(obj=s_login_obj, s=x))
 
         # Perform speed checks and add alerts when applicable
-        alert_l = [obj.alert_num() for obj in t_login_obj.r_alert_objects()]
         speed_l = [d['s'] for d in s_speed_l]
         if len(speed_l) > 0:
             max_s_speed = max(speed_l)
             min_s_speed = min(speed_l)
-            if min_s_speed != max_s_speed and al.ALERT_NUM.LOGIN_MIXED_SPEED_T not in alert_l:
+            if min_s_speed != max_s_speed and t_login_obj.r_alert_obj(al.ALERT_NUM.LOGIN_MIXED_SPEED_T) is None:
                 t_login_obj.s_add_alert(al.AlertTable.alertTbl, al.ALERT_NUM.LOGIN_MIXED_SPEED_T)
-            if max_s_speed > t_speed and al.ALERT_NUM.LOGIN_FASTER_S not in alert_l:
+            if max_s_speed > t_speed and t_login_obj.r_alert_obj(al.ALERT_NUM.LOGIN_FASTER_S) is None:
                 t_login_obj.s_add_alert(al.AlertTable.alertTbl, al.ALERT_NUM.LOGIN_FASTER_S)
 
     return
@@ -343,6 +426,7 @@ def zone_analysis(fab_obj):
     * Duplicate aliases
     * WWN instead of an alias used in zone definition when an alias for the WWN exists
     * Calls check_ficon_zoning() - Ensures all CHPID paths are in the same zone as the CHPID
+    * Calls zone_merge_groups() - Sets the zone merge group for each zone
 
     :param fab_obj: brcddb fabric object
     :type fab_obj: brcddb.classes.fabric.FabricObj
@@ -360,6 +444,9 @@ def zone_analysis(fab_obj):
 
     # We'll need to figure out where all the logins are so build a table to cross-reference all the neighbor WWNs
     brcddb_util.build_login_port_map(fab_obj.r_project_obj())
+    zone_merge_groups(fab_obj)
+    ref_d = _zone_ref_d(fab_obj)
+    mem_alias_d, zoned_d, zone_cfg_d = ref_d['mem_alias_d'], ref_d['zoned_d'], ref_d['zone_cfg_d']
     other_fabrics = fab_obj.r_project_obj().r_fabric_objects()
     other_fabrics.remove(fab_obj)
 
@@ -370,7 +457,7 @@ def zone_analysis(fab_obj):
         flag &= ~(_IN_DEFINED_ZONECFG | _WWN_IN_ZONE | _ALIAS_IN_ZONE | _DI_IN_ZONE | _WWN_MEM)
 
         # Is the zone used in any configuration?
-        if len(zone_obj.r_zone_configurations()) == 0:
+        if len(zone_cfg_d.get(zone_obj.r_obj_key(), list())) == 0:
             zone_obj.s_add_alert(al.AlertTable.alertTbl, al.ALERT_NUM.ZONE_NOT_USED, None, None, None)
 
         # Check for mixed d,i & WWN zones and make sure the member is in the fabric
@@ -382,10 +469,10 @@ def zone_analysis(fab_obj):
                 if gen_util.is_wwn(zmem, full_check=False):
                     flag |= _WWN_MEM | _WWN_IN_ZONE
                     mem_list.append(zmem)
-                    if _check_d['zone_alias_use'] and len(fab_obj.r_alias_for_wwn(zmem)) > 0:
+                    if _check_d['zone_alias_use'] and zmem in mem_alias_d:
                         # An alias was defined for this WWN, but the WWN was used to define the zone
                         zone_obj.s_add_alert(al.AlertTable.alertTbl, al.ALERT_NUM.ZONE_ALIAS_USE, None, zmem,
-                                             ', '.join(fab_obj.r_alias_for_wwn(zmem)))
+                                             ', '.join(mem_alias_d[zmem]))
                 elif gen_util.is_di(zmem):
                     mem_list.append(zmem)
                 else:  # It must be an alias
@@ -511,6 +598,7 @@ def zone_analysis(fab_obj):
         except AttributeError:
             pass  # Defined configuration was deleted
 
+    base_login_d = dict.fromkeys(fab_obj.r_base_logins(), True)
     for login_obj in fab_obj.r_login_objects():
         wwn = login_obj.r_obj_key()
         port_obj = login_obj.r_port_obj()
@@ -518,11 +606,12 @@ def zone_analysis(fab_obj):
             continue  # This happens when a login is found but data for the switch associated with it wasn't captured
 
         # Make sure that all logins are zoned.
-        if len(fab_obj.r_zones_for_wwn(wwn)) + \
-                len(fab_obj.r_zones_for_di(port_obj.r_switch_obj().r_did(), port_obj.r_index())) > 0:
-            if wwn in fab_obj.r_base_logins():
+        did, p_index = port_obj.r_switch_obj().r_did(), port_obj.r_index()
+        di = str(did) + ',' + str(p_index) if isinstance(did, int) and isinstance(p_index, int) else None
+        if wwn in zoned_d or di in zoned_d:
+            if wwn in base_login_d:
                 login_obj.s_add_alert(al.AlertTable.alertTbl, al.ALERT_NUM.LOGIN_BASE_ZONED)
-        elif wwn not in fab_obj.r_base_logins():
+        elif wwn not in base_login_d:
             login_obj.s_add_alert(al.AlertTable.alertTbl, al.ALERT_NUM.LOGIN_NOT_ZONED)
 
         # Check zone participation
@@ -532,7 +621,7 @@ def zone_analysis(fab_obj):
             continue
 
     # Alias analysis, zone speed analysis, and FICON analysis
-    alias_analysis(fab_obj)
+    alias_analysis(fab_obj, ref_d=ref_d)
     zone_by_target(fab_obj)
     check_ficon_zoning(fab_obj)
 
@@ -619,52 +708,100 @@ def copy_fab_obj(fab_obj, fab_key=None, full_copy=False, skip_zone=False, skip_z
     return fab_obj_copy
 
 
-def _zone_merge_group(wwn_d, missing_l, fab_obj, in_wwn):
-    """Internal for zone_merge_group()
+def _uf_find(parent_d, k):
+    """Internal for zone_merge_groups(). Union-find root lookup with path halving.
 
-    This method was written to support scripts that determine zone migration groups. Keep in mind that it has to be
-    iterative because everything associated with every login has to move.
+    :param parent_d: Key is a zone name. Value is the parent zone name.
+    :type parent_d: dict
+    :param k: Zone name
+    :type k: str
+    :return: Zone name of the root of the group k belongs to
+    :rtype: str
+    """
+    while parent_d[k] != k:
+        parent_d[k] = parent_d[parent_d[k]]
+        k = parent_d[k]
+    return k
 
-    :param wwn_d: Used to track WWNs already taken into account
-    :type wwn_d: dict
-    :param missing_l: Running list of WWNs not found
-    :type missing_l: list
-    :param fab_obj: The fabric object to be copied
+
+def zone_merge_groups(fab_obj, defined=False):
+    """Determines the zone merge groups for all zones in a fabric. Zones are in the same merge group if they share a
+    member, directly or indirectly. Members are the WWNs after resolving aliases and d,i members. Since moving a device
+    means moving everything on the port, all logins on the same port are treated as the same member.
+
+    All zones are merged at once with a union-find so there is no recursion. The group ID is stored in each zone object,
+    see brcddb.classes.zone.ZoneObj.r_merge_group(), and the groups are stored in the fabric object, see
+    brcddb.classes.fabric.FabricObj.r_zone_merge_groups(). When defined is False, the group ID is also stored in the
+    defined zone of the same name as each effective zone.
+
+    :param fab_obj: Fabric object
     :type fab_obj: brcddb.classes.fabric.FabricObj
-    :param in_wwn: WWN of the device you want to move
-    :type in_wwn: str, None
-    :return: List of WWNs need to be grouped together
-    :type: list
+    :param defined: If True, the defined zones are included. Otherwise, only the effective zones are used.
+    :type defined: bool
+    :return: List of dict(zone_l=list of zone names, wwn_l=list of WWNs). The index is the group ID.
+    :rtype: list
     """
-    rl = list()  # List of WWNs in the zone merge group
-
-    # The user is moving the device off the port so all logins on the port must be considered
-    port_obj = fab_obj.r_login_obj(in_wwn).r_port_obj()
-    # The WWN may be zoned by not logged into the fabric in which case, it won't be associated with a port
-    if port_obj is None:
-        missing_l.append(in_wwn)
-        wwn_l = [in_wwn]  # We still need to process it because there may be other dependencies
-    else:
-        wwn_l = port_obj.r_login_keys()
-
-    # Figure out all the zone dependencies for each WWN
-    for wwn in wwn_l:
-        rl.append(wwn)
-        wwn_d.update({wwn: True})
-        for d_wwn, zone_l in brcddb_zone.eff_zoned_to_wwn(fab_obj, wwn, target=True, initiator=True).items():
-            for zone in zone_l:  # I don't think this loop does anything, but I'm not fixing working code.
-                for next_wwn in brcddb_zone.eff_zoned_to_wwn(fab_obj, d_wwn, target=True, initiator=True).keys():
-                    if next_wwn not in wwn_d:
-                        rl.extend(_zone_merge_group(wwn_d, missing_l, fab_obj, next_wwn))
-
-    return rl
-
-
-def zone_merge_group(wwn_d, fab_obj, wwn):
+    parent_d, loc_d, zone_wwn_d = dict(), dict(), dict()
+    fab_obj.s_zone_merge_groups(None)
+    zone_obj_l = fab_obj.r_eff_zone_objects()
+    if defined:
+        zone_obj_l = fab_obj.r_zone_objects() + zone_obj_l
+
+    # Union all zones that share a member
+    for zone_obj in zone_obj_l:
+        zone = zone_obj.r_obj_key()
+        if zone not in parent_d:
+            parent_d[zone] = zone
+            zone_wwn_d[zone] = list()
+        for wwn in fab_obj.r_zone_member_wwns(zone_obj.c_members() + zone_obj.c_pmembers()):
+            port_obj = fab_obj.r_port_obj_for_wwn(wwn)
+            if port_obj is None:
+                loc, wwn_l = wwn, [wwn]
+            else:
+                loc, wwn_l = port_obj, port_obj.r_login_keys()
+            zone_wwn_d[zone].extend(wwn_l)
+            first_zone = loc_d.get(loc)
+            if first_zone is None:
+                loc_d[loc] = zone
+            else:
+                root_a, root_b = _uf_find(parent_d, first_zone), _uf_find(parent_d, zone)
+                if root_a != root_b:
+                    parent_d[root_b] = root_a
+
+    # Assign group IDs in zone order
+    group_l, group_id_d, wwn_d = list(), dict(), dict()
+    for zone in parent_d:
+        root = _uf_find(parent_d, zone)
+        group_id = group_id_d.get(root)
+        if group_id is None:
+            group_id = len(group_l)
+            group_id_d[root] = group_id
+            group_l.append(dict(zone_l=list(), wwn_l=list()))
+        group_d = group_l[group_id]
+        group_d['zone_l'].append(zone)
+        for wwn in zone_wwn_d[zone]:
+            if wwn not in wwn_d:
+                wwn_d[wwn] = group_id
+                group_d['wwn_l'].append(wwn)
+
+    if not defined:
+        zone_obj_l = zone_obj_l + [obj for obj in [fab_obj.r_zone_obj(zone) for zone in parent_d] if obj is not None]
+    for zone_obj in zone_obj_l:
+        zone_obj.s_merge_group(group_id_d[_uf_find(parent_d, zone_obj.r_obj_key())])
+    fab_obj.s_zone_merge_groups(dict(group_l=group_l, wwn_d=wwn_d, defined=defined))
+
+    return group_l
+
+
+def zone_merge_group(wwn_d, fab_obj, wwn, defined=False):
     """Determines all logins that would be effected a result of removing a WWN from a fabric.
 
-    This method was written to support scripts that determine zone migration groups. Keep in mind that has to be
-    iterative because everything associated with every login has to move.
+    This method was written to support scripts that determine zone migration groups. Everything associated with every
+    login on the port has to move so the result is the WWNs in all the zone merge groups the logins on the port belong
+    to. See zone_merge_groups()
+
+    By default, only zones in the effective zone configuration are considered. WWNs that are zoned but not logged in
+    are included and also returned in missing_l.
 
     :param wwn_d: Used to track WWNs already taken into account
     :type wwn_d: dict
@@ -672,14 +809,32 @@ def zone_merge_group(wwn_d, fab_obj, wwn):
     :type fab_obj: brcddb.classes.fabric.FabricObj
     :param wwn: WWN of the device you want to move
     :type wwn: str, None
+    :param defined: If True, zones in the defined zone configurations are also considered
+    :type defined: bool
     :return wwn_l: WWNs need to be grouped together
     :rtype wwn_l: list
     :return missing_l: WWNs not found
     :rtype missing_l: list
     """
-    missing_l = list()
-    wwn_l = gen_util.remove_duplicates(_zone_merge_group(wwn_d, missing_l, fab_obj, wwn))
-    return wwn_l, gen_util.remove_duplicates(missing_l)
+    group_l = fab_obj.r_zone_merge_groups(defined=defined)
+    if group_l is None:
+        group_l = zone_merge_groups(fab_obj, defined=defined)
+
+    # The user is moving the device off the port so all logins on the port must be considered
+    port_obj = fab_obj.r_port_obj_for_wwn(wwn)
+    # The WWN may be zoned by not logged into the fabric in which case, it won't be associated with a port
+    in_wwn_l = [wwn] if port_obj is None else port_obj.r_login_keys()
+
+    rl = list()
+    for in_wwn in in_wwn_l:
+        rl.append(in_wwn)
+        group_id = fab_obj.r_zone_merge_group_for_wwn(in_wwn)
+        if group_id is not None:
+            rl.extend([mem for mem in group_l[group_id]['wwn_l'] if mem not in wwn_d])
+    wwn_l = gen_util.remove_duplicates(rl)
+    wwn_d.update({mem: True for mem in wwn_l})
+
+    return wwn_l, [mem for mem in wwn_l if fab_obj.r_port_obj_for_wwn(mem) is None]
 
 
 def fab_match(fab_obj, search_term_l_in, s_type='exact'):
@@ -29,6 +29,8 @@ Methods and tables to support the class ChassisObj.
 +-----------------------+-------------------------------------------------------------------------------------------+
 | port_obj_for_wwn      | Returns the port object for a logged in WWN                                               |
 +-----------------------+-------------------------------------------------------------------------------------------+
+| ficon_index           | Returns the FICON CHPID and link address lookup tables for a project.                     |
++-----------------------+-------------------------------------------------------------------------------------------+
 | port_obj_for_chpid    | Returns the port object matching the rnid/sequence-number and rnid/tag. Used for finding  |
 |                       | CHPIDs                                                                                    |
 +-----------------------+-------------------------------------------------------------------------------------------+
@@ -40,6 +42,10 @@ Methods and tables to support the class ChassisObj.
 +-----------------------+-------------------------------------------------------------------------------------------+
 | port_objects_for_name | Returns a list of port objects using an exact, wild card, or regex match of the port name |
 +-----------------------+-------------------------------------------------------------------------------------------+
+| port_class            | Returns the cached classification (state, type, speed, FC4) of a port.                    |
++-----------------------+-------------------------------------------------------------------------------------------+
+| port_counts           | Returns the port counters for a project, fabric, chassis, or switch.                      |
++-----------------------+-------------------------------------------------------------------------------------------+
 
 **Version Control**
 
@@ -62,15 +68,25 @@ Methods and tables to support the class ChassisObj.
 +-----------+---------------+---------------------------------------------------------------------------------------+
 | 4.0.7     | 20 Feb 2026   | Updated copyright notice.                                                             |
 +-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.8     | 18 Oct 2026   | Added ficon_index(). port_obj_for_chpid() and port_obj_for_addr() use it              |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.9     | 18 Oct 2026   | Added port_class() and port_counts()                                                  |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.0     | 18 Oct 2026   | port_best_desc() caches the descriptor in the port object                             |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.1     | 18 Oct 2026   | port_class() relies on the project data generation to discard stale classifications   |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.2     | 18 Oct 2026   | ficon_index() is rebuilt when the project data generation changes                     |
++-----------+---------------+---------------------------------------------------------------------------------------+
 """
 __author__ = 'Jack Consoli'
 __copyright__ = 'Copyright 2023, 2024, 2025, 2026 Jack Consoli'
-__date__ = '20 Feb 2026'
+__date__ = '18 Oct 2026'
 __license__ = 'Apache License, Version 2.0'
 __email__ = 'jack_consoli@yahoo.com'
 __maintainer__ = 'Jack Consoli'
 __status__ = 'Released'
-__version__ = '4.0.7'
+__version__ = '4.1.2'
 
 import brcdapi.util as brcdapi_util
 import brcdapi.gen_util as gen_util
@@ -80,31 +96,19 @@ import brcddb.brcddb_switch as brcddb_switch
 import brcddb.brcddb_login as brcddb_login
 import brcddb.util.search as brcddb_search
 import brcddb.util.iocp as brcddb_iocp
+import brcddb.classes.util as class_util
 
+# Objects that can be resolved with the lookup tables from ficon_index(). Anything else with r_port_objects() is searched
+_ficon_index_types = ('ProjectObj', 'FabricObj', 'ChassisObj', 'SwitchObj')
 
 # _rnid_keys is used in port_best_desc() to add additional RNID data. This is not a complete list of RNID data
 _rnid_keys = ('manufacturer', 'model-number', 'sequence-number', 'tag', 'flags')
 
 
-def port_best_desc(port_obj):
-    """Finds the first descriptor for what's attached to the port in this order:
-        1   RNID data if RNID data is present
-        2   If E-Port, the upstream switch & port
-        3   FDMI  Node descriptor
-        4   FDMI Port descriptor
-        5   Name server node descriptor
-        6   Name server port descriptor
-
-    :param port_obj: Port Object
-    :type port_obj: brcddb.classes.port.PortObj
-    :return: desc
-    :rtype: str
-    """
+def _port_best_desc(port_obj):
+    """Resolves the descriptor for port_best_desc(). Parameters are the same as port_best_desc()"""
     global _rnid_keys
 
-    if port_obj is None:
-        return 'Unknown'
-
     # Try RNID data
     rnid_d = port_obj.r_get('rnid')
     if isinstance(rnid_d, dict) and 'type-number' in rnid_d:
@@ -134,6 +138,28 @@ def port_best_desc(port_obj):
     return brcddb_login.login_best_port_desc(login_obj)
 
 
+def port_best_desc(port_obj):
+    """Finds the first descriptor for what's attached to the port in this order:
+        1   RNID data if RNID data is present
+        2   If E-Port, the upstream switch & port
+        3   FDMI  Node descriptor
+        4   FDMI Port descriptor
+        5   Name server node descriptor
+        6   Name server port descriptor
+
+    The descriptor is cached in the port object until data in the project changes.
+
+    :param port_obj: Port Object
+    :type port_obj: brcddb.classes.port.PortObj
+    :return: desc
+    :rtype: str
+    """
+    if port_obj is None:
+        return 'Unknown'
+    buf = class_util.r_cached_name(port_obj, 'desc')
+    return class_util.s_cached_name(port_obj, 'desc', _port_best_desc(port_obj)) if buf is None else buf
+
+
 def best_port_name(port_obj, port_num=False):
     """Returns the user defined port name, if available. Otherwise, the port number
 
@@ -192,6 +218,75 @@ def port_obj_for_wwn(obj, wwn):
     return None  # If we got this far, we didn't find it.
 
 
+def ficon_index(proj_obj):
+    """Returns the FICON lookup tables for a project. The tables are built from the RNID data and FC address of every
+    port the first time they are requested and cached in the project object. The cached tables are rebuilt whenever
+    data in the project is added or changed. See brcddb.classes.project.ProjectObj.r_data_gen(). If RNID data or port
+    addresses are modified in place by other means, call proj_obj.s_data_gen().
+
+    +-----------+---------------------------------------------------------------------------------------------------+
+    | Key       | Value                                                                                             |
+    +===========+===================================================================================================+
+    | chpid_d   | Key is the tuple (rnid/sequence-number, rnid/tag) in lower case for ports where rnid/flags is    |
+    |           | 0x10 (channel). Value is the list of port objects.                                                |
+    +-----------+---------------------------------------------------------------------------------------------------+
+    | addr_d    | Key is fibrechannel/fcid-hex in lower case. Value is the list of port objects.                    |
+    +-----------+---------------------------------------------------------------------------------------------------+
+
+    :param proj_obj: Project object
+    :type proj_obj: brcddb.classes.project.ProjectObj
+    :return: FICON lookup tables as defined above
+    :rtype: dict
+    """
+    ficon_d = proj_obj.r_ficon_index()
+    if ficon_d is not None:
+        return ficon_d
+
+    chpid_d, addr_d = dict(), dict()
+    for port_obj in proj_obj.r_port_objects():
+        rnid_d = port_obj.r_get('rnid')
+        if isinstance(rnid_d, dict) and rnid_d.get('flags') == '0x10':  # 0x10 indicates the RNID data is for a channel
+            seq, tag = rnid_d.get('sequence-number'), rnid_d.get('tag')
+            if isinstance(seq, str) and isinstance(tag, str):
+                key = (seq.lower(), tag.lower())
+                if key not in chpid_d:
+                    chpid_d[key] = list()
+                chpid_d[key].append(port_obj)
+        addr = port_obj.r_addr()
+        if isinstance(addr, str):
+            key = addr.lower()
+            if key not in addr_d:
+                addr_d[key] = list()
+            addr_d[key].append(port_obj)
+
+    ficon_d = dict(chpid_d=chpid_d, addr_d=addr_d)
+    proj_obj.s_ficon_index(ficon_d)
+    return ficon_d
+
+
+def _first_in_scope(obj, port_obj_l):
+    """Returns the first port object in a list that belongs to obj. Used with the lists in ficon_index()
+
+    :param obj: Project, fabric, chassis, or switch object the port must belong to
+    :type obj: brcddb.classes.switch.SwitchObj, brcddb.classes.fabric.FabricObj, brcddb.classes.project.ProjectObj,
+                brcddb.classes.chassis.ChassisObj
+    :param port_obj_l: List of port objects
+    :type port_obj_l: list
+    :return: Port object. None if no port in port_obj_l belongs to obj
+    :rtype: brcddb.classes.port.PortObj, None
+    """
+    if len(port_obj_l) == 0:
+        return None
+    obj_type = class_util.get_simple_class_type(obj)
+    if obj_type == 'ProjectObj':
+        return port_obj_l[0]
+    switch_key_l = [obj.r_obj_key()] if obj_type == 'SwitchObj' else obj.r_switch_keys()
+    for port_obj in port_obj_l:
+        if port_obj.r_switch_key() in switch_key_l:
+            return port_obj
+    return None
+
+
 def port_obj_for_chpid(obj, seq, tag):
     """Returns the port object matching the rnid/sequence-number and rnid/tag. Used for finding CHPIDs
 
@@ -207,6 +302,11 @@ def port_obj_for_chpid(obj, seq, tag):
     """
     # The tag from the IOCP will never have '0x' prefix, so adding it if it's missing is in case I ever use this
     # function for a tag that came from elsewhere.
+    if class_util.get_simple_class_type(obj) in _ficon_index_types:
+        chpid_d = ficon_index(obj.r_project_obj())['chpid_d']
+        key = (brcddb_iocp.full_cpc_sn(seq).lower(), (tag if '0x' in tag else '0x' + tag).lower())
+        return _first_in_scope(obj, chpid_d.get(key, list()))
+
     port_list = brcddb_search.match_test(
         obj.r_port_objects(),
         {
@@ -254,6 +354,9 @@ def port_obj_for_addr(obj, addr):
     :return: Port object matching the link address. None if not found
     :rtype: brcddb.classes.port.PortObj, None
     """
+    if class_util.get_simple_class_type(obj) in _ficon_index_types and isinstance(addr, str):
+        return _first_in_scope(obj, ficon_index(obj.r_project_obj())['addr_d'].get(addr.lower(), list()))
+
     port_list = port_objects_for_addr(obj, addr)
     return port_list[0] if len(port_list) > 0 else None
 
@@ -312,3 +415,122 @@ def sort_by_stat(port_obj_l, stat, sort_by):
             sort_d[port_key] = stat_val
             track_d[port_key] = port_obj
 
+
+
+def _fc4_bucket(port_obj):
+    """Determines the FC4 bucket for a port. See port_class()
+
+    :param port_obj: Port object
+    :type port_obj: brcddb.classes.port.PortObj
+    :return: 'target', 'initiator', 'mixed', 'other', or None if the FC4 features are not known
+    :rtype: str, None
+    """
+    attach_type = port_obj.r_get(brcdapi_util.bns_fc4_features)
+    if not isinstance(attach_type, str):
+        return None
+    target, initiator = 'Target' in attach_type, 'Initiator' in attach_type
+    if target:
+        return 'mixed' if initiator else 'target'
+    return 'initiator' if initiator else 'other'
+
+
+def port_class(port_obj):
+    """Returns the classification of a port used for port statistics and summaries. The classification is built the
+    first time it is requested and cached in the port object. The cached classification is discarded whenever data in
+    the project is added or changed. See brcddb.classes.project.ProjectObj.r_data_gen(). If port data is modified in
+    place by other means, call port_obj.r_project_obj().s_data_gen().
+
+    +---------------+-----------------------------------------------------------------------------------------------+
+    | Key           | Value                                                                                         |
+    +===============+===============================================================================================+
+    | online        | True if fibrechannel/operational-status is 2 (online)                                         |
+    +---------------+-----------------------------------------------------------------------------------------------+
+    | enabled       | True if the port is enabled                                                                   |
+    +---------------+-----------------------------------------------------------------------------------------------+
+    | logins        | Number of logins (fibrechannel/neighbor/wwn)                                                  |
+    +---------------+-----------------------------------------------------------------------------------------------+
+    | port_type     | fibrechannel/port-type. See brcddb.brcddb_common.PORT_TYPE_*                                  |
+    +---------------+-----------------------------------------------------------------------------------------------+
+    | login_type    | Human-readable port type. See brcddb.classes.port.PortObj.c_login_type()                      |
+    +---------------+-----------------------------------------------------------------------------------------------+
+    | speed         | fibrechannel/speed. Only valid if online is True                                              |
+    +---------------+-----------------------------------------------------------------------------------------------+
+    | fc4           | 'target', 'initiator', 'mixed', 'other', or None if the FC4 features are not known            |
+    +---------------+-----------------------------------------------------------------------------------------------+
+
+    :param port_obj: Port object
+    :type port_obj: brcddb.classes.port.PortObj
+    :return: Port classification as defined above
+    :rtype: dict
+    """
+    class_d = port_obj.r_port_class()
+    if class_d is not None:
+        return class_d
+
+    class_d = dict(online=port_obj.r_get('fibrechannel/operational-status') == 2,
+                   enabled=bool(port_obj.r_is_enabled()),
+                   logins=len(port_obj.r_login_keys()),
+                   port_type=port_obj.r_get(brcdapi_util.fc_port_type),
+                   login_type=port_obj.c_login_type(),
+                   speed=port_obj.r_get(brcdapi_util.fc_speed),
+                   fc4=_fc4_bucket(port_obj))
+    port_obj.s_port_class(class_d)
+    return class_d
+
+
+def port_counts(obj):
+    """Returns the port counters for an object. Switch counters are summed from the port classifications, see
+    port_class(). Chassis, fabric, and project counters are rolled up from the switch counters.
+
+    +---------------+-----------------------------------------------------------------------------------------------+
+    | Key           | Value                                                                                         |
+    +===============+===============================================================================================+
+    | ports         | Number of ports                                                                               |
+    +---------------+-----------------------------------------------------------------------------------------------+
+    | online        | Number of online ports                                                                        |
+    +---------------+-----------------------------------------------------------------------------------------------+
+    | icl           | Number of online ICL ports                                                                    |
+    +---------------+-----------------------------------------------------------------------------------------------+
+    | e_port        | Number of online E-Ports                                                                      |
+    +---------------+-----------------------------------------------------------------------------------------------+
+    | fc_lag        | Number of online FC-Lag ports                                                                 |
+    +---------------+-----------------------------------------------------------------------------------------------+
+    | logins        | Sum of the logins on online F-Ports                                                           |
+    +---------------+-----------------------------------------------------------------------------------------------+
+    | speed_d       | Key is the login speed, fibrechannel/speed. Value is the number of online ports at that speed |
+    +---------------+-----------------------------------------------------------------------------------------------+
+
+    :param obj: Project, fabric, chassis, or switch object
+    :type obj: brcddb.classes.project.ProjectObj, brcddb.classes.switch.SwitchObj, brcddb.classes.chassis.ChassisObj, \
+        brcddb.classes.fabric.FabricObj
+    :return: Port counters as defined above
+    :rtype: dict
+    """
+    rd = dict(ports=0, online=0, icl=0, e_port=0, fc_lag=0, logins=0, speed_d=dict())
+    if class_util.get_simple_class_type(obj) != 'SwitchObj':
+        for switch_obj in obj.r_switch_objects():
+            switch_d = port_counts(switch_obj)
+            for k in ('ports', 'online', 'icl', 'e_port', 'fc_lag', 'logins'):
+                rd[k] += switch_d[k]
+            for speed, count in switch_d['speed_d'].items():
+                rd['speed_d'][speed] = rd['speed_d'].get(speed, 0) + count
+        return rd
+
+    for port_obj in obj.r_port_objects():
+        class_d = port_class(port_obj)
+        rd['ports'] += 1
+        if not class_d['online']:
+            continue
+        rd['online'] += 1
+        port_type = class_d['port_type']
+        if port_type == brcddb_common.PORT_TYPE_ICL:
+            rd['icl'] += 1
+        elif port_type == brcddb_common.PORT_TYPE_E:
+            rd['e_port'] += 1
+        elif port_type == brcddb_common.PORT_TYPE_FC_LAG:
+            rd['fc_lag'] += 1
+        elif port_type == brcddb_common.PORT_TYPE_F:
+            rd['logins'] += class_d['logins']
+        speed = class_d['speed']
+        rd['speed_d'][speed] = rd['speed_d'].get(speed, 0) + 1
+    return rd
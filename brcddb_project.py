@@ -45,6 +45,11 @@ Support for project level operations.
 +---------------------------+---------------------------------------------------------------------------------------+
 | scan                      | Returns a list of text containing basic fabric information for a project.             |
 +---------------------------+---------------------------------------------------------------------------------------+
+| request_summary           | Summarizes the request statistics recorded by brcddb.api.interface                    |
++---------------------------+---------------------------------------------------------------------------------------+
+| freeze                    | Builds all lookup tables and freezes the project. See                                 |
+|                           | brcddb.classes.project.ProjectObj.freeze()                                            |
++---------------------------+---------------------------------------------------------------------------------------+
 
 **Version Control**
 
@@ -69,16 +74,37 @@ Support for project level operations.
 +-----------+---------------+---------------------------------------------------------------------------------------+
 | 4.0.8     | 10 Mar 2026   | Consolidated error messages for reading and interprting project files.                |
 +-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.9     | 18 Oct 2026   | Added request_summary()                                                               |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.0     | 18 Oct 2026   | Added freeze()                                                                        |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.1     | 18 Oct 2026   | freeze() builds the zoned to map for each fabric                                      |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.2     | 18 Oct 2026   | freeze() builds the zone merge groups                                                 |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.3     | 18 Oct 2026   | Build the ISL topology when freezing a project                                        |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.4     | 18 Oct 2026   | Build the FICON lookup tables when freezing a project                                 |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.5     | 18 Oct 2026   | freeze() caches the parent object references                                          |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.6     | 18 Oct 2026   | Fixed the nearest-rank percentile in request_summary()                                |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.7     | 18 Oct 2026   | add_custom_search_terms() re-computes the terms instead of keeping old values         |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.8     | 18 Oct 2026   | Request statistics without a response size are counted as 0 bytes in the totals       |
++-----------+---------------+---------------------------------------------------------------------------------------+
 """
 __author__ = 'Jack Consoli'
 __copyright__ = 'Copyright 2024, 2025, 2026 Jack Consoli'
-__date__ = '10 Mar 2026'
+__date__ = '18 Oct 2026'
 __license__ = 'Apache License, Version 2.0'
 __email__ = 'jack_consoli@yahoo.com'
 __maintainer__ = 'Jack Consoli'
 __status__ = 'Released'
-__version__ = '4.0.8'
+__version__ = '4.1.8'
 
+import math
 import brcdapi.log as brcdapi_log
 import brcdapi.file as brcdapi_file
 import brcdapi.gen_util as gen_util
@@ -92,12 +118,16 @@ import brcddb.util.search as brcddb_search
 import brcddb.brcddb_chassis as brcddb_chassis
 import brcddb.brcddb_fabric as brcddb_fabric
 import brcddb.brcddb_switch as brcddb_switch
+import brcddb.brcddb_port as brcddb_port
 
 # _STAND_ALONE: True: Executes as a standalone module taking input from the command line. False: Does not automatically
 # execute. This is useful when importing this module into another module that calls psuedo_main().
 _STAND_ALONE = True  # See note above
 
 _dup_wwn_check = False
+# The cs_search terms computed by add_custom_search_terms()
+_cs_search_keys = ('sfp_max_speed', 'sfp_min_speed', 'remote_sfp_max_speed', 'remote_sfp_min_speed', 'max_login_speed',
+                   'speed')
 
 
 def new(name, date):
@@ -218,6 +248,9 @@ def add_custom_search_terms(proj_obj):
     cs_search/max_login_speed (in Gbps. This is the maximum common to both the local and remote SFPs)
     cs_search/speed (in Gbps - This is fibrechannel/speed, which is bps, converted to Gbps. The actual login speed)
 
+    The terms are re-computed every time this method is called so that calling it again after new data is added, such
+    as when brcddb.brcddb_analysis re-runs it, doesn't leave old values behind.
+
     :param proj_obj: Project object
     :type proj_obj: brcddb.classes.project.ProjectObj
     """
@@ -228,15 +261,14 @@ def add_custom_search_terms(proj_obj):
         if search is None:
             search = dict()
             port_obj.s_new_key('cs_search', search)
+        for key in _cs_search_keys:
+            search.pop(key, None)
 
         # Get the maximum and minimum speeds supported by the switch SFP
         speed_l = port_obj.r_get(brcdapi_util.sfp_speed)
         if isinstance(speed_l, (list, tuple)):
             max_sfp = max(speed_l)
-            if 'sfp_max_speed' not in search:
-                search.update(sfp_max_speed=max_sfp)
-            if 'sfp_min_speed' not in search:
-                search.update(sfp_min_speed=min(speed_l))
+            search.update(sfp_max_speed=max_sfp, sfp_min_speed=min(speed_l))
 
         # Get the maximum and minimum speeds supported by the remote (attached device) SFP
         speed_l = port_obj.r_get(brcdapi_util.sfp_remote_speed)
@@ -247,21 +279,16 @@ def add_custom_search_terms(proj_obj):
                     break
         if isinstance(speed_l, (list, tuple)):
             max_r_sfp = max(speed_l)
-            if 'remote_sfp_max_speed' not in search:
-                search.update(remote_sfp_max_speed=max_r_sfp)
-            if 'remote_sfp_min_speed' not in search:
-                search.update(remote_sfp_min_speed=min(speed_l))
+            search.update(remote_sfp_max_speed=max_r_sfp, remote_sfp_min_speed=min(speed_l))
 
         # Get the maximum supported speed (either the maximum local speed or the maximum attached speed)
         if isinstance(max_sfp, int) and isinstance(max_r_sfp, int):
-            if 'max_login_speed' not in search:
-                search.update(max_login_speed=min([max_sfp, max_r_sfp]))
+            search.update(max_login_speed=min([max_sfp, max_r_sfp]))
 
         # Convert the actual login speed, which is bps, to Gbps for easier comparisons to the SFP speed capabilities
-        if 'speed' not in search:
-            v = gen_util.non_decimal.sub('', port_obj.c_login_speed())
-            if len(v) > 0:
-                search.update(speed=int(v))
+        v = gen_util.non_decimal.sub('', port_obj.c_login_speed())
+        if len(v) > 0:
+            search.update(speed=int(v))
 
 
 def fab_obj_for_user_name(proj_obj, name, match_type='exact'):
@@ -437,3 +464,163 @@ def scan(proj_obj, fab_only=False, logical_switch=False):
         rl.extend(_scan_fabric(fab_obj, logical_switch=logical_switch))
 
     return rl
+
+
+def _percentile(sorted_l, pct):
+    """Returns the nearest-rank percentile of a sorted list of numbers
+
+    :param sorted_l: List of numbers sorted in ascending order
+    :type sorted_l: list
+    :param pct: Percentile, 0-100
+    :type pct: int, float
+    :return: Percentile value. 0 if sorted_l is empty
+    :rtype: int, float
+    """
+    if len(sorted_l) == 0:
+        return 0
+    i = max(0, math.ceil(pct * len(sorted_l) / 100) - 1)
+    return sorted_l[min(i, len(sorted_l) - 1)]
+
+
+def _new_request_total():
+    return dict(requests=0, errors=0, time=0.0, bytes=0, ingest=0.0)
+
+
+def _add_request_total(total_d, stat_d, latency):
+    total_d['requests'] += 1
+    total_d['errors'] += 0 if stat_d.get('status', 200) < 400 else 1
+    total_d['time'] += latency
+    total_d['bytes'] += 0 if stat_d.get('bytes') is None else stat_d['bytes']
+    total_d['ingest'] += stat_d.get('ingest', 0)
+
+
+def request_summary(proj_obj, num_slowest=10):
+    """Summarizes the request statistics recorded in a project by brcddb.api.interface
+
+    The request statistics are a list of dictionaries, see ProjectObj.r_request_stats(), as follows:
+
+    +-----------+-------------------------------------------------------------------------------------------+
+    | Key       | Value                                                                                     |
+    +===========+===========================================================================================+
+    | uri       | URI, less the prefix. For example: "running/brocade-fibrechannel-switch/fibrechannel-     |
+    |           | switch"                                                                                   |
+    +-----------+-------------------------------------------------------------------------------------------+
+    | fid       | Fabric ID. None if the request was not associated with a FID.                             |
+    +-----------+-------------------------------------------------------------------------------------------+
+    | chassis   | Chassis WWN. If the chassis WWN was not yet known, the masked IP address.                 |
+    +-----------+-------------------------------------------------------------------------------------------+
+    | start     | Time, from time.time(), the request was sent.                                             |
+    +-----------+-------------------------------------------------------------------------------------------+
+    | end       | Time, from time.time(), the response was received.                                        |
+    +-----------+-------------------------------------------------------------------------------------------+
+    | bytes     | Approximate number of bytes received. Length of the compact JSON of the response. None if |
+    |           | not counted. See count_bytes in brcddb.api.interface.set_instrumentation()                |
+    +-----------+-------------------------------------------------------------------------------------------+
+    | status    | HTTP status. 200 if the request completed without errors.                                 |
+    +-----------+-------------------------------------------------------------------------------------------+
+    | ingest    | Time, in seconds, to add the response to the brcddb database.                             |
+    +-----------+-------------------------------------------------------------------------------------------+
+
+    The returned dictionary is as follows. All times are in seconds. Totals are dictionaries with the keys "requests",
+    "errors", "time", "bytes", and "ingest".
+
+    +-----------+-------------------------------------------------------------------------------------------+
+    | Key       | Value                                                                                     |
+    +===========+===========================================================================================+
+    | total     | Totals for all requests. Also includes "p50", "p95", and "max" latency.                   |
+    +-----------+-------------------------------------------------------------------------------------------+
+    | slowest   | List of the request statistics dictionaries for the slowest requests, slowest first.      |
+    +-----------+-------------------------------------------------------------------------------------------+
+    | uri_d     | Key is the URI. Value is the totals for the URI and "p50", "p95", and "max" latency.      |
+    +-----------+-------------------------------------------------------------------------------------------+
+    | chassis_d | Key is the chassis as in the request statistics. Value is the totals for the chassis.     |
+    +-----------+-------------------------------------------------------------------------------------------+
+
+    :param proj_obj: Project object
+    :type proj_obj: brcddb.classes.project.ProjectObj
+    :param num_slowest: Number of requests to return in "slowest"
+    :type num_slowest: int
+    :return: Summary dictionary as described above
+    :rtype: dict
+    """
+    total_d, uri_d, chassis_d, latency_d, all_latency_l = _new_request_total(), dict(), dict(), dict(), list()
+
+    stat_l = list() if proj_obj is None else proj_obj.r_request_stats()
+    for stat_d in stat_l:
+        latency = stat_d.get('end', 0) - stat_d.get('start', 0)
+        uri, chassis = stat_d.get('uri'), stat_d.get('chassis')
+        if uri not in uri_d:
+            uri_d[uri] = _new_request_total()
+            latency_d[uri] = list()
+        if chassis not in chassis_d:
+            chassis_d[chassis] = _new_request_total()
+        for d in (total_d, uri_d[uri], chassis_d[chassis]):
+            _add_request_total(d, stat_d, latency)
+        latency_d[uri].append(latency)
+        all_latency_l.append(latency)
+
+    # Add the percentiles
+    for d, latency_l in [(total_d, all_latency_l)] + [(uri_d[k], latency_d[k]) for k in uri_d.keys()]:
+        latency_l.sort()
+        d.update(p50=_percentile(latency_l, 50),
+                 p95=_percentile(latency_l, 95),
+                 max=latency_l[-1] if len(latency_l) > 0 else 0)
+
+    slowest_l = sorted(stat_l, key=lambda x: x.get('end', 0) - x.get('start', 0), reverse=True)
+
+    return dict(total=total_d, slowest=slowest_l[0:num_slowest], uri_d=uri_d, chassis_d=chassis_d)
+
+
+def _build_eff_zoned_to(proj_obj):
+    """Builds the cached zoned to map for each fabric. See brcddb.classes.fabric.FabricObj.r_eff_zoned_to_map()"""
+    for fab_obj in proj_obj.r_fabric_objects():
+        fab_obj.r_eff_zoned_to_map()
+
+
+def _build_zone_merge_groups(proj_obj):
+    """Builds the zone merge groups for each fabric if not already built. See brcddb_fabric.zone_merge_groups()"""
+    for fab_obj in proj_obj.r_fabric_objects():
+        if fab_obj.r_zone_merge_groups() is None:
+            brcddb_fabric.zone_merge_groups(fab_obj)
+
+
+def _build_isl_topology(proj_obj):
+    """Builds the ISL topology for each fabric. See brcddb.classes.fabric.FabricObj.r_isl_topology()"""
+    for fab_obj in proj_obj.r_fabric_objects():
+        fab_obj.r_isl_topology()
+
+
+def _build_ficon_index(proj_obj):
+    """Builds the FICON lookup tables. See brcddb_port.ficon_index()"""
+    brcddb_port.ficon_index(proj_obj)
+
+
+def _build_parent_links(proj_obj):
+    """Caches the parent object references used by r_switch_obj(), r_fabric_obj(), and r_chassis_obj()"""
+    for switch_obj in proj_obj.r_switch_objects():
+        switch_obj.r_fabric_obj()
+        switch_obj.r_chassis_obj()
+        for port_obj in switch_obj.r_port_objects():
+            port_obj.r_switch_obj()
+    for fab_obj in proj_obj.r_fabric_objects():
+        for obj_l in (fab_obj.r_login_objects(), fab_obj.r_fdmi_node_objects(), fab_obj.r_fdmi_port_objects(),
+                      fab_obj.r_zonecfg_objects(), fab_obj.r_zone_objects(), fab_obj.r_alias_objects()):
+            for obj in obj_l:
+                obj.r_fabric_obj()
+
+
+# Functions called by freeze() to build lookup tables. Add to this list when a new lazily built lookup table is added.
+_freeze_build_l = (_build_parent_links, build_xref, add_custom_search_terms, _build_eff_zoned_to,
+                   _build_zone_merge_groups, _build_isl_topology, _build_ficon_index)
+
+
+def freeze(proj_obj):
+    """Builds all lookup tables and freezes the project. After this, the project can be safely shared by multiple threads
+    and forked processes. See brcddb.classes.project.ProjectObj.freeze()
+
+    :param proj_obj: Project object
+    :type proj_obj: brcddb.classes.project.ProjectObj
+    """
+    global _freeze_build_l
+
+    proj_obj.freeze(build_l=_freeze_build_l)
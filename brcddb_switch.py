@@ -55,20 +55,23 @@ Methods and tables to support the class SwitchObj.
 +-----------+---------------+---------------------------------------------------------------------------------------+
 | 4.0.4     | 20 Feb 2026   | Updated copyright notice.                                                             |
 +-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.5     | 18 Oct 2026   | best_switch_name() caches the name in the switch object                               |
++-----------+---------------+---------------------------------------------------------------------------------------+
 """
 __author__ = 'Jack Consoli'
 __copyright__ = 'Copyright 2024, 2025, 2026 Jack Consoli'
-__date__ = '20 Feb 2026'
+__date__ = '18 Oct 2026'
 __license__ = 'Apache License, Version 2.0'
 __email__ = 'jack_consoli@yahoo.com'
 __maintainer__ = 'Jack Consoli'
 __status__ = 'Released'
-__version__ = '4.0.4'
+__version__ = '4.0.5'
 
 import time
 import brcdapi.util as brcdapi_util
 import brcdapi.gen_util as gen_util
 import brcddb.util.copy as brcddb_copy
+import brcddb.classes.util as class_util
 
 area_mode = {
     0: ' 10-bit addressing mode',
@@ -112,24 +115,9 @@ def add_rest_port_data(switch_obj, pobj, flag_obj=None, in_skip_list=None):
                     fab_obj.s_add_login(wwn)
 
 
-def best_switch_name(switch_obj, wwn=False, did=False, fid=False):
-    """Returns the user-friendly switch name, optionally with the switch WWN in parentheses. If the switch is not named,
-       just the switch WWN is returned
-
-    :param switch_obj: Switch object
-    :type switch_obj: brcddb.classes.switch.SwitchObj
-    :param wwn: If True, append (wwn) to the switch name
-    :type wwn: bool
-    :param did: If True, append (DID) to the switch name
-    :type did: bool
-    :param fid: If Ture, append (FID) to switch name
-    :type fid: bool
-    :return: Switch name
-    :rtype: str
-    """
+def _best_switch_name(switch_obj, wwn, did, fid):
+    """Resolves the switch name for best_switch_name(). Parameters are the same as best_switch_name()"""
     wwn_f = wwn
-    if switch_obj is None:
-        return 'Unknown'
     buf = switch_obj.r_get(brcdapi_util.bfs_sw_user_name)
     if buf is None:
         buf = switch_obj.r_get(brcdapi_util.bf_sw_user_name)
@@ -152,6 +140,28 @@ def best_switch_name(switch_obj, wwn=False, did=False, fid=False):
     return buf
 
 
+def best_switch_name(switch_obj, wwn=False, did=False, fid=False):
+    """Returns the user-friendly switch name, optionally with the switch WWN in parentheses. If the switch is not named,
+       just the switch WWN is returned. The name is cached in the switch object until data in the project changes.
+
+    :param switch_obj: Switch object
+    :type switch_obj: brcddb.classes.switch.SwitchObj
+    :param wwn: If True, append (wwn) to the switch name
+    :type wwn: bool
+    :param did: If True, append (DID) to the switch name
+    :type did: bool
+    :param fid: If Ture, append (FID) to switch name
+    :type fid: bool
+    :return: Switch name
+    :rtype: str
+    """
+    if switch_obj is None:
+        return 'Unknown'
+    k = (bool(wwn), bool(did), bool(fid))
+    buf = class_util.r_cached_name(switch_obj, k)
+    return class_util.s_cached_name(switch_obj, k, _best_switch_name(switch_obj, wwn, did, fid)) if buf is None else buf
+
+
 def switch_type(switch_obj):
     """Returns the switch type: Default, FICON, Base, FCP
 
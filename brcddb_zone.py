@@ -62,15 +62,21 @@ Zone utilities.
 +-----------+---------------+---------------------------------------------------------------------------------------+
 | 4.0.6     | 20 Feb 2026   | Updated copyright notice.                                                             |
 +-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.7     | 18 Oct 2026   | Use r_has_pmember()                                                                   |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.8     | 18 Oct 2026   | eff_zoned_to_wwn() uses FabricObj.r_eff_zoned_to_map()                                |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.9     | 18 Oct 2026   | add_zone_worksheet() writes through brcddb.report.sink.                               |
++-----------+---------------+---------------------------------------------------------------------------------------+
 """
 __author__ = 'Jack Consoli'
 __copyright__ = 'Copyright 2024, 2025, 2026 Jack Consoli'
-__date__ = '20 Feb 2026'
+__date__ = '18 Oct 2026'
 __license__ = 'Apache License, Version 2.0'
 __email__ = 'jack_consoli@yahoo.com'
 __maintainer__ = 'Jack Consoli'
 __status__ = 'Released'
-__version__ = '4.0.6'
+__version__ = '4.0.9'
 
 import collections
 import openpyxl.utils.cell as xl
@@ -80,6 +86,7 @@ import brcdapi.log as brcdapi_log
 import brcdapi.util as brcdapi_util
 import brcdapi.excel_fonts as excel_fonts
 import brcdapi.excel_util as excel_util
+import brcddb.report.sink as report_sink
 import brcddb.brcddb_common as brcddb_common
 
 _std_font = excel_fonts.font_type('std')
@@ -317,14 +324,14 @@ def add_zone_worksheet(wb, sheet_name, content_l, sheet_i=0):
 
     # Create the worksheet and do some basic setup
     sheet = wb.create_sheet(index=sheet_i, title=sheet_name)
-    sheet.page_setup.paperSize = sheet.PAPERSIZE_LETTER
-    sheet.page_setup.orientation = sheet.ORIENTATION_LANDSCAPE
+    sheet.page_setup.paperSize = report_sink.PAPERSIZE_LETTER
+    sheet.page_setup.orientation = report_sink.ORIENTATION_LANDSCAPE
     for dv in _zone_dv_l:
-        sheet.add_data_validation(dv)
+        report_sink.add_data_validation(sheet, dv)
     row = col = 1
     for key, value_d in _zone_worksheet_hdr.items():
         sheet.column_dimensions[xl.get_column_letter(col)].width = value_d['col']
-        excel_util.cell_update(sheet, row, col, key, font=_hdr2_font, align=_align_wrap, border=_border_thin)
+        report_sink.cell_update(sheet, row, col, key, font=_hdr2_font, align=_align_wrap, border=_border_thin)
         col += 1
     row += 1
 
@@ -345,21 +352,27 @@ def add_zone_worksheet(wb, sheet_name, content_l, sheet_i=0):
 
             # Is it a comment?
             if key == 'Zone_Object' and zone_item == 'comment':
-                excel_util.cell_update(sheet, row, col, zone_item)
-                excel_util.cell_update(sheet, row, col+1, '\n'.join(gen_util.convert_to_list(zone_d.get('Comments'))))
+                report_sink.cell_update(sheet, row, col, zone_item)
+                report_sink.cell_update(sheet, row, col+1, '\n'.join(gen_util.convert_to_list(zone_d.get('Comments'))))
                 x = len(_zone_worksheet_hdr)
-                sheet.merge_cells(start_row=row, start_column=col+1, end_row=row, end_column=len(_zone_worksheet_hdr))
+                report_sink.merge_cells(
+                    sheet,
+                    start_row=row,
+                    start_column=col+1,
+                    end_row=row,
+                    end_column=len(_zone_worksheet_hdr)
+                )
                 break
 
             # Add the zone item to the worksheet
             if isinstance(zone_item, (list, tuple)):
                 mem_row = row
                 for mem in zone_item:
-                    excel_util.cell_update(sheet, mem_row, col, mem)
+                    report_sink.cell_update(sheet, mem_row, col, mem)
                     mem_row += 1
                 next_row = max(next_row, mem_row)
             else:
-                excel_util.cell_update(sheet, row, col, zone_item)
+                report_sink.cell_update(sheet, row, col, zone_item)
             col += 1
         row = next_row + 1
 
@@ -369,7 +382,7 @@ def add_zone_worksheet(wb, sheet_name, content_l, sheet_i=0):
     for next_row in range(2, max(150, row + 12)):
         col = 1
         for value_d in _zone_worksheet_hdr.values():
-            excel_util.cell_update(
+            report_sink.cell_update(
                 sheet,
                 next_row,
                 col,
@@ -411,7 +424,7 @@ def create_zone_workbook():
     # Create the workbook and set up the Instructions sheet
     wb = excel_util.new_report()
     sheet = wb.create_sheet(index=0, title='Instructions')
-    sheet.page_setup.paperSize = sheet.PAPERSIZE_LETTER
+    sheet.page_setup.paperSize = report_sink.PAPERSIZE_LETTER
     for col in range(0, len(_zone_instructions_col_l)):
         sheet.column_dimensions[xl.get_column_letter(col+1)].width = _zone_instructions_col_l[col]
 
@@ -420,7 +433,7 @@ def create_zone_workbook():
     for row_l in _zonecfg_instructions:
         col = 1
         for col_d in row_l:
-            excel_util.cell_update(
+            report_sink.cell_update(
                 sheet,
                 row,
                 col,
@@ -432,7 +445,13 @@ def create_zone_workbook():
             )
             col_span = col_d.get('span', 1)
             if col_span > 1:
-                sheet.merge_cells(start_row=row, start_column=col, end_row=row, end_column=col + col_span-1)
+                report_sink.merge_cells(
+                    sheet,
+                    start_row=row,
+                    start_column=col,
+                    end_row=row,
+                    end_column=col + col_span-1
+                )
             col += col_span
         row += 1
 
@@ -543,7 +562,8 @@ def zone_type(zone_obj, num_flag=False):
 
 
 def eff_zoned_to_wwn(fab_obj, wwn, target=False, initiator=False, all_types=False):
-    """Finds all WWNs in the effective zone that are zoned to wwn.
+    """Finds all WWNs in the effective zone that are zoned to wwn. Uses the cached map returned from
+    brcddb.classes.fabric.FabricObj.r_eff_zoned_to_map() so the effective zones are only walked once per fabric.
 
     WARNING: if all_types == True, the FC4 type in the login data is not checked and therefore, all WWNs will be
     returned. When filtering on "target" or "initiator", there must be something logged in and the login data from the
@@ -559,35 +579,25 @@ def eff_zoned_to_wwn(fab_obj, wwn, target=False, initiator=False, all_types=Fals
     :type initiator: bool
     :param all_types: If True, include all ports, online or offline.
     :type all_types: bool
-    :return: Dictionary - Key: WWN of device zoned to wwn. Value is the list of zone names common to both WWNs.
+    :return: Dictionary - Key: WWN of device zoned to wwn. Value is the list of zone names that zone them together.
     :rtype: dict
     """
-    rd, zones_for_wwn_d = dict(), dict()
-
-    for zone in fab_obj.r_eff_zones_for_wwn(wwn):  # Used to find common zones with members
-        zones_for_wwn_d.update({zone: True})
-
-    for zone_obj in fab_obj.r_eff_zone_objects_for_wwn(wwn):
-        if zone_obj.r_type() == brcddb_common.ZONE_STANDARD_ZONE:
-            mem_l = zone_obj.r_members()
-        else:
-            mem_l = zone_obj.r_members() if wwn in zone_obj.r_pmembers() else zone_obj.r_pmembers()
-        for mem in mem_l:
-            if mem == wwn or mem in rd:
-                continue
-            if all_types:
-                rd.update({mem: [m for m in fab_obj.r_eff_zones_for_wwn(mem) if zones_for_wwn_d.get(m, False)]})
-                continue
-            login_obj = fab_obj.r_login_obj(mem)
-            if login_obj is None:
-                continue
-            fc4 = login_obj.r_get(brcdapi_util.bns_fc4_features)
-            if fc4 is None:
-                continue
-            if target and 'target' in fc4.lower():
-                rd.update({mem: [m for m in fab_obj.r_eff_zones_for_wwn(mem) if zones_for_wwn_d.get(m, False)]})
-            elif initiator and 'initiator' in fc4.lower():
-                # Used "elif" because if both target & initiator was specified, it will already be in rd
-                rd.update({mem: [m for m in fab_obj.r_eff_zones_for_wwn(mem) if zones_for_wwn_d.get(m, False)]})
+    rd = dict()
+
+    for mem, zone_l in fab_obj.r_eff_zoned_to_map().get(wwn, dict()).items():
+        if all_types:
+            rd.update({mem: zone_l.copy()})
+            continue
+        login_obj = fab_obj.r_login_obj(mem)
+        if login_obj is None:
+            continue
+        fc4 = login_obj.r_get(brcdapi_util.bns_fc4_features)
+        if fc4 is None:
+            continue
+        if target and 'target' in fc4.lower():
+            rd.update({mem: zone_l.copy()})
+        elif initiator and 'initiator' in fc4.lower():
+            # Used "elif" because if both target & initiator was specified, it will already be in rd
+            rd.update({mem: zone_l.copy()})
 
     return rd
@@ -18,6 +18,8 @@ Establishes a common framework for processing post data collection analysis.
 
 Alerts are not copied in brcddb.util.brcddb_to_plain_copy() and therefore not saved.
 
+Alerts are interned in a project level AlertTbl. Objects only store alert IDs. See AlertTbl for details.
+
 **Version Control**
 
 +-----------+---------------+---------------------------------------------------------------------------------------+
@@ -37,17 +39,30 @@ Alerts are not copied in brcddb.util.brcddb_to_plain_copy() and therefore not sa
 +-----------+---------------+---------------------------------------------------------------------------------------+
 | 4.0.6     | 20 Feb 2026   | Updated copyright notice.                                                             |
 +-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.7     | 18 Oct 2026   | Added AlertTbl                                                                        |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.8     | 18 Oct 2026   | Added AlertTbl.s_build_alert_objects()                                                |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.9     | 18 Oct 2026   | Added the project alert index to AlertTbl                                             |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.0     | 18 Oct 2026   | Alert messages are compiled once and formatted messages are cached                    |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.1     | 18 Oct 2026   | Added AlertTbl.s_unindex_alerts() and AlertTbl.s_record_alerts()                      |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.2     | 18 Oct 2026   | The alert index is one dictionary keyed by alert number. The severity is read when    |
+|           |               | queried.                                                                              |
++-----------+---------------+---------------------------------------------------------------------------------------+
 """
 __author__ = 'Jack Consoli'
 __copyright__ = 'Copyright 2024, 2025, 2026 Jack Consoli'
-__date__ = '20 Feb 2026'
+__date__ = '18 Oct 2026'
 __license__ = 'Apache License, Version 2.0'
 __email__ = 'jack_consoli@yahoo.com'
 __maintainer__ = 'Jack Consoli'
 __status__ = 'Released'
-__version__ = '4.0.6'
+__version__ = '4.1.2'
 
-import copy
+import re
 import brcddb.classes.util as class_util
 
 
@@ -73,6 +88,45 @@ _sev_to_text = {
     ALERT_SEV.ERROR: 'Error',
 }
 
+# Used in compile_msg(). The index in _msg_param_l is the positional argument index in the compiled message.
+_msg_param_l = ('$key', '$p0', '$p1')
+_msg_param_re = re.compile('(' + '|'.join([re.escape(buf) for buf in _msg_param_l]) + ')')
+_compiled_msg_d = dict()  # Key is the message template. Value is the compiled message returned from compile_msg()
+
+
+def compile_msg(msg):
+    """Compiles an alert message template into a str.format() format string where $key, $p0, and $p1 are positional
+    arguments 0, 1, and 2. Compiled messages are cached so each unique template is only compiled once.
+
+    :param msg: Alert message template. See 'm' in AlertObj
+    :type msg: str
+    :return: Format string
+    :rtype: str
+    """
+    global _msg_param_l, _msg_param_re, _compiled_msg_d
+
+    compiled_msg = _compiled_msg_d.get(msg)
+    if compiled_msg is None:
+        buf_l = _msg_param_re.split(msg)  # Literals are at even indices, parameters at odd indices
+        for i in range(0, len(buf_l)):
+            if i % 2 == 0:
+                buf_l[i] = buf_l[i].replace('{', '{{').replace('}', '}}')
+            else:
+                buf_l[i] = '{' + str(_msg_param_l.index(buf_l[i])) + '}'
+        compiled_msg = ''.join(buf_l)
+        _compiled_msg_d[msg] = compiled_msg
+    return compiled_msg
+
+
+def compile_alert_tbl(msg_tbl):
+    """Compiles all the messages in an alert table. Typically called when the module with the table is imported.
+
+    :param msg_tbl: Alert table. See AlertObj
+    :type msg_tbl: dict
+    """
+    for d in [v for v in msg_tbl.values() if isinstance(v, dict) and isinstance(v.get('m'), str)]:
+        compile_msg(d['m'])
+
 
 class AlertObj:
     """Lightweight object for alerts and comments associated with brcddb.classes.
@@ -115,6 +169,8 @@ class AlertObj:
         self._key = key
         self._p0 = p0
         self._p1 = p1
+        self._msg = None  # Cached formatted message. See fmt_msg()
+        self._msg_template = None  # The message template used to format _msg
 
     def r_get_reserved(self, k):
         """Returns a value for any reserved key. Don't forget to update brcddb.util.copy when adding a new key.
@@ -153,11 +209,13 @@ class AlertObj:
         :return: Formatted message
         :rtype str:
         """
-        msg = copy.copy(self._msg_tbl.get(self.alert_num()).get('m'))
-        msg = msg.replace('$key', '') if self._key is None else msg.replace('$key', str(self._key))
-        msg = msg.replace('$p0', '') if self._p0 is None else msg.replace('$p0', str(self._p0))
-        msg = msg.replace('$p1', '') if self._p1 is None else msg.replace('$p1', str(self._p1))
-        return msg
+        msg_template = self._msg_tbl.get(self.alert_num()).get('m')
+        if self._msg is None or msg_template is not self._msg_template:
+            self._msg = compile_msg(msg_template).format('' if self._key is None else str(self._key),
+                                                         '' if self._p0 is None else str(self._p0),
+                                                         '' if self._p1 is None else str(self._p1))
+            self._msg_template = msg_template
+        return self._msg
 
     def sev(self):
         """
@@ -232,3 +290,291 @@ class AlertObj:
         :rtype: Same type as used when the key/value pair was added
         """
         return class_util.format_obj(self, full=full)
+
+
+class AlertTbl:
+    """Project level table of interned alerts.
+
+    Objects do not store AlertObj instances. Each unique (message table, alert number, key, p0, p1) is stored once in
+    this table and assigned an alert ID. Objects only store a list of alert IDs. AlertObj instances are created when
+    first requested with r_alert_obj() and shared by all objects with the same alert. This table is referenced from
+    the project object, see brcddb.classes.project.ProjectObj.r_alert_tbl(). Typically, this table is only accessed
+    from the s_add_alert(), r_alert_objects(), and r_alert_nums() methods in brcddb.classes.util.
+
+    Attributes:
+        _msg_tbl_l (list): Message tables. The index is the message table ID.
+        _msg_tbl_d (dict): Key is id() of the message table. Value is the message table ID.
+        _alert_l (list): Interned (message table ID, alert number, key, p0, p1) tuples. The index is the alert ID.
+        _alert_d (dict): Key is the tuple in _alert_l. Value is the alert ID.
+        _obj_l (list): AlertObj or None if not yet requested. The index is the alert ID.
+        _num_d (dict): Key is the alert number. Value is the list of (object, alert ID) tuples.
+        _record_l (list, None): When not None, (object, alert ID) is appended for every alert added to an object. See
+            s_record_alerts()
+
+    _num_d is the project wide alert index. Alerts are added to the index with s_index_alert() which is called from
+    s_add_alert() in brcddb.classes.util. Alerts are only removed from an object with s_del_alerts() in
+    brcddb.classes.util which calls s_unindex_alerts(). Alerts for a single object are looked up in the alert IDs the
+    object stores. The severity is always read from the message table so it is never copied into the index.
+    """
+
+    def __init__(self):
+        self._msg_tbl_l = list()
+        self._msg_tbl_d = dict()
+        self._alert_l = list()
+        self._alert_d = dict()
+        self._obj_l = list()
+        self._num_d = dict()
+        self._record_l = None
+
+    def s_add_alert(self, msg_tbl, anum, key=None, p0=None, p1=None):
+        """Adds an alert to the table if it doesn't already exist.
+
+        :param msg_tbl: The table that defines this alert. See AlertObj
+        :type msg_tbl: dict
+        :param anum: Alert number. See AlertObj
+        :type anum: int
+        :param key: Key associated with this alert. See AlertObj
+        :type key: str, None
+        :param p0: Optional parameter. See AlertObj
+        :type p0: str, int, float, None
+        :param p1: Optional parameter. See AlertObj
+        :type p1: str, int, float, None
+        :return: Alert ID
+        :rtype: int
+        """
+        tbl_id = self._msg_tbl_d.get(id(msg_tbl))
+        if tbl_id is None:
+            tbl_id = len(self._msg_tbl_l)
+            self._msg_tbl_l.append(msg_tbl)
+            self._msg_tbl_d[id(msg_tbl)] = tbl_id
+        alert_t = (tbl_id, anum, key, p0, p1)
+        try:
+            alert_id = self._alert_d.get(alert_t)
+        except TypeError:  # A parameter isn't hashable. Just add it without interning.
+            alert_id, alert_t = None, None
+        if alert_id is None:
+            alert_id = len(self._alert_l)
+            self._alert_l.append((tbl_id, anum, key, p0, p1))
+            self._obj_l.append(None)
+            if alert_t is not None:
+                self._alert_d[alert_t] = alert_id
+        return alert_id
+
+    def r_alert_obj(self, alert_id):
+        """Returns the alert object for an alert ID. The object is created the first time it is requested.
+
+        :param alert_id: Alert ID returned from s_add_alert()
+        :type alert_id: int
+        :return: Alert object
+        :rtype: AlertObj
+        """
+        alert_obj = self._obj_l[alert_id]
+        if alert_obj is None:
+            tbl_id, anum, key, p0, p1 = self._alert_l[alert_id]
+            alert_obj = AlertObj(self._msg_tbl_l[tbl_id], anum, key, p0, p1)
+            self._obj_l[alert_id] = alert_obj
+        return alert_obj
+
+    def r_alert_num(self, alert_id):
+        """Returns the alert number for an alert ID without creating an alert object
+
+        :param alert_id: Alert ID returned from s_add_alert()
+        :type alert_id: int
+        :return: Alert number
+        :rtype: int
+        """
+        return self._alert_l[alert_id][1]
+
+    def r_sev(self, alert_id):
+        """Returns the severity level for an alert ID without creating an alert object
+
+        :param alert_id: Alert ID returned from s_add_alert()
+        :type alert_id: int
+        :return: Severity level, see ALERT_SEV. ALERT_SEV.GENERAL if the alert is not in the message table
+        :rtype: int
+        """
+        tbl_id, anum = self._alert_l[alert_id][0: 2]
+        try:
+            return self._msg_tbl_l[tbl_id][anum]['s']
+        except (KeyError, IndexError, TypeError):
+            return ALERT_SEV.GENERAL
+
+    def s_index_alert(self, obj, alert_id):
+        """Adds an alert that was added to an object to the alert index
+
+        :param obj: The object the alert was added to
+        :type obj: Any brcddb.classes object with alerts
+        :param alert_id: Alert ID returned from s_add_alert()
+        :type alert_id: int
+        """
+        anum = self._alert_l[alert_id][1]
+        num_l = self._num_d.get(anum)
+        if num_l is None:
+            self._num_d[anum] = [(obj, alert_id)]
+        else:
+            num_l.append((obj, alert_id))
+        if self._record_l is not None:
+            self._record_l.append((obj, alert_id))
+
+    def s_unindex_alerts(self, del_l):
+        """Removes alerts that were removed from objects from the alert index. Typically only called from
+        s_del_alerts() in brcddb.classes.util
+
+        :param del_l: List of (object, alert ID) tuples
+        :type del_l: list
+        """
+        num_del_d = dict()  # Key is the alert number. Value is a dict: key is (id(object), alert ID), value is the count
+        for obj, alert_id in del_l:
+            count_d = num_del_d.get(self._alert_l[alert_id][1])
+            if count_d is None:
+                count_d = dict()
+                num_del_d[self._alert_l[alert_id][1]] = count_d
+            count_d[(id(obj), alert_id)] = count_d.get((id(obj), alert_id), 0) + 1
+
+        # Filter each alert number list once rather than searching the list for every alert removed.
+        for anum, count_d in num_del_d.items():
+            num_l = list()
+            for obj, alert_id in self._num_d.get(anum, list()):
+                k = (id(obj), alert_id)
+                if count_d.get(k, 0) > 0:
+                    count_d[k] -= 1
+                else:
+                    num_l.append((obj, alert_id))
+            if len(num_l) > 0:
+                self._num_d[anum] = num_l
+            else:
+                self._num_d.pop(anum, None)
+
+    def s_record_alerts(self, record_l):
+        """Starts or stops recording alerts added to objects. Used to determine which alerts an analysis added so they
+        can be removed when the analysis is run again. See brcddb.brcddb_analysis
+
+        :param record_l: List to append (object, alert ID) to for every alert added. None stops recording.
+        :type record_l: list, None
+        :return: The list previously used for recording. None if alerts were not being recorded.
+        :rtype: list, None
+        """
+        rl, self._record_l = self._record_l, record_l
+        return rl
+
+    def r_alert_ids_for_num(self, obj, anum):
+        """Returns the alert IDs of all alerts with a specific alert number added to an object
+
+        :param obj: Any brcddb.classes object with alerts
+        :type obj: Any brcddb.classes object with alerts
+        :param anum: Alert number
+        :type anum: int
+        :return: List of alert IDs in the order they were added. Empty if the object doesn't have the alert.
+        :rtype: list
+        """
+        return [alert_id for alert_id in obj._alerts if self._alert_l[alert_id][1] == anum]
+
+    def r_alert_ids_for_key(self, obj, anum, key):
+        """Returns the alert IDs of all alerts with a specific alert number and key added to an object
+
+        :param obj: Any brcddb.classes object with alerts
+        :type obj: Any brcddb.classes object with alerts
+        :param anum: Alert number
+        :type anum: int
+        :param key: Alert key. See AlertObj
+        :type key: str, None
+        :return: List of alert IDs in the order they were added. Empty if the object doesn't have the alert.
+        :rtype: list
+        """
+        return [alert_id for alert_id in obj._alerts if self._alert_l[alert_id][1: 3] == (anum, key)]
+
+    def r_alert_ids_for_sev(self, obj, sev):
+        """Returns the alert IDs of all alerts with a specific severity added to an object
+
+        :param obj: Any brcddb.classes object with alerts
+        :type obj: Any brcddb.classes object with alerts
+        :param sev: Severity level. See ALERT_SEV
+        :type sev: int
+        :return: List of alert IDs in the order they were added. Empty if the object doesn't have any such alerts.
+        :rtype: list
+        """
+        return [alert_id for alert_id in obj._alerts if self.r_sev(alert_id) == sev]
+
+    def r_has_alert(self, obj, anum, key=None, p0=None, p1=None):
+        """Determines if an alert has been added to an object
+
+        :param obj: Any brcddb.classes object with alerts
+        :type obj: Any brcddb.classes object with alerts
+        :param anum: Alert number
+        :type anum: int
+        :param key: Alert key. See AlertObj
+        :type key: str, None
+        :param p0: Alert parameter p0. See AlertObj
+        :type p0: str, int, float, None
+        :param p1: Alert parameter p1. See AlertObj
+        :type p1: str, int, float, None
+        :return: True if the alert has been added to the object
+        :rtype: bool
+        """
+        for alert_id in obj._alerts:
+            if self._alert_l[alert_id][1:] == (anum, key, p0, p1):
+                return True
+        return False
+
+    def r_alerts_for_num(self, anum):
+        """Returns all alerts with a specific alert number in the project
+
+        :param anum: Alert number
+        :type anum: int
+        :return: List of (object, alert ID) tuples in the order they were added
+        :rtype: list
+        """
+        return self._num_d.get(anum, list())
+
+    def r_alerts_for_sev(self, sev):
+        """Returns all alerts of a specific severity in the project. The severity is read from the message table when
+        called so that changes to the severity of an alert are always reflected.
+
+        :param sev: Severity level. See ALERT_SEV
+        :type sev: int
+        :return: List of (object, alert ID) tuples grouped by alert number in the order they were added
+        :rtype: list
+        """
+        return [t for num_l in self._num_d.values() for t in num_l if self.r_sev(t[1]) == sev]
+
+    def r_top_alerts(self, max_alerts=None, sev_l=(ALERT_SEV.ERROR, ALERT_SEV.WARN)):
+        """Returns a summary of the most frequent alerts in the project, most severe first. The severity is read from
+        the message table when called. See r_alerts_for_sev()
+
+        :param max_alerts: Maximum number of alerts to return. None returns all alerts.
+        :type max_alerts: int, None
+        :param sev_l: Severity levels to include. See ALERT_SEV
+        :type sev_l: list, tuple
+        :return: List of dict as follows: alert_obj: First alert object (AlertObj) for the alert number. sev: Severity
+            level. count: Number of times the alert was added to an object. obj_l: Objects the alert was added to.
+        :rtype: list
+        """
+        summary_d = dict()  # Key is (message table ID, alert number). Value is the dict returned
+        for num_l in self._num_d.values():
+            for obj, alert_id in num_l:
+                sev = self.r_sev(alert_id)
+                if sev not in sev_l:
+                    continue
+                k = self._alert_l[alert_id][0: 2]
+                d = summary_d.get(k)
+                if d is None:
+                    summary_d[k] = dict(alert_obj=self.r_alert_obj(alert_id), sev=sev, count=1, obj_l=[obj])
+                else:
+                    d['count'] += 1
+                    d['obj_l'].append(obj)
+        rl = sorted(summary_d.values(), key=lambda x: (x['sev'], x['count']), reverse=True)
+        return rl if max_alerts is None else rl[0: max_alerts]
+
+    def s_build_alert_objects(self):
+        """Creates the alert objects for all alerts not yet requested. Used when freezing a project so that readers
+        never have to update the table. See brcddb.classes.project.ProjectObj.freeze()"""
+        for alert_id in range(0, len(self._obj_l)):
+            self.r_alert_obj(alert_id)
+
+    def r_num_alerts(self):
+        """Returns the number of unique alerts in the table
+
+        :return: Number of unique alerts
+        :rtype: int
+        """
+        return len(self._alert_l)
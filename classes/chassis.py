@@ -35,19 +35,29 @@ Defines the chassis object, ChassisObj.
 +-----------+---------------+---------------------------------------------------------------------------------------+
 | 4.0.6     | 20 Feb 2026   | Updated copyright notice.                                                             |
 +-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.7     | 18 Oct 2026   | Alerts are interned in a project level alert table. See brcddb.classes.alert.AlertTbl |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.8     | 18 Oct 2026   | s_add_xxx() and s_del_xxx() raise FrozenError when the project is frozen              |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.9     | 18 Oct 2026   | r_alert_obj() uses the project alert index                                            |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.0     | 18 Oct 2026   | Added _best_name                                                                      |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.1     | 18 Oct 2026   | s_add_switch() only checks frozen when adding. Explicitly increment the data          |
+|           |               | generation                                                                            |
++-----------+---------------+---------------------------------------------------------------------------------------+
 """
 __author__ = 'Jack Consoli'
 __copyright__ = 'Copyright 2024, 2025, 2026 Jack Consoli'
-__date__ = '20 Feb 2026'
+__date__ = '18 Oct 2026'
 __license__ = 'Apache License, Version 2.0'
 __email__ = 'jack_consoli@yahoo.com'
 __maintainer__ = 'Jack Consoli'
 __status__ = 'Released'
-__version__ = '4.0.6'
+__version__ = '4.1.1'
 
 import brcdapi.util as brcdapi_util
 import brcdapi.gen_util as gen_util
-import brcddb.classes.alert as alert_class
 import brcddb.classes.util as class_util
 
 # Programmer's Tip: Apparently, .clear() doesn't work on de-referenced list and dict. Rather than write my own, I rely
@@ -67,7 +77,8 @@ class ChassisObj:
     * _flags (int): Flags for each class are defined in brcddb.brcddb_common
     * _switch_keys (str): List of logical switch WWNs defined on this chassis
     * _project_obj (ProjectObj): The project object this chassis belongs to.
-    * _alerts (list): List of AlertObj objects associated with this object.
+    * _alerts (list): Alert IDs associated with this object. See brcddb.classes.alert.AlertTbl
+    * _best_name (dict, None): Cached names. See brcddb.classes.util.r_cached_name()
     """
 
     def __init__(self, name, project_obj):
@@ -75,6 +86,7 @@ class ChassisObj:
         self._flags = 0
         self._switch_keys = list()
         self._alerts = list()
+        self._best_name = None  # See brcddb.classes.util.r_cached_name()
         self._project_obj = project_obj
 
     def r_get_reserved(self, k):
@@ -89,6 +101,7 @@ class ChassisObj:
                 _obj_key=self.r_obj_key(),
                 _flags=self.r_flags(),
                 _alerts=self.r_alert_objects(),
+                _best_name=self._best_name,
                 _project_obj=self.r_project_obj(),
                 _switch_keys=self.r_switch_keys(),
             ),
@@ -110,33 +123,28 @@ class ChassisObj:
         :return: Alert object
         :rtype: alert_class.AlertObj
         """
-        alert_obj = alert_class.AlertObj(tbl, num, key, p0, p1)
-        self._alerts.append(alert_obj)
-        return alert_obj
+        return class_util.s_add_alert(self, tbl, num, key, p0, p1)
 
     def r_alert_objects(self):
         """Returns a list of alert objects associated with this object
         :return: List of alert objects (brcddb.classes.alert.AlertObj)
         :rtype: list
         """
-        return self._alerts
+        return class_util.r_alert_objects(self)
 
     def r_alert_nums(self):
         """Returns a list of alert numbers associated with this object
         :return: List of alert objects (brcddb.classes.alert.AlertObj)
         :rtype: list
         """
-        return [alert_obj.alert_num() for alert_obj in self._alerts]
+        return class_util.r_alert_nums(self)
 
     def r_alert_obj(self, alert_num):
         """Returns the alert object for a specific alert number
         :return: Alert object. None if not found.
         :rtype: None, brcddb.classes.alert.AlertObj
         """
-        for alert_obj in self.r_alert_objects():
-            if alert_obj.alert_num() == alert_num:
-                return alert_obj
-        return None
+        return class_util.r_alert_obj(self, alert_num)
 
     def r_reserved_keys(self):
         """Returns a list of reserved words (keys) associated with this object
@@ -256,6 +264,8 @@ class ChassisObj:
         :type wwn: str
         """
         if wwn not in self._switch_keys:
+            class_util.check_frozen(self)
+            class_util.s_data_gen(self)
             self._switch_keys.append(wwn)
         switch_obj = self.r_project_obj().s_add_switch(wwn)
         switch_obj.s_chassis_key(self.r_obj_key())
@@ -267,6 +277,8 @@ class ChassisObj:
         :type wwn: str
         :rtype: None
         """
+        class_util.check_frozen(self)
+        class_util.s_data_gen(self)
         self._switch_keys = list(filter(lambda item: item != wwn, self._switch_keys))
 
     def r_switch_keys(self):
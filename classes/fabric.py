@@ -43,23 +43,54 @@ is some way to determine this case but it being such a rare scenario, no code wa
 +-----------+---------------+---------------------------------------------------------------------------------------+
 | 4.0.5     | 20 Feb 2026   | Updated copyright notice.                                                             |
 +-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.6     | 18 Oct 2026   | Alerts are interned in a project level alert table. See brcddb.classes.alert.AlertTbl |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.7     | 18 Oct 2026   | s_add_xxx() and s_del_xxx() raise FrozenError when the project is frozen              |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.8     | 18 Oct 2026   | Use r_has_member() and r_has_pmember() for zone and alias membership tests            |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.9     | 18 Oct 2026   | Added r_eff_zoned_to_map(). s_add_eff_zone() adds pmem as principal members.          |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.0     | 18 Oct 2026   | Added zone merge groups and r_zone_member_wwns()                                      |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.1     | 18 Oct 2026   | Added r_isl_topology() and s_isl_dirty()                                              |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.2     | 18 Oct 2026   | r_alert_obj() uses the project alert index                                            |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.3     | 18 Oct 2026   | Added _best_name                                                                      |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.4     | 18 Oct 2026   | s_add_login(), s_add_zonecfg(), and s_add_fdmi_xxx() only check frozen when adding    |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.5     | 18 Oct 2026   | r_eff_zoned_to_map() is rebuilt when the project data generation changes              |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.6     | 18 Oct 2026   | Clearing the zone merge groups also clears the group ID in each zone                  |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.7     | 18 Oct 2026   | Clearing the zone merge groups also clears the group ID in the effective zones. Added |
+|           |               | the defined parameter to r_zone_merge_groups()                                        |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.8     | 18 Oct 2026   | r_isl_topology() is rebuilt when the project data generation changes                  |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.9     | 18 Oct 2026   | s_add_switch(), s_add_zone(), s_add_eff_zone(), s_add_alias(), and                    |
+|           |               | s_add_eff_zonecfg() only check frozen when adding. Explicitly increment the data      |
+|           |               | generation                                                                            |
++-----------+---------------+---------------------------------------------------------------------------------------+
 """
 __author__ = 'Jack Consoli'
 __copyright__ = 'Copyright 2024, 2025, 2026 Jack Consoli'
-__date__ = '20 Feb 2026'
+__date__ = '18 Oct 2026'
 __license__ = 'Apache License, Version 2.0'
 __email__ = 'jack_consoli@yahoo.com'
 __maintainer__ = 'Jack Consoli'
 __status__ = 'Released'
-__version__ = '4.0.5'
+__version__ = '4.1.9'
 
 import brcdapi.gen_util as gen_util
 import brcdapi.util as brcdapi_util
 import brcddb.brcddb_common as brcddb_common
-import brcddb.classes.alert as alert_class
 import brcddb.classes.util as class_util
 import brcddb.classes.zone as zone_class
 import brcddb.classes.login as login_class
+import brcddb.classes.isl as isl_class
 
 # Programmer's Tip: Apparently, .clear() doesn't work on de-referenced list and dict. Rather than write my own, I rely
 # on Python garbage collection to clean it up. If delete becomes common, I'll have to revisit this but for now, I took
@@ -92,9 +123,13 @@ class FabricObj:
         _eff_zone_objs (dict): Zones in the effective zone configuration. Key: zone name, value: ZoneObj.
         _fdmi_node_objs (dict): FDMI node information. Key: login WWN, value: FdmiNodeObj.
         _fdmi_port_objs (dict): FDMI port information. Key: login WWN, value: FdmiPortObj.
-        _alerts (list): List of AlertObj objects associated with this object.
+        _alerts (list): Alert IDs associated with this object. See brcddb.classes.alert.AlertTbl
+        _best_name (dict, None): Cached names. See brcddb.classes.util.r_cached_name()
         _base_logins (list): List of base NPIV login WWNs. Filled in my brcddb.util.util.build_login_port_map()
         _port_map (dict): List of base NPIV login WWNs. Filled in my brcddb.util.util.build_login_port_map()
+        _eff_zoned_to (dict, None): Cached zoned to map for the effective zone configuration. See r_eff_zoned_to_map()
+        _zone_merge_groups (dict, None): Zone merge groups. See brcddb.brcddb_fabric.zone_merge_groups()
+        _isl_topology (IslTopology, None): Cached ISL topology. See r_isl_topology()
     """
 
     def __init__(self, name, project_obj, add_switch=True):  # name is the WWN of the fabric principal switch
@@ -109,9 +144,13 @@ class FabricObj:
         self._fdmi_node_objs = dict()
         self._fdmi_port_objs = dict()
         self._alerts = list()
+        self._best_name = None  # See brcddb.classes.util.r_cached_name()
         self._project_obj = project_obj
         self._base_logins = list()
         self._port_map = dict()
+        self._eff_zoned_to = None
+        self._zone_merge_groups = None
+        self._isl_topology = None
 
     def r_get_reserved(self, k):
         """Returns a value for any reserved key. Don't forget to update brcddb.util.copy when adding a new key.
@@ -126,6 +165,7 @@ class FabricObj:
                 _obj_key=self.r_obj_key(),
                 _flags=self.r_flags(),
                 _alerts=self.r_alert_objects(),
+                _best_name=self._best_name,
                 _project_obj=self.r_project_obj(),
                 _switch_keys=self.r_switch_keys(),
                 _login_objs=self.r_login_objs(),
@@ -137,6 +177,9 @@ class FabricObj:
                 _fdmi_port_objs=self.r_fdmi_port_objs(),
                 _base_logins=self.r_base_logins(),
                 _port_map=self.r_port_map(),
+                _eff_zoned_to=self._eff_zoned_to,
+                _zone_merge_groups=self._zone_merge_groups,
+                _isl_topology=self._isl_topology,
             ),
             k
         )
@@ -156,9 +199,7 @@ class FabricObj:
         :return: Alert object
         :rtype: brcddb.classes.alert.AlertObj
         """
-        alert_obj = alert_class.AlertObj(tbl, num, key, p0, p1)
-        self._alerts.append(alert_obj)
-        return alert_obj
+        return class_util.s_add_alert(self, tbl, num, key, p0, p1)
 
     def r_alert_objects(self):
         """Returns a list of alert objects associated with this object
@@ -166,7 +207,7 @@ class FabricObj:
         :return: List of alert objects (brcddb.classes.alert.AlertObj)
         :rtype: list
         """
-        return self._alerts
+        return class_util.r_alert_objects(self)
 
     def r_alert_nums(self):
         """Returns a list of alert numbers associated with this object
@@ -174,7 +215,7 @@ class FabricObj:
         :return: List of alert objects (brcddb.classes.alert.AlertObj)
         :rtype: list
         """
-        return [alert_obj.alert_num() for alert_obj in self._alerts]
+        return class_util.r_alert_nums(self)
 
     def r_alert_obj(self, alert_num):
         """Returns the alert object for a specific alert number
@@ -182,10 +223,7 @@ class FabricObj:
         :return: Alert object. None if not found.
         :rtype: None, brcddb.classes.alert.AlertObj
         """
-        for alert_obj in self.r_alert_objects():
-            if alert_obj.alert_num() == alert_num:
-                return alert_obj
-        return None
+        return class_util.r_alert_obj(self, alert_num)
 
     def r_reserved_keys(self):
         """Returns a list of reserved words (keys) associated with this object
@@ -252,7 +290,10 @@ class FabricObj:
         :rtype: brcddb.classes.zone.SwitchObj
         """
         if wwn not in self._switch_keys:
+            class_util.check_frozen(self)
+            class_util.s_data_gen(self)
             self._switch_keys.append(wwn)
+            self._isl_topology = None
         switch_obj = self.r_project_obj().s_add_switch(wwn)
         if add_fab_key:
             switch_obj.s_fabric_key(self.r_obj_key())
@@ -265,7 +306,10 @@ class FabricObj:
         :type wwn: str
         :rtype: None
         """
+        class_util.check_frozen(self)
+        class_util.s_data_gen(self)
         self._switch_keys = list(filter(lambda item: item != wwn, self._switch_keys))
+        self._isl_topology = None
 
     def s_add_login(self, wwn):
         """Adds a login to the fabric if it doesn't already exist
@@ -277,6 +321,8 @@ class FabricObj:
         """
         login_obj = self._login_objs.get(wwn)
         if login_obj is None:
+            class_util.check_frozen(self)
+            class_util.s_data_gen(self)
             login_obj = login_class.LoginObj(wwn, self.r_project_obj(), self.r_obj_key())
             self._login_objs.update({wwn: login_obj})
         return login_obj
@@ -287,6 +333,8 @@ class FabricObj:
         :param wwn: WWN of the login
         :type wwn: str
         """
+        class_util.check_frozen(self)
+        class_util.s_data_gen(self)
         if wwn in self._login_objs:
             del self._login_objs[wwn]
 
@@ -339,6 +387,8 @@ class FabricObj:
         """
         zonecfg_obj = self._zonecfg_objs.get(name)
         if zonecfg_obj is None:
+            class_util.check_frozen(self)
+            class_util.s_data_gen(self)
             zonecfg_obj = zone_class.ZoneCfgObj(name, self.r_project_obj(), self.r_obj_key())
             self._zonecfg_objs.update({name: zonecfg_obj})
         zonecfg_obj.s_add_member(mem)
@@ -350,6 +400,8 @@ class FabricObj:
         :param members: Name or list of zone configurations to be deleted
         :type members: None, str, list, tuple
         """
+        class_util.check_frozen(self)
+        class_util.s_data_gen(self)
         for mem in [m for m in gen_util.convert_to_list(members) if m in self._zonecfg_objs]:
             del self._zonecfg_objs[mem]
 
@@ -397,7 +449,7 @@ class FabricObj:
         :return: List of zone configuration names where zone is used
         :rtype: list
         """
-        return [obj.r_obj_key() for obj in self.r_zonecfg_objects() if zone in obj.r_members()]
+        return [obj.r_obj_key() for obj in self.r_zonecfg_objects() if obj.r_has_member(zone)]
 
     def r_defined_eff_zonecfg_key(self):
         """Returns the defined zone configuration name for the effective zone.
@@ -434,6 +486,10 @@ class FabricObj:
 
     def s_del_eff_zonecfg(self):
         """Deletes '_effective_zone_cfg' if it exists."""
+        class_util.check_frozen(self)
+        class_util.s_data_gen(self)
+        self.s_zone_merge_groups(None)
+        self._eff_zoned_to = None
         self.s_del_zonecfg('_effective_zone_cfg')
 
     def r_eff_zone_cfg_obj(self):
@@ -460,10 +516,15 @@ class FabricObj:
         """
         zone_obj = self.r_zone_obj(name)
         if zone_obj is None:
+            class_util.check_frozen(self)
+            class_util.s_data_gen(self)
+            self.s_zone_merge_groups(None)
             zone_obj = zone_class.ZoneObj(name, zone_type, self.r_project_obj(), self.r_obj_key())
             self._zone_objs.update({name: zone_obj})
-        if zone_type is not None:
-            zone_obj.s_type(zone_type)  # This is redundant when creating a zone for the first time
+        elif zone_type is not None and zone_type != zone_obj.r_type():
+            class_util.check_frozen(self)
+            class_util.s_data_gen(self)
+            zone_obj.s_type(zone_type)
         zone_obj.s_add_member(mem)
         zone_obj.s_add_pmember(pmem)
         return zone_obj
@@ -476,8 +537,8 @@ class FabricObj:
         :return: List of zone names that are either members or principal members
         :rtype: list
         """
-        return [obj.r_obj_key() for obj in self.r_zone_objects() if alias in obj.r_members() or alias in
-                obj.r_pmembers()]
+        return [obj.r_obj_key() for obj in self.r_zone_objects() if obj.r_has_member(alias) or
+                obj.r_has_pmember(alias)]
 
     def r_zones_for_wwn(self, wwn):
         """Returns all the zones, by name, a WWN is used in whether by WWN explicitly or by alias
@@ -490,7 +551,7 @@ class FabricObj:
         if wwn is None:
             return list()
         # Below fills l with the zones defined with wwn
-        zone_l = [obj.r_obj_key() for obj in self.r_zone_objects() if wwn in obj.r_members() or wwn in obj.r_pmembers()]
+        zone_l = [obj.r_obj_key() for obj in self.r_zone_objects() if obj.r_has_member(wwn) or obj.r_has_pmember(wwn)]
         # Below gets all the zones where wwn is in an alias
         for alias in self.r_alias_for_wwn(wwn):
             zone_l.extend(self.r_zones_for_alias(alias))
@@ -510,7 +571,7 @@ class FabricObj:
             di = str(did) + ',' + str(p_index)
             # Below fills zone_l with the zones defined with d,i
             zone_l = \
-                [obj.r_obj_key() for obj in self.r_zone_objects() if di in obj.r_members() or di in obj.r_pmembers()]
+                [obj.r_obj_key() for obj in self.r_zone_objects() if obj.r_has_member(di) or obj.r_has_pmember(di)]
             # Below gets all the zones where di is in an alias
             for alias in self.r_alias_for_di(did, p_index):
                 zone_l.extend(self.r_zones_for_alias(alias))
@@ -536,16 +597,22 @@ class FabricObj:
         """
         zone_obj = self.r_eff_zone_obj(name)
         if zone_obj is None:
+            class_util.check_frozen(self)
+            class_util.s_data_gen(self)
+            self.s_zone_merge_groups(None)
+            self._eff_zoned_to = None
             zone_obj = zone_class.ZoneObj(name, zone_type, self.r_project_obj(), self.r_obj_key())
             self._eff_zone_objs.update({name: zone_obj})
+        elif zone_type is not None and zone_type != zone_obj.r_type():
+            class_util.check_frozen(self)
+            class_util.s_data_gen(self)
+            zone_obj.s_type(zone_type)
         zone_obj.s_or_flags(brcddb_common.zone_flag_effective)  # I don't think I need to do this here
         d_zone_obj = self.r_zone_obj(name)
         if d_zone_obj is not None:
             d_zone_obj.s_or_flags(brcddb_common.zone_flag_effective)
-        if zone_type is not None:
-            zone_obj.s_type(zone_type)  # This is redundant when creating a zone for the first time
         zone_obj.s_add_member(mem)
-        zone_obj.s_add_member(pmem)
+        zone_obj.s_add_pmember(pmem)
         self.s_add_eff_zonecfg(name)
         return zone_obj
 
@@ -595,7 +662,7 @@ class FabricObj:
         """
         ret_list = list()
         for zone_obj in self.r_eff_zone_objects():
-            if wwn in zone_obj.r_members() or wwn in zone_obj.r_pmembers():
+            if zone_obj.r_has_member(wwn) or zone_obj.r_has_pmember(wwn):
                 ret_list.append(zone_obj)
         return ret_list
 
@@ -609,6 +676,130 @@ class FabricObj:
         """
         return [zone_obj.r_obj_key() for zone_obj in self.r_eff_zone_objects_for_wwn(wwn)]
 
+    def r_zone_member_wwns(self, mem_l):
+        """Resolves zone members to WWNs. d,i members are resolved to the WWNs logged in to the port. Aliases must
+        already be resolved. See brcddb.classes.zone.ZoneObj.c_members()
+
+        :param mem_l: Zone members
+        :type mem_l: list
+        :return: List of WWNs
+        :rtype: list
+        """
+        rl = list()
+        for mem in mem_l:
+            if gen_util.is_wwn(mem):
+                rl.append(mem)
+            elif gen_util.is_di(mem):
+                port_obj = self.r_port_object_for_di(mem)
+                if port_obj is not None:
+                    rl.extend(port_obj.r_login_keys())
+        return rl
+
+    def r_eff_zoned_to_map(self):
+        """Returns a map of every WWN in the effective zone configuration to the WWNs it is zoned to. In peer zones,
+        principal members are only zoned to non-principal members and non-principal members are only zoned to principal
+        members. d,i members are resolved to the WWNs logged in to the port.
+
+        The map is built the first time it is requested and cached. The cache is cleared when a zone is added to the
+        effective zone configuration, when the effective zone configuration is deleted, when the effective zone
+        configuration checksum changes, and when any data in the project changes, such as added logins or updated port
+        addresses. See brcddb.classes.project.ProjectObj.r_data_gen(). The returned dictionary is the cache so it should
+        not be modified.
+
+        :return: Key: WWN. Value: dict whose key is a WWN zoned to the key WWN and whose value is the list of zone
+            names that zone them together.
+        :rtype: dict
+        """
+        checksum, data_gen = self.r_get(brcdapi_util.bz_eff_checksum), self.r_project_obj().r_data_gen()
+        if self._eff_zoned_to is not None and self._eff_zoned_to['checksum'] == checksum and \
+                self._eff_zoned_to['data_gen'] == data_gen:
+            return self._eff_zoned_to['wwn_d']
+
+        wwn_d = dict()
+        for zone_obj in self.r_eff_zone_objects():
+            zone = zone_obj.r_obj_key()
+            mem_l = self.r_zone_member_wwns(zone_obj.r_members())
+            if zone_obj.r_type() == brcddb_common.ZONE_STANDARD_ZONE:
+                pair_l = [(mem_l, mem_l)]
+            else:
+                pmem_l = self.r_zone_member_wwns(zone_obj.r_pmembers())
+                pair_l = [(pmem_l, mem_l), (mem_l, pmem_l)]
+            for from_l, to_l in pair_l:
+                for wwn in from_l:
+                    zoned_to_d = wwn_d.get(wwn)
+                    if zoned_to_d is None:
+                        zoned_to_d = dict()
+                        wwn_d[wwn] = zoned_to_d
+                    for to_wwn in to_l:
+                        if to_wwn == wwn:
+                            continue
+                        zone_l = zoned_to_d.get(to_wwn)
+                        if zone_l is None:
+                            zoned_to_d[to_wwn] = [zone]
+                        elif zone_l[-1] != zone:
+                            zone_l.append(zone)
+
+        self._eff_zoned_to = dict(checksum=checksum, data_gen=data_gen, wwn_d=wwn_d)
+        return wwn_d
+
+    def r_isl_topology(self):
+        """Returns the ISL topology for this fabric. The topology is built the first time it is requested and cached.
+        It is rebuilt when a switch is added or deleted, when s_isl_dirty() is called, or when the project data
+        generation changes. See brcddb.classes.isl.signature()
+
+        :return: ISL topology
+        :rtype: brcddb.classes.isl.IslTopology
+        """
+        switch_obj_l = [obj for obj in self.r_switch_objects() if obj is not None]
+        if self._isl_topology is None or self._isl_topology.r_signature() != isl_class.signature(switch_obj_l):
+            self._isl_topology = isl_class.IslTopology(switch_obj_l)
+        return self._isl_topology
+
+    def s_isl_dirty(self):
+        """Clears the cached ISL topology. Only needed when trunk or port data is modified in place without calling
+        brcddb.classes.project.ProjectObj.s_data_gen()."""
+        self._isl_topology = None
+
+    def s_zone_merge_groups(self, group_d):
+        """Sets the zone merge groups. Typically only called from brcddb.brcddb_fabric.zone_merge_groups(). Set to None
+        to clear the groups. Clearing the groups also clears the group ID in each zone. See
+        brcddb.classes.zone.ZoneObj.r_merge_group()
+
+        :param group_d: group_l: List of dict(zone_l=list of zone names, wwn_l=list of WWNs). The index is the group
+            ID. wwn_d: Key is a WWN. Value is the group ID. defined: True if the groups include the defined zones.
+        :type group_d: dict, None
+        """
+        if group_d is None and self._zone_merge_groups is not None:
+            for zone_obj in list(self._zone_objs.values()) + list(self._eff_zone_objs.values()):
+                zone_obj.s_merge_group(None)
+        self._zone_merge_groups = group_d
+
+    def r_zone_merge_groups(self, defined=False):
+        """Returns the zone merge groups. The groups are cleared whenever a zone or alias is added, deleted, or has its
+        members changed.
+
+        :param defined: If True, return the groups built from the defined and effective zones. Otherwise, return the
+            groups built from the effective zones only.
+        :type defined: bool
+        :return: List of dict(zone_l=list of zone names, wwn_l=list of WWNs). The index is the group ID. None if the
+            groups have not been built or were built with a different defined parameter. See
+            brcddb.brcddb_fabric.zone_merge_groups()
+        :rtype: list, None
+        """
+        if self._zone_merge_groups is None or self._zone_merge_groups.get('defined', False) != defined:
+            return None
+        return self._zone_merge_groups['group_l']
+
+    def r_zone_merge_group_for_wwn(self, wwn):
+        """Returns the zone merge group ID for a WWN
+
+        :param wwn: WWN
+        :type wwn: str
+        :return: Group ID. None if the WWN is not zoned or the groups have not been built.
+        :rtype: int, None
+        """
+        return None if self._zone_merge_groups is None else self._zone_merge_groups['wwn_d'].get(wwn)
+
     def r_eff_di_zones_for_addr(self, addr):
         return list()  # WIP
 
@@ -618,6 +809,9 @@ class FabricObj:
         :param members: Zone name or list of zone names to be deleted
         :type members: None, str, list, tuple
         """
+        class_util.check_frozen(self)
+        class_util.s_data_gen(self)
+        self.s_zone_merge_groups(None)
         for mem in [m for m in gen_util.convert_to_list(members) if m in self._zone_objs]:
             del self._zone_objs[mem]
 
@@ -673,10 +867,12 @@ class FabricObj:
         if name in self._alias_objs:
             alias_obj = self._alias_objs[name]
         else:
+            class_util.check_frozen(self)
+            class_util.s_data_gen(self)
+            self.s_zone_merge_groups(None)
             alias_obj = zone_class.AliasObj(name, self.r_project_obj(), self.r_obj_key())
             self._alias_objs.update({name: alias_obj})
-        # No one should try to add the same member twice, but just in case
-        alias_obj.s_add_member([wwn for wwn in mem if wwn not in alias_obj.r_members()])
+        alias_obj.s_add_member(mem)  # s_add_member() ignores members that already exist
         return alias_obj
 
     def s_del_alias(self, members):
@@ -685,6 +881,9 @@ class FabricObj:
         :param members: Name or list of the aliases to be deleted
         :type members: None, str, list, tuple
         """
+        class_util.check_frozen(self)
+        class_util.s_data_gen(self)
+        self.s_zone_merge_groups(None)
         for mem in [m for m in gen_util.convert_to_list(members) if m in self._alias_objs]:
             del self._alias_objs[mem]
 
@@ -732,7 +931,7 @@ class FabricObj:
         :return: List of brcddb.classes.zone.AliasObj
         :rtype: list
         """
-        return [alias_obj for alias_obj in self.r_alias_objects() if wwn in alias_obj.r_members()]
+        return [alias_obj for alias_obj in self.r_alias_objects() if alias_obj.r_has_member(wwn)]
 
     def r_alias_for_wwn(self, wwn):
         """Returns a list of aliases, by name, a WWN is a member of
@@ -755,7 +954,7 @@ class FabricObj:
         :rtype: list
         """
         di = str(did) + ',' + str(p_index)
-        return [alias_obj for alias_obj in self.r_alias_objects() if di in alias_obj.r_members()]
+        return [alias_obj for alias_obj in self.r_alias_objects() if alias_obj.r_has_member(di)]
 
     def r_alias_for_di(self, did, p_index):
         """Returns a list of aliases, by name, a "d,i zone" is a member of
@@ -779,6 +978,8 @@ class FabricObj:
         """
         fdmi_obj = self.r_fdmi_node_obj(wwn)
         if fdmi_obj is None:
+            class_util.check_frozen(self)
+            class_util.s_data_gen(self)
             fdmi_obj = login_class.FdmiNodeObj(wwn, self.r_project_obj(), self.r_obj_key())
             self._fdmi_node_objs.update({wwn: fdmi_obj})
         return fdmi_obj
@@ -789,6 +990,8 @@ class FabricObj:
         :param wwn: WWN
         :type wwn: str
         """
+        class_util.check_frozen(self)
+        class_util.s_data_gen(self)
         if wwn in self._fdmi_node_objs:
             del self._fdmi_node_objs[wwn]
 
@@ -838,6 +1041,8 @@ class FabricObj:
         """
         fdmi_obj = self.r_fdmi_port_obj(wwn)
         if fdmi_obj is None:
+            class_util.check_frozen(self)
+            class_util.s_data_gen(self)
             fdmi_obj = login_class.FdmiPortObj(wwn, self.r_project_obj(), self.r_obj_key())
             self._fdmi_port_objs.update({wwn: fdmi_obj})
         return fdmi_obj
@@ -847,6 +1052,8 @@ class FabricObj:
         :param wwn: WWN
         :type wwn: str
         """
+        class_util.check_frozen(self)
+        class_util.s_data_gen(self)
         if wwn in self._fdmi_port_objs:
             del self._fdmi_port_objs[wwn]
 
@@ -36,17 +36,25 @@ Defines the IOCP class IOCPObj
 +-----------+---------------+---------------------------------------------------------------------------------------+
 | 4.0.6     | 20 Feb 2026   | Updated copyright notice.                                                             |
 +-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.7     | 18 Oct 2026   | Alerts are interned in a project level alert table. See brcddb.classes.alert.AlertTbl |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.8     | 18 Oct 2026   | s_add_xxx() and s_del_xxx() raise FrozenError when the project is frozen              |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.9     | 18 Oct 2026   | r_alert_obj() uses the project alert index                                            |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.0     | 18 Oct 2026   | IOCPObj.s_add_chpid() and ChpidObj.s_add_path() only check frozen when adding.        |
+|           |               | Explicitly increment the data generation                                              |
++-----------+---------------+---------------------------------------------------------------------------------------+
 """
 __author__ = 'Jack Consoli'
 __copyright__ = 'Copyright 2024, 2025, 2026 Jack Consoli'
-__date__ = '20 Feb 2026'
+__date__ = '18 Oct 2026'
 __license__ = 'Apache License, Version 2.0'
 __email__ = 'jack_consoli@yahoo.com'
 __maintainer__ = 'Jack Consoli'
 __status__ = 'Released'
-__version__ = '4.0.6'
+__version__ = '4.1.0'
 
-import brcddb.classes.alert as alert_class
 import brcddb.classes.util as class_util
 
 # Programmer's Tip: Apparently, .clear() doesn't work on de-referenced list and dict. Rather than write my own, I rely
@@ -64,7 +72,7 @@ class IOCPObj:
         _flags (int): Flags for each class are defined in brcddb.brcddb_common
         _project_obj (ProjectObj): The project object this IOCP belongs to.
         _chpid_objs (dict): Dictionary of paths. Key is the CHPID tag, value is the CHPID object, ChpidObj
-        _alerts (list): List of AlertObj objects associated with this object.
+        _alerts (list): Alert IDs associated with this object. See brcddb.classes.alert.AlertTbl
     """
 
     def __init__(self, name, project_obj):
@@ -108,9 +116,7 @@ class IOCPObj:
         :return: Alert object
         :rtype: brcddb.classes.alert.AlertObj
         """
-        alert_obj = alert_class.AlertObj(tbl, num, key, p0, p1)
-        self._alerts.append(alert_obj)
-        return alert_obj
+        return class_util.s_add_alert(self, tbl, num, key, p0, p1)
 
     def r_alert_objects(self):
         """Returns a list of alert objects associated with this object
@@ -118,7 +124,7 @@ class IOCPObj:
         :return: List of alert objects (brcddb.classes.alert.AlertObj)
         :rtype: list
         """
-        return self._alerts
+        return class_util.r_alert_objects(self)
 
     def r_alert_nums(self):
         """Returns a list of alert numbers associated with this object
@@ -126,7 +132,7 @@ class IOCPObj:
         :return: List of alert objects (brcddb.classes.alert.AlertObj)
         :rtype: list
         """
-        return [alert_obj.alert_num() for alert_obj in self._alerts]
+        return class_util.r_alert_nums(self)
 
     def r_alert_obj(self, alert_num):
         """Returns the alert object for a specific alert number
@@ -134,10 +140,7 @@ class IOCPObj:
         :return: Alert object. None if not found.
         :rtype: None, brcddb.classes.alert.AlertObj
         """
-        for alert_obj in self.r_alert_objects():
-            if alert_obj.alert_num() == alert_num:
-                return alert_obj
-        return None
+        return class_util.r_alert_obj(self, alert_num)
 
     def r_reserved_keys(self):
         """Returns a list of reserved words (keys) associated with this object
@@ -208,6 +211,8 @@ class IOCPObj:
         """
         chpid_obj = self.r_path_obj(tag)
         if chpid_obj is None:
+            class_util.check_frozen(self)
+            class_util.s_data_gen(self)
             chpid_obj = ChpidObj(tag, self.r_project_obj(), pchid, switch_id, partition)
             self._chpid_objs.update({tag: chpid_obj})
         return chpid_obj
@@ -348,7 +353,7 @@ class ChpidObj:
         _switch_id (str): Switch ID (SWITCH= in CHPID macro)
         _link_addr (dict): Dictionary of link addresses. Key is the link address, value is a dictionary as follows:
             cu_num: dictionary of control unit numbers, value is the unit type.
-        _alerts (list): List of AlertObj objects associated with this object.
+        _alerts (list): Alert IDs associated with this object. See brcddb.classes.alert.AlertTbl
     """
 
     def __init__(self, tag, project_obj, pchid, switch_id, partitions):
@@ -397,9 +402,7 @@ class ChpidObj:
         :return: Alert object
         :rtype: brcddb.classes.alert.AlertObj
         """
-        alert_obj = alert_class.AlertObj(tbl, num, key, p0, p1)
-        self._alerts.append(alert_obj)
-        return alert_obj
+        return class_util.s_add_alert(self, tbl, num, key, p0, p1)
 
     def r_alert_objects(self):
         """Returns a list of alert objects associated with this object
@@ -407,7 +410,7 @@ class ChpidObj:
         :return: List of alert objects (brcddb.classes.alert.AlertObj)
         :rtype: list
         """
-        return self._alerts
+        return class_util.r_alert_objects(self)
 
     def r_alert_nums(self):
         """Returns a list of alert numbers associated with this object
@@ -415,7 +418,7 @@ class ChpidObj:
         :return: List of alert objects (brcddb.classes.alert.AlertObj)
         :rtype: list
         """
-        return [alert_obj.alert_num() for alert_obj in self._alerts]
+        return class_util.r_alert_nums(self)
 
     def r_reserved_keys(self):
         """Returns a list of reserved words (keys) associated with this object
@@ -481,10 +484,12 @@ class ChpidObj:
         :type cu_type: str
         """
         link_addr_d = self._link_addr.get(link_addr)
-        if link_addr_d is None:
-            link_addr_d = dict()
-            self._link_addr.update({link_addr: link_addr_d})
-        if cu_num not in link_addr_d:
+        if link_addr_d is None or cu_num not in link_addr_d:
+            class_util.check_frozen(self)
+            class_util.s_data_gen(self)
+            if link_addr_d is None:
+                link_addr_d = dict()
+                self._link_addr.update({link_addr: link_addr_d})
             link_addr_d.update({cu_num: cu_type})
 
     def r_link_addr(self, link_addr):
@@ -0,0 +1,252 @@
+"""
+Copyright 2023, 2024, 2025, 2026 Jack Consoli.  All rights reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+the License. You may also obtain a copy of the License at https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the specific
+language governing permissions and limitations under the License.
+
+The license is free for single customer use (internal applications). Use of this module in the production,
+redistribution, or service delivery for commerce requires an additional license. Contact jack_consoli@yahoo.com for
+details.
+
+**Description**
+
+ISL topology for a fabric. The topology is built once from 'brocade-fibrechannel-trunk/trunk' of each switch in the
+fabric and cached in the fabric object. See brcddb.classes.fabric.FabricObj.r_isl_topology(). The cached topology is
+rebuilt when the switches in the fabric change or any data in the project is added or changed. See signature().
+
+Only the structure, which ports are connected to which ports, is cached. Port attributes such as the login speed and
+the alerts associated with logins are read from the port objects when requested.
+
+**Public Methods**
+
++-----------------------+-------------------------------------------------------------------------------------------+
+| Method                | Description                                                                               |
++=======================+===========================================================================================+
+| signature             | Returns a value that changes when the switches or any data in the project changes.        |
++-----------------------+-------------------------------------------------------------------------------------------+
+
+**Version Control**
+
++-----------+---------------+---------------------------------------------------------------------------------------+
+| Version   | Last Edit     | Description                                                                           |
++===========+===============+=======================================================================================+
+| 4.0.0     | 18 Oct 2026   | Initial launch                                                                        |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.1     | 18 Oct 2026   | Use the project alert index to find AMP logins                                        |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.2     | 18 Oct 2026   | signature() uses the project data generation instead of object IDs and list lengths   |
++-----------+---------------+---------------------------------------------------------------------------------------+
+"""
+__author__ = 'Jack Consoli'
+__copyright__ = 'Copyright 2024, 2025, 2026 Jack Consoli'
+__date__ = '18 Oct 2026'
+__license__ = 'Apache License, Version 2.0'
+__email__ = 'jack_consoli@yahoo.com'
+__maintainer__ = 'Jack Consoli'
+__status__ = 'Released'
+__version__ = '4.0.2'
+
+import brcdapi.gen_util as gen_util
+import brcddb.classes.util as class_util
+
+
+def signature(switch_obj_l):
+    """Returns a value that changes when the list of switches changes or any data in the project is added or changed.
+    Used to determine if a cached IslTopology is stale. See brcddb.classes.project.ProjectObj.r_data_gen()
+
+    :param switch_obj_l: List of switch objects
+    :type switch_obj_l: list
+    :return: Signature
+    :rtype: tuple
+    """
+    data_gen = switch_obj_l[0].r_project_obj().r_data_gen() if len(switch_obj_l) > 0 else None
+    return data_gen, tuple(switch_obj.r_obj_key() for switch_obj in switch_obj_l)
+
+
+def _is_amp_port(port_obj, amp_alert_num):
+    """Determines if any login on a port is to an AMP. See brcddb.brcddb_bp._amp_in_switch_pair()
+
+    :param port_obj: Port object
+    :type port_obj: brcddb.classes.port.PortObj, None
+    :param amp_alert_num: Alert number for an AMP login
+    :type amp_alert_num: int
+    :return: True if the port is connected to an AMP
+    :rtype: bool
+    """
+    if port_obj is not None:
+        for login_obj in port_obj.r_login_objects():
+            if class_util.has_alert_num(login_obj, amp_alert_num):
+                return True
+    return False
+
+
+class IslTopology:
+    """ISL topology for a list of switches, typically all the switches in a fabric.
+
+    Args:
+        * switch_obj_l (list): List of switch objects, brcddb.classes.switch.SwitchObj
+
+    Attributes:
+        _signature (tuple): Returned from signature() when the topology was built.
+        _trunk_d (dict): Key is the switch WWN. Value is the trunk map for the switch in the same format as returned from
+            brcddb.classes.switch.SwitchObj.c_trunk_map()
+        _pair_d (dict): Key is the tuple (switch WWN, neighbor switch WWN). Value is a dict as follows:
+            links_l: Number of ISLs in each trunk group
+            fru_l: Slot of the source port of each ISL. Duplicates removed.
+            port_l: Source port object of each ISL. May contain None if port data wasn't collected.
+            master_l: Source port object of each trunk master. May contain None if port data wasn't collected.
+    """
+
+    def __init__(self, switch_obj_l):
+        self._signature = signature(switch_obj_l)
+        self._trunk_d = dict()
+        self._pair_d = dict()
+        for switch_obj in switch_obj_l:
+            switch_wwn = switch_obj.r_obj_key()
+            trunk_map = switch_obj.c_trunk_map()
+            self._trunk_d[switch_wwn] = trunk_map
+            for ds_wwn, group_d in trunk_map.items():
+                links_l, fru_l, port_l, master_l = list(), list(), list(), list()
+                for trunk in group_d.values():
+                    links_l.append(len(trunk))
+                    master_l.append(trunk[0][0])
+                    port_l.extend([isl[0] for isl in trunk])
+                    fru_l.extend([isl[0].r_obj_key().split('/')[0] for isl in trunk if isl[0] is not None])
+                self._pair_d[(switch_wwn, ds_wwn)] = dict(links_l=links_l,
+                                                          fru_l=gen_util.remove_duplicates(fru_l),
+                                                          port_l=port_l,
+                                                          master_l=master_l)
+
+    def r_signature(self):
+        """Returns the signature of the switches when this topology was built. See signature()
+
+        :return: Signature
+        :rtype: tuple
+        """
+        return self._signature
+
+    def r_trunk_map(self, switch_wwn):
+        """Returns the trunk map for a switch. This is the cached map so it should not be modified.
+
+        :param switch_wwn: Switch WWN
+        :type switch_wwn: str
+        :return: See brcddb.classes.switch.SwitchObj.c_trunk_map(). Empty dict if the switch has no ISLs.
+        :rtype: dict
+        """
+        return self._trunk_d.get(switch_wwn, dict())
+
+    def r_neighbor_keys(self, switch_wwn):
+        """Returns the WWNs of all switches a switch has ISLs to
+
+        :param switch_wwn: Switch WWN
+        :type switch_wwn: str
+        :return: List of neighbor switch WWNs
+        :rtype: list
+        """
+        return list(self.r_trunk_map(switch_wwn).keys())
+
+    def r_trunk_groups(self, switch_wwn, ds_wwn):
+        """Returns the trunk groups between two switches
+
+        :param switch_wwn: Switch WWN
+        :type switch_wwn: str
+        :param ds_wwn: Neighbor (downstream) switch WWN
+        :type ds_wwn: str
+        :return: Key is the trunk group number. Value is the list of [src_port_obj, dest_port_obj]. The trunk master is
+            first.
+        :rtype: dict
+        """
+        return self.r_trunk_map(switch_wwn).get(ds_wwn, dict())
+
+    def r_links_per_trunk(self, switch_wwn, ds_wwn):
+        """Returns the number of ISLs in each trunk group between two switches
+
+        :param switch_wwn: Switch WWN
+        :type switch_wwn: str
+        :param ds_wwn: Neighbor (downstream) switch WWN
+        :type ds_wwn: str
+        :return: List of the number of ISLs in each trunk group
+        :rtype: list
+        """
+        return self._pair_d.get((switch_wwn, ds_wwn), dict(links_l=list()))['links_l']
+
+    def r_frus(self, switch_wwn, ds_wwn):
+        """Returns the slots the ISLs between two switches are on. Fixed port switches are slot '0'
+
+        :param switch_wwn: Switch WWN
+        :type switch_wwn: str
+        :param ds_wwn: Neighbor (downstream) switch WWN
+        :type ds_wwn: str
+        :return: List of slot numbers as str
+        :rtype: list
+        """
+        return self._pair_d.get((switch_wwn, ds_wwn), dict(fru_l=list()))['fru_l']
+
+    def r_paths(self, switch_wwn, ds_wwn):
+        """Returns the source port objects of all ISLs between two switches
+
+        :param switch_wwn: Switch WWN
+        :type switch_wwn: str
+        :param ds_wwn: Neighbor (downstream) switch WWN
+        :type ds_wwn: str
+        :return: List of brcddb.classes.port.PortObj. None for ports whose data wasn't collected.
+        :rtype: list
+        """
+        return self._pair_d.get((switch_wwn, ds_wwn), dict(port_l=list()))['port_l']
+
+    def r_master_speeds(self, switch_wwn, ds_wwn):
+        """Returns the login speed of each trunk master between two switches. Read from the port objects.
+
+        :param switch_wwn: Switch WWN
+        :type switch_wwn: str
+        :param ds_wwn: Neighbor (downstream) switch WWN
+        :type ds_wwn: str
+        :return: List of speeds, 'fibrechannel/speed', for trunk masters with a known speed.
+        :rtype: list
+        """
+        rl = list()
+        for port_obj in self._pair_d.get((switch_wwn, ds_wwn), dict(master_l=list()))['master_l']:
+            speed = None if port_obj is None else port_obj.r_get('fibrechannel/speed')
+            if speed is not None:
+                rl.append(speed)
+        return rl
+
+    def r_bandwidth(self, switch_wwn, ds_wwn):
+        """Returns the sum of the login speeds of all ISLs between two switches. Read from the port objects.
+
+        :param switch_wwn: Switch WWN
+        :type switch_wwn: str
+        :param ds_wwn: Neighbor (downstream) switch WWN
+        :type ds_wwn: str
+        :return: Bandwidth in bps. Ports with an unknown speed are not included.
+        :rtype: int
+        """
+        bw = 0
+        for port_obj in self.r_paths(switch_wwn, ds_wwn):
+            speed = None if port_obj is None else port_obj.r_get('fibrechannel/speed')
+            if isinstance(speed, (int, float)):
+                bw += speed
+        return bw
+
+    def r_is_amp(self, switch_wwn, ds_wwn, amp_alert_num):
+        """Determines if any port on either end of the ISLs between two switches is connected to an AMP. Read from the
+        login alerts so brcddb.brcddb_fabric.zone_analysis() must be called first.
+
+        :param switch_wwn: Switch WWN
+        :type switch_wwn: str
+        :param ds_wwn: Neighbor (downstream) switch WWN
+        :type ds_wwn: str
+        :param amp_alert_num: Alert number for an AMP login. Typically brcddb.app_data.alert_tables.ALERT_NUM.LOGIN_AMP
+        :type amp_alert_num: int
+        :return: True if any of the ports are connected to an AMP
+        :rtype: bool
+        """
+        for trunk in self.r_trunk_groups(switch_wwn, ds_wwn).values():
+            for isl in trunk:
+                if _is_amp_port(isl[0], amp_alert_num) or _is_amp_port(isl[1], amp_alert_num):
+                    return True
+        return False
@@ -33,18 +33,23 @@ Version Control**
 +-----------+---------------+---------------------------------------------------------------------------------------+
 | 4.0.5     | 20 Feb 2026   | Updated copyright notice.                                                             |
 +-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.6     | 18 Oct 2026   | Alerts are interned in a project level alert table. See brcddb.classes.alert.AlertTbl |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.7     | 18 Oct 2026   | r_alert_obj() uses the project alert index                                            |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.8     | 18 Oct 2026   | r_fabric_obj() returns a cached fabric object                                         |
++-----------+---------------+---------------------------------------------------------------------------------------+
 """
 __author__ = 'Jack Consoli'
 __copyright__ = 'Copyright 2024, 2025, 2026 Jack Consoli'
-__date__ = '19 Oct 2025'
+__date__ = '18 Oct 2026'
 __license__ = 'Apache License, Version 2.0'
 __email__ = 'jack_consoli@yahoo.com'
 __maintainer__ = 'Jack Consoli'
 __status__ = 'Released'
-__version__ = '4.0.5'
+__version__ = '4.0.8'
 
 import brcdapi.util as brcdapi_util
-import brcddb.classes.alert as alert_class
 import brcddb.classes.util as class_util
 
 
@@ -59,8 +64,9 @@ class LoginObj:
         _obj_key (str): Fabric (name server) login WWN
         _flags (int): Flags for each class are defined in brcddb.brcddb_common
         _fabric_key (str): WWN of fabric associated with this login
+        _fabric_obj (FabricObj, None): Cached fabric object. See r_fabric_obj()
         _project_obj (ProjectObj): The project object this fabric belongs to.
-        _alerts (list): List of AlertObj objects associated with this object.
+        _alerts (list): Alert IDs associated with this object. See brcddb.classes.alert.AlertTbl
     """
 
     def __init__(self, name, project_obj, fabric_key):
@@ -68,6 +74,7 @@ class LoginObj:
         self._flags = 0
         self._alerts = list()
         self._fabric_key = fabric_key
+        self._fabric_obj = None  # See r_fabric_obj()
         self._project_obj = project_obj
 
     def r_get_reserved(self, k):
@@ -85,6 +92,7 @@ class LoginObj:
                 _alerts=self.r_alert_objects(),
                 _project_obj=self.r_project_obj(),
                 _fabric_key=self.r_fabric_key(),
+                _fabric_obj=self._fabric_obj,
             ),
             k
         )
@@ -104,9 +112,7 @@ class LoginObj:
         :return: Alert object
         :rtype: brcddb.classes.alert.AlertObj
         """
-        alert_obj = alert_class.AlertObj(tbl, num, key, p0, p1)
-        self._alerts.append(alert_obj)
-        return alert_obj
+        return class_util.s_add_alert(self, tbl, num, key, p0, p1)
 
     def r_alert_objects(self):
         """Returns a list of alert objects associated with this object
@@ -114,7 +120,7 @@ class LoginObj:
         :return: List of alert objects (brcddb.classes.alert.AlertObj)
         :rtype: list
         """
-        return self._alerts
+        return class_util.r_alert_objects(self)
 
     def r_alert_nums(self):
         """Returns a list of alert numbers associated with this object
@@ -122,7 +128,7 @@ class LoginObj:
         :return: List of alert objects (brcddb.classes.alert.AlertObj)
         :rtype: list
         """
-        return [alert_obj.alert_num() for alert_obj in self._alerts]
+        return class_util.r_alert_nums(self)
 
     def r_alert_obj(self, alert_num):
         """Returns the alert object for a specific alert number
@@ -130,10 +136,7 @@ class LoginObj:
         :return: Alert object. None if not found.
         :rtype: None, brcddb.classes.alert.AlertObj
         """
-        for alert_obj in self.r_alert_objects():
-            if alert_obj.alert_num() == alert_num:
-                return alert_obj
-        return None
+        return class_util.r_alert_obj(self, alert_num)
 
     def r_reserved_keys(self):
         """Returns a list of reserved words (keys) associated with this object
@@ -165,10 +168,12 @@ class LoginObj:
         :return: Fabric object. None if the switch is offline or the fabric may not have been polled
         :rtype: FabricObj, None
         """
-        try:
-            return self.r_project_obj().r_fabric_obj(self.r_fabric_key())
-        except AttributeError:
-            return None
+        if self._fabric_obj is None:
+            try:
+                self._fabric_obj = self._project_obj.r_fabric_obj(self._fabric_key)
+            except AttributeError:
+                pass
+        return self._fabric_obj
 
     def r_port_obj(self):
         """Returns the port object associated with this login
@@ -396,7 +401,8 @@ class FdmiNodeObj:
         _flags (int): Flags for each class are defined in brcddb.brcddb_common
         _project_obj (ProjectObj): The project object this fabric belongs to.
         _fabric_key (str): WWN of the fabric this HBA belongs to.
-        _alerts (list): List of AlertObj objects associated with this object.
+        _fabric_obj (FabricObj, None): Cached fabric object. See r_fabric_obj()
+        _alerts (list): Alert IDs associated with this object. See brcddb.classes.alert.AlertTbl
     """
 
     def __init__(self, name, project_obj, fabric_key):
@@ -404,6 +410,7 @@ class FdmiNodeObj:
         self._flags = 0
         self._alerts = list()
         self._fabric_key = fabric_key
+        self._fabric_obj = None  # See r_fabric_obj()
         self._project_obj = project_obj
 
     def r_get_reserved(self, k):
@@ -422,6 +429,7 @@ class FdmiNodeObj:
                 _alerts=self.r_alert_objects(),
                 _project_obj=self.r_project_obj(),
                 _fabric_key=self.r_fabric_key(),
+                _fabric_obj=self._fabric_obj,
             ),
             k
         )
@@ -441,9 +449,7 @@ class FdmiNodeObj:
         :return: Alert object
         :rtype: brcddb.classes.alert.AlertObj
         """
-        alert_obj = alert_class.AlertObj(tbl, num, key, p0, p1)
-        self._alerts.append(alert_obj)
-        return alert_obj
+        return class_util.s_add_alert(self, tbl, num, key, p0, p1)
 
     def r_alert_objects(self):
         """Returns a list of alert objects associated with this object
@@ -451,7 +457,7 @@ class FdmiNodeObj:
         :return: List of alert objects (brcddb.classes.alert.AlertObj)
         :rtype: list
         """
-        return self._alerts
+        return class_util.r_alert_objects(self)
 
     def r_reserved_keys(self):
         """Returns a list of reserved words (keys) associated with this object
@@ -491,10 +497,12 @@ class FdmiNodeObj:
         :return: Fabric object. None if the switch is offline or the fabric may not have been polled
         :rtype: FabricObj, None
         """
-        try:
-            return self.r_project_obj().r_fabric_obj(self.r_fabric_key())
-        except AttributeError:
-            return None
+        if self._fabric_obj is None:
+            try:
+                self._fabric_obj = self._project_obj.r_fabric_obj(self._fabric_key)
+            except AttributeError:
+                pass
+        return self._fabric_obj
 
     def r_switch_obj(self):
         """Returns the switch object associated with this login
@@ -504,7 +512,7 @@ class FdmiNodeObj:
         :rtype: SwitchObj, None
         """
         try:
-            return self.r_project_obj().r_fabric_obj(self.r_fabric_key()).r_switch_obj(self.r_obj_key())
+            return self.r_fabric_obj().r_switch_obj(self.r_obj_key())
         except AttributeError:
             return None
 
@@ -625,7 +633,8 @@ class FdmiPortObj:
         _flags (int): Flags for each class are defined in brcddb.brcddb_common
         _project_obj (ProjectObj): The project object this fabric belongs to.
         _fabric_key (str): WWN of the fabric this login belongs to.
-        _alerts (list): List of AlertObj objects associated with this object.
+        _fabric_obj (FabricObj, None): Cached fabric object. See r_fabric_obj()
+        _alerts (list): Alert IDs associated with this object. See brcddb.classes.alert.AlertTbl
     """
 
     def __init__(self, name, project_obj, fabric_key):
@@ -633,6 +642,7 @@ class FdmiPortObj:
         self._flags = 0
         self._alerts = list()
         self._fabric_key = fabric_key
+        self._fabric_obj = None  # See r_fabric_obj()
         self._project_obj = project_obj
 
     def r_get_reserved(self, k):
@@ -650,6 +660,7 @@ class FdmiPortObj:
                 _alerts=self.r_alert_objects(),
                 _project_obj=self.r_project_obj(),
                 _fabric_key=self.r_fabric_key(),
+                _fabric_obj=self._fabric_obj,
             ),
             k
         )
@@ -669,9 +680,7 @@ class FdmiPortObj:
         :return: Alert object
         :rtype: brcddb.classes.alert.AlertObj
         """
-        alert_obj = alert_class.AlertObj(tbl, num, key, p0, p1)
-        self._alerts.append(alert_obj)
-        return alert_obj
+        return class_util.s_add_alert(self, tbl, num, key, p0, p1)
 
     def r_alert_objects(self):
         """Returns a list of alert objects associated with this object
@@ -679,7 +688,7 @@ class FdmiPortObj:
         :return: List of alert objects (brcddb.classes.alert.AlertObj)
         :rtype: list
         """
-        return self._alerts
+        return class_util.r_alert_objects(self)
 
     def r_reserved_keys(self):
         """Returns a list of reserved words (keys) associated with this object
@@ -711,10 +720,12 @@ class FdmiPortObj:
         :return: Fabric object. None if the switch is offline or the fabric may not have been polled
         :rtype: FabricObj, None
         """
-        try:
-            return self.r_project_obj().r_fabric_obj(self.r_fabric_key())
-        except AttributeError:
-            return None
+        if self._fabric_obj is None:
+            try:
+                self._fabric_obj = self._project_obj.r_fabric_obj(self._fabric_key)
+            except AttributeError:
+                pass
+        return self._fabric_obj
 
     def r_switch_obj(self):
         """Returns the switch object associated with this login
@@ -724,7 +735,7 @@ class FdmiPortObj:
         :rtype: SwitchObj, None
         """
         try:
-            return self.r_project_obj().r_fabric_obj(self.r_fabric_key()).r_switch_obj(self.r_obj_key())
+            return self.r_fabric_obj().r_switch_obj(self.r_obj_key())
         except AttributeError:
             return None
 
@@ -42,20 +42,35 @@ Defines the port object, PortObj.
 +-----------+---------------+---------------------------------------------------------------------------------------+
 | 4.0.9     | 02 Feb 2026   | Bug fix in r_status() when the fibrechannel branch was not polled.                    |
 +-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.0     | 18 Oct 2026   | Alerts are interned in a project level alert table. See brcddb.classes.alert.AlertTbl |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.1     | 18 Oct 2026   | s_add_xxx() and s_del_xxx() raise FrozenError when the project is frozen              |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.2     | 18 Oct 2026   | r_alert_obj() uses the project alert index                                            |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.3     | 18 Oct 2026   | r_switch_obj() returns a cached switch object                                         |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.4     | 18 Oct 2026   | Added r_port_class() and s_port_class()                                               |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.5     | 18 Oct 2026   | Added _best_name                                                                      |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.6     | 18 Oct 2026   | The cached port classification is keyed on the project data generation                |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.7     | 18 Oct 2026   | Explicitly increment the data generation                                              |
++-----------+---------------+---------------------------------------------------------------------------------------+
 """
 __author__ = 'Jack Consoli'
 __copyright__ = 'Copyright 2024, 2025, 2026 Jack Consoli'
-__date__ = '02 Feb 2026'
+__date__ = '18 Oct 2026'
 __license__ = 'Apache License, Version 2.0'
 __email__ = 'jack_consoli@yahoo.com'
 __maintainer__ = 'Jack Consoli'
 __status__ = 'Released'
-__version__ = '4.0.9'
+__version__ = '4.1.7'
 
 import brcdapi.util as brcdapi_util
 import brcdapi.gen_util as gen_util
 import brcddb.brcddb_common as brcddb_common
-import brcddb.classes.alert as alert_class
 import brcddb.classes.util as class_util
 
 # Programmer's Tip: Apparently, .clear() doesn't work on de-referenced list and dict. Rather than write my own, I rely
@@ -80,15 +95,22 @@ class PortObj:
         _flags (int): Flags for each class are defined in brcddb.brcddb_common
         _project_obj (ProjectObj): The project object this port belongs to.
         _switch (str): WWN of the switch this port belongs to.
-        _alerts (list): List of AlertObj objects associated with this object.
+        _switch_obj (SwitchObj, None): Cached switch object. See r_switch_obj()
+        _port_class (dict, None): Cached port classification and the project data generation it was built for. See
+            r_port_class()
+        _alerts (list): Alert IDs associated with this object. See brcddb.classes.alert.AlertTbl
+        _best_name (dict, None): Cached names. See brcddb.classes.util.r_cached_name()
     """
 
     def __init__(self, name, project_obj, switch_wwn):
         self._obj_key = name
         self._project_obj = project_obj
         self._switch = switch_wwn
+        self._switch_obj = None  # See r_switch_obj()
+        self._port_class = None  # See brcddb.brcddb_port.port_class()
         self._flags = 0
         self._alerts = list()
+        self._best_name = None  # See brcddb.classes.util.r_cached_name()
 
     def _i_port_flags(self, k):
         """For internal use only. Returns the state of the specified port flag
@@ -118,8 +140,11 @@ class PortObj:
                 _obj_key=self.r_obj_key(),
                 _flags=self.r_flags(),
                 _alerts=self.r_alert_objects(),
+                _best_name=self._best_name,
                 _project_obj=self.r_project_obj(),
                 _switch=self.r_switch_key(),
+                _switch_obj=self._switch_obj,
+                _port_class=self.r_port_class(),
             ),
             k
         )
@@ -139,9 +164,7 @@ class PortObj:
         :return: Alert object
         :rtype: brcddb.classes.alert.AlertObj
         """
-        alert_obj = alert_class.AlertObj(tbl, num, key, p0, p1)
-        self._alerts.append(alert_obj)
-        return alert_obj
+        return class_util.s_add_alert(self, tbl, num, key, p0, p1)
 
     def r_alert_objects(self):
         """Returns a list of alert objects associated with this object
@@ -149,7 +172,7 @@ class PortObj:
         :return: List of alert objects (brcddb.classes.alert.AlertObj)
         :rtype: list
         """
-        return self._alerts
+        return class_util.r_alert_objects(self)
 
     def r_alert_nums(self):
         """Returns a list of alert numbers associated with this object
@@ -157,7 +180,7 @@ class PortObj:
         :return: List of alert objects (brcddb.classes.alert.AlertObj)
         :rtype: list
         """
-        return [alert_obj.alert_num() for alert_obj in self._alerts]
+        return class_util.r_alert_nums(self)
 
     def r_alert_obj(self, alert_num):
         """Returns the alert object for a specific alert number
@@ -165,10 +188,7 @@ class PortObj:
         :return: Alert object. None if not found.
         :rtype: None, brcddb.classes.alert.AlertObj
         """
-        for alert_obj in self.r_alert_objects():
-            if alert_obj.alert_num() == alert_num:
-                return alert_obj
-        return None
+        return class_util.r_alert_obj(self, alert_num)
 
     def r_reserved_keys(self):
         """Returns a list of reserved words (keys) associated with this object
@@ -206,7 +226,30 @@ class PortObj:
         :return: Switch object
         :rtype: SwitchObj
         """
-        return self.r_project_obj().r_switch_obj(self.r_switch_key())
+        if self._switch_obj is None:
+            self._switch_obj = self._project_obj.r_switch_obj(self._switch)
+        return self._switch_obj
+
+    def s_port_class(self, class_d):
+        """Sets the cached port classification. Typically only called from brcddb.brcddb_port.port_class(). The cached
+        classification is discarded when any data in the project is added or changed. See
+        brcddb.classes.project.ProjectObj.r_data_gen(). Set to None to force the classification to be rebuilt.
+
+        :param class_d: See brcddb.brcddb_port.port_class()
+        :type class_d: dict, None
+        """
+        self._port_class = None if class_d is None else \
+            dict(data_gen=self._project_obj.r_data_gen(), class_d=class_d)
+
+    def r_port_class(self):
+        """Returns the cached port classification. See brcddb.brcddb_port.port_class()
+
+        :return: Port classification. None if it hasn't been built, was cleared, or data changed since it was built.
+        :rtype: dict, None
+        """
+        if self._port_class is None or self._port_class['data_gen'] != self._project_obj.r_data_gen():
+            return None
+        return self._port_class['class_d']
 
     def r_fabric_obj(self):
         """Returns the fabric object associated with this port
@@ -232,6 +275,8 @@ class PortObj:
         :return: Login object
         :rtype: LoginObj
         """
+        class_util.check_frozen(self)
+        class_util.s_data_gen(self)
         fab_obj = self.r_fabric_obj()
         login_obj = fab_obj.s_add_login(wwn)
         wwn_l = class_util.get_or_add(self, 'fibrechannel/neighbor/wwn', list())
@@ -726,7 +771,7 @@ class PortObj:
         :return: Chassis object
         :rtype: ChassisObj
         """
-        return self.r_project_obj().r_chassis_obj(self.r_chassis_key())
+        return self.r_switch_obj().r_chassis_obj()
 
     def s_new_key(self, k, v, f=False):
         """Creates a new key/value pair.
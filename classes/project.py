@@ -34,16 +34,41 @@ Defines the project object, ProjectObj.
 +-----------+---------------+---------------------------------------------------------------------------------------+
 | 4.0.5     | 20 Feb 2026   | Updated copyright notice.                                                             |
 +-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.6     | 18 Oct 2026   | Added s_add_request_stat() and r_request_stats()                                      |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.7     | 18 Oct 2026   | Alerts are interned in a project level alert table. See brcddb.classes.alert.AlertTbl |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.8     | 18 Oct 2026   | Added freeze() and r_is_frozen()                                                      |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.9     | 18 Oct 2026   | Added r_ficon_index() and s_ficon_index()                                             |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.0     | 18 Oct 2026   | r_alert_obj() uses the project alert index                                            |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.1     | 18 Oct 2026   | Added s_data_changed(), r_data_changes(), and s_clear_data_changes()                  |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.2     | 18 Oct 2026   | s_del_fabric() clears the cached fabric object in switches                            |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.3     | 18 Oct 2026   | Added r_data_gen() and s_data_gen()                                                   |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.4     | 18 Oct 2026   | s_add_fabric(), s_add_switch(), s_add_chassis(), and s_add_iocp() only check frozen   |
+|           |               | when adding                                                                           |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.5     | 18 Oct 2026   | The FICON lookup tables are discarded when the project data generation changes        |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.6     | 18 Oct 2026   | Explicitly increment the data generation                                              |
++-----------+---------------+---------------------------------------------------------------------------------------+
 """
 __author__ = 'Jack Consoli'
 __copyright__ = 'Copyright 2024, 2025, 2026 Jack Consoli'
-__date__ = '20 Feb 2026'
+__date__ = '18 Oct 2026'
 __license__ = 'Apache License, Version 2.0'
 __email__ = 'jack_consoli@yahoo.com'
 __maintainer__ = 'Jack Consoli'
 __status__ = 'Released'
-__version__ = '4.0.5'
+__version__ = '4.1.6'
 
+import gc
+import brcdapi.gen_util as gen_util
 import brcddb.brcddb_common as brcddb_common
 import brcddb.classes.alert as alert_class
 import brcddb.classes.util as class_util
@@ -75,7 +100,14 @@ class ProjectObj:
         * _switch_objs (dict): Dictionary of SwitchObj objects. Key is the WWN of the switch
         * _chassis_objs (dict): Dictionary of ChassisObj objects. Key is the WWN of the chassis
         * _iocp_objs (dict): Dictionary of IOCPObj objects. Key is the CEC serial number
-        * _alerts (list): List of AlertObj objects associated with this object.
+        * _alert_tbl (AlertTbl): Alerts for all objects in this project. See brcddb.classes.alert.AlertTbl
+        * _alerts (list): Alert IDs associated with this object. See brcddb.classes.alert.AlertTbl
+        * _request_stats (list): List of request statistics dictionaries. See brcddb.api.interface
+        * _ficon_index (dict, None): FICON CHPID and link address lookup tables and the data generation they were
+          built for. See brcddb.brcddb_port.ficon_index()
+        * _data_changes (dict): Key is the chassis or switch object. Value is the list of URIs added or updated since the
+          last time the changes were cleared. See s_data_changed() and brcddb.brcddb_analysis
+        * _data_gen (int): Incremented whenever data in the project is added or changed. See r_data_gen()
     """
 #    _reserved_keys = ('_reserved_keys', '_obj_key', '_flags', '_date', '_python_version', '_description',
 #                      '_fabric_objs', '_switch_objs', '_chassis_objs', '_alerts')
@@ -90,7 +122,12 @@ class ProjectObj:
         self._switch_objs = dict()  # Switch objects. Key is switch WWN
         self._chassis_objs = dict()  # Chassis objects. Key is chassis WWN
         self._iocp_objs = dict()  # IOCP objects. Key is the CEC serial number
+        self._alert_tbl = alert_class.AlertTbl()  # Interned alerts for all objects in this project
         self._alerts = list()
+        self._request_stats = list()  # See brcddb.brcddb_project.request_summary()
+        self._ficon_index = None  # See brcddb.brcddb_port.ficon_index()
+        self._data_changes = dict()  # See s_data_changed()
+        self._data_gen = 0  # See r_data_gen()
 
     def r_get_reserved(self, k):
         """Returns a value for any reserved key. Don't forget to update brcddb.util.copy when adding a new key.
@@ -111,6 +148,11 @@ class ProjectObj:
                 _switch_objs=self.r_switch_objs(),
                 _chassis_objs=self.r_chassis_objs(),
                 _alerts=self.r_alert_objects(),
+                _alert_tbl=self.r_alert_tbl(),
+                _request_stats=self.r_request_stats(),
+                _ficon_index=self._ficon_index,
+                _data_changes=self._data_changes,
+                _data_gen=self._data_gen,
                 # _iocp_objs=self.r_iocp_objects()
             ),
             k
@@ -131,9 +173,15 @@ class ProjectObj:
         :return: Alert object
         :rtype: brcddb.classes.alert.AlertObj
         """
-        alert_obj = alert_class.AlertObj(tbl, num, key, p0, p1)
-        self._alerts.append(alert_obj)
-        return alert_obj
+        return class_util.s_add_alert(self, tbl, num, key, p0, p1)
+
+    def r_alert_tbl(self):
+        """Returns the alert table for all objects in this project
+
+        :return: Alert table
+        :rtype: brcddb.classes.alert.AlertTbl
+        """
+        return self._alert_tbl
 
     def r_alert_objects(self):
         """Returns a list of alert objects associated with this object
@@ -141,7 +189,7 @@ class ProjectObj:
         :return: List of alert objects (brcddb.classes.alert.AlertObj)
         :rtype: list
         """
-        return self._alerts
+        return class_util.r_alert_objects(self)
 
     def r_alert_nums(self):
         """Returns a list of alert numbers associated with this object
@@ -149,7 +197,7 @@ class ProjectObj:
         :return: List of alert objects (brcddb.classes.alert.AlertObj)
         :rtype: list
         """
-        return [alert_obj.alert_num() for alert_obj in self._alerts]
+        return class_util.r_alert_nums(self)
 
     def r_alert_obj(self, alert_num):
         """Returns the alert object for a specific alert number
@@ -157,10 +205,24 @@ class ProjectObj:
         :return: Alert object. None if not found.
         :rtype: None, brcddb.classes.alert.AlertObj
         """
-        for alert_obj in self.r_alert_objects():
-            if alert_obj.alert_num() == alert_num:
-                return alert_obj
-        return None
+        return class_util.r_alert_obj(self, alert_num)
+
+    def s_add_request_stat(self, stat_d):
+        """Adds the statistics for an API request. Typically only called from brcddb.api.interface
+
+        :param stat_d: Request statistics. See brcddb.brcddb_project.request_summary()
+        :type stat_d: dict
+        """
+        class_util.check_frozen(self)
+        self._request_stats.append(stat_d)
+
+    def r_request_stats(self):
+        """Returns the list of request statistics dictionaries. See brcddb.brcddb_project.request_summary()
+
+        :return: List of request statistics dictionaries
+        :rtype: list
+        """
+        return self._request_stats
 
     def r_reserved_keys(self):
         """Returns a list of reserved words (keys) associated with this object
@@ -216,6 +278,113 @@ class ProjectObj:
         self._flags &= bits
         return self._flags
 
+    def r_is_frozen(self):
+        """Tests the flags against the project frozen flag bit (brcddb_common.project_frozen)
+
+        :return: True if the project has been frozen. See freeze()
+        :rtype: bool
+        """
+        return bool(self._flags & brcddb_common.project_frozen)
+
+    def freeze(self, build_l=None):
+        """Makes the project read only. Intended to be called after all data has been collected and analyzed, before
+        sharing the project with multiple threads or forking report workers. Typically called from
+        brcddb.brcddb_project.freeze() which supplies the functions to build all the lookup tables.
+
+        Once frozen, s_new_key(), rs_key() for a key that doesn't exist, and all s_add_xxx() and s_del_xxx() methods of
+        any object in the project that would add or delete something raise brcddb.classes.util.FrozenError. Adding an
+        object that already exists is allowed. Application bookkeeping keys, such as 'report_app', can still be added
+        so that a frozen project can be reported on. See brcddb.classes.util.check_frozen(). All alert objects are
+        created and, when supported (Python 3.7 and above), gc.freeze() is called so that forked processes do not copy
+        pages just to update garbage collector headers.
+
+        :param build_l: Functions to call before freezing. Each function is called with this project object.
+        :type build_l: None, list, tuple
+        """
+        if self.r_is_frozen():
+            return
+        for build in gen_util.convert_to_list(build_l):
+            build(self)
+        self._alert_tbl.s_build_alert_objects()
+        self.s_or_flags(brcddb_common.project_frozen)
+        if hasattr(gc, 'freeze'):
+            gc.collect()
+            gc.freeze()
+
+    def s_ficon_index(self, ficon_d):
+        """Sets the FICON lookup tables. Typically only called from brcddb.brcddb_port.ficon_index(). The tables are
+        discarded when any data in the project is added or changed. See r_data_gen(). Set to None to force the tables to
+        be rebuilt the next time they are needed.
+
+        :param ficon_d: See brcddb.brcddb_port.ficon_index()
+        :type ficon_d: dict, None
+        """
+        self._ficon_index = None if ficon_d is None else dict(data_gen=self._data_gen, ficon_d=ficon_d)
+
+    def r_ficon_index(self):
+        """Returns the FICON lookup tables. See brcddb.brcddb_port.ficon_index()
+
+        :return: FICON lookup tables. None if they have not been built, were cleared, or data changed since they were
+            built.
+        :rtype: dict, None
+        """
+        if self._ficon_index is None or self._ficon_index['data_gen'] != self._data_gen:
+            return None
+        return self._ficon_index['ficon_d']
+
+    def s_data_changed(self, obj, uri):
+        """Records that the data for a URI was added or updated in a chassis or switch object. Typically only called
+        from brcddb.api.interface.results_action(). Used to determine which analysis needs to be re-run. See
+        brcddb.brcddb_analysis
+
+        :param obj: Chassis or switch object the data was added to
+        :type obj: brcddb.classes.chassis.ChassisObj, brcddb.classes.switch.SwitchObj
+        :param uri: URI (KPI) of the data
+        :type uri: str
+        """
+        self._data_gen += 1
+        uri_l = self._data_changes.get(obj)
+        if uri_l is None:
+            self._data_changes[obj] = [uri]
+        elif uri not in uri_l:
+            uri_l.append(uri)
+
+    def s_data_gen(self):
+        """Increments the data generation. Called from brcddb.classes.util.s_data_gen() and s_data_changed(). Only
+        needs to be called directly when data in an object is modified in place.
+
+        :return: New data generation
+        :rtype: int
+        """
+        self._data_gen += 1
+        return self._data_gen
+
+    def r_data_gen(self):
+        """Returns a number that changes whenever data in the project is added or changed. Used to determine if cached
+        values, such as the names cached with brcddb.classes.util.s_cached_name(), are still valid.
+
+        :return: Data generation
+        :rtype: int
+        """
+        return self._data_gen
+
+    def r_data_changes(self):
+        """Returns the data changes recorded with s_data_changed()
+
+        :return: Key is the chassis or switch object. Value is the list of URIs added or updated.
+        :rtype: dict
+        """
+        return self._data_changes
+
+    def s_clear_data_changes(self):
+        """Clears the data changes recorded with s_data_changed()
+
+        :return: The data changes before they were cleared. See r_data_changes()
+        :rtype: dict
+        """
+        rd, self._data_changes = self._data_changes, dict()
+        return rd
+
     def r_is_warn(self):
         """Tests the flags against the project warn flag bit (brcddb_common.project_warn)
 
@@ -383,6 +552,8 @@ class ProjectObj:
         """
         fab_obj = self.r_fabric_obj(principal_wwn)
         if fab_obj is None:
+            class_util.check_frozen(self)
+            class_util.s_data_gen(self)
             fab_obj = fabric_class.FabricObj(principal_wwn, self, add_switch)
             self._fabric_objs.update({principal_wwn: fab_obj})
         if add_switch:
@@ -395,8 +566,13 @@ class ProjectObj:
         :param wwn: Fabric key (principal WWN) to be deleted
         :type wwn: str
         """
+        class_util.check_frozen(self)
+        class_util.s_data_gen(self)
         if wwn in self._fabric_objs:
             self._fabric_objs.pop(wwn, None)
+            for switch_obj in self.r_switch_objects():
+                if switch_obj.r_fabric_key() == wwn:
+                    switch_obj.s_fabric_key(wwn)  # Clears the cached fabric object
 
     def r_fabric_obj(self, key):  # key is the fabric principal WWNs
         """Returns the fabric object for a certain fabric
@@ -535,6 +711,8 @@ class ProjectObj:
         """
         switch_obj = self.r_switch_obj(wwn)
         if switch_obj is None:
+            class_util.check_frozen(self)
+            class_util.s_data_gen(self)
             switch_obj = switch_class.SwitchObj(wwn, self)
             self._switch_objs.update({wwn: switch_obj})
         return switch_obj
@@ -545,6 +723,8 @@ class ProjectObj:
         :param wwn: WWN of logical switch
         :type wwn: str
         """
+        class_util.check_frozen(self)
+        class_util.s_data_gen(self)
         switch_obj = self.r_switch_obj(wwn)
         if switch_obj is not None:
             fab_obj = switch_obj.r_fabric_obj()
@@ -602,6 +782,8 @@ class ProjectObj:
         """
         chassis_obj = self.r_chassis_obj(wwn)
         if chassis_obj is None:
+            class_util.check_frozen(self)
+            class_util.s_data_gen(self)
             chassis_obj = chassis_class.ChassisObj(wwn, self)
             self._chassis_objs.update({wwn: chassis_obj})
         return chassis_obj
@@ -612,6 +794,8 @@ class ProjectObj:
         :param wwn: WWN or key of chassis
         :type wwn: str
         """
+        class_util.check_frozen(self)
+        class_util.s_data_gen(self)
         chassis_obj = self.r_chassis_obj(wwn)
         if chassis_obj is not None:
             for switch_key in chassis_obj.r_switch_keys():
@@ -755,6 +939,8 @@ class ProjectObj:
         """
         iocp_obj = self.r_iocp_obj(cec_sn)
         if iocp_obj is None:
+            class_util.check_frozen(self)
+            class_util.s_data_gen(self)
             iocp_obj = iocp_class.IOCPObj(cec_sn, self)
             self._iocp_objs.update({cec_sn: iocp_obj})
         return iocp_obj
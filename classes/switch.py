@@ -36,22 +36,38 @@ Defines the switch object, SwitchObj.
 +-----------+---------------+---------------------------------------------------------------------------------------+
 | 4.0.7     | 20 Feb 2026   | Updated copyright notice.                                                             |
 +-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.8     | 18 Oct 2026   | Alerts are interned in a project level alert table. See brcddb.classes.alert.AlertTbl |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.9     | 18 Oct 2026   | s_add_xxx() and s_del_xxx() raise FrozenError when the project is frozen              |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.0     | 18 Oct 2026   | c_trunk_map() uses a port index lookup. Added r_isl_topology()                        |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.1     | 18 Oct 2026   | r_alert_obj() uses the project alert index                                            |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.2     | 18 Oct 2026   | r_fabric_obj() and r_chassis_obj() return cached objects                              |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.3     | 18 Oct 2026   | Added _best_name                                                                      |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.4     | 18 Oct 2026   | s_add_port(), s_add_ge_port(), and s_add_ve_port() only check frozen when adding      |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.5     | 18 Oct 2026   | Explicitly increment the data generation                                              |
++-----------+---------------+---------------------------------------------------------------------------------------+
 """
 __author__ = 'Jack Consoli'
 __copyright__ = 'Copyright 2024, 2025, 2026 Jack Consoli'
-__date__ = '19 Oct 2025'
+__date__ = '18 Oct 2026'
 __license__ = 'Apache License, Version 2.0'
 __email__ = 'jack_consoli@yahoo.com'
 __maintainer__ = 'Jack Consoli'
 __status__ = 'Released'
-__version__ = '4.0.7'
+__version__ = '4.1.5'
 
 import brcdapi.gen_util as gen_util
 import brcdapi.util as brcdapi_util
 import brcddb.brcddb_common as brcddb_common
-import brcddb.classes.alert as alert_class
 import brcddb.classes.util as class_util
 import brcddb.classes.port as port_class
+import brcddb.classes.isl as isl_class
 
 # Programmer's Tip: Apparently, .clear() doesn't work on de-referenced list and dict. Rather than write my own, I rely
 # on Python garbage collection to clean it up. If delete becomes common, I'll have to revisit this but for now, I took
@@ -72,7 +88,10 @@ class SwitchObj:
         * _ge_port_objs (dict): Dictionary of GE ports in this switch. Key: s/p, Value: PortObj
         * _fabric_key (str): WWN of the fabric this port belongs to.
         * _chassis_key (str): WWN of the chassis this port belongs to.
-        * _alerts (list): List of AlertObj objects associated with this object.
+        * _fabric_obj (FabricObj, None): Cached fabric object. Cleared by s_fabric_key(). See r_fabric_obj()
+        * _chassis_obj (ChassisObj, None): Cached chassis object. Cleared by s_chassis_key(). See r_chassis_obj()
+        * _alerts (list): Alert IDs associated with this object. See brcddb.classes.alert.AlertTbl
+        * _best_name (dict, None): Cached names. See brcddb.classes.util.r_cached_name()
     """
 
     def __init__(self, name, project_obj):
@@ -80,10 +99,13 @@ class SwitchObj:
         self._flags = 0
         self._chassis_key = ''
         self._fabric_key = None
+        self._fabric_obj = None  # See r_fabric_obj()
+        self._chassis_obj = None  # See r_chassis_obj()
         self._port_objs = dict()
         self._ge_port_objs = dict()
         self._ve_port_objs = dict()
         self._alerts = list()
+        self._best_name = None  # See brcddb.classes.util.r_cached_name()
         self._project_obj = project_obj
 
     def r_get_reserved(self, k):
@@ -99,12 +121,15 @@ class SwitchObj:
                 _obj_key=self.r_obj_key(),
                 _flags=self.r_flags(),
                 _alerts=self.r_alert_objects(),
+                _best_name=self._best_name,
                 _project_obj=self.r_project_obj(),
                 _port_objs=self.r_port_objs(),
                 _ge_port_objs=self.r_ge_port_objs(),
                 _ve_port_objs=self.r_ve_port_objs(),
                 _fabric_key=self.r_fabric_key(),
                 _chassis_key=self.r_chassis_key(),
+                _fabric_obj=self._fabric_obj,
+                _chassis_obj=self._chassis_obj,
             ),
             k
         )
@@ -123,23 +148,21 @@ class SwitchObj:
         :return: Alert object
         :rtype: brcddb.classes.alert.AlertObj
         """
-        alert_obj = alert_class.AlertObj(tbl, num, key, p0, p1)
-        self._alerts.append(alert_obj)
-        return alert_obj
+        return class_util.s_add_alert(self, tbl, num, key, p0, p1)
 
     def r_alert_objects(self):
         """Returns a list of alert objects associated with this object
         :return: List of alert objects (brcddb.classes.alert.AlertObj)
         :rtype: list
         """
-        return self._alerts
+        return class_util.r_alert_objects(self)
 
     def r_alert_nums(self):
         """Returns a list of alert numbers associated with this object
         :return: List of alert objects (brcddb.classes.alert.AlertObj)
         :rtype: list
         """
-        return [alert_obj.alert_num() for alert_obj in self._alerts]
+        return class_util.r_alert_nums(self)
 
     def r_alert_obj(self, alert_num):
         """Returns the alert object for a specific alert number
@@ -147,10 +170,7 @@ class SwitchObj:
         :return: Alert object. None if not found.
         :rtype: None, brcddb.classes.alert.AlertObj
         """
-        for alert_obj in self.r_alert_objects():
-            if alert_obj.alert_num() == alert_num:
-                return alert_obj
-        return None
+        return class_util.r_alert_obj(self, alert_num)
 
     def r_reserved_keys(self):
         """Returns a list of reserved words (keys) associated with this object
@@ -206,6 +226,7 @@ class SwitchObj:
 
     def s_chassis_key(self, k):
         self._chassis_key = k
+        self._chassis_obj = None  # The switch may have moved to a different chassis
 
     def r_chassis_key(self):
         """Returns the chassis key this switch belongs to
@@ -219,7 +240,9 @@ class SwitchObj:
         :return: Chassis object
         :rtype: brcddb.classes.chassis.ChassisObj
         """
-        return self.r_project_obj().r_chassis_obj(self.r_chassis_key())
+        if self._chassis_obj is None:
+            self._chassis_obj = self._project_obj.r_chassis_obj(self._chassis_key)
+        return self._chassis_obj
 
     def r_is_polled(self):
         """Tests to determined if the switch has been polled, 'fabric/fabric-switch' requested
@@ -305,6 +328,7 @@ class SwitchObj:
         :type wwn: str
         """
         self._fabric_key = wwn
+        self._fabric_obj = None  # The switch may have moved to a different fabric
 
     def r_switch_obj(self):
         return self
@@ -324,9 +348,10 @@ class SwitchObj:
         :return: Fabric object. None if the switch is offline or the fabric may not have been polled
         :rtype: FabricObj, None
         """
-        proj_obj = self.r_project_obj()
         # The switch is not in a fabric if the switch is offline of fabric information wasn't polled
-        return None if self._fabric_key is None else proj_obj.r_fabric_obj(self._fabric_key)
+        if self._fabric_obj is None and self._fabric_key is not None:
+            self._fabric_obj = self._project_obj.r_fabric_obj(self._fabric_key)
+        return self._fabric_obj
 
     def r_defined_scc(self, default=None):
         """Returns the defined SCC_POLICY membership list.
@@ -359,6 +384,8 @@ class SwitchObj:
         """
         port_obj = self.r_port_obj(port)
         if port_obj is None:
+            class_util.check_frozen(self)
+            class_util.s_data_gen(self)
             port_obj = port_class.PortObj(port, self.r_project_obj(), self._obj_key)
             self._port_objs.update({port: port_obj})
         return port_obj
@@ -404,6 +431,8 @@ class SwitchObj:
         """
         port_obj = self.r_ge_port_obj(port)
         if port_obj is None:
+            class_util.check_frozen(self)
+            class_util.s_data_gen(self)
             port_obj = port_class.PortObj(port, self.r_project_obj(), self._obj_key)
             self._ge_port_objs.update({port: port_obj})
         return port_obj
@@ -449,6 +478,8 @@ class SwitchObj:
         """
         port_obj = self.r_ve_port_obj(port)
         if port_obj is None:
+            class_util.check_frozen(self)
+            class_util.s_data_gen(self)
             port_obj = port_class.PortObj(port, self.r_project_obj(), self._obj_key)
             self._ve_port_objs.update({port: port_obj})
         return port_obj
@@ -616,10 +647,22 @@ class SwitchObj:
         :return: List of dict as defined above
         :rtype: list
         """
-        proj_obj = self.r_project_obj()
-        ret = dict()
+        proj_obj, ret, index_d = self.r_project_obj(), dict(), dict()
+        for port_obj in self.r_port_objects():
+            port_index = port_obj.r_index()
+            if isinstance(port_index, int) and port_index not in index_d:
+                index_d[port_index] = port_obj
+        ds_index_d = dict()  # Key is the neighbor switch WWN. Value is the same as index_d but for the neighbor switch
         for td in gen_util.convert_to_list(self.r_get('brocade-fibrechannel-trunk/trunk')):
             ds_wwn = td.get('neighbor-wwn')
+            if ds_wwn not in ds_index_d:
+                ds_index_d[ds_wwn] = dict()
+                ds_switch_obj = proj_obj.r_switch_obj(ds_wwn)
+                if ds_switch_obj is not None:  # The neighbor switch may not have been polled
+                    for port_obj in ds_switch_obj.r_port_objects():
+                        port_index = port_obj.r_index()
+                        if isinstance(port_index, int) and port_index not in ds_index_d[ds_wwn]:
+                            ds_index_d[ds_wwn][port_index] = port_obj
             if ds_wwn not in ret:
                 ret.update({ds_wwn: dict()})
             g = ret.get(ds_wwn)
@@ -627,14 +670,22 @@ class SwitchObj:
             if group not in g:
                 g.update({group: list()})
             group_l = g.get(group)
-            li = [self.r_port_object_for_index(td.get('source-port')),
-                  proj_obj.r_switch_obj(ds_wwn).r_port_object_for_index(td.get('destination-port'))]
+            li = [index_d.get(td.get('source-port')), ds_index_d[ds_wwn].get(td.get('destination-port'))]
             if len(group_l) == 0 or not td.get('master'):
                 group_l.append(li)
             else:
                 group_l.insert(0, li)
         return ret
 
+    def r_isl_topology(self):
+        """Returns the ISL topology for the fabric this switch is in. If the switch is not in a fabric, a topology for
+        just this switch is returned.
+        :return: ISL topology
+        :rtype: brcddb.classes.isl.IslTopology
+        """
+        fab_obj = self.r_fabric_obj()
+        return isl_class.IslTopology([self]) if fab_obj is None else fab_obj.r_isl_topology()
+
     def r_active_maps_policy(self):
         """Returns the active MAPS policy associated with this switch
         :return: Active MAPS. None if no active MAPS policy
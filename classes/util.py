@@ -21,6 +21,8 @@ Includes methods common to class methods.
 +-----------------------+-------------------------------------------------------------------------------------------+
 | Method                | Description                                                                               |
 +=======================+===========================================================================================+
+| check_frozen          | Raises FrozenError if the project the object belongs to has been frozen.                  |
++-----------------------+-------------------------------------------------------------------------------------------+
 | class_getkeys         | Returns a list of keys added to this object.                                              |
 +-----------------------+-------------------------------------------------------------------------------------------+
 | class_getvalue        | Returns the value associated with a key. Key may be multiple keys using "/" notation      |
@@ -35,6 +37,22 @@ Includes methods common to class methods.
 +-----------------------+-------------------------------------------------------------------------------------------+
 | get_simple_class_type | Returns a simple 'ProjectObj', 'SwitchObj', ... for brcddb.classes.* types                |
 +-----------------------+-------------------------------------------------------------------------------------------+
+| name_cache_stats      | Returns the number of cached name hits and misses. See r_cached_name()                    |
++-----------------------+-------------------------------------------------------------------------------------------+
+| r_alert_nums          | A common method for r_alert_nums() in all classes.                                        |
++-----------------------+-------------------------------------------------------------------------------------------+
+| r_alert_objects       | A common method for r_alert_objects() in all classes.                                     |
++-----------------------+-------------------------------------------------------------------------------------------+
+| r_cached_name         | Returns a name cached with s_cached_name().                                               |
++-----------------------+-------------------------------------------------------------------------------------------+
+| s_add_alert           | A common method for s_add_alert() in all classes.                                         |
++-----------------------+-------------------------------------------------------------------------------------------+
+| s_cached_name         | Caches a name, typically a user-friendly name resolved from several keys, in an object.   |
++-----------------------+-------------------------------------------------------------------------------------------+
+| s_data_gen            | Increments the data generation of the project an object belongs to.                       |
++-----------------------+-------------------------------------------------------------------------------------------+
+| s_del_alerts          | Removes alerts from objects and from the project alert index.                             |
++-----------------------+-------------------------------------------------------------------------------------------+
 | s_new_key_for_class   | Creates a new key/value pair in a brcddb object.                                          |
 +-----------------------+-------------------------------------------------------------------------------------------+
 
@@ -55,15 +73,47 @@ Includes methods common to class methods.
 +-----------+---------------+---------------------------------------------------------------------------------------+
 | 4.0.5     | 20 Feb 2026   | Updated copyright notice.                                                             |
 +-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.6     | 18 Oct 2026   | Added _request_stats                                                                  |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.7     | 18 Oct 2026   | Added s_add_alert(), r_alert_objects(), and r_alert_nums()                            |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.8     | 18 Oct 2026   | Added check_frozen() and FrozenError                                                  |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.9     | 18 Oct 2026   | _members and _pmembers are returned as lists                                          |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.0     | 18 Oct 2026   | Added _eff_zoned_to                                                                   |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.1     | 18 Oct 2026   | Added _zone_merge_groups and _merge_group                                             |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.2     | 18 Oct 2026   | Added _isl_topology                                                                   |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.3     | 18 Oct 2026   | Added _ficon_index                                                                    |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.4     | 18 Oct 2026   | s_add_alert() adds alerts to the alert index. Added r_alert_obj() and has_alert_num() |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.5     | 18 Oct 2026   | Added s_del_alerts() and _data_changes                                                |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.6     | 18 Oct 2026   | Added _switch_obj, _fabric_obj, and _chassis_obj                                      |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.7     | 18 Oct 2026   | Added _port_class                                                                     |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.8     | 18 Oct 2026   | Added r_cached_name(), s_cached_name(), name_cache_stats(), _best_name, and _data_gen |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.9     | 18 Oct 2026   | check_frozen() allows report_app in frozen projects                                   |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.2.0     | 18 Oct 2026   | Adding or deleting alerts does not increment the data generation                      |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.2.1     | 18 Oct 2026   | check_frozen() no longer increments the data generation. Added s_data_gen()           |
++-----------+---------------+---------------------------------------------------------------------------------------+
 """
 __author__ = 'Jack Consoli'
 __copyright__ = 'Copyright 2024, 2025, 2026 Jack Consoli'
-__date__ = '20 Feb 2026'
+__date__ = '18 Oct 2026'
 __license__ = 'Apache License, Version 2.0'
 __email__ = 'jack_consoli@yahoo.com'
 __maintainer__ = 'Jack Consoli'
 __status__ = 'Released'
-__version__ = '4.0.5'
+__version__ = '4.2.1'
 
 import brcdapi.log as brcdapi_log
 import brcdapi.gen_util as gen_util
@@ -71,10 +121,17 @@ import pprint
 
 _MAX_PRINT_LINE = 78  # Maximum number of characters per formatted line. Used in format_obj()
 force_msg = 'To overwrite a key, set f=True in the call to s_new_key()\n'
+_name_cache_stats = dict(hit=0, miss=0)  # See r_cached_name()
+_app_keys = ('report_app',)  # Application bookkeeping keys. Allowed in frozen projects. See check_frozen()
 simple_class_type = ('AlertObj', 'AliasObj', 'ChassisObj', 'FabricObj', 'LoginObj', 'FdmiNodeObj', 'FdmiPortObj',
                      'PortObj', 'ProjectObj', 'SwitchObj', 'ZoneCfgObj', 'ZoneObj', 'IOCPObj', 'ChpidObj')
 
 
+class FrozenError(Exception):
+    """Raised when an attempt is made to modify an object in a frozen project. See ProjectObj.freeze()"""
+    pass
+
+
 # Used in class_getvalue():
 def get_simple_class_type(obj, all_types=False):
     """Returns a simple 'ProjectObj', 'SwitchObj', ... for brcddb.classes.* types
@@ -109,6 +166,14 @@ def _reserved_keys(obj):
     return obj._reserved_keys
 
 
+def _request_stats(obj):
+    return obj._request_stats
+
+
+def _alert_tbl(obj):
+    return obj._alert_tbl
+
+
 def _project_obj(obj):
     return obj._project_obj
 
@@ -186,11 +251,11 @@ def _switch(obj):
 
 
 def _members(obj):
-    return obj._members
+    return list(obj._members)
 
 
 def _pmembers(obj):
-    return obj._pmembers
+    return list(obj._pmembers)
 
 
 def _chassis_key(obj):
@@ -217,6 +282,54 @@ def _port_map(obj):
     return obj._port_map
 
 
+def _eff_zoned_to(obj):
+    return obj._eff_zoned_to
+
+
+def _zone_merge_groups(obj):
+    return obj._zone_merge_groups
+
+
+def _merge_group(obj):
+    return obj._merge_group
+
+
+def _isl_topology(obj):
+    return obj._isl_topology
+
+
+def _ficon_index(obj):
+    return obj._ficon_index
+
+
+def _data_changes(obj):
+    return obj._data_changes
+
+
+def _switch_obj(obj):
+    return obj._switch_obj
+
+
+def _fabric_obj(obj):
+    return obj._fabric_obj
+
+
+def _chassis_obj(obj):
+    return obj._chassis_obj
+
+
+def _port_class(obj):
+    return obj._port_class
+
+
+def _best_name(obj):
+    return obj._best_name
+
+
+def _data_gen(obj):
+    return obj._data_gen
+
+
 def _chpid_objs(obj):
     return obj._chpid_objs
 
@@ -260,9 +373,23 @@ _class_reserved_case = dict(
     _zonecfg=_zonecfg,
     _base_logins=_base_logins,
     _port_map=_port_map,
+    _eff_zoned_to=_eff_zoned_to,
+    _zone_merge_groups=_zone_merge_groups,
+    _merge_group=_merge_group,
+    _isl_topology=_isl_topology,
+    _ficon_index=_ficon_index,
+    _data_changes=_data_changes,
+    _switch_obj=_switch_obj,
+    _fabric_obj=_fabric_obj,
+    _chassis_obj=_chassis_obj,
+    _port_class=_port_class,
+    _best_name=_best_name,
+    _data_gen=_data_gen,
     _chpid_objs=_chpid_objs,
     _switch_id=_switch_id,
     _link_addr=_link_addr,
+    _request_stats=_request_stats,
+    _alert_tbl=_alert_tbl,
 )
 
 
@@ -468,6 +595,8 @@ def s_new_key_for_class(obj, k, v, f=False):
     """
     global force_msg, _special
 
+    check_frozen(obj, k)
+    s_data_gen(obj, k)
     ml = list()
     if k in obj.r_reserved_keys():
         ml.append('Attempted to add a reserved key.')
@@ -616,6 +745,8 @@ def get_or_add(obj, k, v):
         return val
 
     # The key does not exist so add it
+    check_frozen(obj, k)
+    s_data_gen(obj, k)
     key_l = k.split('/')
     last_key = key_l.pop()
     if len(key_l) == 0:
@@ -642,6 +773,209 @@ def get_or_add(obj, k, v):
     return v
 
 
+def check_frozen(obj, k=None):
+    """Raises FrozenError if the project the object belongs to has been frozen. Called at the top of every method that
+    adds or deletes keys, objects, or alerts.
+
+    :param obj: Any brcddb.classes object
+    :type obj: ChassisObj, FabricObj, LoginObj, FdmiNodeObj, FdmiPortObj, PortObj, ProjectObj, SwitchObj, ZoneCfgObj \
+        ZoneObj, AliasObj, IOCPObj, ChpidObj
+    :param k: Key, in slash notation, being added. Keys in _app_keys can be added to a frozen project.
+    :type k: str, None
+    """
+    global _app_keys
+
+    proj_obj = obj.r_project_obj() if hasattr(obj, 'r_project_obj') else None
+    if proj_obj is None or (isinstance(k, str) and k.split('/')[0] in _app_keys):
+        return
+    if proj_obj.r_is_frozen():
+        raise FrozenError('Attempt to modify ' + str(get_simple_class_type(obj)) + ' ' + str(obj.r_obj_key()) +
+                          ' in frozen project ' + str(proj_obj.r_obj_key()))
+
+
+def s_data_gen(obj, k=None):
+    """Increments the data generation of the project the object belongs to. Called after check_frozen() by every method
+    that adds, changes, or deletes data that cached values are built from. Incrementing the data generation invalidates
+    cached names, port classifications, FICON lookup tables, and the other cached values keyed on
+    brcddb.classes.project.ProjectObj.r_data_gen(). Alerts are not data so adding or deleting alerts does not call this.
+
+    :param obj: Any brcddb.classes object
+    :type obj: ChassisObj, FabricObj, LoginObj, FdmiNodeObj, FdmiPortObj, PortObj, ProjectObj, SwitchObj, ZoneCfgObj \
+        ZoneObj, AliasObj, IOCPObj, ChpidObj
+    :param k: Key, in slash notation, being added or changed. Keys in _app_keys do not increment the data generation.
+    :type k: str, None
+    """
+    global _app_keys
+
+    proj_obj = obj.r_project_obj() if hasattr(obj, 'r_project_obj') else None
+    if proj_obj is not None and not (isinstance(k, str) and k.split('/')[0] in _app_keys):
+        proj_obj.s_data_gen()
+
+
+def _project_data_gen(obj):
+    """Returns the data generation of the project obj belongs to. None if obj isn't associated with a project"""
+    proj_obj = obj.r_project_obj()
+    return None if proj_obj is None else proj_obj.r_data_gen()
+
+
+def r_cached_name(obj, k):
+    """Returns a name cached with s_cached_name(). Cached names are discarded when any data in the project is added or
+    changed so that names are never stale. See brcddb.classes.project.ProjectObj.r_data_gen()
+
+    :param obj: Chassis, fabric, port, or switch object
+    :type obj: ChassisObj, FabricObj, PortObj, SwitchObj
+    :param k: Identifies the name. Typically a tuple of the parameters used to resolve the name.
+    :type k: tuple, str
+    :return: Cached name. None if the name isn't cached or data changed since it was cached.
+    :rtype: str, None
+    """
+    global _name_cache_stats
+
+    cache_d = obj._best_name
+    if cache_d is not None and cache_d['_gen'] == _project_data_gen(obj):
+        v = cache_d.get(k)
+        if v is not None:
+            _name_cache_stats['hit'] += 1
+            return v
+    _name_cache_stats['miss'] += 1
+    return None
+
+
+def s_cached_name(obj, k, v):
+    """Caches a name, typically a user-friendly name resolved from several keys, in an object. See r_cached_name()
+
+    :param obj: Chassis, fabric, port, or switch object
+    :type obj: ChassisObj, FabricObj, PortObj, SwitchObj
+    :param k: Identifies the name. See r_cached_name()
+    :type k: tuple, str
+    :param v: Name
+    :type v: str
+    :return: v
+    :rtype: str
+    """
+    data_gen = _project_data_gen(obj)
+    if obj._best_name is None or obj._best_name['_gen'] != data_gen:
+        obj._best_name = dict(_gen=data_gen)
+    obj._best_name[k] = v
+    return v
+
+
+def name_cache_stats(reset=False):
+    """Returns the number of cached name hits and misses. Misses are the number of times a name had to be resolved.
+    Intended for measuring report performance.
+
+    :param reset: If True, reset the counters to 0 after reading them
+    :type reset: bool
+    :return: hit: Number of names returned from the cache. miss: Number of names that were resolved.
+    :rtype: dict
+    """
+    global _name_cache_stats
+
+    rd = _name_cache_stats.copy()
+    if reset:
+        _name_cache_stats['hit'], _name_cache_stats['miss'] = 0, 0
+    return rd
+
+
+def s_add_alert(obj, tbl, num, key=None, p0=None, p1=None):
+    """A common method for s_add_alert() in all classes. Adds the alert to the project alert table and the alert ID to
+    the object. See brcddb.classes.alert.AlertTbl
+
+    :param obj: Any brcddb.classes object with alerts
+    :type obj: ChassisObj, FabricObj, LoginObj, FdmiNodeObj, FdmiPortObj, PortObj, ProjectObj, SwitchObj, ZoneCfgObj \
+        ZoneObj, AliasObj, IOCPObj, ChpidObj
+    :param tbl: The table that defines this alert. See brcddb.classes.alert.AlertObj
+    :type tbl: dict
+    :param num: Alert number. See brcddb.classes.alert.AlertObj
+    :type num: int
+    :param key: Key associated with this alert. See brcddb.classes.alert.AlertObj
+    :type key: str, None
+    :param p0: Optional parameter. See brcddb.classes.alert.AlertObj
+    :type p0: str, int, float, None
+    :param p1: Optional parameter. See brcddb.classes.alert.AlertObj
+    :type p1: str, int, float, None
+    :return: Alert object
+    :rtype: brcddb.classes.alert.AlertObj
+    """
+    check_frozen(obj)
+    alert_tbl = obj.r_project_obj().r_alert_tbl()
+    alert_id = alert_tbl.s_add_alert(tbl, num, key, p0, p1)
+    obj._alerts.append(alert_id)
+    alert_tbl.s_index_alert(obj, alert_id)
+    return alert_tbl.r_alert_obj(alert_id)
+
+
+def s_del_alerts(proj_obj, del_l):
+    """Removes alerts from objects and from the project alert index. See brcddb.classes.alert.AlertTbl.s_record_alerts()
+
+    :param proj_obj: Project object the objects belong to
+    :type proj_obj: brcddb.classes.project.ProjectObj
+    :param del_l: List of (object, alert ID) tuples. Alert IDs not in the object are ignored.
+    :type del_l: list
+    """
+    rl = list()
+    for obj, alert_id in del_l:
+        check_frozen(obj)
+        try:
+            obj._alerts.remove(alert_id)
+            rl.append((obj, alert_id))
+        except ValueError:
+            pass
+    proj_obj.r_alert_tbl().s_unindex_alerts(rl)
+
+
+def r_alert_objects(obj):
+    """A common method for r_alert_objects() in all classes.
+
+    :param obj: Any brcddb.classes object with alerts. See s_add_alert()
+    :type obj: ChassisObj, FabricObj, LoginObj, PortObj, ProjectObj, SwitchObj, ZoneCfgObj, ZoneObj, AliasObj
+    :return: List of alert objects (brcddb.classes.alert.AlertObj)
+    :rtype: list
+    """
+    alert_tbl = obj.r_project_obj().r_alert_tbl()
+    return [alert_tbl.r_alert_obj(alert_id) for alert_id in obj._alerts]
+
+
+def r_alert_nums(obj):
+    """A common method for r_alert_nums() in all classes. Alert objects are not created.
+
+    :param obj: Any brcddb.classes object with alerts. See s_add_alert()
+    :type obj: ChassisObj, FabricObj, LoginObj, PortObj, ProjectObj, SwitchObj, ZoneCfgObj, ZoneObj, AliasObj
+    :return: List of alert numbers
+    :rtype: list
+    """
+    alert_tbl = obj.r_project_obj().r_alert_tbl()
+    return [alert_tbl.r_alert_num(alert_id) for alert_id in obj._alerts]
+
+
+def r_alert_obj(obj, num):
+    """A common method for r_alert_obj() in all classes. Uses the project alert index.
+
+    :param obj: Any brcddb.classes object with alerts. See s_add_alert()
+    :type obj: ChassisObj, FabricObj, LoginObj, PortObj, ProjectObj, SwitchObj, ZoneCfgObj, ZoneObj, AliasObj
+    :param num: Alert number
+    :type num: int
+    :return: First alert object added to obj with alert number num. None if not found.
+    :rtype: None, brcddb.classes.alert.AlertObj
+    """
+    alert_tbl = obj.r_project_obj().r_alert_tbl()
+    alert_id_l = alert_tbl.r_alert_ids_for_num(obj, num)
+    return alert_tbl.r_alert_obj(alert_id_l[0]) if len(alert_id_l) > 0 else None
+
+
+def has_alert_num(obj, num):
+    """Determines if an alert number has been added to an object. Uses the project alert index.
+
+    :param obj: Any brcddb.classes object with alerts. See s_add_alert()
+    :type obj: ChassisObj, FabricObj, LoginObj, PortObj, ProjectObj, SwitchObj, ZoneCfgObj, ZoneObj, AliasObj
+    :param num: Alert number
+    :type num: int
+    :return: True if the alert number has been added to obj
+    :rtype: bool
+    """
+    return len(obj.r_project_obj().r_alert_tbl().r_alert_ids_for_num(obj, num)) > 0
+
+
 def _format_obj_none(obj):  # Used in format_obj()
     return list()
 
@@ -697,7 +1031,19 @@ def format_obj(obj, full=False):
                 _fdmi_port_objs=_format_obj_none,
                 _base_logins=_format_obj_none,
                 _port_map=_format_obj_none,
+                _eff_zoned_to=_format_obj_none,
+                _zone_merge_groups=_format_obj_none,
+                _isl_topology=_format_obj_none,
+                _ficon_index=_format_obj_none,
+                _data_changes=_format_obj_none,
+                _switch_obj=_format_obj_none,
+                _fabric_obj=_format_obj_none,
+                _chassis_obj=_format_obj_none,
+                _port_class=_format_obj_none,
+                _best_name=_format_obj_none,
                 _msg_tbl=_format_obj_none,
+                _request_stats=_format_obj_none,
+                _alert_tbl=_format_obj_none,
             )
 
             # Assume everything else has a simple lookup
@@ -37,20 +37,37 @@ Defines the zone classes ZoneCfgObj, ZoneObj, and AliasObj
 +-----------+---------------+---------------------------------------------------------------------------------------+
 | 4.0.7     | 20 Feb 2026   | Updated copyright notice.                                                             |
 +-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.8     | 18 Oct 2026   | Alerts are interned in a project level alert table. See brcddb.classes.alert.AlertTbl |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.9     | 18 Oct 2026   | s_add_xxx() and s_del_xxx() raise FrozenError when the project is frozen              |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.0     | 18 Oct 2026   | Members are stored in insertion ordered sets (dict keys). O(1) r_has_member() and     |
+|           |               | s_del_member()                                                                        |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.1     | 18 Oct 2026   | Added r_merge_group() and s_merge_group() to ZoneObj                                  |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.2     | 18 Oct 2026   | r_alert_obj() uses the project alert index                                            |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.3     | 18 Oct 2026   | r_fabric_obj() returns a cached fabric object                                         |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.4     | 18 Oct 2026   | Alias and zone member changes clear the fabric zone merge groups                      |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.5     | 18 Oct 2026   | s_add_member() and s_add_pmember() are no-ops, even in frozen projects, when the      |
+|           |               | members already exist. Explicitly increment the data generation                       |
++-----------+---------------+---------------------------------------------------------------------------------------+
 """
 __author__ = 'Jack Consoli'
 __copyright__ = 'Copyright 2024, 2025, 2026 Jack Consoli'
-__date__ = '20 Feb 2026'
+__date__ = '18 Oct 2026'
 __license__ = 'Apache License, Version 2.0'
 __email__ = 'jack_consoli@yahoo.com'
 __maintainer__ = 'Jack Consoli'
 __status__ = 'Released'
-__version__ = '4.0.7'
+__version__ = '4.1.5'
 
 import brcdapi.gen_util as gen_util
 import brcdapi.util as brcdapi_util
 import brcddb.brcddb_common as brcddb_common
-import brcddb.classes.alert as alert_class
 import brcddb.classes.util as class_util
 
 # Programmer's Tip: Apparently, .clear() doesn't work on a dereference list and dict. Rather than write my own, I rely
@@ -59,6 +76,17 @@ import brcddb.classes.util as class_util
 # objects that might be sharing a resource with other objects.
 
 
+def _clear_merge_groups(obj):
+    """Clears the zone merge groups in the fabric an alias or zone belongs to. Membership changes invalidate them.
+
+    :param obj: Alias or zone object
+    :type obj: AliasObj, ZoneObj
+    """
+    fab_obj = obj.r_fabric_obj()
+    if fab_obj is not None:
+        fab_obj.s_zone_merge_groups(None)
+
+
 class ZoneCfgObj:
     """The ZoneCfgObj contains all information relevant to a zone configuration including:
         * 'brocade-fibrechannel-configuration/zone-configuration'
@@ -67,17 +95,19 @@ class ZoneCfgObj:
         _obj_key (str): Name of the zone configuration.
         _flags (int): Flags for each class are defined in brcddb.brcddb_common
         _project_obj (ProjectObj): The project object this fabric belongs to.
-        _members (list): List of zone members by zone name
+        _members (dict): Zone members by zone name. Used as an insertion ordered set so the values are always None.
         _fabric_key (str): WWN of fabric this zone configuration belongs to.
-        _alerts (list): List of AlertObj objects associated with this object.
+        _fabric_obj (FabricObj, None): Cached fabric object. See r_fabric_obj()
+        _alerts (list): Alert IDs associated with this object. See brcddb.classes.alert.AlertTbl
     """
 
     def __init__(self, name, project_obj, fabric_key):
         self._obj_key = name
         self._flags = 0
-        self._members = list()
+        self._members = dict()
         self._alerts = list()
         self._fabric_key = fabric_key
+        self._fabric_obj = None  # See r_fabric_obj()
         self._project_obj = project_obj
 
     def r_get_reserved(self, k):
@@ -96,6 +126,7 @@ class ZoneCfgObj:
                 _project_obj=self.r_project_obj(),
                 _members=self.r_members(),
                 _fabric_key=self.r_fabric_key(),
+                _fabric_obj=self._fabric_obj,
             ),
             k
         )
@@ -115,9 +146,7 @@ class ZoneCfgObj:
         :return: Alert object
         :rtype: brcddb.classes.alert.AlertObj
         """
-        alert_obj = alert_class.AlertObj(tbl, num, key, p0, p1)
-        self._alerts.append(alert_obj)
-        return alert_obj
+        return class_util.s_add_alert(self, tbl, num, key, p0, p1)
 
     def r_alert_objects(self):
         """Returns a list of alert objects associated with this object
@@ -125,7 +154,7 @@ class ZoneCfgObj:
         :return: List of alert objects (brcddb.classes.alert.AlertObj)
         :rtype: list
         """
-        return self._alerts
+        return class_util.r_alert_objects(self)
 
     def r_alert_nums(self):
         """Returns a list of alert numbers associated with this object
@@ -133,7 +162,7 @@ class ZoneCfgObj:
         :return: List of alert objects (brcddb.classes.alert.AlertObj)
         :rtype: list
         """
-        return [alert_obj.alert_num() for alert_obj in self._alerts]
+        return class_util.r_alert_nums(self)
 
     def r_alert_obj(self, alert_num):
         """Returns the alert object for a specific alert number
@@ -141,10 +170,7 @@ class ZoneCfgObj:
         :return: Alert object. None if not found.
         :rtype: None, brcddb.classes.alert.AlertObj
         """
-        for alert_obj in self.r_alert_objects():
-            if alert_obj.alert_num() == alert_num:
-                return alert_obj
-        return None
+        return class_util.r_alert_obj(self, alert_num)
 
     def r_reserved_keys(self):
         """Returns a list of reserved words (keys) associated with this object
@@ -218,9 +244,13 @@ class ZoneCfgObj:
         :type members: list, str, None
         """
         try:
-            self._members.extend([mem for mem in gen_util.convert_to_list(members) if mem not in self._members])
+            mem_l = [mem for mem in gen_util.convert_to_list(members) if mem not in self._members]
         except TypeError:
             return
+        if len(mem_l) > 0:
+            class_util.check_frozen(self)
+            class_util.s_data_gen(self)
+            self._members.update(dict.fromkeys(mem_l))
 
     def s_del_member(self, members):
         """Deletes zone members from the zone configuration
@@ -228,11 +258,10 @@ class ZoneCfgObj:
         :param members: Member
         :type members: str, list
         """
+        class_util.check_frozen(self)
+        class_util.s_data_gen(self)
         for mem in gen_util.convert_to_list(members):
-            for i, e in reversed(list(enumerate(self._members))):
-                if e == mem:
-                    self._members.pop(i)
-                    break
+            self._members.pop(mem, None)
 
     def r_members(self):
         """Returns a list of zones in the zone configuration
@@ -240,7 +269,7 @@ class ZoneCfgObj:
         :return: Members
         :rtype: list
         """
-        return self._members.copy()
+        return list(self._members)
 
     def r_has_member(self, mem):
         """Checks to see if a zone exists in the zone configuration
@@ -250,7 +279,7 @@ class ZoneCfgObj:
         :return: True: zone found. False: zone not found
         :rtype: bool
         """
-        return True if mem in self._members else False
+        return mem in self._members
 
     def r_fabric_key(self):
         """Returns the fabric WWN associated with this zone configuration
@@ -266,10 +295,12 @@ class ZoneCfgObj:
         :return: Fabric object
         :rtype: FabricObj, None
         """
-        try:
-            return self.r_project_obj().r_fabric_obj(self.r_fabric_key())
-        except AttributeError:
-            return None
+        if self._fabric_obj is None:
+            try:
+                self._fabric_obj = self._project_obj.r_fabric_obj(self._fabric_key)
+            except AttributeError:
+                pass
+        return self._fabric_obj
 
     def r_zonecfg_obj(self):
         return self
@@ -358,7 +389,7 @@ class ZoneCfgObj:
 
     def s_sort_members(self):
         """Sorts the membership list. This is useful for simple zone configuration comparisons"""
-        self._members.sort()
+        self._members = dict.fromkeys(sorted(self._members))
 
 
 class ZoneObj:
@@ -372,20 +403,24 @@ class ZoneObj:
         _obj_key (str): Name of the zone.
         _flags (int): Flags for each class are defined in brcddb.brcddb_common
         _project_obj (ProjectObj): The project object this fabric belongs to.
-        _members (list): List of zone members.
-        _pmembers (list): List of principal zone members.
+        _members (dict): Zone members. Used as an insertion ordered set so the values are always None.
+        _pmembers (dict): Principal zone members. Same as _members.
+        _merge_group (int, None): Zone merge group ID. See brcddb.brcddb_fabric.zone_merge_groups()
         _fabric_key (str): WWN of fabric this zone configuration belongs to.
-        _alerts (list): List of AlertObj objects associated with this object.
+        _fabric_obj (FabricObj, None): Cached fabric object. See r_fabric_obj()
+        _alerts (list): Alert IDs associated with this object. See brcddb.classes.alert.AlertTbl
     """
 
     def __init__(self, name, zone_type, project_obj, fabric_key):
         self._obj_key = name   # Zone name
         self._flags = 0
-        self._members = list()  # 'member-entry' - Zone members
-        self._pmembers = list()  # 'principal-member-entry' - Principal zone members - for peer zones
+        self._members = dict()  # 'member-entry' - Zone members
+        self._pmembers = dict()  # 'principal-member-entry' - Principal zone members - for peer zones
         self._alerts = list()
         self._type = zone_type   # Zone type from brocade-zone/brocade-zone (0 default, 1 user peer, 2 target  peer)
+        self._merge_group = None
         self._fabric_key = fabric_key
+        self._fabric_obj = None  # See r_fabric_obj()
         self._project_obj = project_obj
 
     def r_get_reserved(self, k):
@@ -403,9 +438,11 @@ class ZoneObj:
                 _alerts=self.r_alert_objects(),
                 _project_obj=self.r_project_obj(),
                 _fabric_key=self.r_fabric_key(),
+                _fabric_obj=self._fabric_obj,
                 _members=self.r_members(),
                 _pmembers=self.r_pmembers(),
                 _type=self.r_type(),
+                _merge_group=self.r_merge_group(),
             ),
             k
         )
@@ -425,9 +462,7 @@ class ZoneObj:
         :return: Alert object
         :rtype: brcddb.classes.alert.AlertObj
         """
-        alert_obj = alert_class.AlertObj(tbl, num, key, p0, p1)
-        self._alerts.append(alert_obj)
-        return alert_obj
+        return class_util.s_add_alert(self, tbl, num, key, p0, p1)
 
     def r_alert_objects(self):
         """Returns a list of alert objects associated with this object
@@ -435,7 +470,7 @@ class ZoneObj:
         :return: List of alert objects (brcddb.classes.alert.AlertObj)
         :rtype: list
         """
-        return self._alerts
+        return class_util.r_alert_objects(self)
 
     def r_alert_nums(self):
         """Returns a list of alert numbers associated with this object
@@ -443,7 +478,7 @@ class ZoneObj:
         :return: List of alert objects (brcddb.classes.alert.AlertObj)
         :rtype: list
         """
-        return [alert_obj.alert_num() for alert_obj in self._alerts]
+        return class_util.r_alert_nums(self)
 
     def r_reserved_keys(self):
         """Returns a list of reserved words (keys) associated with this object
@@ -549,10 +584,12 @@ class ZoneObj:
         :return: Fabric object
         :rtype: FabricObj, None
         """
-        try:
-            return self.r_project_obj().r_fabric_obj(self.r_fabric_key())
-        except AttributeError:
-            return None
+        if self._fabric_obj is None:
+            try:
+                self._fabric_obj = self._project_obj.r_fabric_obj(self._fabric_key)
+            except AttributeError:
+                pass
+        return self._fabric_obj
 
     def s_add_member(self, members):
         """Adds members to the zone
@@ -560,22 +597,24 @@ class ZoneObj:
         :param members: Member
         :type members: str, list
         """
-        self._members.extend([mem for mem in gen_util.convert_to_list(members) if mem not in self._members])
+        mem_l = [mem for mem in gen_util.convert_to_list(members) if mem not in self._members]
+        if len(mem_l) > 0:
+            class_util.check_frozen(self)
+            class_util.s_data_gen(self)
+            self._members.update(dict.fromkeys(mem_l))
+            _clear_merge_groups(self)
 
     def s_del_member(self, members):
         """Deletes members from the zone
         :param members: Member
         :type members: str, list
         """
+        class_util.check_frozen(self)
+        class_util.s_data_gen(self)
         for mem in gen_util.convert_to_list(members):
-            for i, e in reversed(list(enumerate(self._members))):
-                if e == mem:
-                    self._members.pop(i)
-                    break
-            for i, e in reversed(list(enumerate(self._pmembers))):
-                if e == mem:
-                    self._pmembers.pop(i)
-                    break
+            self._members.pop(mem, None)
+            self._pmembers.pop(mem, None)
+        _clear_merge_groups(self)
 
     def r_members(self):
         """Returns a list of members in the zone
@@ -583,7 +622,7 @@ class ZoneObj:
         :return: Members
         :rtype: list
         """
-        return self._members.copy()
+        return list(self._members)
 
     def c_members(self):
         """Same as r_members() but with aliases resolved
@@ -609,7 +648,7 @@ class ZoneObj:
         :return: True: member found. False: member not found
         :rtype: bool
         """
-        return True if mem in self._members else False
+        return mem in self._members
 
     def s_add_pmember(self, members):
         """Adds principal members to the zone
@@ -617,7 +656,11 @@ class ZoneObj:
         :param members: Member
         :type members: str, list
         """
-        self._pmembers.extend([mem for mem in gen_util.convert_to_list(members) if mem not in self._pmembers])
+        mem_l = [mem for mem in gen_util.convert_to_list(members) if mem not in self._pmembers]
+        if len(mem_l) > 0:
+            class_util.check_frozen(self)
+            class_util.s_data_gen(self)
+            self._pmembers.update(dict.fromkeys(mem_l))
 
     def s_del_pmember(self, members):
         """Deletes principal members from the zone
@@ -625,11 +668,10 @@ class ZoneObj:
         :param members: Member
         :type members: str, list
         """
+        class_util.check_frozen(self)
+        class_util.s_data_gen(self)
         for mem in gen_util.convert_to_list(members):
-            for i, e in reversed(list(enumerate(self._pmembers))):
-                if e == mem:
-                    self._pmembers.pop(i)
-                    break
+            self._pmembers.pop(mem, None)
 
     def r_pmembers(self):
         """Returns a list of principal members in the zone
@@ -637,7 +679,7 @@ class ZoneObj:
         :return: Members
         :rtype: list
         """
-        return self._pmembers.copy()
+        return list(self._pmembers)
 
     def c_pmembers(self):
         """Same as r_pmembers() but with aliases resolved
@@ -663,7 +705,7 @@ class ZoneObj:
         :return: True: member found. False: member not found
         :rtype: bool
         """
-        return True if mem in self._pmembers else False
+        return mem in self._pmembers
 
     def r_zonecfg_objects(self):
         """Returns the zone configuration objects of defined zone configurations this zone is a member of
@@ -699,6 +741,23 @@ class ZoneObj:
         """
         self._type = zone_type
 
+    def r_merge_group(self):
+        """Returns the zone merge group ID
+
+        :return: Group ID. None if brcddb.brcddb_fabric.zone_merge_groups() has not been called since the zoning was last
+            changed.
+        :rtype: int, None
+        """
+        return self._merge_group
+
+    def s_merge_group(self, group_id):
+        """Sets the zone merge group ID. Typically only called from brcddb.brcddb_fabric.zone_merge_groups()
+
+        :param group_id: Group ID
+        :type group_id: int, None
+        """
+        self._merge_group = group_id
+
     def s_copy(self, zone):
         """Copy self to a new zone
 
@@ -755,8 +814,8 @@ class ZoneObj:
 
     def s_sort_members(self):
         """Sorts the membership list. This is useful for simple zone configuration comparisons"""
-        self._members.sort()
-        self._pmembers.sort()
+        self._members = dict.fromkeys(sorted(self._members))
+        self._pmembers = dict.fromkeys(sorted(self._pmembers))
 
 
 class AliasObj:
@@ -770,16 +829,19 @@ class AliasObj:
         _obj_key (str): Name of the alias.
         _flags (int): Flags for each class are defined in brcddb.brcddb_common
         _project_obj (ProjectObj): The project object this fabric belongs to.
-        _members (list): List of WWNs or d,i pairs associated with this alias.
+        _members (dict): WWNs or d,i pairs associated with this alias. Used as an insertion ordered set so the values
+            are always None.
         _fabric_key (str): WWN of fabric this alias belongs to.
-        _alerts (list): List of AlertObj objects associated with this object.
+        _fabric_obj (FabricObj, None): Cached fabric object. See r_fabric_obj()
+        _alerts (list): Alert IDs associated with this object. See brcddb.classes.alert.AlertTbl
     """
     def __init__(self, name, project_obj, fabric_key):
         self._obj_key = name  # Alias name
         self._flags = 0
-        self._members = list()  # alias members
+        self._members = dict()  # alias members
         self._alerts = list()
         self._fabric_key = fabric_key
+        self._fabric_obj = None  # See r_fabric_obj()
         self._project_obj = project_obj
 
     def r_get_reserved(self, k):
@@ -797,6 +859,7 @@ class AliasObj:
                 _alerts=self.r_alert_objects(),
                 _project_obj=self.r_project_obj(),
                 _fabric_key=self.r_fabric_key(),
+                _fabric_obj=self._fabric_obj,
                 _members=self.r_members(),
             ),
             k
@@ -817,9 +880,7 @@ class AliasObj:
         :return: Alert object
         :rtype: brcddb.classes.alert.AlertObj
         """
-        alert_obj = alert_class.AlertObj(tbl, num, key, p0, p1)
-        self._alerts.append(alert_obj)
-        return alert_obj
+        return class_util.s_add_alert(self, tbl, num, key, p0, p1)
 
     def r_alert_objects(self):
         """Returns a list of alert objects associated with this object
@@ -827,7 +888,7 @@ class AliasObj:
         :return: List of alert objects (brcddb.classes.alert.AlertObj)
         :rtype: list
         """
-        return self._alerts
+        return class_util.r_alert_objects(self)
 
     def r_reserved_keys(self):
         """Returns a list of reserved words (keys) associated with this object
@@ -889,7 +950,12 @@ class AliasObj:
         :param members: Member
         :type members: str, list
         """
-        self._members.extend([mem for mem in gen_util.convert_to_list(members) if mem not in self._members])
+        mem_l = [mem for mem in gen_util.convert_to_list(members) if mem not in self._members]
+        if len(mem_l) > 0:
+            class_util.check_frozen(self)
+            class_util.s_data_gen(self)
+            self._members.update(dict.fromkeys(mem_l))
+            _clear_merge_groups(self)
 
     def s_del_member(self, members):
         """Deletes members from the alias
@@ -897,11 +963,11 @@ class AliasObj:
         :param members: Member
         :type members: str, list
         """
+        class_util.check_frozen(self)
+        class_util.s_data_gen(self)
         for mem in gen_util.convert_to_list(members):
-            for i, e in reversed(list(enumerate(self._members))):
-                if e == mem:
-                    self._members.pop(i)
-                    break
+            self._members.pop(mem, None)
+        _clear_merge_groups(self)
 
     def r_members(self):
         """Returns a list of members in the alias
@@ -909,7 +975,7 @@ class AliasObj:
         :return: Members
         :rtype: list
         """
-        return self._members.copy()
+        return list(self._members)
 
     def r_has_member(self, mem):
         """Checks to see if a member exists in the alias
@@ -919,7 +985,7 @@ class AliasObj:
         :return: True: member found. False: member not found
         :rtype: bool
         """
-        return True if mem in self._members else False
+        return mem in self._members
 
     def r_login_obj(self):
         return self
@@ -941,10 +1007,12 @@ class AliasObj:
         :return: Fabric object. None if the switch is offline or the fabric may not have been polled
         :rtype: brcddb.classes.fabric.FabricObj, None
         """
-        try:
-            return self.r_project_obj().r_fabric_obj(self.r_fabric_key())
-        except AttributeError:
-            return None
+        if self._fabric_obj is None:
+            try:
+                self._fabric_obj = self._project_obj.r_fabric_obj(self._fabric_key)
+            except AttributeError:
+                pass
+        return self._fabric_obj
 
     def r_zone_objects(self):
         """Returns a list of zone objects where this alias is used
@@ -953,7 +1021,7 @@ class AliasObj:
         :rtype: list
         """
         alias = self.r_obj_key()
-        return [z for z in self.r_fabric_obj().r_zone_objects() if alias in z.r_members() or alias in z.r_pmembers()]
+        return [z for z in self.r_fabric_obj().r_zone_objects() if z.r_has_member(alias) or z.r_has_pmember(alias)]
 
     def s_copy(self, alias):
         """Copy self to a new alias.
@@ -1024,4 +1092,4 @@ class AliasObj:
 
     def s_sort_members(self):
         """Sorts the membership list. This is useful for simple zone configuration comparisons"""
-        self._members.sort()
+        self._members = dict.fromkeys(sorted(self._members))
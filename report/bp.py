@@ -43,19 +43,23 @@ Best practice violations
 +-----------+---------------+---------------------------------------------------------------------------------------+
 | 4.0.6     | 20 Feb 2026   | Updated copyright notice.                                                             |
 +-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.7     | 18 Oct 2026   | Use the project alert index to find alerts by severity                                |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.8     | 18 Oct 2026   | Cells and merges are written through brcddb.report.sink.                              |
++-----------+---------------+---------------------------------------------------------------------------------------+
 """
 __author__ = 'Jack Consoli'
 __copyright__ = 'Copyright 2024, 2025, 2026 Jack Consoli'
-__date__ = '20 Feb 2026'
+__date__ = '18 Oct 2026'
 __license__ = 'Apache License, Version 2.0'
 __email__ = 'jack_consoli@yahoo.com'
 __maintainer__ = 'Jack Consoli'
 __status__ = 'Released'
-__version__ = '4.0.6'
+__version__ = '4.0.8'
 
 import openpyxl.utils.cell as xl
 import brcdapi.log as brcdapi_log
-import brcdapi.excel_util as excel_util
+import brcddb.report.sink as report_sink
 import brcdapi.excel_fonts as excel_fonts
 import brcddb.util.util as brcddb_util
 import brcddb.brcddb_fabric as brcddb_fabric
@@ -92,16 +96,16 @@ _border_thin = excel_fonts.border_type('thin')
 
 
 def _add_alerts(obj, alert_type, sev, area_1, area_2):
-    rl = list()
-    for al_obj in obj.r_alert_objects():
-        if al_obj.sev() == sev:
-            class_type = class_util.get_simple_class_type(obj)
-            rl.append(dict(type=alert_type,
-                           sev=al_obj.fmt_sev(),
-                           area_1=area_1,
-                           area_2=area_2,
-                           link=obj.r_get(_obj_type_link[class_type]) if class_type in _obj_type_link else None,
-                           desc=al_obj.fmt_msg()))
+    rl, alert_tbl = list(), obj.r_project_obj().r_alert_tbl()
+    for alert_id in alert_tbl.r_alert_ids_for_sev(obj, sev):
+        al_obj = alert_tbl.r_alert_obj(alert_id)
+        class_type = class_util.get_simple_class_type(obj)
+        rl.append(dict(type=alert_type,
+                       sev=al_obj.fmt_sev(),
+                       area_1=area_1,
+                       area_2=area_2,
+                       link=obj.r_get(_obj_type_link[class_type]) if class_type in _obj_type_link else None,
+                       desc=al_obj.fmt_msg()))
     return rl
 
 
@@ -194,15 +198,15 @@ def bp_page(wb, tc, sheet_name, sheet_i, sheet_title, obj, display, display_tbl)
 
     # Create the worksheet, add the headers, and set up the column widths
     sheet = wb.create_sheet(index=0 if sheet_i is None else sheet_i, title=sheet_name)
-    sheet.page_setup.paperSize = sheet.PAPERSIZE_LETTER
-    sheet.page_setup.orientation = sheet.ORIENTATION_LANDSCAPE
+    sheet.page_setup.paperSize = report_sink.PAPERSIZE_LETTER
+    sheet.page_setup.orientation = report_sink.ORIENTATION_LANDSCAPE
     brcddb_util.add_to_obj(obj, 'report_app/hyperlink/bp', '#' + sheet_name + '!A1')
     row = col = 1
     if isinstance(tc, str):
-        excel_util.cell_update(sheet, row, col, 'Contents', font=_link_font, link=tc)
+        report_sink.cell_update(sheet, row, col, 'Contents', font=_link_font, link=tc)
         col += 1
-    excel_util.cell_update(sheet, row, col, sheet_title, font=_hdr1_font)
-    sheet.freeze_panes = sheet['A3']
+    report_sink.cell_update(sheet, row, col, sheet_title, font=_hdr1_font)
+    sheet.freeze_panes = 'A3'
     row, col = row+1, 1
     for k in display:
         if k in display_tbl:
@@ -214,7 +218,7 @@ def bp_page(wb, tc, sheet_name, sheet_i, sheet_title, obj, display, display_tbl)
             buf = display_tbl[k]['d'] if 'd' in display_tbl[k] else k
         else:  # This happens when a new key is introduced before the display tables have been updated
             buf, alignment = k, _align_wrap
-        excel_util.cell_update(sheet, row, col, buf, font=_bold_font, border=_border_thin, align=alignment)
+        report_sink.cell_update(sheet, row, col, buf, font=_bold_font, border=_border_thin, align=alignment)
         col += 1
 
     # Get a list of fabric objects and initialize alert_list
@@ -276,12 +280,12 @@ def bp_page(wb, tc, sheet_name, sheet_i, sheet_title, obj, display, display_tbl)
         row, col = row+1, 1
         if 't' in d and d['t']:
             row += 1
-            sheet.merge_cells(start_row=row, start_column=1, end_row=row, end_column=len(display))
-            excel_util.cell_update(sheet, row, col, d.get('desc'), font=_hdr2_font,
-                                   fill=excel_fonts.fill_type('lightblue'))
+            report_sink.merge_cells(sheet, start_row=row, start_column=1, end_row=row, end_column=len(display))
+            report_sink.cell_update(sheet, row, col, d.get('desc'), font=_hdr2_font,
+                                    fill=excel_fonts.fill_type('lightblue'))
         else:
             for k in display:
                 buf, link = bp_case[k](d)
-                excel_util.cell_update(sheet, row, col, buf, font=_std_font if link is None else _link_font,
-                                       align=_align_wrap, border=_border_thin, link=link)
+                report_sink.cell_update(sheet, row, col, buf, font=_std_font if link is None else _link_font,
+                                        align=_align_wrap, border=_border_thin, link=link)
                 col += 1
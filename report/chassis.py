@@ -53,15 +53,17 @@ details.
 +-----------+---------------+---------------------------------------------------------------------------------------+
 | 4.1.0     | 20 Feb 2026   | Updated copyright notice.                                                             |
 +-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.1     | 18 Oct 2026   | Cells and merges are written through brcddb.report.sink.                              |
++-----------+---------------+---------------------------------------------------------------------------------------+
 """
 __author__ = 'Jack Consoli'
 __copyright__ = 'Copyright 2024, 2025, 2026 Jack Consoli'
-__date__ = '20 Feb 2026'
+__date__ = '18 Oct 2026'
 __license__ = 'Apache License, Version 2.0'
 __email__ = 'jack_consoli@yahoo.com'
 __maintainer__ = 'Jack Consoli'
 __status__ = 'Released'
-__version__ = '4.1.0'
+__version__ = '4.1.1'
 
 import collections
 import copy
@@ -70,7 +72,7 @@ import brcdapi.log as brcdapi_log
 import brcdapi.gen_util as gen_util
 import brcdapi.util as brcdapi_util
 import brcdapi.excel_fonts as excel_fonts
-import brcdapi.excel_util as excel_util
+import brcddb.report.sink as report_sink
 import brcdapi.port as brcdapi_port
 import brcddb.brcddb_chassis as brcddb_chassis
 import brcddb.brcddb_switch as brcddb_switch
@@ -993,9 +995,9 @@ def chassis_page(wb, tc, sheet_name, sheet_i, chassis_obj):
 
     # Create the worksheet, set the column widths, and add the report control structure to the chassis object
     sheet = wb.create_sheet(index=0 if sheet_i is None else sheet_i, title=sheet_name)
-    sheet.page_setup.paperSize = sheet.PAPERSIZE_LETTER
-    sheet.page_setup.orientation = sheet.ORIENTATION_LANDSCAPE
-    sheet.add_data_validation(report_utils.highlight_stats_dv)
+    sheet.page_setup.paperSize = report_sink.PAPERSIZE_LETTER
+    sheet.page_setup.orientation = report_sink.ORIENTATION_LANDSCAPE
+    report_sink.add_data_validation(sheet, report_utils.highlight_stats_dv)
     for col in range(0, _num_columns + _extra_columns):
         sheet.column_dimensions[xl.get_column_letter(col+1)].width = _common_width
     sheet_d = dict(sheet=sheet, num_columns=_num_columns, row=1, cond_format_d=dict())
@@ -1004,10 +1006,16 @@ def chassis_page(wb, tc, sheet_name, sheet_i, chassis_obj):
     # Add the link to the table of contents and title
     col = 1
     if isinstance(tc, str):
-        excel_util.cell_update(sheet, sheet_d['row'], col, 'Contents', font=_link_font, link=tc)
-        sheet.merge_cells(start_row=sheet_d['row'], start_column=col, end_row=sheet_d['row'], end_column=col+3)
+        report_sink.cell_update(sheet, sheet_d['row'], col, 'Contents', font=_link_font, link=tc)
+        report_sink.merge_cells(
+            sheet,
+            start_row=sheet_d['row'],
+            start_column=col,
+            end_row=sheet_d['row'],
+            end_column=col+3
+        )
         col += 4
-    excel_util.cell_update(
+    report_sink.cell_update(
         sheet,
         sheet_d['row'],
         col,
@@ -1015,14 +1023,15 @@ def chassis_page(wb, tc, sheet_name, sheet_i, chassis_obj):
         font=_hdr1_font,
         align=_align_wrap_c
     )
-    sheet.merge_cells(
+    report_sink.merge_cells(
+        sheet,
         start_row=sheet_d['row'],
         start_column=col,
         end_row=sheet_d['row'],
         end_column=_hdr_span-col
     )
     sheet_d['row'] += 1
-    sheet.freeze_panes = sheet['A' + str(sheet_d['row'])]
+    sheet.freeze_panes = 'A' + str(sheet_d['row'])
 
     # Add the contents
     report_utils.add_contents(chassis_obj, report_utils.add_content_defaults(_contents, _common_default_d))
@@ -1067,12 +1076,12 @@ def chassis_hidden_port_page(wb, sheet_i, chassis_obj):
 
     # Create the worksheet, set up the column widths, and add the headers
     sheet = wb.create_sheet(index=0 if sheet_i is None else sheet_i, title=sheet_name)
-    sheet.page_setup.paperSize = sheet.PAPERSIZE_LETTER
-    sheet.page_setup.orientation = sheet.ORIENTATION_LANDSCAPE
+    sheet.page_setup.paperSize = report_sink.PAPERSIZE_LETTER
+    sheet.page_setup.orientation = report_sink.ORIENTATION_LANDSCAPE
     sheet.sheet_state = 'hidden'
     row = 1
     for buf, d in _hidden_hdr_d.items():
-        excel_util.cell_update(sheet, row, d['c'], buf, font=_bold_font, align=_align_wrap_c)
+        report_sink.cell_update(sheet, row, d['c'], buf, font=_bold_font, align=_align_wrap_c)
         sheet.column_dimensions[d['cl']].width = d['w']
     row += 1
 
@@ -1118,7 +1127,7 @@ def chassis_hidden_port_page(wb, sheet_i, chassis_obj):
                 elif '$' in v:
                     brcdapi_log.exception('Unresolved reference in v: ' + str(v), echo=True)
                     v = None
-            excel_util.cell_update(sheet, row, d['c'], v, border=_border_thin)
+            report_sink.cell_update(sheet, row, d['c'], v, border=_border_thin)
 
         # Add the remaining aliases and zones
         # Programmers Note: I forgot to add the formulas for the conditional highlighting cells, see k_l below. In
@@ -1152,9 +1161,9 @@ def chassis_hidden_port_page(wb, sheet_i, chassis_obj):
             # These are the remaining aliases and zones
             temp_row = row + 1
             for buf in d['l']:
-                excel_util.cell_update(sheet, temp_row, _hidden_hdr_d[d['h_key']]['c'], buf)  # The zone or alias
+                report_sink.cell_update(sheet, temp_row, _hidden_hdr_d[d['h_key']]['c'], buf)  # The zone or alias
                 for key, ref in d['k_d'].items():  # The zones and aliases that need additional rows
-                    excel_util.cell_update(
+                    report_sink.cell_update(
                         sheet,
                         temp_row,
                         _hidden_hdr_d[key]['c'],
@@ -1170,7 +1179,7 @@ def chassis_hidden_port_page(wb, sheet_i, chassis_obj):
                   _hidden_hdr_d[d['ref'] + ' Highlight Discarded Frames']['cl'] + str(row) + ':' + \
                   _hidden_hdr_d[d['ref'] + ' Highlight Alias FIND']['cl'] + str(max_row) + ')'
             col = _hidden_hdr_d[d['ref'] + ' Highlight Total']['c']
-            excel_util.cell_update(sheet, max_row, col, buf)
+            report_sink.cell_update(sheet, max_row, col, buf)
             port_obj.rs_key(
                 'report_app/hyperlink/' + d['link'] + '_highlight/total',
                 sheet_name + '!' + xl.get_column_letter(col) + str(max_row)
@@ -39,21 +39,23 @@ details.
 +-----------+---------------+---------------------------------------------------------------------------------------+
 | 4.0.5     | 20 Feb 2026   | Updated copyright notice.                                                             |
 +-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.6     | 18 Oct 2026   | Cells and merges are written through brcddb.report.sink.                              |
++-----------+---------------+---------------------------------------------------------------------------------------+
 """
 __author__ = 'Jack Consoli'
 __copyright__ = 'Copyright 2024, 2025, 2026 Jack Consoli'
-__date__ = '20 Feb 2026'
+__date__ = '18 Oct 2026'
 __license__ = 'Apache License, Version 2.0'
 __email__ = 'jack_consoli@yahoo.com'
 __maintainer__ = 'Jack Consoli'
 __status__ = 'Released'
-__version__ = '4.0.5'
+__version__ = '4.0.6'
 
 import collections
 import openpyxl.utils.cell as xl
 import brcdapi.log as brcdapi_log
 import brcdapi.util as brcdapi_util
-import brcdapi.excel_util as excel_util
+import brcddb.report.sink as report_sink
 import brcdapi.excel_fonts as excel_fonts
 import brcddb.brcddb_common as brcddb_common
 import brcddb.brcddb_switch as brcddb_switch
@@ -112,15 +114,15 @@ def _setup_worksheet(wb, tc, sheet_i, sheet_name, sheet_title):
 
     # Create the worksheet, add the headers, and set up the column widths
     sheet = wb.create_sheet(index=0 if sheet_i is None else sheet_i, title=sheet_name)
-    sheet.page_setup.paperSize = sheet.PAPERSIZE_LETTER
-    sheet.page_setup.orientation = sheet.ORIENTATION_LANDSCAPE
+    sheet.page_setup.paperSize = report_sink.PAPERSIZE_LETTER
+    sheet.page_setup.orientation = report_sink.ORIENTATION_LANDSCAPE
     row = col = 1
     if isinstance(tc, str):
-        excel_util.cell_update(sheet, row, col, 'Contents', font=_link_font, link=tc)
+        report_sink.cell_update(sheet, row, col, 'Contents', font=_link_font, link=tc)
         col += 1
-    excel_util.cell_update(sheet, row, col, sheet_title, font=_hdr1_font)
-    sheet.merge_cells(start_row=row, start_column=col, end_row=row, end_column=len(_hdr))
-    sheet.freeze_panes = sheet['A2']
+    report_sink.cell_update(sheet, row, col, sheet_title, font=_hdr1_font)
+    report_sink.merge_cells(sheet, start_row=row, start_column=col, end_row=row, end_column=len(_hdr))
+    sheet.freeze_panes = 'A2'
 
     # Set the column width
     col = 1
@@ -148,7 +150,7 @@ def _fabric_summary(sheet, row, fabric_obj):
     # Add the headers
     col = 1
     for k in _hdr.keys():
-        excel_util.cell_update(sheet, row, col, k, font=_bold_font, align=_align_wrap, border=_border_thin)
+        report_sink.cell_update(sheet, row, col, k, font=_bold_font, align=_align_wrap, border=_border_thin)
         col += 1
     row += 1
 
@@ -162,37 +164,37 @@ def _fabric_summary(sheet, row, fabric_obj):
             buf = '*' + buf
         link = switch_obj.r_get('report_app/hyperlink/switch')
         font = _std_font if link is None else _link_font
-        excel_util.cell_update(sheet, row, col, buf, font=font, align=_align_wrap, border=_border_thin, link=link)
+        report_sink.cell_update(sheet, row, col, buf, font=font, align=_align_wrap, border=_border_thin, link=link)
         col += 1
 
         # Switch WWN
-        excel_util.cell_update(sheet, row, col, switch_obj.r_obj_key(), font=_std_font, align=_align_wrap,
-                               border=_border_thin)
+        report_sink.cell_update(sheet, row, col, switch_obj.r_obj_key(), font=_std_font, align=_align_wrap,
+                                border=_border_thin)
         col += 1
 
         # Switch DID
         buf = switch_obj.r_get(brcdapi_util.bfs_did)
         if buf is None:
             buf = switch_obj.r_get('brocade-fabric/fabric-switch/domain-id')
-        excel_util.cell_update(sheet, row, col, buf, font=_std_font, align=_align_wrap, border=_border_thin)
+        report_sink.cell_update(sheet, row, col, buf, font=_std_font, align=_align_wrap, border=_border_thin)
         col += 1
 
         # Switch FID
-        excel_util.cell_update(sheet, row, col, brcddb_switch.switch_fid(switch_obj), font=_std_font,
-                               align=_align_wrap, border=_border_thin)
+        report_sink.cell_update(sheet, row, col, brcddb_switch.switch_fid(switch_obj), font=_std_font,
+                                align=_align_wrap, border=_border_thin)
         col += 1
 
         # Firmware version
         buf = switch_obj.r_get(brcdapi_util.bfs_fw_version)
         if buf is None:
             buf = switch_obj.r_get(brcdapi_util.bf_fw_version)
-        excel_util.cell_update(sheet, row, col, buf, font=_std_font, align=_align_wrap, border=_border_thin)
+        report_sink.cell_update(sheet, row, col, buf, font=_std_font, align=_align_wrap, border=_border_thin)
         row += 1
 
     # Principal switch footnote
     col = 1
-    sheet.merge_cells(start_row=row, start_column=col, end_row=row, end_column=len(_hdr))
-    excel_util.cell_update(sheet, row, col, '* indicates principal switch', font=_std_font)
+    report_sink.merge_cells(sheet, start_row=row, start_column=col, end_row=row, end_column=len(_hdr))
+    report_sink.cell_update(sheet, row, col, '* indicates principal switch', font=_std_font)
 
     return row + 1
 
@@ -212,25 +214,25 @@ def _maps_dashboard(sheet, row, fabric_obj):
     global _hdr, _align_wrap, _bold_font
 
     col = 1
-    sheet.merge_cells(start_row=row, start_column=col, end_row=row, end_column=len(_hdr))
-    excel_util.cell_update(sheet, row, col, 'MAPS Dashboard Alerts', font=_bold_font, align=_align_wrap)
+    report_sink.merge_cells(sheet, start_row=row, start_column=col, end_row=row, end_column=len(_hdr))
+    report_sink.cell_update(sheet, row, col, 'MAPS Dashboard Alerts', font=_bold_font, align=_align_wrap)
     i = 0
     for alert_obj in fabric_obj.r_alert_objects():
         if alert_obj.alert_num() in al.AlertTable.maps_alerts:
             row += 1
-            sheet.merge_cells(start_row=row, start_column=col, end_row=row, end_column=len(_hdr))
+            report_sink.merge_cells(sheet, start_row=row, start_column=col, end_row=row, end_column=len(_hdr))
             for col in range(1, len(_hdr)):
-                excel_util.cell_update(sheet, row, col, None, border=_border_thin)
+                report_sink.cell_update(sheet, row, col, None, border=_border_thin)
             col = 1
-            excel_util.cell_update(sheet, row, col, alert_obj.fmt_msg(), font=_std_font, align=_align_wrap)
+            report_sink.cell_update(sheet, row, col, alert_obj.fmt_msg(), font=_std_font, align=_align_wrap)
             i += 1
     if i == 0:
         row += 1
-        sheet.merge_cells(start_row=row, start_column=col, end_row=row, end_column=len(_hdr))
+        report_sink.merge_cells(sheet, start_row=row, start_column=col, end_row=row, end_column=len(_hdr))
         for col in range(1, len(_hdr) + 1):
-            excel_util.cell_update(sheet, row, col, None, border=_border_thin)
+            report_sink.cell_update(sheet, row, col, None, border=_border_thin)
         col = 1
-        excel_util.cell_update(sheet, row, col, 'None', font=_std_font, align=_align_wrap)
+        report_sink.cell_update(sheet, row, col, 'None', font=_std_font, align=_align_wrap)
 
     return row + 1
 
@@ -251,8 +253,8 @@ def _fabric_statistics(sheet, row, fabric_obj):
 
     # Add the section header
     col = 1
-    sheet.merge_cells(start_row=row, start_column=col, end_row=row, end_column=len(_hdr)+1)
-    excel_util.cell_update(sheet, row, col, 'Fabric Statistics', font=_bold_font, align=_align_wrap)
+    report_sink.merge_cells(sheet, start_row=row, start_column=col, end_row=row, end_column=len(_hdr)+1)
+    report_sink.cell_update(sheet, row, col, 'Fabric Statistics', font=_bold_font, align=_align_wrap)
 
     # Figure out what to put in the statistics summary section
     fab_stats_d = collections.OrderedDict()
@@ -278,13 +280,13 @@ def _fabric_statistics(sheet, row, fabric_obj):
     # Add the statistics summary items to the sheet
     for k, v in fab_stats_d.items():
         row, col = row+1, 1
-        excel_util.cell_update(sheet, row, col, k, font=_std_font, align=_align_wrap)
-        sheet.merge_cells(start_row=row, start_column=col, end_row=row, end_column=col+1)
+        report_sink.cell_update(sheet, row, col, k, font=_std_font, align=_align_wrap)
+        report_sink.merge_cells(sheet, start_row=row, start_column=col, end_row=row, end_column=col+1)
         col += 2
-        excel_util.cell_update(sheet, row, col, v, font=_std_font)
-        sheet.merge_cells(start_row=row, start_column=col, end_row=row, end_column=len(_hdr))
+        report_sink.cell_update(sheet, row, col, v, font=_std_font)
+        report_sink.merge_cells(sheet, start_row=row, start_column=col, end_row=row, end_column=len(_hdr))
         for col in range(1, len(_hdr) + 1):
-            excel_util.cell_update(sheet, row, col, None, border=_border_thin)
+            report_sink.cell_update(sheet, row, col, None, border=_border_thin)
 
     return row+1
 
@@ -307,11 +309,11 @@ def _scc_policy(sheet, row, fabric_obj):
 
     # Add the sub-header
     row, col = row+2, 1
-    sheet.merge_cells(start_row=row, start_column=col, end_row=row, end_column=len(_hdr)+1)
-    excel_util.cell_update(sheet, row, col, 'Active SCC Policy', font=_bold_font, align=_align_wrap)
+    report_sink.merge_cells(sheet, start_row=row, start_column=col, end_row=row, end_column=len(_hdr)+1)
+    report_sink.cell_update(sheet, row, col, 'Active SCC Policy', font=_bold_font, align=_align_wrap)
     row += 1
     for buf in ('Name', 'WWN', 'DID'):
-        excel_util.cell_update(
+        report_sink.cell_update(
             sheet,
             row,
             col,
@@ -326,13 +328,13 @@ def _scc_policy(sheet, row, fabric_obj):
     row, col = row+1, 1
     scc_d_l = fabric_obj.r_get('brocade-security/active-scc-policy-member-list', list())
     if len(scc_d_l) == 0:
-        excel_util.cell_update(sheet, row, col, 'None', font=_std_font)
+        report_sink.cell_update(sheet, row, col, 'None', font=_std_font)
     else:
         # A little extra checking in case FOS returns something invalid
         for scc_d in scc_d_l:
             scc_switch_obj = fabric_obj.r_switch_obj(scc_d.get('switch-wwn', 'Undefined'))
             link = None if scc_switch_obj is None else scc_switch_obj.r_get('report_app/hyperlink/switch')
-            excel_util.cell_update(
+            report_sink.cell_update(
                 sheet,
                 row,
                 col,
@@ -344,7 +346,7 @@ def _scc_policy(sheet, row, fabric_obj):
             )
             for key in ('switch-wwn', 'domain-id'):
                 col += 1
-                excel_util.cell_update(
+                report_sink.cell_update(
                     sheet,
                     row,
                     col,
@@ -375,9 +377,9 @@ def _zone_configuration(sheet, row, fabric_obj):
 
     # Add the Defined Configurations
     col = 1
-    sheet.merge_cells(start_row=row, start_column=col, end_row=row, end_column=len(_hdr)+1)
-    excel_util.cell_update(sheet, row, col, 'Defined Configurations', font=_bold_font, align=_align_wrap,
-                           border=_border_thin)
+    report_sink.merge_cells(sheet, start_row=row, start_column=col, end_row=row, end_column=len(_hdr)+1)
+    report_sink.cell_update(sheet, row, col, 'Defined Configurations', font=_bold_font, align=_align_wrap,
+                            border=_border_thin)
     for obj in fabric_obj.r_zonecfg_objects():
         buf = obj.r_obj_key()
         if buf == '_effective_zone_cfg':
@@ -385,21 +387,21 @@ def _zone_configuration(sheet, row, fabric_obj):
         row += 1
         if obj.r_is_effective():
             buf = '*' + buf
-        sheet.merge_cells(start_row=row, start_column=col, end_row=row, end_column=len(_hdr))
+        report_sink.merge_cells(sheet, start_row=row, start_column=col, end_row=row, end_column=len(_hdr))
         for col in range(1, len(_hdr)+1):
-            excel_util.cell_update(sheet, row, col, None, border=_border_thin)
+            report_sink.cell_update(sheet, row, col, None, border=_border_thin)
         col = 1
-        excel_util.cell_update(sheet, row, col, buf, font=_std_font, align=_align_wrap)
+        report_sink.cell_update(sheet, row, col, buf, font=_std_font, align=_align_wrap)
 
     # Effective zone footnote
     row, col = row+1, 1
-    sheet.merge_cells(start_row=row, start_column=col, end_row=row, end_column=len(_hdr))
-    excel_util.cell_update(sheet, row, col, '* indicates effective zone configuration', font=_std_font)
+    report_sink.merge_cells(sheet, start_row=row, start_column=col, end_row=row, end_column=len(_hdr))
+    report_sink.cell_update(sheet, row, col, '* indicates effective zone configuration', font=_std_font)
 
     # Links to zoning pages
     row += 2
-    sheet.merge_cells(start_row=row, start_column=col, end_row=row, end_column=len(_hdr))
-    excel_util.cell_update(sheet, row, col, 'Zone Analysis & Login Links', font=_bold_font)
+    report_sink.merge_cells(sheet, start_row=row, start_column=col, end_row=row, end_column=len(_hdr))
+    report_sink.cell_update(sheet, row, col, 'Zone Analysis & Login Links', font=_bold_font)
     row += 1
     for d in (dict(t=fabric_obj.r_get('report_app/control/za/tc'), l=fabric_obj.r_get('report_app/hyperlink/za')),
               dict(t=fabric_obj.r_get('report_app/control/zt/tc'), l=fabric_obj.r_get('report_app/hyperlink/zt')),
@@ -407,37 +409,37 @@ def _zone_configuration(sheet, row, fabric_obj):
               dict(t=fabric_obj.r_get('report_app/control/zc/tc'), l=fabric_obj.r_get('report_app/hyperlink/zc')),
               dict(t=fabric_obj.r_get('report_app/control/log/tc'), l=fabric_obj.r_get('report_app/hyperlink/log'))):
         if d['l'] is not None:
-            sheet.merge_cells(start_row=row, start_column=col, end_row=row, end_column=len(_hdr))
-            excel_util.cell_update(sheet, row, col, d['t'], font=_link_font, link=d['l'])
+            report_sink.merge_cells(sheet, start_row=row, start_column=col, end_row=row, end_column=len(_hdr))
+            report_sink.cell_update(sheet, row, col, d['t'], font=_link_font, link=d['l'])
             row += 1
 
     # Zone configuration summary
     if obj is not None:
         row, col = row+2, 1
-        sheet.merge_cells(start_row=row, start_column=col, end_row=row, end_column=len(_hdr))
-        excel_util.cell_update(sheet, row, col, 'Zone Configuration Summary', font=_bold_font)
+        report_sink.merge_cells(sheet, start_row=row, start_column=col, end_row=row, end_column=len(_hdr))
+        report_sink.cell_update(sheet, row, col, 'Zone Configuration Summary', font=_bold_font)
         ec_obj = fabric_obj.r_get('brocade-zone/effective-configuration')
         if isinstance(ec_obj, dict):
             for k in ec_obj:
                 row, col = row+1, 1
-                sheet.merge_cells(start_row=row, start_column=col, end_row=row, end_column=col+1)
-                excel_util.cell_update(sheet, row, col, _zone_key_conv[k] if k in _zone_key_conv else k,
-                                       font=_std_font, align=_align_wrap)
+                report_sink.merge_cells(sheet, start_row=row, start_column=col, end_row=row, end_column=col+1)
+                report_sink.cell_update(sheet, row, col, _zone_key_conv[k] if k in _zone_key_conv else k,
+                                        font=_std_font, align=_align_wrap)
                 col += 2
-                sheet.merge_cells(start_row=row, start_column=col, end_row=row, end_column=len(_hdr))
+                report_sink.merge_cells(sheet, start_row=row, start_column=col, end_row=row, end_column=len(_hdr))
                 v = ec_obj.get(k)
                 if isinstance(v, (str, int)):
                     try:
                         buf = brcddb_common.zonecfg_conversion_tbl[k][v]
                     except KeyError:
                         buf = v
-                    excel_util.cell_update(sheet, row, col, buf, font=_std_font, align=_align_wrap)
+                    report_sink.cell_update(sheet, row, col, buf, font=_std_font, align=_align_wrap)
                 for col in range(1, len(_hdr)+1):
-                    excel_util.cell_update(sheet, row, col, None, border=_border_thin)
+                    report_sink.cell_update(sheet, row, col, None, border=_border_thin)
         else:
             row, col = row+1, 1
-            sheet.merge_cells(start_row=row, start_column=col, end_row=row, end_column=col+1)
-            excel_util.cell_update(sheet, row, col, 'No effective configuration', font=_std_font, align=_align_wrap)
+            report_sink.merge_cells(sheet, start_row=row, start_column=col, end_row=row, end_column=col+1)
+            report_sink.cell_update(sheet, row, col, 'No effective configuration', font=_std_font, align=_align_wrap)
 
         # Total alias, zone, and zone configuration summary
         zone_l = [dict(d='Total Aliases', v=len(fabric_obj.r_alias_keys())),
@@ -445,14 +447,14 @@ def _zone_configuration(sheet, row, fabric_obj):
                   dict(d='Total Zone Configurations', v=len(fabric_obj.r_zonecfg_keys()))]
         for d in zone_l:
             row, col = row+1, 1
-            sheet.merge_cells(start_row=row, start_column=col, end_row=row, end_column=col+1)
-            excel_util.cell_update(sheet, row, col, d['d'], font=_std_font, align=_align_wrap, border=_border_thin)
-            excel_util.cell_update(sheet, row, col+1, None, border=_border_thin)
+            report_sink.merge_cells(sheet, start_row=row, start_column=col, end_row=row, end_column=col+1)
+            report_sink.cell_update(sheet, row, col, d['d'], font=_std_font, align=_align_wrap, border=_border_thin)
+            report_sink.cell_update(sheet, row, col+1, None, border=_border_thin)
             col += 2
-            sheet.merge_cells(start_row=row, start_column=col, end_row=row, end_column=len(_hdr))
-            excel_util.cell_update(sheet, row, col, d['v'], font=_std_font, align=_align_wrap, border=_border_thin)
+            report_sink.merge_cells(sheet, start_row=row, start_column=col, end_row=row, end_column=len(_hdr))
+            report_sink.cell_update(sheet, row, col, d['v'], font=_std_font, align=_align_wrap, border=_border_thin)
             for col in range(col+1, len(_hdr)+1):
-                excel_util.cell_update(sheet, row, col, None, border=_border_thin)
+                report_sink.cell_update(sheet, row, col, None, border=_border_thin)
 
     return row + 1
 
@@ -16,6 +16,27 @@ details.
 
 Creates a worksheet with a graph
 
+Charts with more than a maximum number of points, _max_points by default, are downsampled so that the size of the chart
+is bounded regardless of how many samples were collected. The downsampled data are written to a helper worksheet, hidden
+by default, and the chart references the helper worksheet rather than the original data. The supported methods are:
+
++-----------+-------------------------------------------------------------------------------------------------------+
+| Method    | Description                                                                                           |
++===========+=======================================================================================================+
+| lttb      | Largest Triangle Three Buckets. Keeps the samples that best preserve the visual shape. The default.   |
++-----------+-------------------------------------------------------------------------------------------------------+
+| minmax    | Keeps the minimum and maximum sample of each series in each bucket so that peaks are not lost. At     |
+|           | least 2 points for each series plus the first and last samples are kept regardless of the maximum.    |
++-----------+-------------------------------------------------------------------------------------------------------+
+| mean      | Replaces each bucket with the mean of the samples in the bucket. The X value is the first in the      |
+|           | bucket.                                                                                               |
++-----------+-------------------------------------------------------------------------------------------------------+
+
+When there are multiple series, the samples kept by lttb and minmax are the union of the samples kept for each series so
+that all series share the same X axis. If the union is larger than the maximum number of points, it is divided into
+buckets again and the sample kept for the most series in each bucket is kept. The first and last samples are always
+kept so the X axis range is not changed.
+
 **Public Methods & Data**
 
 +-----------------------+-------------------------------------------------------------------------------------------+
@@ -23,6 +44,8 @@ Creates a worksheet with a graph
 +=======================+===========================================================================================+
 | chart_types           | Returns the supported chart types.                                                        |
 +-----------------------+-------------------------------------------------------------------------------------------+
+| downsample            | Returns the downsampled X and Y values.                                                   |
++-----------------------+-------------------------------------------------------------------------------------------+
 | graph                 | Inserts a worksheet into a workbook with a graph of specified ports and statistics.       |
 +-----------------------+-------------------------------------------------------------------------------------------+
 
@@ -43,19 +66,29 @@ Creates a worksheet with a graph
 +-----------+---------------+---------------------------------------------------------------------------------------+
 | 4.0.5     | 21 Feb 2026   | Removed debug code.                                                                   |
 +-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.6     | 18 Oct 2026   | Cells and merges are written through brcddb.report.sink.                              |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.7     | 18 Oct 2026   | Added downsampling with lttb, minmax, and mean. Added downsample()                    |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.8     | 18 Oct 2026   | downsample() never returns more than num_points. minmax keeps the first and last      |
+|           |               | samples                                                                               |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.9     | 18 Oct 2026   | minmax keeps at least 2 points for each series plus the first and last samples        |
++-----------+---------------+---------------------------------------------------------------------------------------+
 """
 __author__ = 'Jack Consoli'
 __copyright__ = 'Copyright 2024, 2025, 2026 Jack Consoli'
-__date__ = '21 Feb 2026'
+__date__ = '18 Oct 2026'
 __license__ = 'Apache License, Version 2.0'
 __email__ = 'jack_consoli@yahoo.com'
 __maintainer__ = 'Jack Consoli'
 __status__ = 'Released'
-__version__ = '4.0.5'
+__version__ = '4.0.9'
 
 from openpyxl.chart import AreaChart, AreaChart3D, BarChart, BarChart3D, LineChart, LineChart3D, Reference
 from openpyxl.chart.axis import DateAxis
-import brcdapi.excel_util as excel_util
+import math
+import brcddb.report.sink as report_sink
 import brcdapi.excel_fonts as excel_fonts
 import brcdapi.log as brcdapi_log
 
@@ -65,6 +98,7 @@ _align_wrap = excel_fonts.align_type('wrap')
 
 _chart_width = 22
 _chart_height = 15
+_max_points = 2000  # Default maximum number of points, X values, in a chart. See ds_max in graph()
 
 _chart_types = dict(
     area=AreaChart,
@@ -86,6 +120,229 @@ def supported_chart_types():
     return [str(k) for k in _chart_types.keys()]
 
 
+def _num(v):
+    """Returns a value as a float for downsampling. Anything that isn't a number is treated as 0
+
+    :param v: Cell value
+    :type v: int, float, str, None
+    :rtype: float
+    """
+    return float(v) if isinstance(v, (int, float)) and not isinstance(v, bool) else 0.0
+
+
+def _lttb(y_l, num_points):
+    """Largest Triangle Three Buckets. The first and last samples are always kept. The X values are assumed to be evenly
+    spaced so the sample index is used for the X value.
+
+    :param y_l: Y values
+    :type y_l: list
+    :param num_points: Number of samples to keep
+    :type num_points: int
+    :return: Indices into y_l of the samples to keep
+    :rtype: list
+    """
+    num_samples = len(y_l)
+    if num_points >= num_samples or num_points < 3:
+        return list(range(0, num_samples))
+
+    y_l = [_num(v) for v in y_l]
+    rl, a, bucket_size = [0], 0, (num_samples - 2) / (num_points - 2)
+    for i in range(0, num_points - 2):
+        start, end = int(i * bucket_size) + 1, int((i + 1) * bucket_size) + 1
+        next_start, next_end = end, min(int((i + 2) * bucket_size) + 1, num_samples)
+        if next_start >= next_end:  # The last bucket. Use the last sample as the next point
+            next_start, next_end = num_samples - 1, num_samples
+        avg_x = (next_start + next_end - 1) / 2
+        avg_y = sum(y_l[next_start:next_end]) / (next_end - next_start)
+        keep, max_area = start, -1.0
+        for j in range(start, end):
+            area = abs((a - avg_x) * (y_l[j] - y_l[a]) - (a - j) * (avg_y - y_l[a]))
+            if area > max_area:
+                keep, max_area = j, area
+        rl.append(keep)
+        a = keep
+    rl.append(num_samples - 1)
+
+    return rl
+
+
+def _min_max(y_l, num_points):
+    """Keeps the first sample, the last sample, and the minimum and maximum samples in each bucket in between
+
+    :param y_l: Y values
+    :type y_l: list
+    :param num_points: Maximum number of samples to keep
+    :type num_points: int
+    :return: Indices into y_l of the samples to keep
+    :rtype: list
+    """
+    num_samples = len(y_l)
+    if num_points >= num_samples:
+        return list(range(0, num_samples))
+
+    y_l = [_num(v) for v in y_l]
+    rl, num_buckets = [0], max(1, (num_points - 2) // 2)
+    bucket_size = (num_samples - 2) / num_buckets
+    for i in range(0, num_buckets):
+        start = int(i * bucket_size) + 1
+        end = num_samples - 1 if i == num_buckets - 1 else int((i + 1) * bucket_size) + 1
+        if start < end:
+            i_min = min(range(start, end), key=lambda x: y_l[x])
+            i_max = max(range(start, end), key=lambda x: y_l[x])
+            rl.extend([i_min] if i_min == i_max else sorted([i_min, i_max]))
+    rl.append(num_samples - 1)
+
+    return rl
+
+
+def _cap_indices(keep_d, num_points):
+    """Reduces the union of the samples kept for each series to num_points. The first and last samples are always kept.
+    The samples in between are divided into buckets and the sample kept for the most series in each bucket is kept.
+
+    :param keep_d: Key is an index of a sample to keep. Value is the number of series the sample was kept for.
+    :type keep_d: dict
+    :param num_points: Maximum number of samples to keep
+    :type num_points: int
+    :return: Sorted indices of the samples to keep
+    :rtype: list
+    """
+    keep_l = sorted(keep_d.keys())
+    if len(keep_l) <= num_points:
+        return keep_l
+
+    inner_l, num_buckets = keep_l[1:-1], max(0, num_points - 2)
+    rl, bucket_size = [keep_l[0]], len(inner_l) / max(1, num_buckets)
+    for i in range(0, num_buckets):
+        bucket_l = inner_l[int(i * bucket_size):int((i + 1) * bucket_size)]
+        if len(bucket_l) > 0:
+            rl.append(max(bucket_l, key=lambda x: keep_d[x]))
+    rl.append(keep_l[-1])
+
+    return rl
+
+
+def _mean(x_l, y_ll, num_points):
+    """Replaces each bucket of samples with the mean. See downsample() for parameter definitions"""
+    bucket_size = math.ceil(len(x_l) / num_points)
+    rx_l, ry_ll = list(), [list() for y_l in y_ll]
+    for start in range(0, len(x_l), bucket_size):
+        rx_l.append(x_l[start])
+        for i in range(0, len(y_ll)):
+            v_l = [v for v in y_ll[i][start:start+bucket_size] if isinstance(v, (int, float))]
+            ry_ll[i].append(sum(v_l) / len(v_l) if len(v_l) > 0 else None)
+
+    return rx_l, ry_ll
+
+
+_ds_index_methods = dict(lttb=_lttb, minmax=_min_max)
+
+
+def downsample(x_l, y_ll, num_points, method='lttb'):
+    """Returns the downsampled X and Y values. See the module description for the methods.
+
+    :param x_l: X values
+    :type x_l: list
+    :param y_ll: List of Y value lists, one for each series. Each list must be the same length as x_l
+    :type y_ll: list
+    :param num_points: Maximum number of points to return. For minmax, at least 2 * len(y_ll) + 2
+    :type num_points: int
+    :param method: Downsampling method: 'lttb', 'minmax', or 'mean'
+    :type method: str
+    :return x_l: Downsampled X values
+    :rtype x_l: list
+    :return y_ll: Downsampled Y values
+    :rtype y_ll: list
+    """
+    global _ds_index_methods
+
+    if method == 'minmax':
+        # Each series needs at least its minimum and maximum plus the first and last samples. With fewer points,
+        # _cap_indices() would have to drop the peaks of some series.
+        num_points = max(num_points, 2 * len(y_ll) + 2)
+    if len(x_l) <= num_points:
+        return x_l, y_ll
+    if method == 'mean':
+        return _mean(x_l, y_ll, num_points)
+
+    # All series must share the same X values so keep the union of the samples kept for each series
+    series_points = max(3, num_points // max(1, len(y_ll)))
+    keep_d = dict()
+    for y_l in y_ll:
+        for i in _ds_index_methods[method](y_l, series_points):
+            keep_d[i] = keep_d.get(i, 0) + 1
+    keep_l = _cap_indices(keep_d, num_points)
+
+    return [x_l[i] for i in keep_l], [[y_l[i] for i in keep_l] for y_l in y_ll]
+
+
+def _downsample_ref(wb, sheet_name, data_ref_d, title_in_data):
+    """Downsamples the chart data if necessary. See graph() for parameter definitions.
+
+    :return: Same as data_ref_d but referencing the helper sheet. None if the data were not downsampled.
+    :rtype: dict, None
+    """
+    global _max_points, _ds_index_methods
+
+    method, max_points = data_ref_d.get('ds_method', 'lttb'), data_ref_d.get('ds_max', _max_points)
+    num_samples = data_ref_d['x_end_row'] - data_ref_d['x_start_row'] + 1
+    if method is None or num_samples <= max_points:
+        return None
+    if method != 'mean' and method not in _ds_index_methods:
+        brcdapi_log.log('Unknown downsampling method, ' + str(method) + ', for ' + sheet_name + '. Using lttb.',
+                        echo=True)
+        method = 'lttb'
+    if report_sink.is_streaming(wb):
+        brcdapi_log.log('Cannot downsample ' + sheet_name + '. The data in a write-only workbook cannot be read.',
+                        echo=True)
+        return None
+
+    # Read the X values and each Y series (column)
+    x_sheet, hdr_offset = data_ref_d['x_sheet'], 1 if title_in_data else 0
+    x_cell_l = [x_sheet.cell(row=row, column=data_ref_d['x_start_col'])
+                for row in range(data_ref_d['x_start_row'], data_ref_d['x_end_row'] + 1)]
+    hdr_l, y_ll = list(), list()
+    for y_data_d in data_ref_d['y_data_l']:
+        if y_data_d['end_row'] - y_data_d['start_row'] + 1 - hdr_offset != num_samples:
+            brcdapi_log.log('Cannot downsample ' + sheet_name + '. The number of X and Y values are not the same.',
+                            echo=True)
+            return None
+        for col in range(y_data_d['start_col'], y_data_d['end_col'] + 1):
+            col_l = [y_data_d['sheet'].cell(row=row, column=col).value
+                     for row in range(y_data_d['start_row'], y_data_d['end_row'] + 1)]
+            hdr_l.append(col_l[0] if title_in_data else None)
+            y_ll.append(col_l[hdr_offset:])
+
+    x_l, y_ll = downsample([cell.value for cell in x_cell_l], y_ll, max_points, method)
+
+    # Write the helper sheet. Column 1 is the X axis. Row 1 is for the headers.
+    ds_sheet_name = data_ref_d.get('ds_sheet')
+    if ds_sheet_name is None:
+        ds_sheet_name = sheet_name[0:26] + '_data'
+    sheet = wb.create_sheet(title=ds_sheet_name)
+    if data_ref_d.get('ds_hidden', True):
+        sheet.sheet_state = 'hidden'
+    number_format = x_cell_l[0].number_format if len(x_cell_l) > 0 else None
+    report_sink.cell_update(sheet, 1, 1, data_ref_d.get('x_title'), font=_std_font)
+    for col in range(0, len(hdr_l)):
+        report_sink.cell_update(sheet, 1, col + 2, hdr_l[col], font=_std_font)
+    for row in range(0, len(x_l)):
+        report_sink.cell_update(sheet, row + 2, 1, x_l[row], font=_std_font, number_format=number_format)
+        for col in range(0, len(y_ll)):
+            report_sink.cell_update(sheet, row + 2, col + 2, y_ll[col][row], font=_std_font)
+    brcdapi_log.log('Downsampled ' + sheet_name + ' from ' + str(num_samples) + ' to ' + str(len(x_l)) +
+                    ' points using ' + method, echo=False)
+
+    # Return the references to the helper sheet
+    rd = data_ref_d.copy()
+    rd.update(x_sheet=sheet, x_start_col=1, x_start_row=2, x_end_row=len(x_l) + 1)
+    rd['y_data_l'] = [dict(sheet=sheet,
+                           start_col=2,
+                           end_col=len(y_ll) + 1,
+                           start_row=1 if title_in_data else 2,
+                           end_row=len(x_l) + 1)]
+    return rd
+
+
 def graph(wb, tc, sheet_name, sheet_i, data_ref_d, msg=None, title_in_data=False):
     """Inserts a worksheet into a workbook with a graph of specified ports and statistics.
 
@@ -127,6 +384,16 @@ def graph(wb, tc, sheet_name, sheet_i, data_ref_d, msg=None, title_in_data=False
     |               |           |                                                                                   |
     |               |           | end_row       int ow number where the x data end. See Note below.                 |
     +---------------+-----------+-----------------------------------------------------------------------------------+
+    | ds_method     | str, None | Optional. Downsampling method: 'lttb', 'minmax', or 'mean'. See the module        |
+    |               |           | description. None: chart every sample. The default is 'lttb'.                     |
+    +---------------+-----------+-----------------------------------------------------------------------------------+
+    | ds_max        | int       | Optional. Maximum number of points in the chart. The default is _max_points.      |
+    +---------------+-----------+-----------------------------------------------------------------------------------+
+    | ds_sheet      | str       | Optional. Name of the helper sheet for the downsampled data. The default is the   |
+    |               |           | sheet name with "_data" appended.                                                 |
+    +---------------+-----------+-----------------------------------------------------------------------------------+
+    | ds_hidden     | bool      | Optional. If False, the helper sheet is visible. The default is True.             |
+    +---------------+-----------+-----------------------------------------------------------------------------------+
 
     **Note** Keep in mind that cell references in Excel begin with 1, not 0. The row number should include the row
     header, whether title_in_data is True or False. The X axis can only have one reference, so there isn't an x_end_col.
@@ -151,15 +418,20 @@ def graph(wb, tc, sheet_name, sheet_i, data_ref_d, msg=None, title_in_data=False
 
     # Create the worksheet, add the headers, and set up the column widths
     sheet = wb.create_sheet(index=sheet_i, title=sheet_name)
-    sheet.page_setup.paperSize = sheet.PAPERSIZE_LETTER
-    sheet.page_setup.orientation = sheet.ORIENTATION_LANDSCAPE
+    sheet.page_setup.paperSize = report_sink.PAPERSIZE_LETTER
+    sheet.page_setup.orientation = report_sink.ORIENTATION_LANDSCAPE
     col = 10
     sheet.column_dimensions['A'].width = col
     sheet.column_dimensions['B'].width = 120 - col
     if isinstance(tc, str):
-        excel_util.cell_update(sheet, 1, 1, 'Contents', link=tc, font=_link_font, align=_align_wrap)
+        report_sink.cell_update(sheet, 1, 1, 'Contents', link=tc, font=_link_font, align=_align_wrap)
     if isinstance(msg, str):
-        excel_util.cell_update(sheet, 1, 2, msg, font=_std_font, align=_align_wrap)
+        report_sink.cell_update(sheet, 1, 2, msg, font=_std_font, align=_align_wrap)
+
+    # Downsample the data if necessary. The chart then references the helper sheet rather than the original data.
+    ds_ref_d = _downsample_ref(wb, sheet_name, data_ref_d, title_in_data)
+    if ds_ref_d is not None:
+        data_ref_d = ds_ref_d
 
     # Setup the chart
     chart = _chart_types.get(data_ref_d['type'], 'line')()
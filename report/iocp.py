@@ -43,15 +43,17 @@ Creates an iocp page to be added to an Excel Workbook
 +-----------+---------------+---------------------------------------------------------------------------------------+
 | 4.0.6     | 20 Feb 2026   | Updated copyright notice.                                                             |
 +-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.7     | 18 Oct 2026   | Cells and merges are written through brcddb.report.sink.                              |
++-----------+---------------+---------------------------------------------------------------------------------------+
 """
 __author__ = 'Jack Consoli'
 __copyright__ = 'Copyright 2023, 2024, 2025, 2026 Jack Consoli'
-__date__ = '20 Feb 2026'
+__date__ = '18 Oct 2026'
 __license__ = 'Apache License, Version 2.0'
 __email__ = 'jack_consoli@yahoo.com'
 __maintainer__ = 'Jack Consoli'
 __status__ = 'Released'
-__version__ = '4.0.6'
+__version__ = '4.0.7'
 
 import collections
 import openpyxl.utils.cell as xl
@@ -60,6 +62,7 @@ import brcdapi.util as brcdapi_util
 import brcdapi.gen_util as gen_util
 import brcdapi.excel_fonts as excel_fonts
 import brcdapi.excel_util as excel_util
+import brcddb.report.sink as report_sink
 import brcddb.brcddb_switch as brcddb_switch
 import brcddb.report.utils as report_utils
 import brcddb.util.iocp as brcddb_iocp
@@ -319,19 +322,19 @@ def iocp_page(iocp_obj, tc, wb, sheet_name, sheet_i, sheet_title):
 
     # Create the worksheet, add the headers, and set up the column widths
     sheet = wb.create_sheet(index=0 if sheet_i is None else sheet_i, title=sheet_name)
-    sheet.page_setup.paperSize = sheet.PAPERSIZE_LETTER
-    sheet.page_setup.orientation = sheet.ORIENTATION_LANDSCAPE
+    sheet.page_setup.paperSize = report_sink.PAPERSIZE_LETTER
+    sheet.page_setup.orientation = report_sink.ORIENTATION_LANDSCAPE
     row = col = 1
     if isinstance(tc, str):
-        excel_util.cell_update(sheet, row, col, 'Contents', font=_link_font, link=tc)
+        report_sink.cell_update(sheet, row, col, 'Contents', font=_link_font, link=tc)
         col += 1
-    excel_util.cell_update(sheet, row, col, sheet_title, font=_hdr1_font)
+    report_sink.cell_update(sheet, row, col, sheet_title, font=_hdr1_font)
     row, col = row+2, 1
-    sheet.freeze_panes = sheet['A4']
+    sheet.freeze_panes = 'A4'
     for k, d in _chpid_hdr.items():
         sheet.column_dimensions[xl.get_column_letter(col)].width = d['c']
         alignment = _align_wrap_vc if 'v' in d and d['v'] else _align_wrap
-        excel_util.cell_update(sheet, row, col, k, font=_hdr2_font, align=alignment, border=_border_thin)
+        report_sink.cell_update(sheet, row, col, k, font=_hdr2_font, align=alignment, border=_border_thin)
         col += 1
 
     # Sort the CHPIDs by PCHID in the report.
@@ -364,15 +367,15 @@ def iocp_page(iocp_obj, tc, wb, sheet_name, sheet_i, sheet_title):
                         font = _link_font
                 elif k == 'Comments':
                     font = report_utils.font_type(chpid_port_obj.r_alert_objects())
-            excel_util.cell_update(sheet,
-                                   row,
-                                   key_to_col_d[k],
-                                   d['m'](chpid_port_obj, chpid_obj),
-                                   font=font,
-                                   align=_align_wrap,
-                                   border=_border_thin,
-                                   number_format=d.get('f'),
-                                   link=link)
+            report_sink.cell_update(sheet,
+                                    row,
+                                    key_to_col_d[k],
+                                    d['m'](chpid_port_obj, chpid_obj),
+                                    font=font,
+                                    align=_align_wrap,
+                                    border=_border_thin,
+                                    number_format=d.get('f'),
+                                    link=link)
 
         # Display the link addresses
         row += 1
@@ -409,15 +412,15 @@ def iocp_page(iocp_obj, tc, wb, sheet_name, sheet_i, sheet_title):
                             pass  # This can happen when there is a partial data collection
                     elif k == 'Comments':
                         font = report_utils.font_type(port_obj.r_alert_objects())
-                excel_util.cell_update(sheet,
-                                       row,
-                                       key_to_col_d[k],
-                                       _cu_hdr.get(k)(port_obj, chpid_obj, link_addr) if k in _cu_hdr else None,
-                                       font=font,
-                                       align=_align_wrap,
-                                       border=_border_thin,
-                                       number_format=d.get('f'),
-                                       link=link)
+                report_sink.cell_update(sheet,
+                                        row,
+                                        key_to_col_d[k],
+                                        _cu_hdr.get(k)(port_obj, chpid_obj, link_addr) if k in _cu_hdr else None,
+                                        font=font,
+                                        align=_align_wrap,
+                                        border=_border_thin,
+                                        number_format=d.get('f'),
+                                        link=link)
             row += 1
 
     return
@@ -41,22 +41,24 @@ Includes methods to create device login page
 +-----------+---------------+---------------------------------------------------------------------------------------+
 | 4.0.5     | 20 Feb 2026   | Updated copyright notice.                                                             |
 +-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.6     | 18 Oct 2026   | Write through brcddb.report.sink. Rows are flushed as they are completed.             |
++-----------+---------------+---------------------------------------------------------------------------------------+
 """
 __author__ = 'Jack Consoli'
 __copyright__ = 'Copyright 2024, 2025, 2026 Jack Consoli'
-__date__ = '20 Feb 2026'
+__date__ = '18 Oct 2026'
 __license__ = 'Apache License, Version 2.0'
 __email__ = 'jack_consoli@yahoo.com'
 __maintainer__ = 'Jack Consoli'
 __status__ = 'Released'
-__version__ = '4.0.5'
+__version__ = '4.0.6'
 
 import openpyxl.utils.cell as xl
 import brcdapi.log as brcdapi_log
 import brcdapi.gen_util as gen_util
 import brcdapi.util as brcdapi_util
 import brcdapi.excel_fonts as excel_fonts
-import brcdapi.excel_util as excel_util
+import brcddb.report.sink as report_sink
 import brcddb.brcddb_common as brcddb_common
 import brcddb.brcddb_fabric as brcddb_fabric
 import brcddb.util.util as brcddb_util
@@ -265,19 +267,19 @@ def login_page(wb, tc, sheet_name, sheet_i, sheet_title, l_list, in_display=None
 
     # Create the worksheet with a title.
     sheet = wb.create_sheet(index=0 if sheet_i is None else sheet_i, title=sheet_name)
-    sheet.page_setup.paperSize = sheet.PAPERSIZE_LETTER
-    sheet.page_setup.orientation = sheet.ORIENTATION_LANDSCAPE
+    sheet.page_setup.paperSize = report_sink.PAPERSIZE_LETTER
+    sheet.page_setup.orientation = report_sink.ORIENTATION_LANDSCAPE
     row = col = 1
     if isinstance(tc, str):
-        excel_util.cell_update(sheet, row, col, 'Contents', font=_link_font, link=tc)
+        report_sink.cell_update(sheet, row, col, 'Contents', font=_link_font, link=tc)
         col += 1
-    excel_util.cell_update(sheet, row, col, sheet_title, font=_hdr1_font)
+    report_sink.cell_update(sheet, row, col, sheet_title, font=_hdr1_font)
 
     # Add a link to the fabric
     row, col = row + 1, 1
     fab_obj = l_list[0].r_fabric_obj() if len(l_list) > 0 else None
     if fab_obj is not None:
-        excel_util.cell_update(
+        report_sink.cell_update(
             sheet,
             row,
             col,
@@ -286,11 +288,11 @@ def login_page(wb, tc, sheet_name, sheet_i, sheet_title, l_list, in_display=None
             border=_border_thin,
             link=fab_obj.r_get('report_app/hyperlink/fab')
         )
-        sheet.merge_cells(start_row=row, start_column=1, end_row=row, end_column=2)
+        report_sink.merge_cells(sheet, start_row=row, start_column=1, end_row=row, end_column=2)
 
     # Add the headers, set the column widths, and freeze the header row.
     row += 1
-    sheet.freeze_panes = sheet['A4']
+    sheet.freeze_panes = 'A4'
     row, col = row + 1, 1
     for k in display:
         buf, align = k, _align_wrap
@@ -302,7 +304,7 @@ def login_page(wb, tc, sheet_name, sheet_i, sheet_title, l_list, in_display=None
             if 'v' in login_display_tbl[k] and login_display_tbl[k]['v']:
                 align = _align_wrap_vc
             buf = login_display_tbl[k]['d'] if 'd' in login_display_tbl[k] else k
-        excel_util.cell_update(sheet, row, col, buf, font=_bold_font, align=align, border=_border_thin)
+        report_sink.cell_update(sheet, row, col, buf, font=_bold_font, align=align, border=_border_thin)
         col += 1
 
     # Add a row for each login
@@ -370,6 +372,7 @@ def login_page(wb, tc, sheet_name, sheet_i, sheet_title, l_list, in_display=None
             else:
                 font = _std_font
                 buf = '' if login_obj.r_get(k) is None else str(login_obj.r_get(k))
-            excel_util.cell_update(sheet, row, col, buf, font=font, align=align, border=_border_thin)
+            report_sink.cell_update(sheet, row, col, buf, font=font, align=align, border=_border_thin)
             col += 1
         row += 1
+        report_sink.flush(sheet, row)
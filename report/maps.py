@@ -48,21 +48,24 @@ Adds MAPS policy, group, and rules pages to a workbook
 +-----------+---------------+---------------------------------------------------------------------------------------+
 | 4.0.4     | 20 Feb 2026   | Updated copyright notice.                                                             |
 +-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.5     | 18 Oct 2026   | Cells and merges are written through brcddb.report.sink.                              |
++-----------+---------------+---------------------------------------------------------------------------------------+
 """
 __author__ = 'Jack Consoli'
 __copyright__ = 'Copyright 2024, 2025, 2026 Jack Consoli'
-__date__ = '20 Feb 2026'
+__date__ = '18 Oct 2026'
 __license__ = 'Apache License, Version 2.0'
 __email__ = 'jack_consoli@yahoo.com'
 __maintainer__ = 'Jack Consoli'
 __status__ = 'Released'
-__version__ = '4.0.4'
+__version__ = '4.0.5'
 
 import collections
 import openpyxl.utils.cell as xl
 import brcdapi.log as brcdapi_log
 import brcdapi.util as brcdapi_util
 import brcdapi.excel_util as excel_util
+import brcddb.report.sink as report_sink
 import brcdapi.excel_fonts as excel_fonts
 import brcdapi.gen_util as gen_util
 import brcddb.brcddb_switch as brcddb_switch
@@ -211,8 +214,8 @@ def maps_policy(wb, content_d, switch_obj, i, sheet_i=None):
     sheet_name = excel_util.valid_sheet_name.sub('_', brcddb_switch.best_switch_name(switch_obj))
     sheet_name = sheet_name[0:21] + '_policy_' + str(i) if len(sheet_name) > 21 else sheet_name + '_policy_' + str(i)
     sheet = wb.create_sheet(index=0 if sheet_i is None else sheet_i, title=sheet_name)
-    sheet.page_setup.paperSize = sheet.PAPERSIZE_LETTER
-    sheet.page_setup.orientation = sheet.ORIENTATION_LANDSCAPE
+    sheet.page_setup.paperSize = report_sink.PAPERSIZE_LETTER
+    sheet.page_setup.orientation = report_sink.ORIENTATION_LANDSCAPE
     content_d[switch_obj.r_obj_key()].update(policy=sheet_name)
 
     # Set the column widths
@@ -223,19 +226,19 @@ def maps_policy(wb, content_d, switch_obj, i, sheet_i=None):
 
     # Switch name and column headers
     col = 1
-    sheet.merge_cells(start_row=row, start_column=col, end_row=row, end_column=len(_policy_hdr_d))
-    excel_util.cell_update(sheet,
-                           row,
-                           col,
-                           'MAPS Policies for: ' + brcddb_switch.best_switch_name(switch_obj, wwn=True, fid=True),
-                           font=_hdr1_font,
-                           align=_align_wrap,
-                           border=_border_thin)
+    report_sink.merge_cells(sheet, start_row=row, start_column=col, end_row=row, end_column=len(_policy_hdr_d))
+    report_sink.cell_update(sheet,
+                            row,
+                            col,
+                            'MAPS Policies for: ' + brcddb_switch.best_switch_name(switch_obj, wwn=True, fid=True),
+                            font=_hdr1_font,
+                            align=_align_wrap,
+                            border=_border_thin)
     row, col = row+1, 1
     for d in _policy_hdr_d.values():
-        excel_util.cell_update(sheet, row, col, d['t'], font=_hdr2_font, align=d['align'], border=_border_thin)
+        report_sink.cell_update(sheet, row, col, d['t'], font=_hdr2_font, align=d['align'], border=_border_thin)
         col += 1
-    sheet.freeze_panes = sheet['A3']
+    sheet.freeze_panes = 'A3'
     
     # Add the content and track which rule is used in which policy
     for d in gen_util.convert_to_list(switch_obj.r_get(brcdapi_util.maps_policy)):
@@ -246,13 +249,13 @@ def maps_policy(wb, content_d, switch_obj, i, sheet_i=None):
                 class_util.get_or_add(switch_obj, k + 'custom', list())
             policy_l.append(d['name'])
         for k, cd in _policy_hdr_d.items():
-            excel_util.cell_update(sheet,
-                                   row,
-                                   col,
-                                   cd['v'](switch_obj, d, k),
-                                   font=_std_font,
-                                   align=cd['va'],
-                                   border=_border_thin)
+            report_sink.cell_update(sheet,
+                                    row,
+                                    col,
+                                    cd['v'](switch_obj, d, k),
+                                    font=_std_font,
+                                    align=cd['va'],
+                                    border=_border_thin)
             col += 1
 
 
@@ -277,8 +280,8 @@ def maps_groups(wb, content_d, switch_obj, i, sheet_i=None):
     sheet_name = excel_util.valid_sheet_name.sub('_', brcddb_switch.best_switch_name(switch_obj))
     sheet_name = sheet_name[0:21] + '_group_' + str(i) if len(sheet_name) > 21 else sheet_name + '_group_' + str(i)
     sheet = wb.create_sheet(index=0 if sheet_i is None else sheet_i, title=sheet_name)
-    sheet.page_setup.paperSize = sheet.PAPERSIZE_LETTER
-    sheet.page_setup.orientation = sheet.ORIENTATION_LANDSCAPE
+    sheet.page_setup.paperSize = report_sink.PAPERSIZE_LETTER
+    sheet.page_setup.orientation = report_sink.ORIENTATION_LANDSCAPE
     content_d[switch_obj.r_obj_key()].update(group=sheet_name)
 
     # Set the column widths
@@ -289,31 +292,31 @@ def maps_groups(wb, content_d, switch_obj, i, sheet_i=None):
 
     # Switch name and column headers
     col = 1
-    sheet.merge_cells(start_row=row, start_column=col, end_row=row, end_column=len(_group_hdr_d))
-    excel_util.cell_update(sheet,
-                           row,
-                           col,
-                           'MAPS Groups for: ' + brcddb_switch.best_switch_name(switch_obj, wwn=True, fid=True),
-                           font=_hdr1_font,
-                           align=_align_wrap,
-                           border=_border_thin)
+    report_sink.merge_cells(sheet, start_row=row, start_column=col, end_row=row, end_column=len(_group_hdr_d))
+    report_sink.cell_update(sheet,
+                            row,
+                            col,
+                            'MAPS Groups for: ' + brcddb_switch.best_switch_name(switch_obj, wwn=True, fid=True),
+                            font=_hdr1_font,
+                            align=_align_wrap,
+                            border=_border_thin)
     row, col = row+1, 1
     for d in _group_hdr_d.values():
-        excel_util.cell_update(sheet, row, col, d['t'], font=_hdr2_font, align=d['align'], border=_border_thin)
+        report_sink.cell_update(sheet, row, col, d['t'], font=_hdr2_font, align=d['align'], border=_border_thin)
         col += 1
-    sheet.freeze_panes = sheet['A3']
+    sheet.freeze_panes = 'A3'
 
     # Add the content
     for d in gen_util.convert_to_list(switch_obj.r_get(brcdapi_util.maps_group)):
         row, col = row+1, 1
         for k, cd in _group_hdr_d.items():
-            excel_util.cell_update(sheet,
-                                   row,
-                                   col,
-                                   cd['v'](switch_obj, d, k),
-                                   font=_std_font,
-                                   align=cd['va'],
-                                   border=_border_thin)
+            report_sink.cell_update(sheet,
+                                    row,
+                                    col,
+                                    cd['v'](switch_obj, d, k),
+                                    font=_std_font,
+                                    align=cd['va'],
+                                    border=_border_thin)
             col += 1
 
 
@@ -338,8 +341,8 @@ def maps_rules(wb, content_d, switch_obj, i, sheet_i=None):
     sheet_name = excel_util.valid_sheet_name.sub('_', brcddb_switch.best_switch_name(switch_obj))
     sheet_name = sheet_name[0:21] + '_rule_' + str(i) if len(sheet_name) > 21 else sheet_name + '_rule_' + str(i)
     sheet = wb.create_sheet(index=0 if sheet_i is None else sheet_i, title=sheet_name)
-    sheet.page_setup.paperSize = sheet.PAPERSIZE_LETTER
-    sheet.page_setup.orientation = sheet.ORIENTATION_LANDSCAPE
+    sheet.page_setup.paperSize = report_sink.PAPERSIZE_LETTER
+    sheet.page_setup.orientation = report_sink.ORIENTATION_LANDSCAPE
     content_d[switch_obj.r_obj_key()].update(rule=sheet_name)
 
     # Set the column widths
@@ -350,31 +353,31 @@ def maps_rules(wb, content_d, switch_obj, i, sheet_i=None):
 
     # Switch name and column headers
     col = 1
-    sheet.merge_cells(start_row=row, start_column=col, end_row=row, end_column=len(_rules_hdr_d))
-    excel_util.cell_update(sheet,
-                           row,
-                           col,
-                           'MAPS Rules for: ' + brcddb_switch.best_switch_name(switch_obj, wwn=True, fid=True),
-                           font=_hdr1_font,
-                           align=_align_wrap,
-                           border=_border_thin)
+    report_sink.merge_cells(sheet, start_row=row, start_column=col, end_row=row, end_column=len(_rules_hdr_d))
+    report_sink.cell_update(sheet,
+                            row,
+                            col,
+                            'MAPS Rules for: ' + brcddb_switch.best_switch_name(switch_obj, wwn=True, fid=True),
+                            font=_hdr1_font,
+                            align=_align_wrap,
+                            border=_border_thin)
     row, col = row+1, 1
     for d in _rules_hdr_d.values():
-        excel_util.cell_update(sheet, row, col, d['t'], font=_hdr2_font, align=d['align'], border=_border_thin)
+        report_sink.cell_update(sheet, row, col, d['t'], font=_hdr2_font, align=d['align'], border=_border_thin)
         col += 1
-    sheet.freeze_panes = sheet['A3']
+    sheet.freeze_panes = 'A3'
 
     # Add the content
     for d in gen_util.convert_to_list(switch_obj.r_get(brcdapi_util.maps_rule)):
         row, col = row+1, 1
         for k, cd in _rules_hdr_d.items():
-            excel_util.cell_update(sheet,
-                                   row,
-                                   col,
-                                   cd['v'](switch_obj, d, k),
-                                   font=_std_font,
-                                   align=cd['va'],
-                                   border=_border_thin)
+            report_sink.cell_update(sheet,
+                                    row,
+                                    col,
+                                    cd['v'](switch_obj, d, k),
+                                    font=_std_font,
+                                    align=cd['va'],
+                                    border=_border_thin)
             col += 1
 
 
@@ -45,22 +45,24 @@ Contains functions to create port page and performance dashboard Excel worksheet
 +-----------+---------------+---------------------------------------------------------------------------------------+
 | 4.0.6     | 20 Feb 2026   | Added port_stats()                                                                    |
 +-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.7     | 18 Oct 2026   | Write through brcddb.report.sink. Rows are flushed as they are completed.             |
++-----------+---------------+---------------------------------------------------------------------------------------+
 """
 __author__ = 'Jack Consoli'
 __copyright__ = 'Copyright 2024, 2025, 2026 Jack Consoli'
-__date__ = '20 Feb 2026'
+__date__ = '18 Oct 2026'
 __license__ = 'Apache License, Version 2.0'
 __email__ = 'jack_consoli@yahoo.com'
 __maintainer__ = 'Jack Consoli'
 __status__ = 'Released'
-__version__ = '4.0.6'
+__version__ = '4.0.7'
 
 import datetime
 import collections
 import openpyxl.utils.cell as xl
 import brcdapi.log as brcdapi_log
 import brcdapi.util as brcdapi_util
-import brcdapi.excel_util as excel_util
+import brcddb.report.sink as report_sink
 import brcdapi.excel_fonts as excel_fonts
 import brcddb.brcddb_common as brcddb_common
 import brcddb.util.util as brcddb_util
@@ -114,8 +116,8 @@ def performance_dashboard(wb, tc, sheet_name, sheet_i, sheet_title, content):
 
     # Create the worksheet, add the title, and set up the column widths
     sheet = wb.create_sheet(index=0 if sheet_i is None else sheet_i, title=sheet_name)
-    sheet.page_setup.paperSize = sheet.PAPERSIZE_LETTER
-    sheet.page_setup.orientation = sheet.ORIENTATION_LANDSCAPE
+    sheet.page_setup.paperSize = report_sink.PAPERSIZE_LETTER
+    sheet.page_setup.orientation = report_sink.ORIENTATION_LANDSCAPE
     row = col = 1
     for k, v in hdr.items():
         sheet.column_dimensions[xl.get_column_letter(col)].width = v
@@ -123,10 +125,10 @@ def performance_dashboard(wb, tc, sheet_name, sheet_i, sheet_title, content):
     max_col = col - 1
     col = 1
     if isinstance(tc, str):
-        excel_util.cell_update(sheet, row, col, 'Contents', font=_link_font, link=tc)
+        report_sink.cell_update(sheet, row, col, 'Contents', font=_link_font, link=tc)
         col += 1
-    sheet.merge_cells(start_row=row, start_column=col, end_row=row, end_column=max_col)
-    excel_util.cell_update(sheet, row, col, sheet_title, font=_hdr1_font)
+    report_sink.merge_cells(sheet, start_row=row, start_column=col, end_row=row, end_column=max_col)
+    report_sink.cell_update(sheet, row, col, sheet_title, font=_hdr1_font)
     row += 2
 
     # Now add each dashboard item
@@ -135,16 +137,16 @@ def performance_dashboard(wb, tc, sheet_name, sheet_i, sheet_title, content):
         col = 1
 
         # The individual dashboard title
-        sheet.merge_cells(start_row=row, start_column=1, end_row=row, end_column=max_col)
+        report_sink.merge_cells(sheet, start_row=row, start_column=1, end_row=row, end_column=max_col)
         for i in range(col, max_col+1):
-            excel_util.cell_update(sheet, row, i, None, border=_border_thin)
-        excel_util.cell_update(sheet, row, col, db.get('title'), font=_hdr2_font,
-                               fill=excel_fonts.fill_type('lightblue'))
+            report_sink.cell_update(sheet, row, i, None, border=_border_thin)
+        report_sink.cell_update(sheet, row, col, db.get('title'), font=_hdr2_font,
+                                fill=excel_fonts.fill_type('lightblue'))
         row, col = row + 1, 1
 
         # Now the individual dashboard headers
         for k in hdr.keys():
-            excel_util.cell_update(sheet, row, col, k, font=_bold_font, border=_border_thin)
+            report_sink.cell_update(sheet, row, col, k, font=_bold_font, border=_border_thin)
             col += 1
 
         # Now add the dashboard content
@@ -157,19 +159,19 @@ def performance_dashboard(wb, tc, sheet_name, sheet_i, sheet_title, content):
                       brcddb_fabric.best_fab_name(port_obj.r_switch_obj().r_fabric_obj()),
                       brcddb_switch.best_switch_name(port_obj.r_switch_obj())]
             for buf in temp_l:
-                excel_util.cell_update(sheet, row, col, buf, font=_std_font, align=_align_wrap, border=_border_thin)
+                report_sink.cell_update(sheet, row, col, buf, font=_std_font, align=_align_wrap, border=_border_thin)
                 col += 1
             # Port
             link = port_obj.r_get('report_app/hyperlink_ps')
             if link is not None:
-                excel_util.cell_update(sheet, row, col, port_obj.r_obj_key(), font=_link_font, align=_align_wrap,
-                                       link=link, border=_border_thin)
+                report_sink.cell_update(sheet, row, col, port_obj.r_obj_key(), font=_link_font, align=_align_wrap,
+                                        link=link, border=_border_thin)
             else:
-                excel_util.cell_update(sheet, row, col, port_obj.r_obj_key(), font=_std_font, align=_align_wrap,
-                                       border=_border_thin)
+                report_sink.cell_update(sheet, row, col, port_obj.r_obj_key(), font=_std_font, align=_align_wrap,
+                                        border=_border_thin)
             col += 1
             for buf in [port_obj.c_login_type(), brcddb_port.port_best_desc(port_obj)]:
-                excel_util.cell_update(sheet, row, col, buf, font=_std_font, align=_align_wrap, border=_border_thin)
+                report_sink.cell_update(sheet, row, col, buf, font=_std_font, align=_align_wrap, border=_border_thin)
                 col += 1
             row += 1
         row += 1
@@ -429,16 +431,16 @@ def port_page(wb, tc, sheet_name, sheet_i, sheet_title, p_list, in_display=None,
 
     # Create the worksheet
     sheet = wb.create_sheet(index=0 if sheet_i is None else sheet_i, title=sheet_name)
-    sheet.page_setup.paperSize = sheet.PAPERSIZE_LETTER
-    sheet.page_setup.orientation = sheet.ORIENTATION_LANDSCAPE
+    sheet.page_setup.paperSize = report_sink.PAPERSIZE_LETTER
+    sheet.page_setup.orientation = report_sink.ORIENTATION_LANDSCAPE
 
     # Add the headers and set up the column widths
     row = col = 1
     if isinstance(tc, str):
-        excel_util.cell_update(sheet, row, col, 'Contents', font=_link_font, link=tc)
+        report_sink.cell_update(sheet, row, col, 'Contents', font=_link_font, link=tc)
         col += 1
-    excel_util.cell_update(sheet, row, col, sheet_title, font=_hdr1_font)
-    sheet.freeze_panes = sheet['A3']
+    report_sink.cell_update(sheet, row, col, sheet_title, font=_hdr1_font)
+    sheet.freeze_panes = 'A3'
     row, col = row+1, 1
     for k in display:
         if k in port_display_tbl:
@@ -453,7 +455,7 @@ def port_page(wb, tc, sheet_name, sheet_i, sheet_title, p_list, in_display=None,
             brcdapi_log.exception('Item ' + k + ' not in port_display_tbl.', echo=True)
             alignment = _align_wrap
             buf = k
-        excel_util.cell_update(sheet, row, col, buf, font=_bold_font, align=alignment, border=_border_thin)
+        report_sink.cell_update(sheet, row, col, buf, font=_bold_font, align=alignment, border=_border_thin)
         col += 1
 
     # Add the ports
@@ -503,7 +505,7 @@ def port_page(wb, tc, sheet_name, sheet_i, sheet_title, p_list, in_display=None,
             else:
                 font = _std_font
                 buf = '' if port_obj.r_get(k) is None else str(port_obj.r_get(k))
-            excel_util.cell_update(sheet, row, col, buf, font=font, align=alignment, border=_border_thin, link=link)
+            report_sink.cell_update(sheet, row, col, buf, font=font, align=alignment, border=_border_thin, link=link)
 
             col += 1
         row += 1
@@ -524,9 +526,10 @@ def port_page(wb, tc, sheet_name, sheet_i, sheet_title, p_list, in_display=None,
                                 else _port_case[k1](port_obj, k1, login[i])
                         else:
                             buf = port_obj.r_fabric_obj().r_get(k1)
-                    excel_util.cell_update(sheet, row, col, '' if buf is None else buf, font=font, align=_align_wrap,
-                                           border=_border_thin, link=link)
+                    report_sink.cell_update(sheet, row, col, '' if buf is None else buf, font=font, align=_align_wrap,
+                                            border=_border_thin, link=link)
                 row += 1
+        report_sink.flush(sheet, row)
 
     return sheet
 
@@ -578,8 +581,8 @@ def port_stats(wb, tc_page, sname, title, sheet_i, stats_l, time_format=None, su
 
     # Create the worksheet
     sheet = wb.create_sheet(index=0 if sheet_i is None else sheet_i, title=sname)
-    sheet.page_setup.paperSize = sheet.PAPERSIZE_LETTER
-    sheet.page_setup.orientation = sheet.ORIENTATION_LANDSCAPE
+    sheet.page_setup.paperSize = report_sink.PAPERSIZE_LETTER
+    sheet.page_setup.orientation = report_sink.ORIENTATION_LANDSCAPE
     cell_map_d['sheet'] = sheet
 
     # Figure out what the headers should be
@@ -594,15 +597,15 @@ def port_stats(wb, tc_page, sname, title, sheet_i, stats_l, time_format=None, su
         col += 1
     col = 1
     if isinstance(tc_page, str):
-        excel_util.cell_update(sheet, row, col, 'Contents', font=_link_font, link=tc_page)
+        report_sink.cell_update(sheet, row, col, 'Contents', font=_link_font, link=tc_page)
     col += 1
-    sheet.merge_cells(start_row=row, start_column=col, end_row=row, end_column=len(hdr_l))
-    excel_util.cell_update(sheet, row, col, title, font=_hdr1_font)
+    report_sink.merge_cells(sheet, start_row=row, start_column=col, end_row=row, end_column=len(hdr_l))
+    report_sink.cell_update(sheet, row, col, title, font=_hdr1_font)
 
     # Add the column headers
     row, col = row + 1, 1
     for key in hdr_l:
-        excel_util.cell_update(
+        report_sink.cell_update(
             sheet,
             row,
             col,
@@ -612,7 +615,7 @@ def port_stats(wb, tc_page, sname, title, sheet_i, stats_l, time_format=None, su
             align=_align_wrap_vc if rt.Port.port_display_tbl.get(key, dict()).get('v', False) else _align_wrap
         )
         col += 1
-    sheet.freeze_panes = sheet['A3']
+    sheet.freeze_panes = 'A3'
 
     # Add the sub-header
     if isinstance(sub_hdr, str):
@@ -622,7 +625,7 @@ def port_stats(wb, tc_page, sname, title, sheet_i, stats_l, time_format=None, su
         if isinstance(time_format, str) and isinstance(time_hdr, int):
             buf = str(datetime.datetime.fromtimestamp(time_hdr).strftime('%H:%M:%S'))
             cell_number_format = time_format
-        excel_util.cell_update(
+        report_sink.cell_update(
             sheet,
             row,
             1,
@@ -635,7 +638,7 @@ def port_stats(wb, tc_page, sname, title, sheet_i, stats_l, time_format=None, su
 
         # All the remaining columns
         for col in range(2, len(hdr_l) + 1):
-            excel_util.cell_update(
+            report_sink.cell_update(
                 sheet,
                 row,
                 col,
@@ -657,7 +660,7 @@ def port_stats(wb, tc_page, sname, title, sheet_i, stats_l, time_format=None, su
             else:
                 cell_val = val
                 cell_number_format = None
-            excel_util.cell_update(
+            report_sink.cell_update(
                 sheet,
                 row,
                 cell_map_d['col'][stat],
@@ -668,6 +671,7 @@ def port_stats(wb, tc_page, sname, title, sheet_i, stats_l, time_format=None, su
                 number_format=cell_number_format,
             )
         row += 1
+        report_sink.flush(sheet, row)
 
     cell_map_d['row']['end'] = row
 
@@ -0,0 +1,177 @@
+"""
+Copyright 2023, 2024, 2025, 2026 Jack Consoli.  All rights reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+the License. You may also obtain a copy of the License at https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the specific
+language governing permissions and limitations under the License.
+
+The license is free for single customer use (internal applications). Use of this module in the production,
+redistribution, or service delivery for commerce requires an additional license. Contact jack_consoli@yahoo.com for
+details.
+
+**Description**
+
+Adds a request timing page to a workbook. The request statistics are recorded by brcddb.api.interface and summarized
+with brcddb.brcddb_project.request_summary()
+
+**Public Methods**
+
++-----------------------+---------------------------------------------------------------------------------------+
+| Method                | Description                                                                           |
++=======================+=======================================================================================+
+| request_page          | Creates a request timing page: totals, per URI, per chassis, and the slowest requests |
++-----------------------+---------------------------------------------------------------------------------------+
+
+**Version Control**
+
++-----------+---------------+---------------------------------------------------------------------------------------+
+| Version   | Last Edit     | Description                                                                           |
++===========+===============+=======================================================================================+
+| 4.0.0     | 18 Oct 2026   | Initial launch                                                                        |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.1     | 18 Oct 2026   | Cells and merges are written through brcddb.report.sink.                              |
++-----------+---------------+---------------------------------------------------------------------------------------+
+"""
+__author__ = 'Jack Consoli'
+__copyright__ = 'Copyright 2024, 2025, 2026 Jack Consoli'
+__date__ = '18 Oct 2026'
+__license__ = 'Apache License, Version 2.0'
+__email__ = 'jack_consoli@yahoo.com'
+__maintainer__ = 'Jack Consoli'
+__status__ = 'Released'
+__version__ = '4.0.1'
+
+import openpyxl.utils.cell as xl
+import brcdapi.log as brcdapi_log
+import brcddb.report.sink as report_sink
+import brcdapi.excel_fonts as excel_fonts
+import brcddb.brcddb_project as brcddb_project
+import brcddb.brcddb_chassis as brcddb_chassis
+import brcddb.util.util as brcddb_util
+
+_std_font = excel_fonts.font_type('std')
+_bold_font = excel_fonts.font_type('bold')
+_link_font = excel_fonts.font_type('link')
+_hdr2_font = excel_fonts.font_type('hdr_2')
+_hdr1_font = excel_fonts.font_type('hdr_1')
+_align_wrap = excel_fonts.align_type('wrap')
+_align_wrap_r = excel_fonts.align_type('wrap_right')
+_border_thin = excel_fonts.border_type('thin')
+
+# Column headers and widths. The first column width is for the URI or chassis name
+_col_width_l = (60, 10, 10, 12, 14, 12, 12, 12, 12)
+_total_hdr_l = ('', 'Requests', 'Errors', 'Time (sec)', 'Bytes', 'Ingest (sec)', 'p50 (sec)', 'p95 (sec)',
+                'Max (sec)')
+_total_key_l = ('requests', 'errors', 'time', 'bytes', 'ingest', 'p50', 'p95', 'max')
+_slow_hdr_l = ('URI', 'FID', 'Chassis', 'Time (sec)', 'Bytes', 'Ingest (sec)', 'Status')
+
+
+def _fmt(v):
+    """Rounds floats to milliseconds for display"""
+    return round(v, 3) if isinstance(v, float) else v
+
+
+def _chassis_name(proj_obj, chassis):
+    chassis_obj = proj_obj.r_chassis_obj(chassis)
+    return chassis if chassis_obj is None else brcddb_chassis.best_chassis_name(chassis_obj, wwn=True)
+
+
+def _add_hdr(sheet, row, hdr_l):
+    """Adds a row of column headers. Returns the next row"""
+    col = 1
+    for buf in hdr_l:
+        report_sink.cell_update(sheet, row, col, buf, font=_bold_font, align=_align_wrap, border=_border_thin)
+        col += 1
+    return row + 1
+
+
+def _add_totals(sheet, row, name, d, key_l):
+    """Adds a row of totals. Returns the next row"""
+    report_sink.cell_update(sheet, row, 1, name, font=_std_font, align=_align_wrap, border=_border_thin)
+    col = 2
+    for k in key_l:
+        report_sink.cell_update(sheet, row, col, _fmt(d.get(k)), font=_std_font, align=_align_wrap_r,
+                                border=_border_thin)
+        col += 1
+    return row + 1
+
+
+def request_page(wb, tc, sheet_name, sheet_i, sheet_title, proj_obj, num_slowest=25):
+    """Creates a request timing worksheet for the Excel report.
+
+    :param wb: Workbook object
+    :type wb: class
+    :param tc: Table of context page. A link to this page is place in cell A1
+    :type tc: str, None
+    :param sheet_name: Sheet (tab) name
+    :type sheet_name: str
+    :param sheet_i: Sheet index where page is to be placed. Default is 0
+    :type sheet_i: int, None
+    :param sheet_title: Title to be displayed in large font, hdr_1, at the top of the sheet
+    :type sheet_title: str
+    :param proj_obj: Project object
+    :type proj_obj: brcddb.classes.project.ProjectObj
+    :param num_slowest: Number of the slowest requests to display
+    :type num_slowest: int
+    :rtype: None
+    """
+    global _link_font, _hdr1_font, _hdr2_font, _col_width_l, _total_hdr_l, _total_key_l, _slow_hdr_l
+
+    # Validate the user input
+    if proj_obj is None or 'ProjectObj' not in str(type(proj_obj)):
+        brcdapi_log.exception('Invalid object type: ' + str(type(proj_obj)) + '.', echo=True)
+        return
+    summary_d = brcddb_project.request_summary(proj_obj, num_slowest=num_slowest)
+
+    # Create the worksheet, add the title, and set up the column widths
+    sheet = wb.create_sheet(index=0 if sheet_i is None else sheet_i, title=sheet_name)
+    sheet.page_setup.paperSize = report_sink.PAPERSIZE_LETTER
+    sheet.page_setup.orientation = report_sink.ORIENTATION_LANDSCAPE
+    brcddb_util.add_to_obj(proj_obj, 'report_app/hyperlink/request', '#' + sheet_name + '!A1')
+    for i in range(0, len(_col_width_l)):
+        sheet.column_dimensions[xl.get_column_letter(i+1)].width = _col_width_l[i]
+    row = col = 1
+    if isinstance(tc, str):
+        report_sink.cell_update(sheet, row, col, 'Contents', font=_link_font, link=tc)
+        col += 1
+    report_sink.cell_update(sheet, row, col, sheet_title, font=_hdr1_font)
+    row += 2
+
+    # Totals
+    report_sink.cell_update(sheet, row, 1, 'Totals', font=_hdr2_font)
+    row = _add_hdr(sheet, row+1, _total_hdr_l)
+    row = _add_totals(sheet, row, 'All requests', summary_d['total'], _total_key_l)
+
+    # Per URI, slowest total time first
+    report_sink.cell_update(sheet, row+1, 1, 'By URI', font=_hdr2_font)
+    row = _add_hdr(sheet, row+2, ('URI',) + _total_hdr_l[1:])
+    uri_d = summary_d['uri_d']
+    for uri in sorted(uri_d.keys(), key=lambda x: uri_d[x]['time'], reverse=True):
+        row = _add_totals(sheet, row, uri, uri_d[uri], _total_key_l)
+
+    # Per chassis
+    report_sink.cell_update(sheet, row+1, 1, 'By Chassis', font=_hdr2_font)
+    row = _add_hdr(sheet, row+2, ('Chassis',) + _total_hdr_l[1:6])
+    chassis_d = summary_d['chassis_d']
+    for chassis in sorted(chassis_d.keys(), key=lambda x: chassis_d[x]['time'], reverse=True):
+        row = _add_totals(sheet, row, _chassis_name(proj_obj, chassis), chassis_d[chassis], _total_key_l[0:5])
+
+    # The slowest requests
+    report_sink.cell_update(sheet, row+1, 1, 'Slowest Requests', font=_hdr2_font)
+    row = _add_hdr(sheet, row+2, _slow_hdr_l)
+    for stat_d in summary_d['slowest']:
+        col = 1
+        for buf in (stat_d.get('uri'),
+                    stat_d.get('fid'),
+                    _chassis_name(proj_obj, stat_d.get('chassis')),
+                    stat_d.get('end', 0) - stat_d.get('start', 0),
+                    stat_d.get('bytes'),
+                    stat_d.get('ingest'),
+                    stat_d.get('status')):
+            report_sink.cell_update(sheet, row, col, _fmt(buf), font=_std_font, align=_align_wrap,
+                                    border=_border_thin)
+            col += 1
+        row += 1
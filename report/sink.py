@@ -0,0 +1,419 @@
+"""
+Copyright 2023, 2024, 2025, 2026 Jack Consoli.  All rights reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+the License. You may also obtain a copy of the License at https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the specific
+language governing permissions and limitations under the License.
+
+The license is free for single customer use (internal applications). Use of this module in the production,
+redistribution, or service delivery for commerce requires an additional license. Contact jack_consoli@yahoo.com for
+details.
+
+**Description**
+
+Row sink for the report pages. The report pages write cells through this module rather than calling
+brcdapi.excel_util.cell_update() directly so that the same page code works with either of two backends:
+
+    * In memory. The default. The workbook is created with brcdapi.excel_util.new_report() and every call is passed
+      directly to brcdapi.excel_util.cell_update(). Cells can be written in any order.
+    * Streaming. The workbook is an openpyxl write-only workbook. Cells are buffered by row, rows are emitted whole with
+      sheet.append(), and the cell formatting is done with named styles. A named style is registered once per workbook
+      for each unique combination of font, fill, alignment, border, and number format so that the styles are shared
+      rather than copied into every cell.
+
+Rows in a write-only worksheet can only be written once, in order. Pages that write their rows sequentially, such as the
+port, login, and zone pages, call flush() as each row is completed so that only the current row is held in memory. Pages
+that go back and fill in rows later, such as the switch and chassis pages, simply don't call flush(). Their rows are
+buffered until save_report() is called. Writing to a row that was already flushed is reported as an error and the cell
+is dropped.
+
+With write-only worksheets, the column widths and freeze panes must be set before the first row is flushed. Use the
+string cell reference, 'A4' for example, when setting freeze_panes. Worksheets in a write-only workbook do not support
+cell indexing, sheet['A4'].
+
+**Public Methods & Data**
+
++-----------------------+-------------------------------------------------------------------------------------------+
+| Method                | Description                                                                               |
++=======================+===========================================================================================+
+| add_conditional_format| Adds a conditional formatting rule to one or more ranges of cells.                        |
++-----------------------+-------------------------------------------------------------------------------------------+
+| add_data_validation   | Adds a data validation to a worksheet.                                                    |
++-----------------------+-------------------------------------------------------------------------------------------+
+| cell_update           | Same as brcdapi.excel_util.cell_update() but works with either backend.                   |
++-----------------------+-------------------------------------------------------------------------------------------+
+| flush                 | Emits all buffered rows before a row. Does nothing for in memory worksheets.              |
++-----------------------+-------------------------------------------------------------------------------------------+
+| is_streaming          | Returns True if a workbook or worksheet is write-only.                                    |
++-----------------------+-------------------------------------------------------------------------------------------+
+| load_report           | Opens a workbook saved with save_report() so that worksheets can be replaced.             |
++-----------------------+-------------------------------------------------------------------------------------------+
+| merge_cells           | Same as sheet.merge_cells() but works with either backend.                                |
++-----------------------+-------------------------------------------------------------------------------------------+
+| named_style           | Returns the named style for a combination of formatting. Registered once per workbook.    |
++-----------------------+-------------------------------------------------------------------------------------------+
+| new_report            | Creates a workbook for either backend.                                                    |
++-----------------------+-------------------------------------------------------------------------------------------+
+| save_report           | Flushes all buffered rows and saves the workbook.                                         |
++-----------------------+-------------------------------------------------------------------------------------------+
+| ORIENTATION_LANDSCAPE | Same as sheet.ORIENTATION_LANDSCAPE. Write-only worksheets do not have this attribute.    |
++-----------------------+-------------------------------------------------------------------------------------------+
+| ORIENTATION_PORTRAIT  | Same as sheet.ORIENTATION_PORTRAIT                                                        |
++-----------------------+-------------------------------------------------------------------------------------------+
+| PAPERSIZE_LETTER      | Same as sheet.PAPERSIZE_LETTER                                                            |
++-----------------------+-------------------------------------------------------------------------------------------+
+
+**Version Control**
+
++-----------+---------------+---------------------------------------------------------------------------------------+
+| Version   | Last Edit     | Description                                                                           |
++===========+===============+=======================================================================================+
+| 4.0.0     | 18 Oct 2026   | Initial launch                                                                        |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.1     | 18 Oct 2026   | Added named_style() and the style parameter to cell_update(). Added                   |
+|           |               | add_conditional_format().                                                             |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.2     | 18 Oct 2026   | Added load_report()                                                                   |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.3     | 18 Oct 2026   | named_style() shares styles with equal values and does not reuse style names already  |
+|           |               | in the workbook                                                                       |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.4     | 18 Oct 2026   | Row sinks are kept in a weak dictionary keyed by the worksheet                        |
++-----------+---------------+---------------------------------------------------------------------------------------+
+"""
+__author__ = 'Jack Consoli'
+__copyright__ = 'Copyright 2026 Jack Consoli'
+__date__ = '18 Oct 2026'
+__license__ = 'Apache License, Version 2.0'
+__email__ = 'jack_consoli@yahoo.com'
+__maintainer__ = 'Jack Consoli'
+__status__ = 'Released'
+__version__ = '4.0.4'
+
+import weakref
+import zipfile
+import openpyxl as xl
+import openpyxl.utils.cell as xl_util
+from openpyxl.cell.cell import Cell
+from openpyxl.comments import Comment
+from openpyxl.styles import NamedStyle, PatternFill, Border, Alignment
+from openpyxl.styles.fonts import DEFAULT_FONT
+from openpyxl.worksheet.worksheet import Worksheet
+from openpyxl.worksheet.cell_range import CellRange
+import brcdapi.log as brcdapi_log
+import brcdapi.excel_util as excel_util
+
+PAPERSIZE_LETTER = Worksheet.PAPERSIZE_LETTER
+ORIENTATION_LANDSCAPE = Worksheet.ORIENTATION_LANDSCAPE
+ORIENTATION_PORTRAIT = Worksheet.ORIENTATION_PORTRAIT
+
+# Key is the worksheet. Value is the _RowSink for that sheet. Only write-only worksheets are added.
+_sink_d = weakref.WeakKeyDictionary()
+# Key is the workbook. Value is a dict as follows:
+#   id_d      Key is the tuple of id() of the style objects and number format. Value is [style name, style objects]. The
+#             style objects are kept so that the id() values are not reused.
+#   value_d   Key is the tuple of style objects, compared by value, and number format. Value is the style name.
+#   name_l    Style names already in the workbook when it was first used with named_style()
+_style_d = weakref.WeakKeyDictionary()
+
+
+class _RowSink:
+    """Buffers the cells for a write-only worksheet by row.
+
+    Args:
+        * sheet (openpyxl.worksheet._write_only.WriteOnlyWorksheet): Write-only worksheet
+
+    Attributes:
+        _sheet (weakref.ref): Weak reference to the worksheet so that the worksheet can be freed. See _sink_d
+        _row_d (dict): Key is the row number. Value is a dict whose key is the column number and value is the list
+            [buf, kwargs], where kwargs are the keyword arguments passed to cell_update()
+        _next_row (int): Next row to be emitted with sheet.append()
+    """
+
+    def __init__(self, sheet):
+        self._sheet = weakref.ref(sheet)
+        self._row_d = dict()
+        self._next_row = 1
+
+    def cell_update(self, row, col, buf, **kwargs):
+        if row < self._next_row:
+            brcdapi_log.exception('Row ' + str(row) + ' on ' + self._sheet().title + ' was already written.', echo=True)
+            return
+        row_d = self._row_d.get(row)
+        if row_d is None:
+            row_d = dict()
+            self._row_d[row] = row_d
+        cell_l = row_d.get(col)
+        if cell_l is None:
+            row_d[col] = [buf, kwargs]
+        else:
+            # A None buf with formatting only is how some pages format blank rows. Keep whatever was already written.
+            if buf is not None:
+                cell_l[0] = buf
+            cell_l[1].update({k: v for k, v in kwargs.items() if v is not None})
+
+    def flush(self, row=None):
+        last_row = max(self._row_d.keys()) + 1 if len(self._row_d) > 0 else self._next_row
+        last_row = last_row if row is None else min(row, last_row)
+        sheet = self._sheet()
+        wb = sheet.parent
+        while self._next_row < last_row:
+            row_d = self._row_d.pop(self._next_row, dict())
+            cell_l = [None for _i in range(max(row_d.keys()) if len(row_d) > 0 else 0)]
+            for col, buf_kwargs_l in row_d.items():
+                cell_l[col - 1] = _new_cell(wb, sheet, self._next_row, col, buf_kwargs_l[0], buf_kwargs_l[1])
+            sheet.append(cell_l)
+            self._next_row += 1
+
+
+def named_style(wb, font, fill, align, border, number_format=None):
+    """Returns the name of the named style for a combination of formatting. The style is registered with the workbook
+    the first time it's used. Formatting not specified, None, is the workbook default. Style objects with the same
+    values share the same named style even if they are different objects. Names already in the workbook, such as those
+    in a workbook opened with load_report(), are not reused.
+
+    :param wb: Workbook
+    :type wb: openpyxl.Workbook
+    :param font: Font
+    :type font: openpyxl.styles.Font, None
+    :param fill: Fill
+    :type fill: openpyxl.styles.PatternFill, None
+    :param align: Alignment
+    :type align: openpyxl.styles.Alignment, None
+    :param border: Border
+    :type border: openpyxl.styles.Border, None
+    :param number_format: Number format
+    :type number_format: str, None
+    :return: Named style name. None if there is no formatting.
+    :rtype: str, None
+    """
+    global _style_d
+
+    if font is None and fill is None and align is None and border is None and number_format is None:
+        return None
+    wb_style_d = _style_d.get(wb)
+    if wb_style_d is None:
+        wb_style_d = dict(id_d=dict(), value_d=dict(), name_l=list(wb.named_styles))
+        _style_d[wb] = wb_style_d
+    id_key = (id(font), id(fill), id(align), id(border), number_format)
+    style_l = wb_style_d['id_d'].get(id_key)
+    if style_l is None:
+        value_key = (DEFAULT_FONT if font is None else font,
+                       PatternFill() if fill is None else fill,
+                       Alignment() if align is None else align,
+                       Border() if border is None else border,
+                       'General' if number_format is None else number_format)
+        name = wb_style_d['value_d'].get(value_key)  # openpyxl style objects compare by value
+        if name is None:
+            i = len(wb_style_d['value_d'])
+            name = 'brcddb_' + str(i)
+            while name in wb_style_d['name_l']:
+                i += 1
+                name = 'brcddb_' + str(i)
+            wb.add_named_style(NamedStyle(name=name,
+                                          font=value_key[0],
+                                          fill=value_key[1],
+                                          alignment=value_key[2],
+                                          border=value_key[3],
+                                          number_format=value_key[4]))
+            wb_style_d['value_d'][value_key] = name
+            wb_style_d['name_l'].append(name)
+        style_l = [name, (font, fill, align, border)]
+        wb_style_d['id_d'][id_key] = style_l
+    return style_l[0]
+
+
+def _new_cell(wb, sheet, row, col, buf, kwargs):
+    """Creates a cell for a write-only worksheet. Parameters are as passed to cell_update()
+
+    :rtype: openpyxl.cell.cell.Cell
+    """
+    cell = Cell(sheet, row=row, column=col, value=buf)
+    style = kwargs.get('style')
+    if style is None:
+        style = named_style(wb,
+                            kwargs.get('font'),
+                            kwargs.get('fill'),
+                            kwargs.get('align'),
+                            kwargs.get('border'),
+                            kwargs.get('number_format'))
+    if style is not None:
+        cell.style = style
+    link = kwargs.get('link')
+    if link is not None:
+        cell.hyperlink = link
+    comments = kwargs.get('comments')
+    if isinstance(comments, (list, tuple)):
+        comments = '\n'.join([str(b) for b in comments])
+    if comments is not None and len(str(comments)) > 0:
+        comment_height = kwargs.get('comment_height')
+        comment = Comment(str(comments), 'brcddb')
+        if comment_height is not None:
+            comment.height = comment_height
+        cell.comment = comment
+    coord = xl_util.get_column_letter(col) + str(row)
+    cf = kwargs.get('cf')
+    if cf is not None:
+        sheet.conditional_formatting.add(coord, cf)
+    dv = kwargs.get('dv')
+    if dv is not None:
+        add_data_validation(sheet, dv)
+        dv.add(coord)
+    return cell
+
+
+def _sink(sheet):
+    """Returns the _RowSink for a sheet
+
+    :param sheet: Worksheet
+    :type sheet: openpyxl.worksheet.worksheet.Worksheet, openpyxl.worksheet._write_only.WriteOnlyWorksheet
+    :return: Row sink. None for in memory worksheets.
+    :rtype: _RowSink, None
+    """
+    global _sink_d
+
+    row_sink = _sink_d.get(sheet)
+    if row_sink is None and is_streaming(sheet):
+        row_sink = _RowSink(sheet)
+        _sink_d[sheet] = row_sink
+    return row_sink
+
+
+def is_streaming(obj):
+    """Returns True if a workbook or worksheet is write-only
+
+    :param obj: Workbook or worksheet
+    :type obj: openpyxl.Workbook, openpyxl.worksheet.worksheet.Worksheet
+    :rtype: bool
+    """
+    wb = getattr(obj, 'parent', obj)  # Worksheets have a parent. Workbooks do not.
+    return bool(getattr(wb, 'write_only', False))
+
+
+def load_report(file_name):
+    """Opens a workbook saved with save_report(). The workbook is opened in memory, not write-only, so that worksheets
+    can be removed and added.
+
+    :param file_name: Name of the workbook file
+    :type file_name: str
+    :return: Workbook. None if the file could not be read.
+    :rtype: openpyxl.Workbook, None
+    """
+    try:
+        return xl.load_workbook(file_name)
+    except (OSError, ValueError, KeyError, zipfile.BadZipFile) as e:
+        brcdapi_log.log(['Could not read ' + file_name, str(e)], echo=True)
+    return None
+
+
+def new_report(streaming=False):
+    """Creates a workbook
+
+    :param streaming: If True, create a write-only workbook. Otherwise, use brcdapi.excel_util.new_report()
+    :type streaming: bool
+    :return: Workbook
+    :rtype: openpyxl.Workbook
+    """
+    return xl.Workbook(write_only=True) if streaming else excel_util.new_report()
+
+
+def cell_update(sheet, row, col, buf, **kwargs):
+    """Same as brcdapi.excel_util.cell_update() but also works with write-only worksheets. See brcdapi.excel_util for
+    parameter definitions. In addition to the brcdapi.excel_util.cell_update() parameters, style may be the name returned
+    from named_style(). When style is specified, it takes the place of font, fill, align, border, and number_format.
+    """
+    row_sink = _sink(sheet)
+    if row_sink is None:
+        style = kwargs.pop('style', None)
+        excel_util.cell_update(sheet, row, col, buf, **kwargs)
+        if style is not None:
+            sheet.cell(row=row, column=col).style = style
+    else:
+        row_sink.cell_update(row, col, buf, **kwargs)
+
+
+def merge_cells(sheet, start_row, start_column, end_row, end_column):
+    """Same as sheet.merge_cells() but also works with write-only worksheets
+
+    :param sheet: Worksheet
+    :type sheet: openpyxl.worksheet.worksheet.Worksheet, openpyxl.worksheet._write_only.WriteOnlyWorksheet
+    :param start_row: First row to merge
+    :type start_row: int
+    :param start_column: First column to merge
+    :type start_column: int
+    :param end_row: Last row to merge
+    :type end_row: int
+    :param end_column: Last column to merge
+    :type end_column: int
+    :rtype: None
+    """
+    if is_streaming(sheet):
+        sheet.merged_cells.add(CellRange(min_col=start_column, min_row=start_row, max_col=end_column, max_row=end_row))
+    else:
+        sheet.merge_cells(start_row=start_row, start_column=start_column, end_row=end_row, end_column=end_column)
+
+
+def add_conditional_format(sheet, ref, rule):
+    """Same as sheet.conditional_formatting.add(). Provided so that pages don't need to know which backend is in use.
+
+    :param sheet: Worksheet
+    :type sheet: openpyxl.worksheet.worksheet.Worksheet, openpyxl.worksheet._write_only.WriteOnlyWorksheet
+    :param ref: Cell range(s) the rule applies to. Multiple ranges are separated by a space. Example: 'A5:D5 F5'
+    :type ref: str
+    :param rule: Conditional formatting rule
+    :type rule: openpyxl.formatting.Rule
+    :rtype: None
+    """
+    sheet.conditional_formatting.add(ref, rule)
+
+
+def add_data_validation(sheet, dv):
+    """Same as sheet.add_data_validation() but also works with write-only worksheets. A data validation is only added
+    once.
+
+    :param sheet: Worksheet
+    :type sheet: openpyxl.worksheet.worksheet.Worksheet, openpyxl.worksheet._write_only.WriteOnlyWorksheet
+    :param dv: Data validation
+    :type dv: openpyxl.worksheet.datavalidation.DataValidation
+    :rtype: None
+    """
+    for sheet_dv in sheet.data_validations.dataValidation:
+        if sheet_dv is dv:
+            return
+    sheet.data_validations.append(dv)
+
+
+def flush(sheet, row=None):
+    """Emits all buffered rows before row. Pages that write rows sequentially should call this as each row is complete.
+
+    :param sheet: Worksheet
+    :type sheet: openpyxl.worksheet.worksheet.Worksheet, openpyxl.worksheet._write_only.WriteOnlyWorksheet
+    :param row: Rows before this row are emitted. If None, all buffered rows are emitted.
+    :type row: int, None
+    :rtype: None
+    """
+    row_sink = _sink(sheet)
+    if row_sink is not None:
+        row_sink.flush(row)
+
+
+def save_report(wb, file_name):
+    """Flushes all buffered rows and saves the workbook. See brcdapi.excel_util.save_report()
+
+    :param wb: Workbook
+    :type wb: openpyxl.Workbook
+    :param file_name: Name of the file to write the workbook to
+    :type file_name: str
+    :return: True if the file was saved. Otherwise, False.
+    :rtype: bool
+    """
+    global _sink_d
+
+    for sheet in wb.worksheets:
+        row_sink = _sink_d.pop(sheet, None)
+        if row_sink is not None:
+            row_sink.flush()
+    return excel_util.save_report(wb, file_name)
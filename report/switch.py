@@ -59,15 +59,21 @@ not fully thought this out yet.
 | 4.0.7     | 20 Feb 2026   | Updated copyright notice.                                                             |
 +-----------+---------------+---------------------------------------------------------------------------------------+
 +-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.8     | 18 Oct 2026   | Added ISL summary                                                                     |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.9     | 18 Oct 2026   | Cells and merges are written through brcddb.report.sink.                              |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.0     | 18 Oct 2026   | port_summary() classifies each port once. Fixed Other FC4 column                      |
++-----------+---------------+---------------------------------------------------------------------------------------+
 """
 __author__ = 'Jack Consoli'
 __copyright__ = 'Copyright 2024, 2025, 2026 Jack Consoli'
-__date__ = '20 Feb 2026'
+__date__ = '18 Oct 2026'
 __license__ = 'Apache License, Version 2.0'
 __email__ = 'jack_consoli@yahoo.com'
 __maintainer__ = 'Jack Consoli'
 __status__ = 'Released'
-__version__ = '4.0.7'
+__version__ = '4.1.0'
 
 import openpyxl.utils.cell as xl
 import copy
@@ -75,10 +81,11 @@ import collections
 import brcddb.brcddb_common as brcddb_common
 import brcdapi.util as brcdapi_util
 import brcdapi.gen_util as gen_util
-import brcdapi.excel_util as excel_util
+import brcddb.report.sink as report_sink
 import brcdapi.excel_fonts as excel_fonts
 import brcdapi.port as brcdapi_port
 import brcddb.brcddb_switch as brcddb_switch
+import brcddb.brcddb_port as brcddb_port
 import brcddb.report.utils as report_utils
 import brcddb.app_data.alert_tables as alert_table
 import brcddb.util.util as brcddb_util
@@ -163,6 +170,39 @@ def _port_statistics(switch_obj, col_d):
     return report_utils.port_statistics(switch_obj, _SWITCH_LINK_C, _PORT_SPEED)
 
 
+def _isl_summary(switch_obj, col_d):
+    """Returns the ISL summary to insert in _contents. See _links() for parameter definitions."""
+    global _SWITCH_LINK_C, _bold_font, _std_font, _align_wrap, _border_thin
+
+    proj_obj, switch_wwn, isl_topology = switch_obj.r_project_obj(), switch_obj.r_obj_key(), \
+        switch_obj.r_isl_topology()
+    rl = [
+        [
+            dict(buf='Neighbor Switch', font=_bold_font),
+            dict(buf='Trunk Groups', font=_bold_font),
+            dict(buf='ISLs', font=_bold_font),
+            dict(buf='Bandwidth (Gbps)', font=_bold_font),
+            dict(buf='FRUs', font=_bold_font),
+        ],
+    ]
+    for ds_wwn in isl_topology.r_neighbor_keys(switch_wwn):
+        ds_switch_obj = proj_obj.r_switch_obj(ds_wwn)
+        rl.append([
+            dict(buf=ds_wwn if ds_switch_obj is None else brcddb_switch.best_switch_name(ds_switch_obj, wwn=True)),
+            dict(buf=len(isl_topology.r_trunk_groups(switch_wwn, ds_wwn))),
+            dict(buf=len(isl_topology.r_paths(switch_wwn, ds_wwn))),
+            dict(buf=isl_topology.r_bandwidth(switch_wwn, ds_wwn)/1000000000),
+            dict(buf=', '.join(isl_topology.r_frus(switch_wwn, ds_wwn))),
+        ])
+    if len(rl) == 1:
+        rl.append([dict(buf='None')])
+
+    return report_utils.add_content_defaults(
+        rl,
+        dict(font=_std_font, align=_align_wrap, border=_border_thin, span=_SWITCH_LINK_C)
+    )
+
+
 def _conditional_highlight(switch_obj, col_d):
     """Returns the conditional highlighting to insert in _contents. See _links() for parameter definitions."""
     global _CONDITIONAL_C
@@ -437,6 +477,9 @@ _contents = [  # Search for **add_contents()** in brcddb.report.utils for an exp
     list(),
     _port_statistics,
     list(),
+    [dict(buf='ISL Summary', font=_bold_font, border=None, span=0)],
+    _isl_summary,
+    list(),
     _conditional_highlight,
     list(),
 ]
@@ -500,80 +543,65 @@ def add_port_map(switch_obj):
     report_utils.add_contents(switch_obj, content_l)
 
 
-def _all_ports(port_obj, port_l):
-    """Adds the port number to port_l
+def _all_ports(class_d):
+    """Returns True for all ports
 
-    :param port_obj: Port object
-    :type port_obj: brcddb.classes.port.PortObject
-    :param port_l: The list the matching port number should be added to.
-    :type port_l: list
+    :param class_d: Port classification. See brcddb.brcddb_port.port_class()
+    :type class_d: dict
+    :return: True if the port belongs in the summary column
+    :rtype: bool
     """
-    port_l.append(port_obj.r_obj_key())
+    return True
 
 
-def _enabled_logins(port_obj, port_l):
-    """If the port is enabled with logins, the port number is added to port_l. See _all_ports() for parameters."""
-    if port_obj.r_is_enabled() and len(port_obj.r_login_keys()) > 0:
-        port_l.append(port_obj.r_obj_key())
+def _enabled_logins(class_d):
+    """Returns True if the port is enabled with logins. See _all_ports() for parameters."""
+    return class_d['enabled'] and class_d['logins'] > 0
 
 
-def _enabled_no_logins(port_obj, port_l):
-    """If the port is enabled with no logins, the port number is added to port_l. See _all_ports() for parameters."""
-    if port_obj.r_is_enabled() and len(port_obj.r_login_keys()) == 0:
-        port_l.append(port_obj.r_obj_key())
+def _enabled_no_logins(class_d):
+    """Returns True if the port is enabled with no logins. See _all_ports() for parameters."""
+    return class_d['enabled'] and class_d['logins'] == 0
 
 
-def _disabled(port_obj, port_l):
-    """If the port is enabled with no logins, the port number is added to port_l. See _all_ports() for parameters."""
-    if not port_obj.r_is_enabled():
-        port_l.append(port_obj.r_obj_key())
+def _disabled(class_d):
+    """Returns True if the port is disabled. See _all_ports() for parameters."""
+    return not class_d['enabled']
 
 
-def _e_port(port_obj, port_l):
-    """If the port is an E-Port (ISL), the port number is added to port_l. See _all_ports() for parameters."""
-    if port_obj.c_login_type() == 'E-Port':
-        port_l.append(port_obj.r_obj_key())
+def _e_port(class_d):
+    """Returns True if the port is an E-Port (ISL). See _all_ports() for parameters."""
+    return class_d['login_type'] == 'E-Port'
 
 
-def _f_port(port_obj, port_l):
-    """If the port is an F-Port, the port number is added to port_l. See _all_ports() for parameters."""
-    if port_obj.c_login_type() == 'F-Port':
-        port_l.append(port_obj.r_obj_key())
+def _f_port(class_d):
+    """Returns True if the port is an F-Port. See _all_ports() for parameters."""
+    return class_d['login_type'] == 'F-Port'
 
 
-def _u_or_n_port(port_obj, port_l):
-    """If the port is a U-Port or N-Port, the port number is added to port_l. See _all_ports() for parameters."""
-    port_type = port_obj.c_login_type()
-    if port_type == 'U-Port' or port_type == 'N-Port':
-        port_l.append(port_obj.r_obj_key())
+def _u_or_n_port(class_d):
+    """Returns True if the port is a U-Port or N-Port. See _all_ports() for parameters."""
+    return class_d['login_type'] in ('U-Port', 'N-Port')
 
 
-def _fc4_target(port_obj, port_l):
-    """If the attached device is storage, the port number is added to port_l. See _all_ports() for parameters."""
-    attach_type = port_obj.r_get(brcdapi_util.bns_fc4_features)
-    if isinstance(attach_type, str) and 'Target' in attach_type and 'Initiator' not in attach_type:
-        port_l.append(port_obj.r_obj_key())
+def _fc4_target(class_d):
+    """Returns True if the attached device is storage. See _all_ports() for parameters."""
+    return class_d['fc4'] == 'target'
 
 
-def _fc4_initiator(port_obj, port_l):
-    """If the attached device is storage, the port number is added to port_l. See _all_ports() for parameters."""
-    attach_type = port_obj.r_get(brcdapi_util.bns_fc4_features)
-    if isinstance(attach_type, str) and 'Initiator' in attach_type and 'Target' not in attach_type:
-        port_l.append(port_obj.r_obj_key())
+def _fc4_initiator(class_d):
+    """Returns True if the attached device is a server. See _all_ports() for parameters."""
+    return class_d['fc4'] == 'initiator'
 
 
-def _fc4_mixed(port_obj, port_l):
-    """If the attached device is storage, the port number is added to port_l. See _all_ports() for parameters."""
-    attach_type = port_obj.r_get(brcdapi_util.bns_fc4_features)
-    if isinstance(attach_type, str) and 'Initiator' in attach_type and 'Target' in attach_type:
-        port_l.append(port_obj.r_obj_key())
+def _fc4_mixed(class_d):
+    """Returns True if the attached device is both storage and a server. See _all_ports() for parameters."""
+    return class_d['fc4'] == 'mixed'
 
 
-def _fc4_other(port_obj, port_l):
-    """If the attached device is storage, the port number is added to port_l. See _all_ports() for parameters."""
-    attach_type = port_obj.r_get(brcdapi_util.bns_fc4_features)
-    if isinstance(attach_type, str) and 'Initiator' not in attach_type and 'Target' not in attach_type:
-        port_l.append(port_obj.r_obj_key())
+def _fc4_other(class_d):
+    """Returns True if the attached device is neither storage nor a server. See _all_ports() for parameters."""
+    return class_d['fc4'] == 'other'
 
 
 def port_summary(switch_obj):
@@ -593,10 +621,12 @@ def port_summary(switch_obj):
     port_d['FC4 Storage'] = dict(l=list(),a=_fc4_target)
     port_d['FC4 Server'] = dict(l=list(),a=_fc4_initiator)
     port_d['Mixed FC4'] = dict(l=list(),a=_fc4_mixed)
-    port_d['Other FC4'] = dict(l=list(),a=_all_ports)
+    port_d['Other FC4'] = dict(l=list(),a=_fc4_other)
     for port_obj in switch_obj.r_port_objects():
-        for hdr, d in port_d.items():
-            d['a'](port_obj, d['l'])
+        class_d = brcddb_port.port_class(port_obj)  # Classify the port once and use it for all the columns
+        for d in port_d.values():
+            if d['a'](class_d):
+                d['l'].append(port_obj.r_obj_key())
 
     # Add the headers to the worksheet
     # The Main Header
@@ -656,22 +686,28 @@ def switch_page(wb, tc, sheet_name, sheet_i, sheet_title, switch_obj, in_display
 
     # Create the worksheet and set up the column widths
     sheet = wb.create_sheet(index=0 if sheet_i is None else sheet_i, title=sheet_name)
-    sheet.page_setup.paperSize = sheet.PAPERSIZE_LETTER
-    sheet.page_setup.orientation = sheet.ORIENTATION_LANDSCAPE
-    sheet.add_data_validation(report_utils.highlight_stats_dv)
+    sheet.page_setup.paperSize = report_sink.PAPERSIZE_LETTER
+    sheet.page_setup.orientation = report_sink.ORIENTATION_LANDSCAPE
+    report_sink.add_data_validation(sheet, report_utils.highlight_stats_dv)
     for col in range(0, _num_columns + _extra_columns):
         sheet.column_dimensions[xl.get_column_letter(col+1)].width = _common_width
-    sheet.freeze_panes = sheet['A2']
+    sheet.freeze_panes = 'A2'
     sheet_d = dict(sheet=sheet, num_columns=_num_columns, row=1)  # Add cond_format_d=dict()
     switch_obj.rs_key('report_app/worksheet', sheet_d)
 
     # Add the table of contents and title to the first row.
     col = 1
     if isinstance(tc, str):
-        excel_util.cell_update(sheet, sheet_d['row'], col, 'Contents', font=_link_font, link=tc)
-        sheet.merge_cells(start_row=sheet_d['row'], start_column=col, end_row=sheet_d['row'], end_column=col+3)
+        report_sink.cell_update(sheet, sheet_d['row'], col, 'Contents', font=_link_font, link=tc)
+        report_sink.merge_cells(
+            sheet,
+            start_row=sheet_d['row'],
+            start_column=col,
+            end_row=sheet_d['row'],
+            end_column=col+3
+        )
         col += 4
-    excel_util.cell_update(
+    report_sink.cell_update(
         sheet,
         sheet_d['row'],
         col,
@@ -679,7 +715,8 @@ def switch_page(wb, tc, sheet_name, sheet_i, sheet_title, switch_obj, in_display
         font=_hdr1_font,
         align=_align_wrap_c
     )
-    sheet.merge_cells(
+    report_sink.merge_cells(
+        sheet,
         start_row=sheet_d['row'],
         start_column=col,
         end_row=sheet_d['row'],
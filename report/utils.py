@@ -200,18 +200,32 @@ data was also added for fabrics with future plans to add port highlighting to th
 +-----------+---------------+---------------------------------------------------------------------------------------+
 | 4.1.2     | 10 Mar 2026   | Added more error checking and more user friendly error messages.                      |
 +-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.3     | 18 Oct 2026   | alert_eval() uses the project alert index                                             |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.4     | 18 Oct 2026   | add_contents() and the other pages write through brcddb.report.sink.                  |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.5     | 18 Oct 2026   | add_contents() uses shared named styles and adds one highlighting rule per reference  |
+|           |               | for all the cell ranges using it instead of one rule per cell.                        |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.6     | 18 Oct 2026   | port_statistics() and enabled_no_login() use brcddb_port.port_counts()                |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.7     | 18 Oct 2026   | groups() resolves the group filters against name and WWN indexes built once per       |
+|           |               | project                                                                               |
++-----------+---------------+---------------------------------------------------------------------------------------+
 """
 __author__ = 'Jack Consoli'
 __copyright__ = 'Copyright 2023, 2024, 2025, 2026 Jack Consoli'
-__date__ = '10 Mar 2026'
+__date__ = '18 Oct 2026'
 __license__ = 'Apache License, Version 2.0'
 __email__ = 'jack_consoli@yahoo.com'
 __maintainer__ = 'Jack Consoli'
 __status__ = 'Released'
-__version__ = '4.1.2'
+__version__ = '4.1.7'
 
 import collections
 import copy
+import re
+import bisect
 from openpyxl.worksheet.datavalidation import DataValidation
 from openpyxl.formatting import Rule
 from openpyxl.styles.differential import DifferentialStyle
@@ -221,6 +235,7 @@ import fnmatch
 import brcdapi.log as brcdapi_log
 import brcdapi.gen_util as gen_util
 import brcdapi.excel_util as excel_util
+import brcddb.report.sink as report_sink
 import brcdapi.excel_fonts as excel_fonts
 import brcdapi.port as brcdapi_port
 import brcddb.util.obj_convert as brcddb_conv
@@ -270,6 +285,12 @@ _yellow_fill = excel_fonts.fill_type('yellow')
 
 # _obj_type_to_key_d is used in add_contents() to determine what "xxx_Highlight Total" to use for the object.
 _obj_type_to_key_d = dict(ChassisObj='ch_cond_link', SwitchObj='sw_cond_link', FabricObj='fab_cond_link')
+# All the port highlighting conditional formatting rules use the same differential style
+_highlight_dxf = DifferentialStyle(fill=_yellow_fill, font=_bold_font)
+# Login speeds, fibrechannel/speed, reported in port_statistics(). Must match the order of the 'Ports by Login Speed'
+# headers
+_login_speed_l = (1000000000, 2000000000, 4000000000, 8000000000, 16000000000, 32000000000, 64000000000,
+                  128000000000)
 
 # About worksheet - used in function: about
 _about_sheet_l = (
@@ -532,11 +553,11 @@ def title_page(wb, tc, sheet_name, sheet_i, sheet_title, content, col_width):
     max_col = col-1
     row = col = 1
     if isinstance(tc, str):
-        excel_util.cell_update(sheet, row, col, 'Contents', link='#' + tc + '!A1', font=excel_fonts.font_type('link'))
+        report_sink.cell_update(sheet, row, col, 'Contents', link='#' + tc + '!A1', font=excel_fonts.font_type('link'))
         col += 1
-    sheet.merge_cells(start_row=row, start_column=col, end_row=row, end_column=max_col)
-    excel_util.cell_update(sheet, row, col, sheet_title, font=excel_fonts.font_type('hdr_1'),
-                           fill=excel_fonts.fill_type('lightblue'))
+    report_sink.merge_cells(sheet, start_row=row, start_column=col, end_row=row, end_column=max_col)
+    report_sink.cell_update(sheet, row, col, sheet_title, font=excel_fonts.font_type('hdr_1'),
+                            fill=excel_fonts.fill_type('lightblue'))
     row += 2
     # Add the content. Intended for general use so lots of error checking.
     col = 1
@@ -555,17 +576,17 @@ def title_page(wb, tc, sheet_name, sheet_i, sheet_title, content, col_width):
                         brcdapi_log.exception('Unknown disp type, ' + str(type((obj.get('disp')))) + ', at row ' +
                                               str(row), echo=True)
                 for buf in display_l:
-                    excel_util.cell_update(sheet, row, col, buf,
-                                           link=obj.get('hyper'),
-                                           font=excel_fonts.font_type(obj.get('font')),
-                                           align=excel_fonts.align_type(obj.get('align')),
-                                           border=excel_fonts.border_type(obj.get('border')),
-                                           fill=excel_fonts.fill_type(obj.get('fill')))
+                    report_sink.cell_update(sheet, row, col, buf,
+                                            link=obj.get('hyper'),
+                                            font=excel_fonts.font_type(obj.get('font')),
+                                            align=excel_fonts.align_type(obj.get('align')),
+                                            border=excel_fonts.border_type(obj.get('border')),
+                                            fill=excel_fonts.fill_type(obj.get('fill')))
                     if 'merge' in obj:
                         if isinstance(obj.get('merge'), int):
                             if obj.get('merge') > 1:
-                                sheet.merge_cells(start_row=row, start_column=col, end_row=row,
-                                                  end_column=(col + obj.get('merge') - 1))
+                                report_sink.merge_cells(sheet, start_row=row, start_column=col, end_row=row,
+                                                        end_column=(col + obj.get('merge') - 1))
                                 col += obj.get('merge')
                         else:
                             brcdapi_log.exception('Merge must be an integer. Type: ' + str(type(obj.get('merge'))),
@@ -1558,13 +1579,11 @@ def port_statistics(obj, type_span, speed_span):
     :return: List of lists containing dictionaries to insert while processing _contents
     :rtype: list
     """
-    global _border_thin, _align_wrap, _bold_font, _align_wrap_r
+    global _border_thin, _align_wrap, _bold_font, _align_wrap_r, _login_speed_l
 
     # Figure out what to put in the statistics summary section
-    port_obj_l = brcddb_search.match_test(obj.r_port_objects(), brcddb_search.port_online)
-    sum_logins = 0
-    for port_obj in brcddb_search.match_test(port_obj_l, brcddb_search.f_ports):
-        sum_logins += len(port_obj.r_login_keys())
+    count_d = brcddb_port.port_counts(obj)
+    speed_d = count_d['speed_d']
     sheet_d = obj.r_get('report_app/worksheet')
 
     # Add the ports by login type
@@ -1579,15 +1598,11 @@ def port_statistics(obj, type_span, speed_span):
                  span=type_span),
         ],
         [
-            dict(buf=len(obj.r_port_objects()),
-                 font=_std_font, align=_align_wrap_r, border=_border_thin, span=type_span),
-            dict(buf=len(brcddb_search.match_test(port_obj_l, brcddb_search.icl_ports)),
-                 font=_std_font, align=_align_wrap_r, border=_border_thin, span=type_span),
-            dict(buf=len(brcddb_search.match_test(port_obj_l, brcddb_search.e_ports)),
-                 font=_std_font, align=_align_wrap_r, border=_border_thin, span=type_span),
-            dict(buf=len(brcddb_search.match_test(port_obj_l, brcddb_search.fc_lag_ports)),
-                 font=_std_font, align=_align_wrap_r, border=_border_thin, span=type_span),
-            dict(buf=sum_logins, font=_std_font, align=_align_wrap_r, border=_border_thin, span=type_span),
+            dict(buf=count_d['ports'], font=_std_font, align=_align_wrap_r, border=_border_thin, span=type_span),
+            dict(buf=count_d['icl'], font=_std_font, align=_align_wrap_r, border=_border_thin, span=type_span),
+            dict(buf=count_d['e_port'], font=_std_font, align=_align_wrap_r, border=_border_thin, span=type_span),
+            dict(buf=count_d['fc_lag'], font=_std_font, align=_align_wrap_r, border=_border_thin, span=type_span),
+            dict(buf=count_d['logins'], font=_std_font, align=_align_wrap_r, border=_border_thin, span=type_span),
         ],
         [],
 
@@ -1604,22 +1619,8 @@ def port_statistics(obj, type_span, speed_span):
             dict(buf='128G', font=_std_font, align=_align_wrap_r, border=_border_thin, span=speed_span),
         ],
         [  # Add the ports by speed: The values
-            dict(buf=len(brcddb_search.match_test(port_obj_l, brcddb_search.login_1g)),
-                 font=_std_font, align=_align_wrap_r, border=_border_thin, span=speed_span),
-            dict(buf=len(brcddb_search.match_test(port_obj_l, brcddb_search.login_2g)),
-                 font=_std_font, align=_align_wrap_r, border=_border_thin, span=speed_span),
-            dict(buf=len(brcddb_search.match_test(port_obj_l, brcddb_search.login_4g)),
-                 font=_std_font, align=_align_wrap_r, border=_border_thin, span=speed_span),
-            dict(buf=len(brcddb_search.match_test(port_obj_l, brcddb_search.login_8g)),
-                 font=_std_font, align=_align_wrap_r, border=_border_thin, span=speed_span),
-            dict(buf=len(brcddb_search.match_test(port_obj_l, brcddb_search.login_16g)),
-                 font=_std_font, align=_align_wrap_r, border=_border_thin, span=speed_span),
-            dict(buf=len(brcddb_search.match_test(port_obj_l, brcddb_search.login_32g)),
-                 font=_std_font, align=_align_wrap_r, border=_border_thin, span=speed_span),
-            dict(buf=len(brcddb_search.match_test(port_obj_l, brcddb_search.login_64g)),
-                 font=_std_font, align=_align_wrap_r, border=_border_thin, span=speed_span),
-            dict(buf=len(brcddb_search.match_test(port_obj_l, brcddb_search.login_128g)),
-                 font=_std_font, align=_align_wrap_r, border=_border_thin, span=speed_span),
+            dict(buf=speed_d.get(speed, 0), font=_std_font, align=_align_wrap_r, border=_border_thin, span=speed_span)
+            for speed in _login_speed_l
         ],
     ]
 
@@ -1637,70 +1638,7 @@ def enabled_no_login(obj, type_span, speed_span):
     :return: List of lists containing dictionaries to insert while processing _contents
     :rtype: list
     """
-    global _border_thin, _align_wrap, _bold_font, _align_wrap_r
-
-    # Figure out what to put in the statistics summary section
-    port_obj_l = brcddb_search.match_test(obj.r_port_objects(), brcddb_search.port_online)
-    sum_logins = 0
-    for port_obj in brcddb_search.match_test(port_obj_l, brcddb_search.f_ports):
-        sum_logins += len(port_obj.r_login_keys())
-    sheet_d = obj.r_get('report_app/worksheet')
-
-    # Add the ports by login type
-    return [
-        [dict(buf='Ports by Login Type', font=_bold_font, align=_align_wrap, span=sheet_d['num_columns'])],
-        [
-            dict(buf='Physical Ports', font=_std_font, align=_align_wrap_r, border=_border_thin, span=type_span),
-            dict(buf='ICL-Ports', font=_std_font, align=_align_wrap_r, border=_border_thin, span=type_span),
-            dict(buf='ISL (E-Ports)', font=_std_font, align=_align_wrap_r, border=_border_thin, span=type_span),
-            dict(buf='FC-Lag Ports', font=_std_font, align=_align_wrap_r, border=_border_thin, span=type_span),
-            dict(buf='Name Server Logins', font=_std_font, align=_align_wrap_r, border=_border_thin,
-                 span=type_span),
-        ],
-        [
-            dict(buf=len(obj.r_port_objects()),
-                 font=_std_font, align=_align_wrap_r, border=_border_thin, span=type_span),
-            dict(buf=len(brcddb_search.match_test(port_obj_l, brcddb_search.icl_ports)),
-                 font=_std_font, align=_align_wrap_r, border=_border_thin, span=type_span),
-            dict(buf=len(brcddb_search.match_test(port_obj_l, brcddb_search.e_ports)),
-                 font=_std_font, align=_align_wrap_r, border=_border_thin, span=type_span),
-            dict(buf=len(brcddb_search.match_test(port_obj_l, brcddb_search.fc_lag_ports)),
-                 font=_std_font, align=_align_wrap_r, border=_border_thin, span=type_span),
-            dict(buf=sum_logins, font=_std_font, align=_align_wrap_r, border=_border_thin, span=type_span),
-        ],
-        [],
-
-        # Add the ports by speed: Headers
-        [dict(buf='Ports by Login Speed', font=_bold_font, align=_align_wrap, span=sheet_d['num_columns'])],
-        [
-            dict(buf='1G', font=_std_font, align=_align_wrap_r, border=_border_thin, span=speed_span),
-            dict(buf='2G', font=_std_font, align=_align_wrap_r, border=_border_thin, span=speed_span),
-            dict(buf='4G', font=_std_font, align=_align_wrap_r, border=_border_thin, span=speed_span),
-            dict(buf='8G', font=_std_font, align=_align_wrap_r, border=_border_thin, span=speed_span),
-            dict(buf='16G', font=_std_font, align=_align_wrap_r, border=_border_thin, span=speed_span),
-            dict(buf='32G', font=_std_font, align=_align_wrap_r, border=_border_thin, span=speed_span),
-            dict(buf='64G', font=_std_font, align=_align_wrap_r, border=_border_thin, span=speed_span),
-            dict(buf='128G', font=_std_font, align=_align_wrap_r, border=_border_thin, span=speed_span),
-        ],
-        [  # Add the ports by speed: The values
-            dict(buf=len(brcddb_search.match_test(port_obj_l, brcddb_search.login_1g)),
-                 font=_std_font, align=_align_wrap_r, border=_border_thin, span=speed_span),
-            dict(buf=len(brcddb_search.match_test(port_obj_l, brcddb_search.login_2g)),
-                 font=_std_font, align=_align_wrap_r, border=_border_thin, span=speed_span),
-            dict(buf=len(brcddb_search.match_test(port_obj_l, brcddb_search.login_4g)),
-                 font=_std_font, align=_align_wrap_r, border=_border_thin, span=speed_span),
-            dict(buf=len(brcddb_search.match_test(port_obj_l, brcddb_search.login_8g)),
-                 font=_std_font, align=_align_wrap_r, border=_border_thin, span=speed_span),
-            dict(buf=len(brcddb_search.match_test(port_obj_l, brcddb_search.login_16g)),
-                 font=_std_font, align=_align_wrap_r, border=_border_thin, span=speed_span),
-            dict(buf=len(brcddb_search.match_test(port_obj_l, brcddb_search.login_32g)),
-                 font=_std_font, align=_align_wrap_r, border=_border_thin, span=speed_span),
-            dict(buf=len(brcddb_search.match_test(port_obj_l, brcddb_search.login_64g)),
-                 font=_std_font, align=_align_wrap_r, border=_border_thin, span=speed_span),
-            dict(buf=len(brcddb_search.match_test(port_obj_l, brcddb_search.login_128g)),
-                 font=_std_font, align=_align_wrap_r, border=_border_thin, span=speed_span),
-        ],
-    ]
+    return port_statistics(obj, type_span, speed_span)
 
 
 def add_content_defaults(contents_l, default_d):
@@ -1818,9 +1756,10 @@ def alert_eval(obj, col_d):
     """
     global _alert_d, alert_font_d
 
-    comment_l, alert_level = list(), alert_class.ALERT_SEV.GENERAL
-    for alert_obj in obj.r_alert_objects():
-        if alert_obj.alert_num() in _alert_d.get(col_d['key'], list()):
+    comment_l, alert_level, alert_tbl = list(), alert_class.ALERT_SEV.GENERAL, obj.r_project_obj().r_alert_tbl()
+    for alert_num in _alert_d.get(col_d['key'], list()):
+        for alert_id in alert_tbl.r_alert_ids_for_num(obj, alert_num):
+            alert_obj = alert_tbl.r_alert_obj(alert_id)
             comment_l.append(alert_obj.fmt_msg())
             alert_level = max(alert_level, alert_obj.sev())
 
@@ -1883,6 +1822,45 @@ def list_to_str(obj, col_d):
     ]
 
 
+def _range_ref(row, first, last):
+    """Returns the cell range reference for columns first through last in a row. Example: 'B5:D5'"""
+    return xl_util.get_column_letter(first) + str(row) + ':' + xl_util.get_column_letter(last) + str(row)
+
+
+def _add_highlight_rules(sheet, cf_d):
+    """Adds the port highlighting conditional formatting collected by add_contents(). One rule is added for each
+    highlight reference and applied to all the cell ranges that use it.
+
+    :param sheet: Worksheet
+    :type sheet: openpyxl.worksheet.worksheet.Worksheet
+    :param cf_d: Key is the highlight reference. Value is a dict whose key is the row and value is a list of
+        [first column, last column]
+    :type cf_d: dict
+    :rtype: None
+    """
+    global _highlight_dxf
+
+    for rule_key, row_d in cf_d.items():
+        range_l = list()
+        for row, col_l in row_d.items():
+            col_l.sort()
+            first, last = col_l[0]
+            for next_first, next_last in col_l[1:]:
+                if next_first > last + 1:
+                    range_l.append(_range_ref(row, first, last))
+                    first = next_first
+                last = max(last, next_last)
+            range_l.append(_range_ref(row, first, last))
+
+        # The rule applies to a range so the reference must be absolute. Otherwise, Excel offsets it for each cell.
+        sheet_ref, x, cell_ref = rule_key.rpartition('!')
+        rule = Rule(type='expression',
+                    dxf=_highlight_dxf,
+                    stopIfTrue=True,
+                    formula=[sheet_ref + x + xl_util.absolute_coordinate(cell_ref) + '>0'])
+        report_sink.add_conditional_format(sheet, ' '.join(range_l), rule)
+
+
 def add_contents(obj, contents_l):
     """Adds contents to the worksheet
 
@@ -1891,7 +1869,7 @@ def add_contents(obj, contents_l):
     :param contents_l: List of dictionaries defining the contents. See brcddb.report.switch._contents for definition
     :type contents_l: list
     """
-    global _yellow_fill
+    global _obj_type_to_key_d
 
     col = 1
     sheet_d = obj.r_get('report_app/worksheet')
@@ -1899,6 +1877,13 @@ def add_contents(obj, contents_l):
         brcdapi_log.exception(str(type(obj)) + ' missing "report_app/worksheet"', echo=True)
         return
     sheet = sheet_d['sheet']
+    cf_d = dict()  # See _add_highlight_rules()
+
+    # Which "xxx_Highlight Total" to use, if any, is the same for every cell.
+    class_type = brcddb_class_util.get_simple_class_type(obj)
+    rule_key_name = _obj_type_to_key_d.get(class_type)
+    if rule_key_name is None:
+        brcdapi_log.exception('Unexpected object type, ' + str(class_type), echo=True)
 
     # Add the contents
     for row_item in contents_l:
@@ -1925,40 +1910,41 @@ def add_contents(obj, contents_l):
                             brcdapi_log.exception(['Could not convert buf_item to string.', e], echo=True)
                             buf = None  # IDK why it wouldn't be None. This is just to be certain.
 
-                    # Is there any conditional formatting?
-                    rule, rule_key = None, None
-                    class_type = brcddb_class_util.get_simple_class_type(obj)
-                    try:
-                        rule_key = col_d.get(_obj_type_to_key_d[class_type])
-                    except KeyError:
-                        brcdapi_log.exception('Unexpected object type, ' + class_type, echo=True)
-                    if isinstance(rule_key, str):
-                        rule = Rule(type="expression",
-                                    dxf=DifferentialStyle(fill=_yellow_fill, font=_bold_font),
-                                    stopIfTrue=True)
-                        rule.formula = [rule_key + '>0']
-
                     # Add the cell contents
-                    excel_util.cell_update(
+                    report_sink.cell_update(
                         sheet,
                         sheet_d['row'],
                         col,
                         buf,
-                        font=col_d.get('font'),
-                        fill=col_d.get('fill'),
-                        align=col_d.get('align'),
-                        border=col_d.get('border'),
+                        style=report_sink.named_style(sheet.parent,
+                                                      col_d.get('font'),
+                                                      col_d.get('fill'),
+                                                      col_d.get('align'),
+                                                      col_d.get('border')),
                         comments=col_d.get('comments'),
                         comment_height=len(col_d.get('comments', list())) + 20,
                         link=col_d.get('link'),
-                        cf=rule,
                         dv=col_d.get('dv')
                     )
 
-                    # Merge cells, if necessary
+                    # Is there any conditional formatting? The rules are added once all the cells are known.
                     span = col_d.get('span', 1)
+                    rule_key = None if rule_key_name is None else col_d.get(rule_key_name)
+                    if isinstance(rule_key, str):
+                        row_d = cf_d.get(rule_key)
+                        if row_d is None:
+                            row_d = dict()
+                            cf_d[rule_key] = row_d
+                        col_l = row_d.get(sheet_d['row'])
+                        if col_l is None:
+                            col_l = list()
+                            row_d[sheet_d['row']] = col_l
+                        col_l.append([col, col + max(span, 1) - 1])
+
+                    # Merge cells, if necessary
                     if span > 1:
-                        sheet.merge_cells(
+                        report_sink.merge_cells(
+                            sheet,
                             start_row=sheet_d['row'],
                             start_column=col,
                             end_row=sheet_d['row'],
@@ -1967,6 +1953,8 @@ def add_contents(obj, contents_l):
 
             sheet_d['row'], col = sheet_d['row'] + 1, 1
 
+    _add_highlight_rules(sheet, cf_d)
+
 
 def about_page(wb, sheet_i, sheet_name, file_name, version, description, tc=None):
     """Inserts a standard "About" page in a workbook
@@ -1986,7 +1974,7 @@ def about_page(wb, sheet_i, sheet_name, file_name, version, description, tc=None
 
     # Add an "about" sheet
     sheet = wb.create_sheet(index=sheet_i, title=sheet_name)
-    sheet.page_setup.paperSize = sheet.PAPERSIZE_LETTER
+    sheet.page_setup.paperSize = report_sink.PAPERSIZE_LETTER
     sheet.column_dimensions['A'].width = 80
 
     row = col = 1
@@ -1999,7 +1987,7 @@ def about_page(wb, sheet_i, sheet_name, file_name, version, description, tc=None
 
     # Add link to Table of Contents
     if isinstance(tc, str):
-        excel_util.cell_update(sheet, row, col, 'Contents', font=_link_font, link=tc)
+        report_sink.cell_update(sheet, row, col, 'Contents', font=_link_font, link=tc)
         row += 1
 
     # First portion of the About page
@@ -2007,7 +1995,7 @@ def about_page(wb, sheet_i, sheet_name, file_name, version, description, tc=None
         if d is not None:
             buf_l = gen_util.convert_to_list(buf_xlate_d.get(d.get('s', 'default')))
             for buf in buf_l:
-                excel_util.cell_update(sheet, row, col, d['t'] + buf, font=d['f'], align=_align_wrap, link=d.get('l'))
+                report_sink.cell_update(sheet, row, col, d['t'] + buf, font=d['f'], align=_align_wrap, link=d.get('l'))
                 row += 1
         else:
             row += 1
@@ -2018,7 +2006,153 @@ def about_page(wb, sheet_i, sheet_name, file_name, version, description, tc=None
 #                                               #
 #################################################
 
-def _filter_wwn(proj_obj, filter_val, search):
+def _literal_prefix(search_term, search):
+    """Returns the leading characters that every name matching search_term must begin with
+
+    :param search_term: Search term from the "Operand" column of the workbook
+    :type search_term: str
+    :param search: Search type. See brcddb.util.search.match_test()
+    :type search: str
+    :return: Literal prefix. Empty if there isn't one or it can't be determined
+    :rtype: str
+    """
+    if search == 'wild':
+        return re.split(r'[*?\[]', search_term, maxsplit=1)[0]
+    if search in ('regexm', 'regex_m', 'regex-m') and '|' not in search_term:
+        prefix = re.match(r'[\w:\-]*', search_term).group(0)
+        if len(prefix) < len(search_term) and search_term[len(prefix)] in '*?{':
+            prefix = prefix[0:len(prefix)-1]  # A quantifier applies to the last character
+        return prefix
+    return ''
+
+
+class _NameIndex:
+    """Index of objects by name used to resolve the group filters without testing every object for each group row.
+    The names are kept sorted so that the names beginning with a literal prefix, see _literal_prefix(), can be found
+    with a binary search. Only the names beginning with the prefix are then tested with the same tests used in
+    brcddb.util.search.match().
+
+    Args:
+        * obj_l (list): Objects to index
+        * name_m (method): Returns the name, str or None, for an object
+        * ignore_case (bool): If True, matching ignores case. Same as 'i' in brcddb.util.search.match_test()
+
+    Attributes:
+        _name_d (dict): Key is the name, lower case if ignore case. Value is the list of objects with that name
+        _name_l (list): Sorted list of the keys in _name_d
+        _order_d (dict): Key is id(obj). Value is the position in obj_l. Used to return matches in the original order
+        _ignore_case (bool): ignore_case
+    """
+
+    def __init__(self, obj_l, name_m, ignore_case):
+        self._name_d, self._order_d, self._ignore_case = dict(), dict(), ignore_case
+        for i, obj in enumerate(obj_l):
+            name = name_m(obj)
+            if not isinstance(name, str):
+                continue
+            if ignore_case:
+                name = name.lower()
+            if name not in self._name_d:
+                self._name_d[name] = list()
+            self._name_d[name].append(obj)
+            self._order_d[id(obj)] = i
+        self._name_l = sorted(self._name_d.keys())
+
+    def _prefixed(self, prefix):
+        """Returns the names beginning with prefix"""
+        if self._ignore_case:
+            prefix = prefix.lower()
+        rl = list()
+        for i in range(bisect.bisect_left(self._name_l, prefix), len(self._name_l)):
+            if not self._name_l[i].startswith(prefix):
+                break
+            rl.append(self._name_l[i])
+        return rl
+
+    def match(self, search_term, search):
+        """Returns the objects whose name matches search_term. Same as brcddb.util.search.match_test() with
+        dict(k=name, t=search, v=search_term, i=ignore_case).
+
+        :param search_term: Search term from the "Operand" column of the workbook
+        :type search_term: str
+        :param search: Search type: 'exact', 'wild', 'regexm', 'regex_m', 'regex-m', 'regexs', 'regex_s', or 'regex-s'
+        :type search: str
+        :return: Matching objects in the order they were indexed
+        :rtype: list
+        """
+        if not isinstance(search_term, str):
+            brcdapi_log.exception('Invalid search_term type: ' + str(type(search_term)), echo=True)
+            return list()
+        if search == 'exact':
+            return list(self._name_d.get(search_term.lower() if self._ignore_case else search_term, list()))
+
+        name_l = self._prefixed(_literal_prefix(search_term, search))
+        if search == 'wild':
+            # Same as brcddb.util.search.match(). Note that fnmatch.fnmatch() only ignores case on Windows.
+            test_m = fnmatch.fnmatch if self._ignore_case else fnmatch.fnmatchcase
+            name_l = [name for name in name_l if test_m(name, search_term)]
+        elif search in ('regexm', 'regex_m', 'regex-m', 'regexs', 'regex_s', 'regex-s'):
+            regex_obj = re.compile(search_term, re.IGNORECASE) if self._ignore_case else re.compile(search_term)
+            test_m = regex_obj.match if search in ('regexm', 'regex_m', 'regex-m') else regex_obj.search
+            name_l = [name for name in name_l if test_m(name)]
+        else:
+            brcdapi_log.exception('Invalid search type: ' + str(search), echo=True)
+            return list()
+
+        rl = list()
+        for name in name_l:
+            rl.extend(self._name_d[name])
+        return sorted(rl, key=lambda obj: self._order_d[id(obj)])
+
+
+def _obj_key(obj):
+    return obj.r_obj_key()
+
+
+def _port_user_name(obj):
+    return obj.r_get(brcdapi_util.fc_user_name)
+
+
+class _GroupIndex:
+    """Name and WWN indexes for resolving the group filters in groups(). Each index is built by walking the project
+    once, the first time it's needed.
+
+    Args:
+        * proj_obj (brcddb.classes.project.ProjectObj): Project object
+
+    Attributes:
+        _proj_obj (brcddb.classes.project.ProjectObj): proj_obj
+        _index_d (dict): Key is the object type, see brcddb.classes.util.get_simple_class_type(). Value is _NameIndex
+        _port_name_d (dict): Key is the switch WWN. Value is a _NameIndex of the port names in that switch
+    """
+
+    def __init__(self, proj_obj):
+        self._proj_obj = proj_obj
+        self._index_d = dict()
+        self._port_name_d = dict()
+
+    def match(self, obj_type, search_term, search):
+        """Returns the objects of obj_type whose key matches search_term. Case is ignored. See _NameIndex.match()
+
+        :param obj_type: Object type: LoginObj, AliasObj, or ZoneObj
+        :type obj_type: str
+        """
+        name_index = self._index_d.get(obj_type)
+        if name_index is None:
+            name_index = _NameIndex(brcddb_conv.obj_extract(self._proj_obj, obj_type), _obj_key, True)
+            self._index_d[obj_type] = name_index
+        return name_index.match(search_term, search)
+
+    def port_objects_for_name(self, switch_obj, name, search):
+        """Same as brcddb.brcddb_port.port_objects_for_name() for a switch object. See _NameIndex.match()"""
+        name_index = self._port_name_d.get(switch_obj.r_obj_key())
+        if name_index is None:
+            name_index = _NameIndex(switch_obj.r_port_objects(), _port_user_name, False)
+            self._port_name_d[switch_obj.r_obj_key()] = name_index
+        return name_index.match(name, search)
+
+
+def _filter_wwn(proj_obj, filter_val, search, group_index):
     """Returns a list of port objects with logins that have WWNs matching the search criteria
 
     :param proj_obj: Project object
@@ -2027,25 +2161,18 @@ def _filter_wwn(proj_obj, filter_val, search):
     :type filter_val: str, None
     :param search: The search type. Value from the "Operator" column of the workbook
     :type search: str, None
+    :param group_index: Indexes used to resolve filter_val
+    :type group_index: _GroupIndex
     """
-
-    return brcddb_conv.obj_extract(
-        brcddb_search.match_test(
-            brcddb_conv.obj_extract(proj_obj, 'LoginObj'),
-            dict(k='_obj_key', t=search, v=filter_val, i=True)),
-        'PortObj')
+    return brcddb_conv.obj_extract(group_index.match('LoginObj', filter_val, search), 'PortObj')
 
 
-def _filter_alias(proj_obj, filter_val, search):
+def _filter_alias(proj_obj, filter_val, search, group_index):
     """Returns a list of port objects with logins that have aliases matching the search criteria. See _filter_wwn()"""
-    return brcddb_conv.obj_extract(
-        brcddb_search.match_test(brcddb_conv.obj_extract(proj_obj, 'AliasObj'),
-                                 dict(k='_obj_key', t=search, v=filter_val, i=True)),
-        'PortObj'
-    )
+    return brcddb_conv.obj_extract(group_index.match('AliasObj', filter_val, search), 'PortObj')
 
 
-def _filter_switch_port(proj_obj, filter_val, search):
+def _filter_switch_port(proj_obj, filter_val, search, group_index):
     """Returns a list of port objects for the switch(es) and port(s) specified in filter_val. See _filter_wwn()"""
     switch_l, rl = list(), list()
     tl = filter_val.split(';') if isinstance(filter_val, str) else list()
@@ -2063,7 +2190,7 @@ def _filter_switch_port(proj_obj, filter_val, search):
     return rl
 
 
-def _filter_switch_port_name(proj_obj, filter_val, search):
+def _filter_switch_port_name(proj_obj, filter_val, search, group_index):
     """Returns a list of port objects for the switch(es) and port(s) specified in filter_val. See _filter_wwn()"""
     switch_l, rl = list(), list()
     tl = filter_val.split(';') if isinstance(filter_val, str) else list()
@@ -2077,14 +2204,14 @@ def _filter_switch_port_name(proj_obj, filter_val, search):
                 switch_l.append(switch_obj)
         for switch_obj in switch_l:
             for name in tl[1].split(','):
-                rl.extend(brcddb_port.port_objects_for_name(switch_obj, name, search=search))
+                rl.extend(group_index.port_objects_for_name(switch_obj, name, search))
     else:
         brcdapi_log.log('**ERROR** Missing port in ' + str(filter_val), echo=True)
 
     return rl
 
 
-def _filter_isl(proj_obj, filter_val, search):
+def _filter_isl(proj_obj, filter_val, search, group_index):
     """Returns a dictionary whose key is the ISL group name (switch_x_to_switch_y). The value is a list of port objects
     associated with the ISLs for the pairs. See _filter_wwn()"""
     rd = dict()
@@ -2116,14 +2243,9 @@ def _filter_isl(proj_obj, filter_val, search):
     return rd
 
 
-def _filter_zone(proj_obj, filter_val, search):
-    """Returns a list of alias objects in proj_obj. See _filter_wwn()"""
-    return brcddb_conv.obj_extract(
-        brcddb_search.match_test(
-            brcddb_conv.obj_extract(proj_obj, 'ZoneObj'),
-            dict(k='_obj_key', t=search, v=filter_val, i=True)),
-        'PortObj'
-    )
+def _filter_zone(proj_obj, filter_val, search, group_index):
+    """Returns a list of port objects for the zones matching the search criteria. See _filter_wwn()"""
+    return brcddb_conv.obj_extract(group_index.match('ZoneObj', filter_val, search), 'PortObj')
 
 
 # Valid group filters for processing the groups workbook.
@@ -2164,7 +2286,7 @@ def groups(proj_obj, group_file):
 
     el, group_l, ungrouped_initiator_l, ungrouped_target_l = list(), list(), list(), list()
     grouped_d, group_d = dict(), collections.OrderedDict()
-    previous_group_name = None
+    previous_group_name, group_index = None, _GroupIndex(proj_obj)
 
     # Read the group definition file.
     if group_file is not None:  # Group group_file
@@ -2242,7 +2364,7 @@ def groups(proj_obj, group_file):
             operand = row_l[col_d['Operand']]
             if isinstance(operand, str):
                 operand = operand.strip()
-            processed_row = _group_filter_d[g_filter](proj_obj, operand, row_l[col_d['Operator']])
+            processed_row = _group_filter_d[g_filter](proj_obj, operand, row_l[col_d['Operator']], group_index)
             if isinstance(processed_row, list):
                 sub_group_d = group_d.get(group_name)
                 if sub_group_d is None:
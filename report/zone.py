@@ -61,22 +61,28 @@ Creates zone database pages to be added to an Excel Workbook
 +-----------+---------------+---------------------------------------------------------------------------------------+
 | 4.1.0     | 20 Feb 2026   | Updated copyright notice.                                                             |
 +-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.1     | 18 Oct 2026   | Use r_has_pmember()                                                                   |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.2     | 18 Oct 2026   | Added Merge Group column to zone_page()                                               |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.3     | 18 Oct 2026   | Write through brcddb.report.sink. Rows are flushed as they are completed.             |
++-----------+---------------+---------------------------------------------------------------------------------------+
 """
 __author__ = 'Jack Consoli'
 __copyright__ = 'Copyright 2024, 2025, 2026 Jack Consoli'
-__date__ = '20 Feb 2026'
+__date__ = '18 Oct 2026'
 __license__ = 'Apache License, Version 2.0'
 __email__ = 'jack_consoli@yahoo.com'
 __maintainer__ = 'Jack Consoli'
 __status__ = 'Released'
-__version__ = '4.1.0'
+__version__ = '4.1.3'
 
 import collections
 import openpyxl.utils.cell as xl
 import brcdapi.log as brcdapi_log
 import brcdapi.gen_util as gen_util
 import brcdapi.util as brcdapi_util
-import brcdapi.excel_util as excel_util
+import brcddb.report.sink as report_sink
 import brcdapi.excel_fonts as excel_fonts
 import brcddb.brcddb_fabric as brcddb_fabric
 import brcddb.brcddb_switch as brcddb_switch
@@ -157,6 +163,11 @@ def _zone_cfg_case(obj):
     return '\n'.join(obj.r_zone_configurations())
 
 
+def _zone_merge_group_case(obj):
+    group_id = obj.r_merge_group()
+    return '' if group_id is None else group_id
+
+
 def _zone_member_case(obj):
     return len(obj.r_members()) + len(obj.r_pmembers())
 
@@ -187,7 +198,7 @@ def _mem_comment_case(obj, mem, wwn, port_obj, obj_l=None):
 
 
 def _mem_principal_case(obj, mem, wwn, port_obj, obj_l=None):
-    return '\u221A' if mem in obj.r_pmembers() else ''
+    return '\u221A' if obj.r_has_pmember(mem) else ''
 
 
 def _mem_member_wwn_case(obj, mem, wwn, port_obj, obj_l=None):
@@ -357,6 +368,7 @@ _zone_hdr = collections.OrderedDict({
     'Target Driven': dict(c=5, ha=_align_wrap_vc, a=_align_wrap_c, z=_zone_target_case, m=_null_case),
     'Principal': dict(c=5, ha=_align_wrap_vc, a=_align_wrap_c, z=_null_case, m=_mem_principal_case),
     'Configurations': dict(c=22, z=_zone_cfg_case, m=_null_case),
+    'Merge Group': dict(c=7, ha=_align_wrap_vc, a=_align_wrap_c, z=_zone_merge_group_case, m=_null_case),
     'Member': dict(c=48, z=_zone_member_case, m=_mem_member_case),
     'Member WWN': dict(c=22, z=_zone_member_wwn_case, m=_mem_member_wwn_case),
     'Switch': dict(c=22, z=_null_case, m=_mem_switch_case),
@@ -450,17 +462,17 @@ def zone_page(fab_obj, tc, wb, sheet_name, sheet_i, sheet_title):
 
     # Create the worksheet with a title
     sheet = wb.create_sheet(index=0 if sheet_i is None else sheet_i, title=sheet_name)
-    sheet.page_setup.paperSize = sheet.PAPERSIZE_LETTER
-    sheet.page_setup.orientation = sheet.ORIENTATION_LANDSCAPE
+    sheet.page_setup.paperSize = report_sink.PAPERSIZE_LETTER
+    sheet.page_setup.orientation = report_sink.ORIENTATION_LANDSCAPE
     row = col = 1
     if isinstance(tc, str):
-        excel_util.cell_update(sheet, row, col, 'Contents', font=_link_font, link=tc)
+        report_sink.cell_update(sheet, row, col, 'Contents', font=_link_font, link=tc)
         col += 1
-    excel_util.cell_update(sheet, row, col, sheet_title, font=_hdr1_font)
+    report_sink.cell_update(sheet, row, col, sheet_title, font=_hdr1_font)
 
     # Add the fabric link
     row, col = row + 1, 1
-    excel_util.cell_update(
+    report_sink.cell_update(
         sheet,
         row,
         col,
@@ -469,14 +481,14 @@ def zone_page(fab_obj, tc, wb, sheet_name, sheet_i, sheet_title):
         border=_border_thin,
         link=fab_obj.r_get('report_app/hyperlink/fab')
     )
-    sheet.merge_cells(start_row=row, start_column=1, end_row=row, end_column=2)
+    report_sink.merge_cells(sheet, start_row=row, start_column=1, end_row=row, end_column=2)
 
     # Add the headers, set the column widths, and freeze the header row.
     row += 1
-    sheet.freeze_panes = sheet['A4']
+    sheet.freeze_panes = 'A4'
     for k in _zone_hdr:
         sheet.column_dimensions[xl.get_column_letter(col)].width = _zone_hdr[k]['c']
-        excel_util.cell_update(sheet, row, col, k, font=_hdr2_font, align=_zone_hdr[k]['ha'], border=_border_thin)
+        report_sink.cell_update(sheet, row, col, k, font=_hdr2_font, align=_zone_hdr[k]['ha'], border=_border_thin)
         col += 1
 
     # Fill out all the zoning information
@@ -493,7 +505,7 @@ def zone_page(fab_obj, tc, wb, sheet_name, sheet_i, sheet_title):
         # The zone information
         for k in _zone_hdr:
             font = report_utils.font_type(zone_obj.r_alert_objects()) if k == 'Comments' else _bold_font
-            excel_util.cell_update(
+            report_sink.cell_update(
                 sheet,
                 row,
                 col,
@@ -536,7 +548,7 @@ def zone_page(fab_obj, tc, wb, sheet_name, sheet_i, sheet_title):
                         font = report_utils.font_type(alerts)
                     else:
                         font = _std_font
-                    excel_util.cell_update(
+                    report_sink.cell_update(
                         sheet,
                         row,
                         col,
@@ -547,6 +559,7 @@ def zone_page(fab_obj, tc, wb, sheet_name, sheet_i, sheet_title):
                     )
                     col += 1
                 row, col = row + 1, 1
+        report_sink.flush(sheet, row)
 
 
 def zone_clean_page(fab_obj, tc, wb, sheet_name, sheet_i, sheet_title):
@@ -615,7 +628,7 @@ def zone_clean_page(fab_obj, tc, wb, sheet_name, sheet_i, sheet_title):
     brcddb_zone.add_zone_worksheet(wb, sheet_name, content_l, sheet_i)
 
     # Insert the fabric link
-    excel_util.cell_update(
+    report_sink.cell_update(
         wb[sheet_name],
         2,  # row
         2,  # column
@@ -709,19 +722,19 @@ def alias_page(obj, tc, wb, sheet_name, sheet_i, sheet_title):
 
     # Create the worksheet. Row 1: Add the table of contents link, and add the sheet title.
     sheet = wb.create_sheet(index=0 if sheet_i is None else sheet_i, title=sheet_name)
-    sheet.page_setup.paperSize = sheet.PAPERSIZE_LETTER
-    sheet.page_setup.orientation = sheet.ORIENTATION_LANDSCAPE
+    sheet.page_setup.paperSize = report_sink.PAPERSIZE_LETTER
+    sheet.page_setup.orientation = report_sink.ORIENTATION_LANDSCAPE
     row = col = 1
     if isinstance(tc, str):
-        excel_util.cell_update(sheet, row, col, 'Contents', font=_link_font, link=tc)
+        report_sink.cell_update(sheet, row, col, 'Contents', font=_link_font, link=tc)
         col += 1
-    excel_util.cell_update(sheet, row, col, sheet_title, font=_hdr1_font, border=_border_thin)
+    report_sink.cell_update(sheet, row, col, sheet_title, font=_hdr1_font, border=_border_thin)
     row, col = row + 1, 1
 
     # Row 2: Add the fabric link
     obj_type_fab = False
     if str(brcddb_class_util.get_simple_class_type(obj)) == 'FabricObj':
-        excel_util.cell_update(
+        report_sink.cell_update(
             sheet,
             row,
             col,
@@ -730,15 +743,15 @@ def alias_page(obj, tc, wb, sheet_name, sheet_i, sheet_title):
             border=_border_thin,
             link=obj.r_get('report_app/hyperlink/fab')
         )
-        sheet.merge_cells(start_row=row, start_column=1, end_row=row, end_column=2)
+        report_sink.merge_cells(sheet, start_row=row, start_column=1, end_row=row, end_column=2)
         obj_type_fab = True
     row += 1
 
     # Freeze the row at the header row and add the header
-    sheet.freeze_panes = sheet['A4']
+    sheet.freeze_panes = 'A4'
     for k in _alias_hdr:
         sheet.column_dimensions[xl.get_column_letter(col)].width = _alias_hdr[k]['c']
-        excel_util.cell_update(sheet, row, col, k, font=_hdr2_font, align=_align_wrap, border=_border_thin)
+        report_sink.cell_update(sheet, row, col, k, font=_hdr2_font, align=_align_wrap, border=_border_thin)
         col += 1
 
     # Fill out the alias information
@@ -755,8 +768,8 @@ def alias_page(obj, tc, wb, sheet_name, sheet_i, sheet_title):
 
         for k in _alias_hdr:
             font = report_utils.font_type(alias_obj.r_alert_objects()) if k == 'Comments' else _std_font
-            excel_util.cell_update(sheet, row, col,  _alias_hdr[k]['v'](alias_obj, mem), font=font, align=_align_wrap,
-                                   border=_border_thin)
+            report_sink.cell_update(sheet, row, col,  _alias_hdr[k]['v'](alias_obj, mem), font=font, align=_align_wrap,
+                                    border=_border_thin)
             col += 1
 
         # Usually just one member per alias, but just in case...
@@ -764,9 +777,10 @@ def alias_page(obj, tc, wb, sheet_name, sheet_i, sheet_title):
             mem = mem_list.pop(0)
             row, col = row+1, 1
             for k in _alias_hdr:
-                excel_util.cell_update(sheet, row, col, _alias_hdr[k]['m'](alias_obj, mem), font=_std_font,
-                                       align=_align_wrap, border=_border_thin)
+                report_sink.cell_update(sheet, row, col, _alias_hdr[k]['m'](alias_obj, mem), font=_std_font,
+                                        align=_align_wrap, border=_border_thin)
                 col += 1
+        report_sink.flush(sheet, row + 1)
 
 
 ##################################################################
@@ -895,17 +909,17 @@ def _common_zone_page(fab_obj, tc, wb, sheet_name, sheet_i, sheet_title, hdr):
 
     # Create the worksheet with a title
     sheet = wb.create_sheet(index=0 if sheet_i is None else sheet_i, title=sheet_name)
-    sheet.page_setup.paperSize = sheet.PAPERSIZE_LETTER
-    sheet.page_setup.orientation = sheet.ORIENTATION_LANDSCAPE
+    sheet.page_setup.paperSize = report_sink.PAPERSIZE_LETTER
+    sheet.page_setup.orientation = report_sink.ORIENTATION_LANDSCAPE
     row = col = 1
     if isinstance(tc, str):
-        excel_util.cell_update(sheet, row, col, 'Contents', font=_link_font, align=_align_wrap, link=tc)
+        report_sink.cell_update(sheet, row, col, 'Contents', font=_link_font, align=_align_wrap, link=tc)
         col += 1
-    excel_util.cell_update(sheet, row, col, sheet_title, font=_hdr1_font)
+    report_sink.cell_update(sheet, row, col, sheet_title, font=_hdr1_font)
 
     # Add a link to the fabric page
     row, col = row + 1, 1
-    excel_util.cell_update(
+    report_sink.cell_update(
         sheet,
         row,
         col,
@@ -914,14 +928,14 @@ def _common_zone_page(fab_obj, tc, wb, sheet_name, sheet_i, sheet_title, hdr):
         border=_border_thin,
         link=fab_obj.r_get('report_app/hyperlink/fab')
     )
-    sheet.merge_cells(start_row=row, start_column=1, end_row=row, end_column=2)
+    report_sink.merge_cells(sheet, start_row=row, start_column=1, end_row=row, end_column=2)
 
     # Add the headers, freeze the header row, and set the column widths
     row += 1
-    sheet.freeze_panes = sheet['A4']
+    sheet.freeze_panes = 'A4'
     for k, d in hdr.items():
         sheet.column_dimensions[xl.get_column_letter(col)].width = d['c']
-        excel_util.cell_update(sheet, row, col, k, font=_hdr2_font, align=_align_wrap, border=_border_thin)
+        report_sink.cell_update(sheet, row, col, k, font=_hdr2_font, align=_align_wrap, border=_border_thin)
         col += 1
     row, col = row + 1, 1
 
@@ -1000,7 +1014,7 @@ def target_zone_page(fab_obj, tc, wb, sheet_name, sheet_i, sheet_title):
             font = report_utils.font_type(_filter_alerts([t_login_obj, t_login_obj.r_port_obj()])) if k == 'Comments' \
                 else _bold_font
             buf = d['ha'](wwn, t_login_obj, t_login_obj.r_port_obj(), list(), zoned_to_d)
-            excel_util.cell_update(sheet, row, col, buf, font=font, align=_align_wrap, border=_border_thin)
+            report_sink.cell_update(sheet, row, col, buf, font=font, align=_align_wrap, border=_border_thin)
             col += 1
 
         # Everything zoned to this target that is not a target (in most cases, these are servers)
@@ -1013,7 +1027,7 @@ def target_zone_page(fab_obj, tc, wb, sheet_name, sheet_i, sheet_title):
                     else _std_font
                 buf = '' if k == 'Zoned Target' else \
                     _target_zone_hdr[k]['a'](wwn, login_obj, port_obj, zone_l, zoned_to_d)
-                excel_util.cell_update(sheet, row, col, buf, font=font, align=_align_wrap, border=_border_thin)
+                report_sink.cell_update(sheet, row, col, buf, font=font, align=_align_wrap, border=_border_thin)
                 col += 1
 
         # Add any targets zoned to this target
@@ -1026,10 +1040,11 @@ def target_zone_page(fab_obj, tc, wb, sheet_name, sheet_i, sheet_title):
                     else _std_font
                 buf = '' if k == 'Non-Target' else \
                     _target_zone_hdr[k]['a'](wwn, login_obj, port_obj, zone_l, zoned_to_d)
-                excel_util.cell_update(sheet, row, col, buf, font=font, align=_align_wrap, border=_border_thin)
+                report_sink.cell_update(sheet, row, col, buf, font=font, align=_align_wrap, border=_border_thin)
                 col += 1
 
         row += 1
+        report_sink.flush(sheet, row)
 
 
 def non_target_zone_page(fab_obj, tc, wb, sheet_name, sheet_i, sheet_title):
@@ -1060,7 +1075,7 @@ def non_target_zone_page(fab_obj, tc, wb, sheet_name, sheet_i, sheet_title):
             font = report_utils.font_type(_filter_alerts([s_login_obj, s_login_obj.r_port_obj()])) if k == 'Comments' \
                 else _bold_font
             buf = d['ha'](wwn, s_login_obj, s_login_obj.r_port_obj(), list(), zoned_to_d)
-            excel_util.cell_update(sheet, row, col, buf, font=font, align=_align_wrap, border=_border_thin)
+            report_sink.cell_update(sheet, row, col, buf, font=font, align=_align_wrap, border=_border_thin)
             col += 1
 
         # Fill in all targets zoned to this initiator
@@ -1073,7 +1088,7 @@ def non_target_zone_page(fab_obj, tc, wb, sheet_name, sheet_i, sheet_title):
                     else _std_font
                 buf = '' if k == 'Zoned Server' else \
                     _server_zone_hdr[k]['a'](wwn, login_obj, port_obj, zone_l, zoned_to_d)
-                excel_util.cell_update(sheet, row, col, buf, font=font, align=_align_wrap, border=_border_thin)
+                report_sink.cell_update(sheet, row, col, buf, font=font, align=_align_wrap, border=_border_thin)
                 col += 1
 
         # Add any initiators zoned to this initiator
@@ -1086,10 +1101,11 @@ def non_target_zone_page(fab_obj, tc, wb, sheet_name, sheet_i, sheet_title):
                     else _std_font
                 buf = '' if k == 'Target' else \
                     _server_zone_hdr[k]['a'](wwn, login_obj, port_obj, zone_l, zoned_to_d)
-                excel_util.cell_update(sheet, row, col, buf, font=font, align=_align_wrap, border=_border_thin)
+                report_sink.cell_update(sheet, row, col, buf, font=font, align=_align_wrap, border=_border_thin)
                 col += 1
 
         row += 1
+        report_sink.flush(sheet, row)
 
 
 def group_zone_page(proj_obj, tc, wb, sheet_name, sheet_i, sheet_title):
@@ -1103,26 +1119,26 @@ def group_zone_page(proj_obj, tc, wb, sheet_name, sheet_i, sheet_title):
 
     # Create the worksheet, add the headers, and set up the column widths
     sheet = wb.create_sheet(index=0 if sheet_i is None else sheet_i, title=sheet_name)
-    sheet.page_setup.paperSize = sheet.PAPERSIZE_LETTER
-    sheet.page_setup.orientation = sheet.ORIENTATION_LANDSCAPE
+    sheet.page_setup.paperSize = report_sink.PAPERSIZE_LETTER
+    sheet.page_setup.orientation = report_sink.ORIENTATION_LANDSCAPE
     row = col = 1
     wwn = ''
     if isinstance(tc, str):
-        excel_util.cell_update(sheet, row, col, 'Contents', font=_link_font, align=_align_wrap, link=tc)
+        report_sink.cell_update(sheet, row, col, 'Contents', font=_link_font, align=_align_wrap, link=tc)
         col += 1
-    excel_util.cell_update(sheet, row, col, sheet_title, font=_hdr1_font)
-    sheet.merge_cells(start_row=row, start_column=2, end_row=row, end_column=len(_zone_group_hdr_d))
+    report_sink.cell_update(sheet, row, col, sheet_title, font=_hdr1_font)
+    report_sink.merge_cells(sheet, start_row=row, start_column=2, end_row=row, end_column=len(_zone_group_hdr_d))
     row, col = row+1, 2
-    sheet.merge_cells(start_row=row, start_column=col, end_row=row, end_column=len(_zone_group_hdr_d))
+    report_sink.merge_cells(sheet, start_row=row, start_column=col, end_row=row, end_column=len(_zone_group_hdr_d))
     buf = 'Ports in the group are highlighted in bold font and followed by all that is online and zoned to that port. '\
           'Groups for mainframes are auto-generated based on RNID data. The "zoned to" ports are determined by the '\
           'IOCP instead of fabric zoning. If IOCPs were not supplied, there won\'t be any "zoned to" ports to display'
-    excel_util.cell_update(sheet, row, col, buf, font=_std_font, align=_align_wrap, border=_border_thin)
+    report_sink.cell_update(sheet, row, col, buf, font=_std_font, align=_align_wrap, border=_border_thin)
     row, col = row + 1, 1
-    sheet.freeze_panes = sheet['A4']
+    sheet.freeze_panes = 'A4'
     for k, d in _zone_group_hdr_d.items():
         sheet.column_dimensions[xl.get_column_letter(col)].width = d['c']
-        excel_util.cell_update(sheet, row, col, k, font=_hdr2_font, align=_align_wrap, border=_border_thin)
+        report_sink.cell_update(sheet, row, col, k, font=_hdr2_font, align=_align_wrap, border=_border_thin)
         col += 1
     row += 2
 
@@ -1140,8 +1156,8 @@ def group_zone_page(proj_obj, tc, wb, sheet_name, sheet_i, sheet_title):
         col = 1
 
         # Add the group name to the worksheet
-        excel_util.cell_update(sheet, row, col, group_name, fill=_lightblue_fill, font=_bold_font, border=_border_thin)
-        sheet.merge_cells(start_row=row, start_column=1, end_row=row, end_column=len(_zone_group_hdr_d))
+        report_sink.cell_update(sheet, row, col, group_name, fill=_lightblue_fill, font=_bold_font, border=_border_thin)
+        report_sink.merge_cells(sheet, start_row=row, start_column=1, end_row=row, end_column=len(_zone_group_hdr_d))
         row += 1
 
         # A common use for groups is to define storage enclosures. It's also common to put all the storage in the same
@@ -1173,15 +1189,15 @@ def group_zone_page(proj_obj, tc, wb, sheet_name, sheet_i, sheet_title):
                 wwn = None if login_obj is None else login_obj.r_obj_key()
                 for d in hdr_d.values():
                     buf, link = d['m'](login_obj, None, wwn, port_obj)
-                    excel_util.cell_update(sheet,
-                                           row,
-                                           col,
-                                           buf,
-                                           font=_bold_font if link is None else _link_font,
-                                           border=_border_thin,
-                                           align=d.get('a', _align_wrap),
-                                           link=link,
-                                           number_format=d.get('f'))
+                    report_sink.cell_update(sheet,
+                                            row,
+                                            col,
+                                            buf,
+                                            font=_bold_font if link is None else _link_font,
+                                            border=_border_thin,
+                                            align=d.get('a', _align_wrap),
+                                            link=link,
+                                            number_format=d.get('f'))
                     col += 1
                 row += 1
 
@@ -1191,15 +1207,15 @@ def group_zone_page(proj_obj, tc, wb, sheet_name, sheet_i, sheet_title):
                     col, wwn = 1, login_obj.r_obj_key()
                     for d in add_hdr_d.values():
                         buf, link = d['m'](login_obj, None, wwn, port_obj)
-                        excel_util.cell_update(sheet,
-                                               row,
-                                               col,
-                                               buf,
-                                               font=_bold_font if link is None else _link_font,
-                                               border=_border_thin,
-                                               align=d.get('a', _align_wrap),
-                                               link=link,
-                                               number_format=d.get('f'))
+                        report_sink.cell_update(sheet,
+                                                row,
+                                                col,
+                                                buf,
+                                                font=_bold_font if link is None else _link_font,
+                                                border=_border_thin,
+                                                align=d.get('a', _align_wrap),
+                                                link=link,
+                                                number_format=d.get('f'))
                         col += 1
                     row += 1
             except IndexError:
@@ -1220,15 +1236,15 @@ def group_zone_page(proj_obj, tc, wb, sheet_name, sheet_i, sheet_title):
                         except (IndexError, TypeError):
                             brcdapi_log.exception('No login data for CHPID port.', echo=True)
                         buf, link = d['m'](chpid_port_obj, None, lwwn, chpid_port_obj)
-                        excel_util.cell_update(sheet,
-                                               row,
-                                               col,
-                                               buf,
-                                               font=_std_font if link is None else _link_font,
-                                               border=_border_thin,
-                                               align=d.get('a', _align_wrap),
-                                               link=link,
-                                               number_format=d.get('f'))
+                        report_sink.cell_update(sheet,
+                                                row,
+                                                col,
+                                                buf,
+                                                font=_std_font if link is None else _link_font,
+                                                border=_border_thin,
+                                                align=d.get('a', _align_wrap),
+                                                link=link,
+                                                number_format=d.get('f'))
                         col += 1
                     row += 1
 
@@ -1242,26 +1258,27 @@ def group_zone_page(proj_obj, tc, wb, sheet_name, sheet_i, sheet_title):
                     col = 1
                     for d in sub_hdr_d.values():
                         buf, link = d['m'](lz_obj, None, lwwn, lz_obj.r_port_obj(), zl)
-                        excel_util.cell_update(sheet,
-                                               row,
-                                               col,
-                                               buf,
-                                               font=_std_font if link is None else _link_font,
-                                               border=_border_thin,
-                                               align=d.get('a', _align_wrap),
-                                               link=link,
-                                               number_format=d.get('f'))
+                        report_sink.cell_update(sheet,
+                                                row,
+                                                col,
+                                                buf,
+                                                font=_std_font if link is None else _link_font,
+                                                border=_border_thin,
+                                                align=d.get('a', _align_wrap),
+                                                link=link,
+                                                number_format=d.get('f'))
                         col += 1
                     row += 1
 
         row += 1
+        report_sink.flush(sheet, row)
 
     missing_cpu_l = zone_group_d.get(MISSING_CPU, dict()).get('port_obj_l', list())
     if isinstance(missing_cpu_l, list) and len(missing_cpu_l) > 0:
         row, col = row + 1, 1
         buf = 'Missing IOCPs for the following CECs:'
-        excel_util.cell_update(sheet, row, col, buf, fill=_lightblue_fill, font=_bold_font, border=_border_thin)
-        sheet.merge_cells(start_row=row, start_column=1, end_row=row, end_column=len(_zone_group_hdr_d))
+        report_sink.cell_update(sheet, row, col, buf, fill=_lightblue_fill, font=_bold_font, border=_border_thin)
+        report_sink.merge_cells(sheet, start_row=row, start_column=1, end_row=row, end_column=len(_zone_group_hdr_d))
         row += 1
         for port_obj in missing_cpu_l:
             rnid_d = port_obj.r_get('rnid')
@@ -1277,6 +1294,12 @@ def group_zone_page(proj_obj, tc, wb, sheet_name, sheet_i, sheet_title):
                 'First found port: ' + brcddb_switch.best_switch_name(port_obj.r_switch_obj()) + port_obj.r_obj_key()
             ]
             buf = ', '.join(buf_l)
-            excel_util.cell_update(sheet, row, col, buf, font=_std_font, border=_border_thin, align=_align_wrap)
-            sheet.merge_cells(start_row=row, start_column=1, end_row=row, end_column=len(_zone_group_hdr_d))
+            report_sink.cell_update(sheet, row, col, buf, font=_std_font, border=_border_thin, align=_align_wrap)
+            report_sink.merge_cells(
+                sheet,
+                start_row=row,
+                start_column=1,
+                end_row=row,
+                end_column=len(_zone_group_hdr_d)
+            )
             row += 1
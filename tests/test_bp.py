@@ -0,0 +1,74 @@
+"""
+Copyright 2023, 2024, 2025, 2026 Jack Consoli.  All rights reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+the License. You may also obtain a copy of the License at https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the specific
+language governing permissions and limitations under the License.
+
+**Description**
+
+Tests for brcddb.brcddb_bp
+"""
+import unittest
+import unittest.mock
+import brcddb.app_data.alert_tables as al
+import brcddb.classes.project as project_class
+import brcddb.brcddb_bp as brcddb_bp
+
+_SWITCH_A = '10:00:00:05:1e:00:00:0a'
+_SWITCH_B = '10:00:00:05:1e:00:00:0b'
+
+
+def _fabric(links_l):
+    """Returns switch A from a fabric with two switches connected by one trunk group per entry in links_l
+
+    :param links_l: Number of ISLs in each trunk group
+    :type links_l: list
+    :rtype: brcddb.classes.switch.SwitchObj
+    """
+    proj_obj = project_class.ProjectObj('isl', '18 Oct 2026')
+    fab_obj = proj_obj.s_add_fabric(_SWITCH_A)
+    trunk_l, index = list(), 0
+    for wwn in (_SWITCH_A, _SWITCH_B):
+        fab_obj.s_add_switch(wwn)
+    switch_a, switch_b = proj_obj.r_switch_obj(_SWITCH_A), proj_obj.r_switch_obj(_SWITCH_B)
+    for group, links in enumerate(links_l):
+        for i in range(0, links):
+            for switch_obj in (switch_a, switch_b):
+                port_obj = switch_obj.s_add_port('0/' + str(index))
+                port_obj.s_new_key('fibrechannel', {'name': '0/' + str(index), 'index': index})
+            trunk_l.append({'group': group, 'source-port': index, 'destination-port': index,
+                            'neighbor-wwn': _SWITCH_B, 'master': i == 0})
+            index += 1
+    switch_a.s_new_key('brocade-fibrechannel-trunk', {'trunk': trunk_l})
+    return switch_a
+
+
+class TestIslNumLinks(unittest.TestCase):
+    """SWITCH_ISL_IMBALANCE compares the number of ISLs in each trunk group between two switches
+
+    Prior to version 4.0.8 of brcddb_bp, each ISL (a source and destination port pair) was counted instead of the ISLs
+    in each trunk group so this alert was never raised.
+    """
+
+    def _alert_nums(self, links_l):
+        switch_obj = _fabric(links_l)
+        with unittest.mock.patch.object(brcddb_bp, '_alert_tbl_d', al.AlertTable.alertTbl):
+            brcddb_bp._isl_num_links(al.ALERT_NUM.SWITCH_ISL_IMBALANCE, [switch_obj], None)
+        return switch_obj.r_alert_nums()
+
+    def test_balanced(self):
+        self.assertNotIn(al.ALERT_NUM.SWITCH_ISL_IMBALANCE, self._alert_nums([2, 2]))
+
+    def test_single_trunk(self):
+        self.assertNotIn(al.ALERT_NUM.SWITCH_ISL_IMBALANCE, self._alert_nums([3]))
+
+    def test_imbalanced(self):
+        self.assertIn(al.ALERT_NUM.SWITCH_ISL_IMBALANCE, self._alert_nums([2, 1]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+"""
+Copyright 2023, 2024, 2025, 2026 Jack Consoli.  All rights reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+the License. You may also obtain a copy of the License at https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the specific
+language governing permissions and limitations under the License.
+
+**Description**
+
+Tests for downsample() in brcddb.report.graph
+"""
+import math
+import unittest
+import brcddb.report.graph as report_graph
+
+_NUM_SAMPLES = 1000
+
+
+def _series(num_samples=_NUM_SAMPLES):
+    """Returns the X values and two series. The first has a peak and the second a trough.
+
+    :param num_samples: Number of samples
+    :type num_samples: int
+    :rtype: tuple
+    """
+    x_l = list(range(0, num_samples))
+    y0_l = [math.sin(i / 10) for i in x_l]
+    y1_l = [math.cos(i / 10) for i in x_l]
+    y0_l[num_samples // 3] = 1000
+    y1_l[2 * num_samples // 3] = -1000
+    return x_l, [y0_l, y1_l]
+
+
+class TestDownsample(unittest.TestCase):
+    """Point cap, first and last samples, and peaks for each downsampling method"""
+
+    def _check(self, method, num_points, max_points=None):
+        x_l, y_ll = _series()
+        rx_l, ry_ll = report_graph.downsample(x_l, y_ll, num_points, method=method)
+        self.assertLessEqual(len(rx_l), num_points if max_points is None else max_points)
+        self.assertEqual(len(ry_ll), len(y_ll))
+        for ry_l in ry_ll:
+            self.assertEqual(len(ry_l), len(rx_l))
+        self.assertEqual(rx_l[0], x_l[0])
+        if method != 'mean':  # mean uses the first X value in each bucket
+            self.assertEqual(rx_l[-1], x_l[-1])
+            self.assertEqual(rx_l, sorted(set(rx_l)))
+            for i in range(0, len(y_ll)):
+                self.assertEqual(ry_ll[i], [y_ll[i][x] for x in rx_l])
+        return rx_l, ry_ll
+
+    def test_not_downsampled(self):
+        x_l, y_ll = _series(10)
+        for method in ('lttb', 'minmax', 'mean'):
+            self.assertEqual(report_graph.downsample(x_l, y_ll, 10, method=method), (x_l, y_ll))
+
+    def test_lttb(self):
+        for num_points in (3, 10, 100):
+            self._check('lttb', num_points)
+
+    def test_minmax(self):
+        for num_points in (6, 11, 100):
+            rx_l, ry_ll = self._check('minmax', num_points)
+            self.assertIn(1000, ry_ll[0])
+            self.assertIn(-1000, ry_ll[1])
+
+    def test_minmax_min_points(self):
+        """The peaks of every series are kept when fewer than 2 points per series are requested"""
+        rx_l, ry_ll = self._check('minmax', 4, max_points=6)
+        self.assertIn(1000, ry_ll[0])
+        self.assertIn(-1000, ry_ll[1])
+
+    def test_mean(self):
+        y_l = _series()[1][0]
+        for num_points in (3, 10, 100):
+            rx_l, ry_ll = self._check('mean', num_points)
+            bucket_size = math.ceil(_NUM_SAMPLES / num_points)
+            self.assertEqual(rx_l[1], bucket_size)
+            self.assertAlmostEqual(ry_ll[0][0], sum(y_l[0:bucket_size]) / bucket_size)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+"""
+Copyright 2023, 2024, 2025, 2026 Jack Consoli.  All rights reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+the License. You may also obtain a copy of the License at https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the specific
+language governing permissions and limitations under the License.
+
+**Description**
+
+Tests for brcddb.util.parse_cli
+"""
+import os
+import tempfile
+import unittest
+import brcddb.classes.project as project_class
+import brcddb.util.copy as brcddb_copy
+import brcddb.util.parse_cli as parse_cli
+
+_CHASSIS_A = '10:00:00:05:1e:00:00:0a'
+_CHASSIS_B = '10:00:00:05:1e:00:00:0b'
+_SWITCH_WWN = '10:00:00:05:1e:00:00:10'
+_FAB_WWN = _SWITCH_WWN  # The fabric key is the WWN of the principal switch
+
+
+def _ss_result(file, chassis_wwn, switch_name, port_l):
+    """Returns a result as returned from _ss_worker() for a supportshow with one chassis, switch, and fabric
+
+    :param file: Supportshow file name
+    :type file: str
+    :param chassis_wwn: Chassis WWN
+    :type chassis_wwn: str
+    :param switch_name: Switch name
+    :type switch_name: str
+    :param port_l: Port names to add to the switch
+    :type port_l: list
+    :rtype: dict
+    """
+    proj_obj = project_class.ProjectObj(file, '')
+    proj_obj.s_add_fabric(_FAB_WWN).s_add_switch(_SWITCH_WWN)
+    proj_obj.s_add_chassis(chassis_wwn).s_add_switch(_SWITCH_WWN)
+    switch_obj = proj_obj.s_add_switch(_SWITCH_WWN)
+    switch_obj.s_new_key('switch-name', switch_name)
+    for port in port_l:
+        switch_obj.s_add_port(port)
+    plain_d = dict()
+    brcddb_copy.brcddb_to_plain_copy(proj_obj, plain_d)
+    return dict(file=file, time=0, chassis=chassis_wwn, err_msg=None,
+                plain_d={k: plain_d[k] for k in parse_cli._ss_merge_keys if k in plain_d})
+
+
+_SS_L = [
+    '',
+    '  /fabos/link_bin/sfpshow -all :',
+    'Port 0:',
+    'SS CMD END',
+    'CURRENT CONTEXT -- 0 , 128',
+    '',
+    'switchshow',
+    'switchName:\tsw1  ',
+    'SS CMD END',
+    'SS CMD END',
+]
+
+
+class TestSsSections(unittest.TestCase):
+    """Splitting supportshow output into command sections"""
+
+    def test_sections(self):
+        self.assertEqual(list(parse_cli.ss_sections(_SS_L)),
+                         [('sfpshow -all', None, ['  /fabos/link_bin/sfpshow -all :', 'Port 0:']),
+                          ('switchshow', 128, ['switchshow', 'switchName:\tsw1'])])
+
+    def test_file(self):
+        """A file name is read one line at a time with the same result"""
+        fd, inf = tempfile.mkstemp(suffix='.txt')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write('\n'.join(_SS_L + ['nsshow']) + '\n')
+            section_l = list(parse_cli.ss_sections(inf))
+        finally:
+            os.remove(inf)
+        self.assertEqual([cmd for cmd, fid, content in section_l], ['sfpshow -all', 'switchshow', 'nsshow'])
+        self.assertEqual(section_l[2], ('nsshow', 128, ['nsshow']))
+
+    def test_cmd(self):
+        self.assertEqual(parse_cli._ss_cmd('/fabos/cliexec/portstatsshow -i 0-47'), 'portstatsshow -i')
+        self.assertEqual(parse_cli._ss_cmd('cfgshow'), 'cfgshow')
+        self.assertIsNone(parse_cli._ss_cmd('-----'))
+
+
+class TestCfgshowTokens(unittest.TestCase):
+    """The compiled tokenizer in _cfgshow_process() treats ';', tabs, and runs of spaces as one separator"""
+
+    def test_zone(self):
+        self.assertEqual(parse_cli._cfgshow_process(parse_cli._cfgshow_state_start,
+                                                    ' zone:\tz1\t10:00:00:00:00:00:00:01; 10:00:00:00:00:00:00:02'),
+                         (parse_cli._cfgshow_operand_tbl['zone:']['state'], 'zone:', 'z1',
+                          ['10:00:00:00:00:00:00:01', '10:00:00:00:00:00:00:02']))
+
+    def test_configuration(self):
+        state, k, operand, rl = parse_cli._cfgshow_process(parse_cli._cfgshow_state_start, 'Effective configuration:')
+        self.assertEqual((k, operand, rl), ('Effective_configuration:', None, list()))
+
+    def test_continuation(self):
+        buf = '\t\t10:00:00:00:00:00:00:03;  a_1'
+        self.assertEqual(parse_cli._cfgshow_process(parse_cli._cfgshow_state_start, buf),
+                         (None, None, None, ['10:00:00:00:00:00:00:03', 'a_1']))
+
+
+class TestSupportshowMerge(unittest.TestCase):
+    """Merging the supportshow files parsed by parse_supportshow_l()"""
+
+    def test_no_overlap(self):
+        proj_obj = project_class.ProjectObj('merge', '')
+        result_l = [_ss_result('a.txt', _CHASSIS_A, 'sw_a', ['0/0'])]
+        parse_cli._ss_merge(proj_obj, result_l)
+        self.assertEqual(result_l[0]['conflict_l'], list())
+        self.assertNotIn('plain_d', result_l[0])
+        self.assertFalse(proj_obj.r_is_warn())
+
+    def test_overlap(self):
+        """The same switch in two files is a conflict. The first value is kept and the ports are merged."""
+        proj_obj = project_class.ProjectObj('merge', '')
+        result_l = [_ss_result('a.txt', _CHASSIS_A, 'sw_a', ['0/0']),
+                    _ss_result('b.txt', _CHASSIS_B, 'sw_b', ['0/1'])]
+        parse_cli._ss_merge(proj_obj, result_l)
+        self.assertEqual(result_l[0]['conflict_l'], list())
+        self.assertEqual(result_l[1]['conflict_l'], [_SWITCH_WWN])
+        self.assertTrue(proj_obj.r_is_warn())
+        switch_obj = proj_obj.r_switch_obj(_SWITCH_WWN)
+        self.assertEqual(switch_obj.r_get('switch-name'), 'sw_a')
+        self.assertEqual(sorted(switch_obj.r_port_keys()), ['0/0', '0/1'])
+        self.assertEqual(len(proj_obj.r_chassis_keys()), 2)
+        self.assertEqual(proj_obj.r_fabric_keys(), [_FAB_WWN])
+
+
+if __name__ == '__main__':
+    unittest.main()
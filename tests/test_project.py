@@ -0,0 +1,38 @@
+"""
+Copyright 2023, 2024, 2025, 2026 Jack Consoli.  All rights reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+the License. You may also obtain a copy of the License at https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the specific
+language governing permissions and limitations under the License.
+
+**Description**
+
+Tests for brcddb.brcddb_project
+"""
+import unittest
+import brcddb.brcddb_project as brcddb_project
+
+
+class TestPercentile(unittest.TestCase):
+    """Nearest rank percentiles used in request_summary()"""
+
+    def test_empty(self):
+        self.assertEqual(brcddb_project._percentile(list(), 50), 0)
+
+    def test_single(self):
+        self.assertEqual(brcddb_project._percentile([7], 50), 7)
+        self.assertEqual(brcddb_project._percentile([7], 95), 7)
+
+    def test_nearest_rank(self):
+        self.assertEqual(brcddb_project._percentile([1, 2], 50), 1)
+        self.assertEqual(brcddb_project._percentile(list(range(1, 11)), 50), 5)
+        self.assertEqual(brcddb_project._percentile(list(range(1, 101)), 95), 95)
+        self.assertEqual(brcddb_project._percentile(list(range(1, 101)), 100), 100)
+        self.assertEqual(brcddb_project._percentile(list(range(1, 101)), 0), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
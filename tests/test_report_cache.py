@@ -0,0 +1,126 @@
+"""
+Copyright 2023, 2024, 2025, 2026 Jack Consoli.  All rights reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+the License. You may also obtain a copy of the License at https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the specific
+language governing permissions and limitations under the License.
+
+**Description**
+
+Tests for the workbook cache in brcddb.apps.report.report()
+"""
+import os
+import shutil
+import tempfile
+import unittest
+import openpyxl
+import brcddb.brcddb_common as brcddb_common
+import brcddb.classes.project as project_class
+import brcddb.apps.report as report
+
+_FAB_WWN = '10:00:00:05:1e:00:00:01'
+_CHASSIS_WWN = '10:00:00:05:1e:00:00:02'
+_SHEET_L = ('fab', 'pc', 'pz', 'rq')
+
+
+def _collection(date, frames=1000, time_generated=0, zone_member=None):
+    """Returns a project as it would be read from one data collection
+
+    :param date: Collection date
+    :type date: str
+    :param frames: Class 3 frames counted on each port
+    :type frames: int
+    :param time_generated: Time the port statistics were generated
+    :type time_generated: int
+    :param zone_member: Additional member for zone z1. None: No additional member
+    :type zone_member: str, None
+    :rtype: brcddb.classes.project.ProjectObj
+    """
+    proj_obj = project_class.ProjectObj('nightly', date)
+    proj_obj.s_description('Nightly collection')
+    fab_obj = proj_obj.s_add_fabric(_FAB_WWN)
+    chassis_obj = proj_obj.s_add_chassis(_CHASSIS_WWN)
+    switch_obj = proj_obj.s_add_switch(_FAB_WWN)
+    switch_obj.s_fabric_key(_FAB_WWN)
+    switch_obj.s_chassis_key(_CHASSIS_WWN)
+    fab_obj.s_add_switch(_FAB_WWN)
+    chassis_obj.s_add_switch(_FAB_WWN)
+    wwn_l = list()
+    for i in range(0, 8):
+        port_obj = switch_obj.s_add_port('0/' + str(i))
+        wwn = '20:00:00:25:b5:00:00:' + format(i, '02x')
+        wwn_l.append(wwn)
+        port_obj.s_new_key('fibrechannel', {'name': '0/' + str(i),
+                                            'port-type': brcddb_common.PORT_TYPE_F,
+                                            'operational-status': 2,
+                                            'neighbor': {'wwn': [wwn]}})
+        port_obj.s_new_key('fibrechannel-statistics', {'name': '0/' + str(i),
+                                                       'class-3-frames': frames + i,
+                                                       'time-generated': time_generated})
+        fab_obj.s_add_login(wwn)
+    fab_obj.s_add_zone('z1', 0, wwn_l[0:2] + ([] if zone_member is None else [zone_member]))
+    proj_obj.s_add_request_stat(dict(uri='running/brocade-fibrechannel-switch/fibrechannel-switch', fid=None,
+                                     chassis=_CHASSIS_WWN, start=time_generated, end=time_generated + 0.5, bytes=100,
+                                     status=200, ingest=0.01))
+    return proj_obj
+
+
+class TestReportCache(unittest.TestCase):
+    """The cached workbook is used when the data displayed is unchanged"""
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.folder, 'cache')
+        self.outf = os.path.join(self.folder, 'report.xlsx')
+
+    def tearDown(self):
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+    def _report(self, proj_obj, sheet_l=_SHEET_L, skip_l=None, streaming=False):
+        return report.report(proj_obj, self.outf, sheet_l=sheet_l, skip_l=skip_l, streaming=streaming,
+                             cache_dir=self.cache_dir)
+
+    def test_unchanged_data(self):
+        """Different collection dates and request timing don't change the fabric sheets"""
+        self.assertNotIn('cache', self._report(_collection('01 Oct 2026', time_generated=1000)))
+        timing_d = self._report(_collection('02 Oct 2026', time_generated=2000))
+        self.assertIn('cache', timing_d)
+
+        # The table of contents is rebuilt with the new collection date
+        sheet = openpyxl.load_workbook(self.outf)['table_of_contents']
+        self.assertIn('02 Oct 2026', [cell.value for row in sheet.iter_rows() for cell in row])
+
+    def test_counters_not_displayed(self):
+        """Port counters only change the sheets that display them"""
+        self._report(_collection('01 Oct 2026', frames=1000))
+        self.assertIn('cache', self._report(_collection('02 Oct 2026', frames=5000)))
+        self._report(_collection('03 Oct 2026', frames=5000), sheet_l=_SHEET_L + ('ps',))
+        self.assertNotIn('cache', self._report(_collection('04 Oct 2026', frames=9000), sheet_l=_SHEET_L + ('ps',)))
+
+    def test_volatile_only(self):
+        """Port statistics changes don't rebuild the report when the sheets that display them are skipped"""
+        sheet_l = _SHEET_L + ('ps', 'db')
+        self._report(_collection('01 Oct 2026', frames=1000, time_generated=1000), sheet_l=sheet_l, skip_l=['ps', 'db'])
+        timing_d = self._report(_collection('02 Oct 2026', frames=9000, time_generated=2000), sheet_l=sheet_l,
+                                skip_l=['ps', 'db'])
+        self.assertIn('cache', timing_d)
+        self.assertNotIn('cache', self._report(_collection('03 Oct 2026', frames=9500, time_generated=3000),
+                                               sheet_l=sheet_l, skip_l=['db']))
+
+    def test_write_mode(self):
+        """A workbook cached in the other write mode is not used"""
+        self._report(_collection('01 Oct 2026'))
+        self.assertNotIn('cache', self._report(_collection('02 Oct 2026'), streaming=True))
+        self.assertIn('cache', self._report(_collection('03 Oct 2026'), streaming=True))
+
+    def test_changed_data(self):
+        """Zoning changes are not taken from the cache"""
+        self._report(_collection('01 Oct 2026'))
+        self.assertNotIn('cache', self._report(_collection('02 Oct 2026', zone_member='20:00:00:25:b5:00:00:07')))
+
+
+if __name__ == '__main__':
+    unittest.main()
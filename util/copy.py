@@ -45,25 +45,60 @@ Contains brcddb class object copy methods
 +-----------+---------------+---------------------------------------------------------------------------------------+
 | 4.0.4     | 20 Feb 2026   | Fixed case when a key was added to an object with a value of None.                    |
 +-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.5     | 18 Oct 2026   | Added _request_stats                                                                  |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.6     | 18 Oct 2026   | Alerts are interned in a project level alert table. See brcddb.classes.alert.AlertTbl |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.7     | 18 Oct 2026   | project_frozen is not copied                                                          |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.8     | 18 Oct 2026   | Added _eff_zoned_to                                                                   |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.9     | 18 Oct 2026   | Added _zone_merge_groups and _merge_group                                             |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.0     | 18 Oct 2026   | Added _isl_topology                                                                   |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.1     | 18 Oct 2026   | Added _ficon_index                                                                    |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.2     | 18 Oct 2026   | Added _data_changes                                                                   |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.3     | 18 Oct 2026   | Added _switch_obj, _fabric_obj, and _chassis_obj                                      |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.4     | 18 Oct 2026   | Added _port_class                                                                     |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.5     | 18 Oct 2026   | Added _best_name and _data_gen                                                        |
++-----------+---------------+---------------------------------------------------------------------------------------+
 """
 __author__ = 'Jack Consoli'
 __copyright__ = 'Copyright 2024, 2025, 2026 Jack Consoli'
-__date__ = '20 Feb 2026'
+__date__ = '18 Oct 2026'
 __license__ = 'Apache License, Version 2.0'
 __email__ = 'jack_consoli@yahoo.com'
 __maintainer__ = 'Jack Consoli'
 __status__ = 'Released'
-__version__ = '4.0.4'
+__version__ = '4.1.5'
 
 import brcddb.brcddb_common as brcddb_common
 import brcdapi.log as brcdapi_log
 
 default_skip_list = [
     '_alerts',
+    '_alert_tbl',
     '_project_obj',
     '_zonecfg',
     '_base_logins',
     '_port_map',
+    '_eff_zoned_to',
+    '_zone_merge_groups',
+    '_merge_group',
+    '_isl_topology',
+    '_ficon_index',
+    '_data_changes',
+    '_switch_obj',
+    '_fabric_obj',
+    '_chassis_obj',
+    '_port_class',
+    '_best_name',
+    '_data_gen',
 ]
 
 
@@ -187,7 +222,7 @@ def brcddb_to_plain_copy(objx, obj, flag_obj=None, skip_list=None):
         for k in objx.r_reserved_keys():
             if k not in skip_list:
                 if k == '_flags' and 'ProjectObj' in str(type(objx)):
-                    v = objx.r_flags() & ~brcddb_common.project_error_warn_mask
+                    v = objx.r_flags() & ~(brcddb_common.project_error_warn_mask | brcddb_common.project_frozen)
                 else:
                     v = objx.r_get_reserved(k)
                     if v is None:
@@ -388,8 +423,14 @@ def _brcddb_fdmi_port_objs_key(obj, objx):  # FabricObj
         plain_copy_to_brcddb(obj.get(k), objx.s_add_fdmi_port(k))
 
 
+def _brcddb_request_stats_key(obj, objx):  # project
+    for stat_d in obj:
+        objx.s_add_request_stat(stat_d)
+
+
 _r_key_table = dict(
     _alerts=_brcddb_null,
+    _alert_tbl=_brcddb_null,
     _reserved_keys=_brcddb_null,
     _project_obj=_brcddb_null,
     _obj_key=_brcddb_null,
@@ -418,10 +459,23 @@ _r_key_table = dict(
     _chassis_key=_brcddb_chassis_key_key,
     _fdmiPortObj=_brcddb_fdmi_port_obj_key,
     _fdmi_node_objs=_brcddb_fdmi_node_objs_key,
+    _request_stats=_brcddb_request_stats_key,
     _fdmi_port_objs=_brcddb_fdmi_port_objs_key,
     _zonecfg=_brcddb_null,
     _base_logins=_brcddb_null,
     _port_map=_brcddb_null,
+    _eff_zoned_to=_brcddb_null,
+    _zone_merge_groups=_brcddb_null,
+    _merge_group=_brcddb_null,
+    _isl_topology=_brcddb_null,
+    _ficon_index=_brcddb_null,
+    _data_changes=_brcddb_null,
+    _switch_obj=_brcddb_null,
+    _fabric_obj=_brcddb_null,
+    _chassis_obj=_brcddb_null,
+    _port_class=_brcddb_null,
+    _best_name=_brcddb_null,
+    _data_gen=_brcddb_null,
     _type=_brcddb_null,
     _chpid_objs=_brcddb_null,
     _switch_id=_brcddb_null,
@@ -0,0 +1,865 @@
+"""
+Copyright 2023, 2024, 2025, 2026 Jack Consoli.  All rights reserved.
+
+Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+the License. You may also obtain a copy of the License at https://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the specific
+language governing permissions and limitations under the License.
+
+The license is free for single customer use (internal applications). Use of this module in the production,
+redistribution, or service delivery for commerce requires an additional license. Contact jack_consoli@yahoo.com for
+details.
+
+**Description**
+
+Exports the brcddb object model as flat tables. Intended for downstream applications that only need tabular data and
+would otherwise have to build a workbook with brcddb.apps.report.report() and read it back.
+
+The columns for the port, statistics, SFP, RNID, login, chassis, and switch tables are taken from the same tables in
+brcddb.app_data.report_tables that control the Excel report so modifying those tables modifies both. Hyperlinks and
+Excel formatting are not exported. Values are the raw values from the API with the same conversions the report uses,
+brcddb.brcddb_common.port_conversion_tbl and login_conversion_tbl. Lists are converted to comma separated text.
+
+The project is walked once. Rows are written to all requested tables as they are built so memory use is independent of
+the project size.
+
++-----------+-------------------------------------------------------------------------------------------------------+
+| Format    | Output                                                                                                |
++===========+=======================================================================================================+
+| csv       | One file per table, <table>.csv, in the out folder.                                                   |
++-----------+-------------------------------------------------------------------------------------------------------+
+| parquet   | One file per table, <table>.parquet, in the out folder. Requires pyarrow. All columns are strings.    |
++-----------+-------------------------------------------------------------------------------------------------------+
+| sqlite    | A single SQLite database file, out, with one table per table. Indexes are created on the key columns. |
++-----------+-------------------------------------------------------------------------------------------------------+
+
+**Public Methods**
+
++-----------------------+-------------------------------------------------------------------------------------------+
+| Method                | Description                                                                               |
++=======================+===========================================================================================+
+| table_names           | Returns the names of all tables that can be exported.                                     |
++-----------------------+-------------------------------------------------------------------------------------------+
+| columns               | Returns the column names for a table.                                                     |
++-----------------------+-------------------------------------------------------------------------------------------+
+| export                | Exports a project to CSV, Parquet, or SQLite.                                             |
++-----------------------+-------------------------------------------------------------------------------------------+
+
+**Version Control**
+
++-----------+---------------+---------------------------------------------------------------------------------------+
+| Version   | Last Edit     | Description                                                                           |
++===========+===============+=======================================================================================+
+| 4.0.0     | 18 Oct 2026   | Initial launch                                                                        |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.1     | 18 Oct 2026   | Exports switch_name for port tables. Ports on switches not in a fabric no longer      |
+|           |               | raise                                                                                 |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.2     | 18 Oct 2026   | Alias and zone columns use per-fabric lookup tables built once per export. Logins not |
+|           |               | in a fabric no longer raise                                                           |
++-----------+---------------+---------------------------------------------------------------------------------------+
+"""
+__author__ = 'Jack Consoli'
+__copyright__ = 'Copyright 2026 Jack Consoli'
+__date__ = '18 Oct 2026'
+__license__ = 'Apache License, Version 2.0'
+__email__ = 'jack_consoli@yahoo.com'
+__maintainer__ = 'Jack Consoli'
+__status__ = 'Released'
+__version__ = '4.0.2'
+
+import os
+import re
+import csv
+import time
+import sqlite3
+import brcdapi.log as brcdapi_log
+import brcdapi.util as brcdapi_util
+import brcdapi.gen_util as gen_util
+import brcddb.brcddb_common as brcddb_common
+import brcddb.brcddb_fabric as brcddb_fabric
+import brcddb.brcddb_switch as brcddb_switch
+import brcddb.brcddb_chassis as brcddb_chassis
+import brcddb.brcddb_port as brcddb_port
+import brcddb.app_data.report_tables as rt
+try:
+    import pyarrow
+    import pyarrow.parquet as pyarrow_parquet
+except ImportError:
+    pyarrow, pyarrow_parquet = None, None
+
+_BATCH_SIZE = 10000  # Number of rows buffered before they are written to the output
+_fab_lookup_d = dict()  # Key is the fabric WWN. Value is returned from _fab_lookup(). Cleared by export()
+
+# Custom keys in the report tables that only make sense in a workbook
+_skip_keys = ('_CONFIG_LINK', '_STATS_LINK', '_ZONE_LINK', '_SFP_LINK', '_RNID_LINK')
+
+# Custom keys that are the same as, or equivalent to, a key column. Key is the report table key. Value is the column
+_col_alias = {
+    '_FABRIC_WWN': 'fabric_wwn',
+    '_SWITCH_WWN': 'switch_wwn',
+    '_SWITCH_LINK': 'switch_name',
+    '_PORT_NUMBER': 'port',
+    '_LOGIN_WWN': 'login_wwn',
+}
+
+
+def _col_name(k):
+    """Converts a key to a column name. Column names are lower case and only contain letters, numbers, and '_'
+
+    :param k: Key from one of the report tables
+    :type k: str
+    :return: Column name
+    :rtype: str
+    """
+    return _col_alias[k] if k in _col_alias else re.sub(r'\W+', '_', k).strip('_').lower()
+
+
+def _value(v):
+    """Converts a value to something that can be written to any of the output formats
+
+    :param v: Value as read from the object
+    :type v: None, bool, int, float, str, list, tuple, dict
+    :return: Converted value
+    :rtype: None, bool, int, float, str
+    """
+    if v is None or isinstance(v, (bool, int, float, str)):
+        return v
+    if isinstance(v, (list, tuple)):
+        return ', '.join([str(b) for b in v])
+    return str(v)
+
+
+def _alert_text(obj_l):
+    """Returns the formatted alert messages associated with a list of objects
+
+    :param obj_l: List of brcddb class objects. None entries are ignored
+    :type obj_l: list
+    :return: Alert messages, one per line. None if there are no alerts
+    :rtype: str, None
+    """
+    msg_l = [a_obj.fmt_msg() for obj in obj_l if obj is not None for a_obj in obj.r_alert_objects()]
+    return '\n'.join(msg_l) if len(msg_l) > 0 else None
+
+
+def _add_ref(ref_d, mem, name):
+    """Appends name to the list for mem in ref_d. Used to build the reverse lookup tables in _fab_lookup()"""
+    name_l = ref_d.get(mem)
+    if name_l is None:
+        ref_d[mem] = [name]
+    elif name_l[-1] != name:
+        name_l.append(name)
+
+
+def _fab_lookup(fab_obj):
+    """Returns the reverse lookup tables for the aliases and zones in a fabric. The tables are built the first time they
+    are needed for each fabric during an export. Without them, each row would search every alias and zone in the fabric.
+
+    +-----------+---------------------------------------------------------------------------------------------------+
+    | Key       | Value                                                                                             |
+    +===========+===================================================================================================+
+    | alias_d   | Key is an alias member, WWN or d,i. Value is the list of alias names.                             |
+    +-----------+---------------------------------------------------------------------------------------------------+
+    | zone_d    | Key is a member or principal member, WWN, d,i, or alias, of a defined zone. Value is the list of  |
+    |           | zone names.                                                                                       |
+    +-----------+---------------------------------------------------------------------------------------------------+
+    | eff_d     | Same as zone_d but for the zones in the effective zone configuration.                             |
+    +-----------+---------------------------------------------------------------------------------------------------+
+
+    :param fab_obj: Fabric object
+    :type fab_obj: brcddb.classes.fabric.FabricObj
+    :return: Lookup tables as defined above
+    :rtype: dict
+    """
+    global _fab_lookup_d
+
+    lookup_d = _fab_lookup_d.get(fab_obj.r_obj_key())
+    if lookup_d is None:
+        lookup_d = dict(alias_d=dict(), zone_d=dict(), eff_d=dict())
+        for alias_obj in fab_obj.r_alias_objects():
+            for mem in alias_obj.r_members():
+                _add_ref(lookup_d['alias_d'], mem, alias_obj.r_obj_key())
+        for zone_obj_l, ref_d in ((fab_obj.r_zone_objects(), lookup_d['zone_d']),
+                                  (fab_obj.r_eff_zone_objects(), lookup_d['eff_d'])):
+            for zone_obj in zone_obj_l:
+                for mem in zone_obj.r_members() + zone_obj.r_pmembers():
+                    _add_ref(ref_d, mem, zone_obj.r_obj_key())
+        _fab_lookup_d[fab_obj.r_obj_key()] = lookup_d
+    return lookup_d
+
+
+def _aliases_for(fab_obj, mem):
+    """Same as fab_obj.r_alias_for_wwn() but uses the lookup tables. mem may also be a d,i member"""
+    return list(_fab_lookup(fab_obj)['alias_d'].get(mem, list()))
+
+
+def _zones_for(fab_obj, mem):
+    """Same as fab_obj.r_zones_for_wwn() but uses the lookup tables. mem may also be a d,i member"""
+    lookup_d = _fab_lookup(fab_obj)
+    zone_l = list(lookup_d['zone_d'].get(mem, list()))
+    for alias in lookup_d['alias_d'].get(mem, list()):
+        zone_l.extend(lookup_d['zone_d'].get(alias, list()))
+    return zone_l
+
+
+def _eff_zones_for(fab_obj, mem):
+    """Same as fab_obj.r_eff_zones_for_wwn() but uses the lookup tables"""
+    return list(_fab_lookup(fab_obj)['eff_d'].get(mem, list()))
+
+
+###################################################################
+#
+#                    Key column case statements
+#
+###################################################################
+def _fabric_wwn_case(obj):
+    return obj.r_fabric_key()
+
+
+def _fabric_name_case(obj):
+    return brcddb_fabric.best_fab_name(obj.r_fabric_obj())
+
+
+def _switch_wwn_case(obj):
+    return obj.r_switch_key()
+
+
+def _switch_name_case(obj):
+    return brcddb_switch.best_switch_name(obj.r_switch_obj())
+
+
+def _obj_key_case(obj):
+    return obj.r_obj_key()
+
+
+def _chassis_name_case(obj):
+    return brcddb_chassis.best_chassis_name(obj)
+
+
+def _login_switch_wwn_case(obj):
+    switch_obj = obj.r_switch_obj()
+    return None if switch_obj is None else switch_obj.r_obj_key()
+
+
+def _login_port_case(obj):
+    port_obj = obj.r_port_obj()
+    return None if port_obj is None else port_obj.r_obj_key()
+
+
+###################################################################
+#
+#                    Port case statements
+#
+###################################################################
+def _p_fabric_name_and_wwn_case(port_obj, wwn):
+    return brcddb_fabric.best_fab_name(port_obj.r_fabric_obj(), wwn=True)
+
+
+def _p_switch_name_and_wwn_case(port_obj, wwn):
+    return brcddb_switch.best_switch_name(port_obj.r_switch_obj(), True)
+
+
+def _p_port_desc_case(port_obj, wwn):
+    return brcddb_port.port_best_desc(port_obj)
+
+
+def _p_alias_case(port_obj, wwn):
+    fab_obj = port_obj.r_fabric_obj()
+    return None if wwn is None or fab_obj is None else ', '.join(_aliases_for(fab_obj, wwn))
+
+
+def _p_comment_case(port_obj, wwn):
+    fab_obj = port_obj.r_fabric_obj()
+    obj_l = [port_obj]
+    if fab_obj is not None and wwn is not None:
+        obj_l.extend([fab_obj.r_login_obj(wwn), fab_obj.r_fdmi_node_obj(wwn), fab_obj.r_fdmi_port_obj(wwn)])
+    return _alert_text(obj_l)
+
+
+def _p_login_obj(port_obj, wwn):
+    """Returns the login object for a WWN on a port. None if wwn is None or the switch is not in a fabric"""
+    fab_obj = port_obj.r_fabric_obj()
+    return None if wwn is None or fab_obj is None else fab_obj.r_login_obj(wwn)
+
+
+def _p_login_addr_case(port_obj, wwn):
+    login_obj = _p_login_obj(port_obj, wwn)
+    return None if login_obj is None else login_obj.r_get(brcdapi_util.bns_port_id)
+
+
+def _p_zones_def_case(port_obj, wwn):
+    fab_obj = port_obj.r_fabric_obj()
+    if fab_obj is None:
+        return None
+    did, p_index = port_obj.r_switch_obj().r_did(), port_obj.r_index()
+    zone_l = _zones_for(fab_obj, str(did) + ',' + str(p_index)) if isinstance(did, int) and isinstance(p_index, int) \
+        else list()
+    return ', '.join(zone_l if wwn is None else _zones_for(fab_obj, wwn) + zone_l)
+
+
+def _p_zones_eff_case(port_obj, wwn):
+    fab_obj = port_obj.r_fabric_obj()
+    if fab_obj is None:
+        return None
+    zone_l = fab_obj.r_eff_di_zones_for_addr(port_obj.r_addr())
+    return ', '.join(zone_l if wwn is None else _eff_zones_for(fab_obj, wwn) + zone_l)
+
+
+def _p_name_server_node_case(port_obj, wwn):
+    login_obj = _p_login_obj(port_obj, wwn)
+    return None if login_obj is None else login_obj.r_get(brcdapi_util.bns_node_symbol)
+
+
+def _p_name_server_port_case(port_obj, wwn):
+    login_obj = _p_login_obj(port_obj, wwn)
+    return None if login_obj is None else login_obj.r_get(brcdapi_util.bns_port_symbol)
+
+
+def _p_fdmi_node_case(port_obj, wwn):
+    fab_obj = port_obj.r_fabric_obj()
+    fdmi_obj = None if wwn is None or fab_obj is None else fab_obj.r_fdmi_node_obj(wwn)
+    return None if fdmi_obj is None else fdmi_obj.r_get(brcdapi_util.fdmi_node_sym)
+
+
+def _p_fdmi_port_case(port_obj, wwn):
+    fab_obj = port_obj.r_fabric_obj()
+    fdmi_obj = None if wwn is None or fab_obj is None else fab_obj.r_fdmi_port_obj(wwn)
+    return None if fdmi_obj is None else fdmi_obj.r_get(brcdapi_util.fdmi_port_sym)
+
+
+def _p_operational_status_case(port_obj, wwn):
+    return port_obj.r_status()
+
+
+def _p_port_type_case(port_obj, wwn):
+    return port_obj.c_login_type()
+
+
+def _p_fabric_name_case(port_obj, wwn):
+    return _fabric_name_case(port_obj)
+
+
+def _p_switch_name_case(port_obj, wwn):
+    return _switch_name_case(port_obj)
+
+
+_port_case = {
+    '_FABRIC_NAME': _p_fabric_name_case,
+    '_FABRIC_NAME_AND_WWN': _p_fabric_name_and_wwn_case,
+    '_SWITCH_NAME': _p_switch_name_case,
+    '_SWITCH_LINK': _p_switch_name_case,  # The workbook hyperlink text is the switch name
+    '_SWITCH_NAME_AND_WWN': _p_switch_name_and_wwn_case,
+    '_BEST_DESC': _p_port_desc_case,
+    '_ALIAS': _p_alias_case,
+    '_PORT_COMMENTS': _p_comment_case,
+    '_LOGIN_ADDR': _p_login_addr_case,
+    '_ZONES_DEF': _p_zones_def_case,
+    '_ZONES_EFF': _p_zones_eff_case,
+    '_NAME_SERVER_NODE': _p_name_server_node_case,
+    '_NAME_SERVER_PORT': _p_name_server_port_case,
+    '_FDMI_NODE': _p_fdmi_node_case,
+    '_FDMI_PORT': _p_fdmi_port_case,
+    brcdapi_util.fc_op_status_str: _p_operational_status_case,
+    brcdapi_util.fc_port_type_str: _p_port_type_case,
+}
+
+
+###################################################################
+#
+#                    Login case statements
+#
+###################################################################
+def _l_fabric_name_case(login_obj, k):
+    return _fabric_name_case(login_obj)
+
+
+def _l_fabric_name_and_wwn_case(login_obj, k):
+    return brcddb_fabric.best_fab_name(login_obj.r_fabric_obj(), wwn=True)
+
+
+def _l_switch_name_case(login_obj, k):
+    switch_obj = login_obj.r_switch_obj()
+    return None if switch_obj is None else brcddb_switch.best_switch_name(switch_obj)
+
+
+def _l_switch_name_and_wwn_case(login_obj, k):
+    switch_obj = login_obj.r_switch_obj()
+    return None if switch_obj is None else brcddb_switch.best_switch_name(switch_obj, True)
+
+
+def _l_alias_case(login_obj, k):
+    fab_obj = login_obj.r_fabric_obj()
+    return None if fab_obj is None else ', '.join(_aliases_for(fab_obj, login_obj.r_obj_key()))
+
+
+def _l_zones_def_case(login_obj, k):
+    fab_obj = login_obj.r_fabric_obj()
+    return None if fab_obj is None else ', '.join(_zones_for(fab_obj, login_obj.r_obj_key()))
+
+
+def _l_zones_eff_case(login_obj, k):
+    fab_obj = login_obj.r_fabric_obj()
+    return None if fab_obj is None else ', '.join(_eff_zones_for(fab_obj, login_obj.r_obj_key()))
+
+
+def _l_comment_case(login_obj, k):
+    return _alert_text([login_obj])
+
+
+def _l_fdmi_node_case(login_obj, k):
+    # It's the base WWN we want for the node (hba), not the login WWN. See brcddb.report.login._l_fdmi_node_case()
+    port_obj = login_obj.r_port_obj()
+    wwn_l = None if port_obj is None else port_obj.r_get(brcdapi_util.fc_neighbor_wwn)
+    fab_obj = login_obj.r_fabric_obj()
+    if not isinstance(wwn_l, list) or len(wwn_l) == 0 or fab_obj is None:
+        return None
+    fdmi_obj = fab_obj.r_fdmi_node_obj(wwn_l[0])
+    return None if fdmi_obj is None else fdmi_obj.r_get(k)
+
+
+def _l_fdmi_port_case(login_obj, k):
+    fab_obj = login_obj.r_fabric_obj()
+    fdmi_obj = None if fab_obj is None else fab_obj.r_fdmi_port_obj(login_obj.r_obj_key())
+    return None if fdmi_obj is None else fdmi_obj.r_get(k)
+
+
+_login_case = {
+    '_FABRIC_NAME': _l_fabric_name_case,
+    '_FABRIC_NAME_AND_WWN': _l_fabric_name_and_wwn_case,
+    '_SWITCH_NAME': _l_switch_name_case,
+    '_SWITCH_NAME_AND_WWN': _l_switch_name_and_wwn_case,
+    '_ALIAS': _l_alias_case,
+    '_ZONES_DEF': _l_zones_def_case,
+    '_ZONES_EFF': _l_zones_eff_case,
+    '_LOGIN_COMMENTS': _l_comment_case,
+    '_FDMI_NODE': _l_fdmi_node_case,
+    '_FDMI_PORT': _l_fdmi_port_case,
+}
+
+
+###################################################################
+#
+#                    Chassis and switch case statements
+#
+###################################################################
+def _c_firmware_version_case(obj, k):
+    return brcddb_chassis.firmware_version(obj)
+
+
+def _s_active_maps_policy_case(switch_obj, k):
+    policy_d = switch_obj.r_active_maps_policy()
+    return None if policy_d is None else policy_d.get('name')
+
+
+def _s_fabric_name_case(switch_obj, k):
+    return _fabric_name_case(switch_obj)
+
+
+def _s_switch_name_case(switch_obj, k):
+    return brcddb_switch.best_switch_name(switch_obj)
+
+
+_chassis_case = {
+    '_FIRMWARE_VERSION': _c_firmware_version_case,
+}
+_switch_case = {
+    '_FABRIC_NAME': _s_fabric_name_case,
+    '_SWITCH_NAME': _s_switch_name_case,
+    '_FIRMWARE_VERSION': _c_firmware_version_case,
+    '_SWITCH_ACTIVE_MAPS_POLICY_NAME': _s_active_maps_policy_case,
+}
+
+
+###################################################################
+#
+#                    Table definitions
+#
+###################################################################
+# Key columns common to all port tables
+_port_key_l = (('fabric_wwn', _fabric_wwn_case), ('switch_wwn', _switch_wwn_case), ('port', _obj_key_case))
+
+"""_table_d: Key is the table name. Value is a dictionary as follows:
+
++-----------+-------------------------------------------------------------------------------------------------------+
+| Key       | Description                                                                                           |
++===========+=======================================================================================================+
+| obj       | Object type the rows are built from: chassis, switch, port, login, zone, alias, or zonecfg.           |
++-----------+-------------------------------------------------------------------------------------------------------+
+| key_l     | List of (column name, method) for the key columns. The method is passed the object.                   |
++-----------+-------------------------------------------------------------------------------------------------------+
+| tbl       | Keys in brcddb.app_data.report_tables used for the remaining columns. Not used for zoning tables      |
++-----------+-------------------------------------------------------------------------------------------------------+
+| index     | Columns to index. Only used for SQLite                                                                |
++-----------+-------------------------------------------------------------------------------------------------------+"""
+_table_d = dict(
+    chassis=dict(obj='chassis',
+                 key_l=(('chassis_wwn', _obj_key_case), ('chassis_name', _chassis_name_case)),
+                 tbl=tuple(rt.Chassis.chassis_display_tbl.keys()),
+                 index=('chassis_wwn',)),
+    switch=dict(obj='switch',
+                key_l=(('fabric_wwn', _fabric_wwn_case), ('switch_wwn', _obj_key_case),
+                       ('switch_name', _switch_name_case)),
+                tbl=tuple(rt.Switch.switch_display_tbl.keys()),
+                index=('fabric_wwn', 'switch_wwn')),
+    port=dict(obj='port', key_l=_port_key_l, tbl=rt.Port.port_config_tbl, index=('fabric_wwn', 'switch_wwn', 'port')),
+    port_stats=dict(obj='port', key_l=_port_key_l, tbl=rt.Port.port_stats_tbl,
+                    index=('fabric_wwn', 'switch_wwn', 'port')),
+    sfp=dict(obj='port', key_l=_port_key_l, tbl=rt.Port.port_sfp_tbl, index=('fabric_wwn', 'switch_wwn', 'port')),
+    rnid=dict(obj='port', key_l=_port_key_l, tbl=rt.Port.port_rnid_tbl, index=('fabric_wwn', 'switch_wwn', 'port')),
+    login=dict(obj='login',
+               key_l=(('fabric_wwn', _fabric_wwn_case), ('login_wwn', _obj_key_case),
+                      ('switch_wwn', _login_switch_wwn_case), ('port', _login_port_case)),
+               tbl=rt.Login.login_tbl,
+               index=('fabric_wwn', 'login_wwn', 'switch_wwn')),
+    zone=dict(obj='zone',
+              key_l=(('fabric_wwn', _fabric_wwn_case), ('zone', _obj_key_case)),
+              tbl=('zone_type', 'effective', 'peer', 'target_driven', 'zonecfg', 'comments'),
+              index=('fabric_wwn', 'zone')),
+    zone_member=dict(obj='zone',
+                     key_l=(('fabric_wwn', _fabric_wwn_case), ('zone', _obj_key_case)),
+                     tbl=('member', 'principal', 'effective'),
+                     index=('fabric_wwn', 'zone', 'member')),
+    alias_member=dict(obj='alias',
+                      key_l=(('fabric_wwn', _fabric_wwn_case), ('alias', _obj_key_case)),
+                      tbl=('member',),
+                      index=('fabric_wwn', 'alias', 'member')),
+    zonecfg_member=dict(obj='zonecfg',
+                        key_l=(('fabric_wwn', _fabric_wwn_case), ('zonecfg', _obj_key_case)),
+                        tbl=('member', 'effective'),
+                        index=('fabric_wwn', 'zonecfg', 'member')),
+)
+
+
+def table_names():
+    """Returns the names of all tables that can be exported.
+
+    :return: Table names
+    :rtype: list
+    """
+    return list(_table_d.keys())
+
+
+def _column_keys(table):
+    """Returns the column names and the associated report table key for the non-key columns of a table.
+
+    :param table: Table name. Must be a key in _table_d
+    :type table: str
+    :return: List of (column name, key)
+    :rtype: list
+    """
+    table_d = _table_d[table]
+    col_l = [b[0] for b in table_d['key_l']]
+    rl = list()
+    for k in table_d['tbl']:
+        if k in _skip_keys:
+            continue
+        if table_d['obj'] == 'port' and rt.Port.port_display_tbl.get(k, dict()).get('dc', False):
+            continue  # The report doesn't display these either
+        col = _col_name(k)
+        if col not in col_l:
+            col_l.append(col)
+            rl.append((col, k))
+    return rl
+
+
+def columns(table):
+    """Returns the column names for a table.
+
+    :param table: Table name. See table_names()
+    :type table: str
+    :return: Column names in the order they are written
+    :rtype: list
+    """
+    return [b[0] for b in _table_d[table]['key_l']] + [b[0] for b in _column_keys(table)]
+
+
+###################################################################
+#
+#                    Row builders
+#
+###################################################################
+def _key_values(table, obj):
+    return [_value(b[1](obj)) for b in _table_d[table]['key_l']]
+
+
+def _port_rows(table, port_obj, col_key_l):
+    """Returns the rows for a port. Same as brcddb.report.port.port_page(), only the first F-Port login is used"""
+    login_l = port_obj.r_login_keys() if port_obj.c_login_type() == 'F-Port' else list()
+    wwn = login_l[0] if len(login_l) > 0 else None
+    row = _key_values(table, port_obj)
+    for col, k in col_key_l:
+        if k in _port_case:
+            v = _port_case[k](port_obj, wwn)
+        elif k == '_LOGIN_WWN':
+            v = wwn
+        else:
+            v = port_obj.r_get(k)
+            v = brcddb_common.port_conversion_tbl.get(k, dict()).get(v, v) if isinstance(v, (int, str)) else v
+        row.append(_value(v))
+    return [row]
+
+
+def _login_rows(table, login_obj, col_key_l):
+    row = _key_values(table, login_obj)
+    for col, k in col_key_l:
+        k_l = k.split('.')
+        if len(k_l) > 1 and k_l[0] in _login_case:
+            v = _login_case[k_l[0]](login_obj, k_l[1])
+        elif k in _login_case:
+            v = _login_case[k](login_obj, k)
+        else:
+            v = login_obj.r_get(k)
+            v = brcddb_common.login_conversion_tbl.get(k, dict()).get(v, v) if isinstance(v, (int, str)) else v
+        row.append(_value(v))
+    return [row]
+
+
+def _chassis_rows(table, obj, col_key_l):
+    case_d = _chassis_case if _table_d[table]['obj'] == 'chassis' else _switch_case
+    row = _key_values(table, obj)
+    for col, k in col_key_l:
+        if k in case_d:
+            row.append(_value(case_d[k](obj, k)))
+        elif k.startswith('_'):
+            row.append(None)  # A custom key for the report that isn't supported here
+        else:
+            row.append(_value(obj.r_get(k)))
+    return [row]
+
+
+def _zone_rows(table, zone_obj, col_key_l):
+    key_l = _key_values(table, zone_obj)
+    effective = zone_obj.r_is_effective()
+    if table == 'zone':
+        zone_type = zone_obj.r_type()
+        return [key_l + [brcddb_common.zone_conversion_tbl['zone-type'].get(zone_type, zone_type),
+                         effective,
+                         zone_obj.r_is_peer(),
+                         zone_obj.r_is_target_driven(),
+                         _value(zone_obj.r_zone_configurations()),
+                         _alert_text([zone_obj])]]
+    rl = [key_l + [mem, True, effective] for mem in zone_obj.r_pmembers()]
+    return rl + [key_l + [mem, False, effective] for mem in zone_obj.r_members()]
+
+
+def _alias_rows(table, alias_obj, col_key_l):
+    key_l = _key_values(table, alias_obj)
+    return [key_l + [mem] for mem in alias_obj.r_members()]
+
+
+def _zonecfg_rows(table, zonecfg_obj, col_key_l):
+    key_l = _key_values(table, zonecfg_obj)
+    effective = zonecfg_obj.r_is_effective()
+    return [key_l + [mem, effective] for mem in zonecfg_obj.r_members()]
+
+
+_row_case = dict(
+    chassis=_chassis_rows,
+    switch=_chassis_rows,
+    port=_port_rows,
+    login=_login_rows,
+    zone=_zone_rows,
+    alias=_alias_rows,
+    zonecfg=_zonecfg_rows,
+)
+
+
+###################################################################
+#
+#                    Writers
+#
+###################################################################
+class _CsvWriter:
+    """Writes each table to <folder>/<table>.csv"""
+
+    def __init__(self, out):
+        os.makedirs(out, exist_ok=True)
+        self._folder = out
+        self._f_d = dict()
+        self._w_d = dict()
+
+    def open(self, table, col_l, index_l):
+        f = open(os.path.join(self._folder, table + '.csv'), 'w', newline='', encoding='utf-8')
+        self._f_d[table] = f
+        self._w_d[table] = csv.writer(f)
+        self._w_d[table].writerow(col_l)
+
+    def write(self, table, row_l):
+        self._w_d[table].writerows(row_l)
+
+    def close(self):
+        for f in self._f_d.values():
+            f.close()
+
+
+class _ParquetWriter:
+    """Writes each table to <folder>/<table>.parquet. Rows are written in row groups of _BATCH_SIZE. Values are
+    converted to str because the type of a value in the API responses is not always consistent."""
+
+    def __init__(self, out):
+        os.makedirs(out, exist_ok=True)
+        self._folder = out
+        self._schema_d = dict()
+        self._w_d = dict()
+        self._buf_d = dict()
+
+    def open(self, table, col_l, index_l):
+        self._schema_d[table] = pyarrow.schema([(col, pyarrow.string()) for col in col_l])
+        self._w_d[table] = pyarrow_parquet.ParquetWriter(os.path.join(self._folder, table + '.parquet'),
+                                                         self._schema_d[table])
+        self._buf_d[table] = list()
+
+    def _flush(self, table):
+        if len(self._buf_d[table]) > 0:
+            col_l = [list(b) for b in zip(*self._buf_d[table])]
+            arrays = [pyarrow.array([None if v is None else str(v) for v in b], type=pyarrow.string()) for b in col_l]
+            self._w_d[table].write_table(pyarrow.Table.from_arrays(arrays, schema=self._schema_d[table]))
+            self._buf_d[table] = list()
+
+    def write(self, table, row_l):
+        self._buf_d[table].extend(row_l)
+        if len(self._buf_d[table]) >= _BATCH_SIZE:
+            self._flush(table)
+
+    def close(self):
+        for table, w in self._w_d.items():
+            self._flush(table)
+            w.close()
+
+
+class _SqliteWriter:
+    """Writes all tables to a single SQLite database. Inserts are batched in a single transaction and the indexes are
+    created after all rows are inserted."""
+
+    def __init__(self, out):
+        if os.path.exists(out):
+            os.remove(out)
+        self._conn = sqlite3.connect(out)
+        self._conn.execute('PRAGMA journal_mode = OFF')
+        self._conn.execute('PRAGMA synchronous = OFF')
+        self._sql_d = dict()
+        self._buf_d = dict()
+        self._index_d = dict()
+
+    def open(self, table, col_l, index_l):
+        self._conn.execute('DROP TABLE IF EXISTS "' + table + '"')
+        self._conn.execute('CREATE TABLE "' + table + '" (' + ', '.join(['"' + col + '"' for col in col_l]) + ')')
+        self._sql_d[table] = 'INSERT INTO "' + table + '" VALUES (' + ', '.join(['?'] * len(col_l)) + ')'
+        self._buf_d[table] = list()
+        self._index_d[table] = index_l
+
+    def _flush(self, table):
+        if len(self._buf_d[table]) > 0:
+            self._conn.executemany(self._sql_d[table], self._buf_d[table])
+            self._buf_d[table] = list()
+
+    def write(self, table, row_l):
+        self._buf_d[table].extend(row_l)
+        if len(self._buf_d[table]) >= _BATCH_SIZE:
+            self._flush(table)
+
+    def close(self):
+        for table, index_l in self._index_d.items():
+            self._flush(table)
+            for col in index_l:
+                self._conn.execute('CREATE INDEX "' + table + '_' + col + '" ON "' + table + '" ("' + col + '")')
+        self._conn.commit()
+        self._conn.close()
+
+
+_writer_d = dict(csv=_CsvWriter, parquet=_ParquetWriter, sqlite=_SqliteWriter)
+
+
+###################################################################
+#
+#                    Public methods
+#
+###################################################################
+def export(proj_obj, out, fmt='csv', table_l=None):
+    """Exports a project to CSV, Parquet, or SQLite. The project is walked once.
+
+    :param proj_obj: Project object
+    :type proj_obj: brcddb.classes.project.ProjectObj
+    :param out: Folder for the CSV and Parquet files. Database file name for SQLite. An existing database is replaced.
+    :type out: str
+    :param fmt: Output format: 'csv', 'parquet', or 'sqlite'
+    :type fmt: str
+    :param table_l: Tables to export. See table_names(). None exports all tables.
+    :type table_l: None, str, list, tuple
+    :return: Dictionary as follows:
+        rows    dict: Key is the table name. Value is the number of rows written.
+        time    float: Elapsed time in seconds.
+        err_msg list: Error messages. Empty if there were no errors.
+    :rtype: dict
+    """
+    global _table_d, _writer_d, _row_case, _fab_lookup_d
+
+    start_time = time.time()
+    rd = dict(rows=dict(), time=0.0, err_msg=list())
+
+    # Validate the input
+    table_l = table_names() if table_l is None else gen_util.convert_to_list(table_l)
+    rd['err_msg'].extend(['Unknown table: ' + str(table) for table in table_l if table not in _table_d])
+    if fmt not in _writer_d:
+        rd['err_msg'].append('Unknown format: ' + str(fmt))
+    elif fmt == 'parquet' and pyarrow is None:
+        rd['err_msg'].append('The parquet format requires pyarrow. Use "pip install pyarrow" to install it.')
+    if len(rd['err_msg']) > 0:
+        brcdapi_log.log(rd['err_msg'], echo=True)
+        return rd
+
+    # Open the output and set up the tables, grouped by the object type the rows are built from
+    writer = _writer_d[fmt](out)
+    obj_type_d, col_key_d = dict(), dict()
+    for table in table_l:
+        writer.open(table, columns(table), _table_d[table]['index'])
+        obj_type = _table_d[table]['obj']
+        if obj_type not in obj_type_d:
+            obj_type_d[obj_type] = list()
+        obj_type_d[obj_type].append(table)
+        col_key_d[table] = _column_keys(table)
+        rd['rows'][table] = 0
+
+    def _write(obj_type, obj):
+        for obj_table in obj_type_d.get(obj_type, list()):
+            row_l = _row_case[obj_type](obj_table, obj, col_key_d[obj_table])
+            writer.write(obj_table, row_l)
+            rd['rows'][obj_table] += len(row_l)
+
+    # Walk the project
+    _fab_lookup_d = dict()
+    try:
+        for chassis_obj in proj_obj.r_chassis_objects():
+            _write('chassis', chassis_obj)
+        for switch_obj in proj_obj.r_switch_objects():
+            _write('switch', switch_obj)
+            if 'port' in obj_type_d:
+                for port_obj in switch_obj.r_port_objects():
+                    _write('port', port_obj)
+        for fab_obj in proj_obj.r_fabric_objects():
+            if 'login' in obj_type_d:
+                for login_obj in fab_obj.r_login_objects():
+                    _write('login', login_obj)
+            if 'zone' in obj_type_d:
+                for zone_obj in fab_obj.r_zone_objects():
+                    _write('zone', zone_obj)
+            if 'alias' in obj_type_d:
+                for alias_obj in fab_obj.r_alias_objects():
+                    _write('alias', alias_obj)
+            if 'zonecfg' in obj_type_d:
+                for zonecfg_obj in fab_obj.r_zonecfg_objects():
+                    if zonecfg_obj.r_obj_key() != '_effective_zone_cfg':
+                        _write('zonecfg', zonecfg_obj)
+    except (OSError, sqlite3.Error) as e:
+        rd['err_msg'].append('Error writing to ' + out + ': ' + str(e))
+        brcdapi_log.exception(rd['err_msg'], echo=True)
+    finally:
+        writer.close()
+        _fab_lookup_d = dict()
+
+    rd['time'] = time.time() - start_time
+    brcdapi_log.log('Exported ' + str(sum(rd['rows'].values())) + ' rows in ' + str(round(rd['time'], 3)) +
+                    ' seconds to ' + out, echo=False)
+    return rd
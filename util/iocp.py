@@ -87,15 +87,17 @@ is functional.
 +-----------+---------------+---------------------------------------------------------------------------------------+
 | 4.0.7     | 10 Mar 2026   | Consolidated project read and Excel error messaging.                                  |
 +-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.8     | 18 Oct 2026   | build_rnid_table() indexes CHPID paths by link address                                |
++-----------+---------------+---------------------------------------------------------------------------------------+
 """
 __author__ = 'Jack Consoli'
 __copyright__ = 'Copyright 2023, 2024, 2025, 2026 Jack Consoli'
-__date__ = '10 Mar 2026'
+__date__ = '18 Oct 2026'
 __license__ = 'Apache License, Version 2.0'
 __email__ = 'jack_consoli@yahoo.com'
 __maintainer__ = 'Jack Consoli'
 __status__ = 'Released'
-__version__ = '4.0.7'
+__version__ = '4.0.8'
 
 import collections
 import brcdapi.log as brcdapi_log
@@ -807,6 +809,26 @@ def build_rnid_table(proj_obj):
     # Add the rnid_d dictionary to the fabric object to each fabric
     for fabric_obj in proj_obj.r_fabric_objects():
         fabric_key = fabric_obj.r_obj_key()
+
+        # Index the CHPIDs by the link address of each device in their paths. See IOCPObj.r_has_link_addr(). link_d:
+        # Key is the 2 byte link address (4 upper case hex characters). any_did_d: Key is the 1 byte link address. Only
+        # used for CHPIDs without an FC address so the DID of the device is assumed. The values are lists of indices
+        # into fab_chpid_l so that the CHPIDs are added to each port in the same order as they were found.
+        fab_chpid_l, link_d, any_did_d = chpids_by_fabric_d[fabric_key], dict(), dict()
+        for i, d in enumerate(fab_chpid_l):
+            chpid_addr = d['port'].r_addr()
+            chpid_did = None if chpid_addr is None else chpid_addr.upper().replace('0X', '')[0: 2]
+            key_d = dict()  # Key is the link address. Value is link_d or any_did_d. A path is only added once per key.
+            for link_addr in [a.upper() for a in d['iocp'].r_link_addr(d['chpid'].r_obj_key())]:
+                if len(link_addr) == 2 and chpid_did is None:
+                    key_d[link_addr] = any_did_d
+                else:
+                    key_d[chpid_did + link_addr if len(link_addr) == 2 else link_addr] = link_d
+            for key, index_d in key_d.items():
+                if key not in index_d:
+                    index_d[key] = list()
+                index_d[key].append(i)
+
         rnid_d = dict()
         for key in _rnid_types_l:
             rnid_d.update({key: list()})
@@ -824,9 +846,11 @@ def build_rnid_table(proj_obj):
                 rnid_d[generic_device_type(port_rnid_d.get('type-number'))].append(port_obj)
 
                 # Add the port objects for CHPIDs with paths to this port address
-                for d in chpids_by_fabric_d[fabric_key]:
-                    if d['iocp'].r_has_link_addr(d['chpid'].r_obj_key(), port_obj.r_addr(), d['port'].r_addr()):
-                        chpid_l.append(d['port'])
+                port_addr = port_obj.r_addr()
+                if port_addr is not None:
+                    dev_link_addr = port_addr.upper().replace('0X', '')[0: 4]
+                    i_l = link_d.get(dev_link_addr, list()) + any_did_d.get(dev_link_addr[2:], list())
+                    chpid_l.extend([fab_chpid_l[i]['port'] for i in sorted(gen_util.remove_duplicates(i_l))])
 
     if len(error_l) > 0:
         brcdapi_log.log(error_l, echo=True)
@@ -56,15 +56,17 @@ Utility functions to simplify MAPS
 +-----------+---------------+---------------------------------------------------------------------------------------+
 | 4.0.4     | 20 Feb 2026   | Updated copyright notice.                                                             |
 +-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.5     | 18 Oct 2026   | Added switch_obj_l to maps_dashboard_alerts()                                         |
++-----------+---------------+---------------------------------------------------------------------------------------+
 """
 __author__ = 'Jack Consoli'
 __copyright__ = 'Copyright 2024, 2025, 2026 Jack Consoli'
-__date__ = '20 Feb 2026'
+__date__ = '18 Oct 2026'
 __license__ = 'Apache License, Version 2.0'
 __email__ = 'jack_consoli@yahoo.com'
 __maintainer__ = 'Jack Consoli'
 __status__ = 'Released'
-__version__ = '4.0.4'
+__version__ = '4.0.5'
 
 from deepdiff import DeepDiff
 import collections
@@ -621,7 +623,7 @@ _maps_category = {
 }
 
 
-def maps_dashboard_alerts(proj_obj):
+def maps_dashboard_alerts(proj_obj, switch_obj_l=None):
     """Looks through the MAPS alerts dashboard and adds an alert to the associated object.
 
     **WARNING:** As of 21 April 2019, there was not a reliable means of correlating MAPS alerts in the dashboard to a
@@ -629,8 +631,10 @@ def maps_dashboard_alerts(proj_obj):
 
     :param proj_obj: Project object
     :type proj_obj: brcddb.classes.project.ProjectObj
+    :param switch_obj_l: Switches to check. If None, all switches in proj_obj are checked.
+    :type switch_obj_l: list, None
     """
-    for switch_obj in proj_obj.r_switch_objects():
+    for switch_obj in proj_obj.r_switch_objects() if switch_obj_l is None else switch_obj_l:
         for dash_obj in gen_util.convert_to_list(switch_obj.r_get('brocade-maps/dashboard-rule')):
             cat = dash_obj.get('category')
             if cat is None or cat not in _maps_category:
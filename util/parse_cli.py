@@ -47,6 +47,15 @@ Parses CLI output.
 +-----------------------+-------------------------------------------------------------------------------------------+
 | switchshow            | Adds a switch object to a project object from switchshow output                           |
 +-----------------------+-------------------------------------------------------------------------------------------+
+| ss_sections           | Generator that reads supportshow output one line at a time and returns each command       |
+|                       | section.                                                                                  |
++-----------------------+-------------------------------------------------------------------------------------------+
+| parse_supportshow     | Streams supportshow output through the parsers in this module and adds the results to a   |
+|                       | project.                                                                                  |
++-----------------------+-------------------------------------------------------------------------------------------+
+| parse_supportshow_l   | Parses multiple supportshow files in parallel, one per process, and merges the results    |
+|                       | into a project.                                                                           |
++-----------------------+-------------------------------------------------------------------------------------------+
 
 **Version Control**
 
@@ -74,20 +83,29 @@ Parses CLI output.
 +-----------+---------------+---------------------------------------------------------------------------------------+
 | 4.0.9     | 20 Feb 2026   | Changed from fibrechannel/port-type to fibrechannel/port-type-string                  |
 +-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.0     | 18 Oct 2026   | Added ss_sections() and parse_supportshow(). Replaced chained str.replace() and       |
+|           |               | remove_duplicate_char() with compiled regular expressions.                            |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.1     | 18 Oct 2026   | Added parse_supportshow_l() to parse supportshow files in parallel.                   |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.2     | 18 Oct 2026   | Conflicting chassis and switch objects are logged when merging supportshow files. See |
+|           |               | _ss_merge()                                                                           |
++-----------+---------------+---------------------------------------------------------------------------------------+
 """
 __author__ = 'Jack Consoli'
 __copyright__ = 'Copyright 2023, 2024, 2025, 2026 Jack Consoli'
-__date__ = '20 Feb 2026'
+__date__ = '18 Oct 2026'
 __license__ = 'Apache License, Version 2.0'
 __email__ = 'jack_consoli@yahoo.com'
 __maintainer__ = 'Jack Consoli'
 __status__ = 'Released'
-__version__ = '4.0.9'
+__version__ = '4.1.2'
 
 import re
 import time
 import collections
 import copy
+import concurrent.futures
 import brcdapi.log as brcdapi_log
 import brcdapi.util as brcdapi_util
 import brcdapi.gen_util as gen_util
@@ -95,6 +113,35 @@ import brcddb.brcddb_common as brcddb_common
 import brcddb.util.util as brcddb_util
 import brcddb.brcddb_port as brcddb_port
 import brcddb.classes.util as brcddb_class_util
+import brcddb.classes.project as project_class
+import brcddb.util.copy as brcddb_copy
+
+# Compiled tokenizers. Splitting on runs of white space with a compiled expression is the same as, but much faster than,
+# gen_util.remove_duplicate_char(buf.replace('\t', ' '), ' ').split(' ')
+_ws_re = re.compile(r'[ \t]+')  # Runs of spaces and tabs
+_sp_re = re.compile(r' +')  # Runs of spaces only. Used where tabs are not converted to spaces
+
+
+def _tokenize(buf):
+    """Same as gen_util.remove_duplicate_char(buf.replace('\t', ' '), ' ').split(' ')
+
+    :param buf: Line of CLI output
+    :type buf: str
+    :return: Tokens
+    :rtype: list
+    """
+    return _ws_re.split(buf)
+
+
+def _squeeze(buf):
+    """Same as gen_util.remove_duplicate_char(buf.replace('\t', ' '), ' ')
+
+    :param buf: Line of CLI output
+    :type buf: str
+    :return: buf with tabs converted to spaces and runs of spaces replaced with a single space
+    :rtype: str
+    """
+    return _ws_re.sub(' ', buf)
 
 
 def _conv_to_int(buf):
@@ -481,7 +528,7 @@ def switchshow(obj, content, append_buf=''):
     i += 2  # Skip the line just below it that has ================ in it
     while len(content) > i:
         buf = content[i].replace('\t', ' ').strip()
-        cl = gen_util.remove_duplicate_char(buf, ' ').split(' ')
+        cl = _sp_re.split(buf)
         if len(cl) < 6:
             break
         if 'ge' in cl[0]:
@@ -670,7 +717,7 @@ def portcfgshow(obj, content):
                     state = 'separator'
         elif state == 'separator':
             separator_index = buf.index('+')
-            port_l = gen_util.remove_duplicate_char(ports[separator_index:].strip(), ' ').split(' ')
+            port_l = _sp_re.split(ports[separator_index:].strip())
             state = 'values'
         elif state == 'values':
             if len(buf) == 0:
@@ -680,7 +727,7 @@ def portcfgshow(obj, content):
                 if len(clean_buf) >= len('where') and clean_buf[0: len('where')] == 'where':
                     break
                 key = 'fos_cli/portcfgshow/' + buf[0: separator_index-1].rstrip().replace('/', '_')
-                vl = [b.strip() for b in gen_util.remove_duplicate_char(buf[separator_index:].strip(), ' ').split(' ')]
+                vl = [b.strip() for b in _sp_re.split(buf[separator_index:].strip())]
                 for x in range(0, len(vl)):
                     port = slot + '/' + port_l[x]
                     port_obj = switch_obj.r_port_obj(port)
@@ -709,6 +756,8 @@ def _stats_latency_dma_ts(port_obj):
     return
 
 
+# Some counters in portstatsshow output run into the value. This is used to stuff a space after them.
+_portstats_run_on_re = re.compile(r'(er_single_credit_loss|er_multi_credit_loss|fec_corrected_rate|latency_dma_ts)')
 _portstatsshow_special = dict(
     tim_txcrd_z_vc=_stats_tim_txcrd_z_vc,
     phy_stats_clear_ts=_stats_phy_stats_clear_ts,
@@ -725,16 +774,12 @@ def portstatsshow(obj, content):
     :param content: List of portstatsshow output text
     :type content: list
     """
-    global _portstats_to_api
+    global _portstats_to_api, _portstats_run_on_re
 
     port_obj, port_stats_d, switch_obj = None, None, obj.r_switch_obj()
 
     for buf in content:
-        buf = buf.replace('er_single_credit_loss', 'er_single_credit_loss ')
-        buf = buf.replace('er_multi_credit_loss', 'er_multi_credit_loss ')
-        buf = buf.replace('fec_corrected_rate', 'fec_corrected_rate ')
-        buf = buf.replace('latency_dma_ts', 'latency_dma_ts ')
-        tl = gen_util.remove_duplicate_char(buf.replace('\t', ' '), ' ').split(' ')
+        tl = _tokenize(_portstats_run_on_re.sub(r'\1 ', buf))
         if len(tl) < 2:
             continue
 
@@ -773,7 +818,7 @@ def portstats64show(obj, content):
     while len(content) > i:
 
         # Get the port object
-        buf = gen_util.remove_duplicate_char(content[i].replace('\t', ' '), ' ')
+        buf = _squeeze(content[i])
         if len(buf) == 0:
             i += 1
             continue
@@ -792,13 +837,13 @@ def portstats64show(obj, content):
         # Parse the port statistics
         i += 1
         while len(content) > i and len(content[i]) > 0:
-            buf = gen_util.remove_duplicate_char(content[i].replace('\t', ' '), ' ')
+            buf = _squeeze(content[i])
             cl = buf.split(' ')
             key = _portstats_to_api.get(cl[0])
             if key is not None:
                 if 'top_int :' in buf:
                     i += 1
-                    lv = int(gen_util.remove_duplicate_char(content[i].replace('\t', ' ').strip().split(' ')[0], ' '))
+                    lv = int(_tokenize(content[i].strip())[0])
                     v = int('{:x}'.format(int(cl[1])) + '{:08x}'.format(lv), 16)
                 else:
                     v = int(cl[1])
@@ -835,7 +880,7 @@ def _chassishow_unit_parse(chassis_obj, content, cl, i, n, d):
             else:
                 d.update({_chassis_to_api[cl[0]]: cl[1]})
         x += 1
-        cl = [p.strip() for p in gen_util.remove_duplicate_char(content[x].replace('\t', ' '), ' ').split(':')]
+        cl = [p.strip() for p in _squeeze(content[x]).split(':')]
 
     return x
 
@@ -917,7 +962,7 @@ def chassisshow(obj, content):
         i = 1
         while len(tl) > i:
             buf = tl[i]
-            cl = [p.strip() for p in gen_util.remove_duplicate_char(buf.replace('\t', ' '), ' ').split(':')]
+            cl = [p.strip() for p in _squeeze(buf).split(':')]
             if len(cl) > 1:
                 if cl[0] in _chassisshow_actions:
                     i = _chassisshow_actions[cl[0]]['m'](chassis_obj, tl, cl, i, _chassisshow_actions[cl[0]]['n'])
@@ -958,7 +1003,7 @@ def fabricshow(obj, content):
         ri += 1
         if len(buf) == 0 or 'The Fabric has' in buf or 'Fabric had' in buf or 'SS CMD END' in buf:
             break
-        temp_l = gen_util.remove_duplicate_char(buf.strip(), ' ').split(' ')
+        temp_l = _sp_re.split(buf.strip())
         if len(temp_l) > 5:
             if temp_l[5][0] == '>':  # It's the principal switch
                 fab_obj = proj_obj.s_add_fabric(temp_l[2])
@@ -1097,12 +1142,12 @@ def sfpshow(obj, content):
     :rtype ri: int
     """
     global _sfp_sep, _sfp_sep_len, _sfpshow_state_start, _sfpshow_state_port, _sfpshow_state_1st_sep, _sfp_start_match
-    global _sfp_to_api_1
+    global _sfp_to_api_1, _sp_re
 
     switch_obj, state, port_num, port_obj, ri = obj.r_switch_obj(), _sfpshow_state_start, None, None, 0
 
     for buf in content:
-        buf = gen_util.remove_duplicate_char(buf.replace('\t', ' '), ' ')
+        buf = _squeeze(buf)
 
         if _sfp_end_match.search(buf):
             break
@@ -1153,7 +1198,7 @@ def sfpshow(obj, content):
                 continue
             if port_obj.r_get('media-rdp/name') is None:
                 brcddb_util.add_to_obj(port_obj, 'media-rdp/name', 'fc/' + port_num)
-            cl = gen_util.remove_duplicate_char(buf.replace(':', ': ', 1), ' ').split(' ')
+            cl = _sp_re.split(buf.replace(':', ': ', 1))
             param = buf.split(':')[0]
 
             # Transceiver requires special handling
@@ -1275,12 +1320,10 @@ _cfgshow_operand_tbl = {
     'zone:': dict(state=_cfgshow_state_continue, da=_cfgshow_def_zone_act, ea=_cfgshow_eff_zone_act),
     'alias:': dict(state=_cfgshow_state_continue, da=_cfgshow_alias_act),
 }
-_cfgshow_clean_buf = (
-    (';', ' '),
-    ('\t', ' '),
-    ('Defined configuration:', 'Defined_configuration:'),
-    ('Effective configuration:', 'Effective_configuration:'),
-)
+# Used in _cfgshow_process() to tokenize lines. ';' and tabs are treated as spaces and "Defined configuration:" and
+# "Effective configuration:" are converted to single tokens to match the keys in _cfgshow_operand_tbl.
+_cfgshow_cfg_re = re.compile(r'(Defined|Effective)[ ;\t]configuration:')
+_cfgshow_tok_re = re.compile(r'[ ;\t]+')
 
 
 def _cfgshow_process(state, buf):
@@ -1297,14 +1340,13 @@ def _cfgshow_process(state, buf):
     :return rl: List of members associated with the operand
     :rtype rl: list()
     """
-    global _cfgshow_state_eff, _cfgshow_state_exit, _cfgshow_operand_tbl, _cfgshow_clean_buf
+    global _cfgshow_state_eff, _cfgshow_state_exit, _cfgshow_operand_tbl, _cfgshow_cfg_re, _cfgshow_tok_re
 
-    operand, rl, next_state, t_buf, key = None, list(), None, buf, None
+    operand, rl, next_state, key = None, list(), None, None
 
     # Clean up the line for processing
-    for tl in _cfgshow_clean_buf:
-        t_buf = t_buf.replace(tl[0], tl[1])
-    tl = [b.strip() for b in gen_util.remove_duplicate_char(t_buf.strip(), ' ').split(' ') if len(b.strip()) > 0]
+    t_buf = _cfgshow_cfg_re.sub(r'\1_configuration:', buf)
+    tl = [b.strip() for b in _cfgshow_tok_re.split(t_buf) if len(b.strip()) > 0]
 
     # Figure out what the key, operand, and content is
     k = tl[0] if len(tl) > 0 else None
@@ -1408,7 +1450,7 @@ def ficonshow(obj, content):
             break
 
         # Process each entry
-        cl = gen_util.remove_duplicate_char(buf.replace('\t', ' '), ' ').strip().split(' ')
+        cl = _squeeze(buf).strip().split(' ')
         if len(cl) > 12:  # It should always be 13
             pid = '0x' + cl[2].lower()
             port_obj = switch_obj.r_port_obj_for_pid(pid)
@@ -1437,12 +1479,8 @@ def ficonshow(obj, content):
     return ri
 
 
-_slotshow_d576_clean = (
-    ('\t', ' '),
-    (' BLADE', '_BLADE'),
-    (' SUPP', '_SUPP'),
-    (' CARD', '_CARD'),
-)
+# Used in _slotshow() to convert FRU types with a space, such as "SW BLADE", to the keys in _slotshow_d576_tbl
+_slotshow_d576_clean_re = re.compile(r'[ \t](BLADE|SUPP|CARD)')
 _slotshow_d576_int = dict(
     CP_BLADE={
         'blade-state': dict(ON='enabled', OFF='disabled', FLTY='faulty')
@@ -1498,7 +1536,7 @@ def _slotshow(obj, content, slotshow_d):
     :return ri: Index into content where we left off
     :rtype ri: int
     """
-    global _slotshow_d576_clean
+    global _slotshow_d576_clean_re
 
     chassis_obj, ri = obj.r_chassis_obj(), 0
 
@@ -1511,9 +1549,8 @@ def _slotshow(obj, content, slotshow_d):
     # Parse the output
     for buf in content[ri:]:
         ri += 1
-        for tl in _slotshow_d576_clean:
-            buf = buf.replace(tl[0], tl[1])
-        cl = gen_util.remove_duplicate_char(buf.strip(), ' ').split(' ')
+        buf = _slotshow_d576_clean_re.sub(r'_\1', buf).replace('\t', ' ')
+        cl = _sp_re.split(buf.strip())
         if len(cl) < 4:
             break
         if '*' in cl[0]:  # It's a note at the end of the slotshow for one of the FRUs - typically faulty
@@ -1628,3 +1665,313 @@ def portname_range(obj, content):
             break
 
     return ri
+
+
+"""The remainder of this module is a streaming front end for parsing supportshow output. The supportshow file is read
+one line at a time and split into command sections in a single pass. Each section is dispatched, as a list of lines
+for that section only, to the parsers above. The section boundaries are:
+
+    * A line with "SS CMD END" - End of the current command output
+    * A line with "CURRENT CONTEXT -- ls_id , fid" - Changes the FID for the commands that follow
+
+The first non-blank line of a section is the command. The command is the base name of the first word plus the first
+option, if it begins with '-'. For example, "/fabos/link_bin/sfpshow -all :" is "sfpshow -all". Sections for commands
+not in _ss_action_d are discarded as they are read.
+
+Some parsers require a chassis, switch, or fabric object that may not have been created yet. For example, slotshow
+output typically precedes chassisshow output. Those sections are held and dispatched again after the entire file has
+been read."""
+_ss_end_re = re.compile(r'SS CMD END')
+_ss_context_re = re.compile(r'CURRENT CONTEXT\s*--\s*(\d+)\s*,\s*(\d+)')
+_ss_cmd_re = re.compile(r'^\s*(?:\S*/)?([A-Za-z][\w.]*)(?:\s+(-{1,2}[\w-]+))?')
+_ss_pbs_hdr_re = re.compile(r'^\s*User\s+Port')
+
+
+def _ss_cmd(buf):
+    """Returns the command for a section of supportshow output. See notes above _ss_end_re
+
+    :param buf: First non-blank line of the section
+    :type buf: str
+    :return: Command. None if buf does not look like a command
+    :rtype: str, None
+    """
+    global _ss_cmd_re
+
+    m = _ss_cmd_re.match(buf)
+    if m is None:
+        return None
+    return m.group(1) if m.group(2) is None else m.group(1) + ' ' + m.group(2)
+
+
+def ss_sections(inf):
+    """Generator that reads supportshow output one line at a time and returns each command section.
+
+    :param inf: Name of file with supportshow output or an iterable of lines, such as an open file.
+    :type inf: str, list, tuple, io.TextIOBase
+    :return cmd: Command. See notes above _ss_end_re
+    :rtype cmd: str, None
+    :return fid: Fabric ID from the last "CURRENT CONTEXT". None if there was no context (VF not enabled)
+    :rtype fid: int, None
+    :return content: Lines of output, including the command line, with trailing white space removed.
+    :rtype content: list
+    """
+    global _ss_end_re, _ss_context_re
+
+    cmd, fid, content = None, None, list()
+    fp = open(inf, 'r', encoding='utf-8', errors='ignore') if isinstance(inf, str) else None
+    try:
+        for buf in inf if fp is None else fp:
+            buf = buf.rstrip()
+            m = _ss_context_re.search(buf)
+            if m is not None or _ss_end_re.search(buf) is not None:
+                if len(content) > 0:
+                    yield cmd, fid, content
+                cmd, content = None, list()
+                if m is not None:
+                    fid = int(m.group(2))
+                continue
+            if cmd is None:
+                if len(buf) == 0:
+                    continue
+                cmd = _ss_cmd(buf)
+            content.append(buf)
+        if len(content) > 0:
+            yield cmd, fid, content
+    finally:
+        if fp is not None:
+            fp.close()
+
+
+"""Actions for each command section in parse_supportshow(). All parameters are as follows:
+
+ctx_d       Context. See parse_supportshow()
+fid         Fabric ID. None if the output was not collected in a logical switch context
+content     Lines of output for this command section
+method      The parser in this module for the command. See _ss_action_d
+return      True if the section was processed. False if an object needed to process it has not been created yet"""
+
+
+def _ss_chassisshow(ctx_d, fid, content, method):
+    chassis_obj = method(ctx_d['proj_obj'], content)[0]
+    if chassis_obj is not None:
+        ctx_d['chassis_obj'] = chassis_obj
+        for switch_obj in ctx_d['switch_d'].values():
+            chassis_obj.s_add_switch(switch_obj.r_obj_key())
+    return True
+
+
+def _ss_switchshow(ctx_d, fid, content, method):
+    r = method(ctx_d['proj_obj'], content)
+    switch_obj = r[0] if isinstance(r, tuple) else r  # switchshow() only returns the switch object if it wasn't found
+    if switch_obj is not None:
+        ctx_d['switch_d'][fid] = switch_obj
+        if fid is not None:
+            brcddb_util.add_to_obj(switch_obj, brcdapi_util.bfls_fid, fid)
+        if ctx_d['chassis_obj'] is not None:
+            ctx_d['chassis_obj'].s_add_switch(switch_obj.r_obj_key())
+    return True
+
+
+def _ss_project_action(ctx_d, fid, content, method):
+    method(ctx_d['proj_obj'], content)
+    return True
+
+
+def _ss_switch_action(ctx_d, fid, content, method):
+    switch_obj = ctx_d['switch_d'].get(fid)
+    if switch_obj is None:
+        return False
+    method(switch_obj, content)
+    return True
+
+
+def _ss_fabric_action(ctx_d, fid, content, method):
+    # The fabric object is also required for nsshow() which gets the fabric object from the switch object.
+    switch_obj = ctx_d['switch_d'].get(fid)
+    if switch_obj is None or switch_obj.r_fabric_obj() is None:
+        return False
+    method(switch_obj, content)
+    return True
+
+
+def _ss_chassis_action(ctx_d, fid, content, method):
+    if ctx_d['chassis_obj'] is None:
+        return False
+    method(ctx_d['chassis_obj'], content)
+    return True
+
+
+def _ss_portbuffershow(ctx_d, fid, content, method):
+    # portbuffershow() expects the column headers to be the first 3 lines
+    global _ss_pbs_hdr_re
+
+    for i in range(0, len(content)):
+        if _ss_pbs_hdr_re.match(content[i]):
+            return _ss_switch_action(ctx_d, fid, content[i:], method)
+    return True  # No ports or the output is not in a recognizable format so there is nothing to do
+
+
+# Key is the command as returned from _ss_cmd(). a: Action method. m: Parser in this module passed to the action
+_ss_action_d = {
+    'chassisshow': dict(a=_ss_chassisshow, m=chassisshow),
+    'switchshow': dict(a=_ss_switchshow, m=switchshow),
+    'fabricshow': dict(a=_ss_project_action, m=fabricshow),
+    'nsshow': dict(a=_ss_fabric_action, m=nsshow),
+    'cfgshow': dict(a=_ss_fabric_action, m=cfgshow),
+    'defzone --show': dict(a=_ss_fabric_action, m=defzone),
+    'portbuffershow': dict(a=_ss_portbuffershow, m=portbuffershow),
+    'portcfgshow': dict(a=_ss_switch_action, m=portcfgshow),
+    'portstatsshow': dict(a=_ss_switch_action, m=portstatsshow),
+    'sfpshow -all': dict(a=_ss_switch_action, m=sfpshow),
+    'ficonshow': dict(a=_ss_switch_action, m=ficonshow),
+    'portstats64show': dict(a=_ss_chassis_action, m=portstats64show),
+    'slotshow -d576': dict(a=_ss_chassis_action, m=slotshow_d576),
+    'slotshow -m': dict(a=_ss_chassis_action, m=slotshow_m),
+    'portname': dict(a=_ss_chassis_action, m=portname_range),
+}
+
+
+def parse_supportshow(proj_obj, inf):
+    """Parses supportshow output and adds the chassis, switches, fabrics, ports, logins, and zoning to a project
+
+    :param proj_obj: Project object
+    :type proj_obj: brcddb.classes.project.ProjectObj
+    :param inf: Name of file with supportshow output or an iterable of lines. See ss_sections()
+    :type inf: str, list, tuple, io.TextIOBase
+    :return: Chassis object. None if chassisshow output was not found
+    :rtype: brcddb.classes.chassis.ChassisObj, None
+    """
+    global _ss_action_d
+
+    # ctx_d is the context passed to the _ss_action_d methods. switch_d: key is the FID, value is the switch object
+    ctx_d, held_l = dict(proj_obj=proj_obj, chassis_obj=None, switch_d=dict()), list()
+
+    for cmd, fid, content in ss_sections(inf):
+        action_d = _ss_action_d.get(cmd)
+        if action_d is None:
+            continue
+        try:
+            if not action_d['a'](ctx_d, fid, content, action_d['m']):
+                held_l.append(dict(cmd=cmd, fid=fid, content=content))
+        except BaseException as e:
+            brcdapi_log.exception(['Error parsing ' + str(cmd) + ' for FID ' + str(fid) + '.',
+                                   str(type(e)) + ': ' + str(e)],
+                                  echo=True)
+
+    # Process the held sections now that all the objects have been created. Sections are processed in the order they
+    # were read because, for example, fabricshow adds the switch to the fabric which is required for cfgshow.
+    for d in held_l:
+        try:
+            action_d = _ss_action_d[d['cmd']]
+            if not action_d['a'](ctx_d, d['fid'], d['content'], action_d['m']):
+                brcdapi_log.exception('Could not find the object for ' + d['cmd'] + ' for FID ' + str(d['fid']),
+                                      echo=True)
+        except BaseException as e:
+            brcdapi_log.exception(['Error parsing ' + d['cmd'] + ' for FID ' + str(d['fid']) + '.',
+                                   str(type(e)) + ': ' + str(e)],
+                                  echo=True)
+
+    return ctx_d['chassis_obj']
+
+
+# Project level keys from a worker project that are merged into the parent project in parse_supportshow_l()
+_ss_merge_keys = ('_chassis_objs', '_switch_objs', '_fabric_objs')
+
+
+def _ss_worker(inf):
+    """Parses a single supportshow file into a plain dictionary. Runs in a worker process for parse_supportshow_l()
+
+    :param inf: Name of file with supportshow output
+    :type inf: str
+    :return: Dictionary with file, time, chassis, err_msg, and plain_d. plain_d is the plain copy of the project
+    :rtype: dict
+    """
+    global _ss_merge_keys
+
+    start, rd = time.time(), dict(file=inf, chassis=None, err_msg=None, plain_d=dict())
+    try:
+        proj_obj = project_class.ProjectObj(inf, '')
+        chassis_obj = parse_supportshow(proj_obj, inf)
+        rd['chassis'] = None if chassis_obj is None else chassis_obj.r_obj_key()
+        plain_d = dict()
+        brcddb_copy.brcddb_to_plain_copy(proj_obj, plain_d)
+        rd['plain_d'] = {k: plain_d[k] for k in _ss_merge_keys if k in plain_d}
+    except Exception as e:
+        rd['err_msg'] = str(type(e)) + ': ' + str(e)
+    rd['time'] = time.time() - start
+
+    return rd
+
+
+def _ss_merge(proj_obj, result_l):
+    """Merges the plain dictionaries returned from _ss_worker() into a project in the order of result_l. A chassis or
+    switch in more than one file is logged as a conflict. Since brcddb.classes.util.s_new_key_for_class() doesn't
+    overwrite existing values, where the values differ the value from the first file is kept. Lists and dictionaries
+    are merged. Fabrics are expected to be in the supportshow of every chassis in the fabric so they are not conflicts.
+
+    :param proj_obj: Project object
+    :type proj_obj: brcddb.classes.project.ProjectObj
+    :param result_l: List of dictionaries returned from _ss_worker(). "plain_d" is removed and "conflict_l", the list
+        of chassis and switch keys also in a previous file, is added.
+    :type result_l: list
+    """
+    file_d = dict()  # Key is the chassis or switch key. Value is the first file it was found in
+    for d in result_l:
+        if d['err_msg'] is not None:
+            brcdapi_log.exception(['Error parsing ' + d['file'], d['err_msg']], echo=True)
+            proj_obj.s_warn_flag()
+        plain_d, d['conflict_l'] = d.pop('plain_d'), list()
+        for k in ('_chassis_objs', '_switch_objs'):
+            for key in plain_d.get(k, dict()).keys():
+                first_file = file_d.setdefault(key, d['file'])
+                if first_file != d['file']:
+                    d['conflict_l'].append(key)
+                    brcdapi_log.log(key + ' in ' + d['file'] + ' was also in ' + first_file + '. Values that differ are '
+                                    'kept from ' + first_file + '.', echo=True)
+        if len(d['conflict_l']) > 0:
+            proj_obj.s_warn_flag()
+        brcddb_copy.plain_copy_to_brcddb(plain_d, proj_obj)
+
+
+def parse_supportshow_l(proj_obj, file_l, max_workers=None):
+    """Parses multiple supportshow files in parallel and merges the results into a project.
+
+    Each file is parsed with parse_supportshow() into a separate project in a worker process. The chassis, switch, and
+    fabric objects are returned as a plain dictionary, see brcddb.util.copy.brcddb_to_plain_copy(), and merged into
+    proj_obj in the order of file_l, regardless of the order the workers finish, so the result is always the same. A
+    chassis or switch in more than one file is logged as a conflict and the values from the first file are kept. See
+    _ss_merge()
+
+    :param proj_obj: Project object
+    :type proj_obj: brcddb.classes.project.ProjectObj
+    :param file_l: List of file names with supportshow output
+    :type file_l: list, tuple
+    :param max_workers: Maximum number of worker processes. None: Use the number of processors
+    :type max_workers: int, None
+    :return: List of dictionaries, one for each file in file_l, with "file", "time" (seconds to parse), "chassis"
+        (chassis key or None), "conflict_l" (chassis and switch keys also in a previous file), and "err_msg" (None if
+        no errors)
+    :rtype: list
+    """
+    file_l = gen_util.convert_to_list(file_l)
+    result_l, num_files, start = [None] * len(file_l), len(file_l), time.time()
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+        future_d = {executor.submit(_ss_worker, file_l[i]): i for i in range(0, num_files)}
+        count = 0
+        for future in concurrent.futures.as_completed(future_d):
+            i, count = future_d[future], count + 1
+            try:
+                result_l[i] = future.result()
+            except Exception as e:  # Typically a worker process that terminated abruptly
+                result_l[i] = dict(file=file_l[i], time=0, chassis=None, err_msg=str(type(e)) + ': ' + str(e),
+                                   plain_d=dict())
+            brcdapi_log.log('Parsed ' + str(count) + ' of ' + str(num_files) + ': ' + file_l[i] + ' in ' +
+                            str(round(result_l[i]['time'], 2)) + ' sec', echo=True)
+
+    # Merge the results into the project in the order they were passed
+    _ss_merge(proj_obj, result_l)
+    brcdapi_log.log('Parsed ' + str(num_files) + ' files in ' + str(round(time.time() - start, 2)) + ' sec',
+                    echo=True)
+
+    return result_l
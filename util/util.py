@@ -74,15 +74,21 @@ details.
 +-----------+---------------+---------------------------------------------------------------------------------------+
 | 4.0.7     | 20 Feb 2026   | Updated copyright notice.                                                             |
 +-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.8     | 18 Oct 2026   | has_alert() uses the project alert index                                              |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.0.9     | 18 Oct 2026   | add_to_obj() increments the project data generation for nested keys                   |
++-----------+---------------+---------------------------------------------------------------------------------------+
+| 4.1.0     | 18 Oct 2026   | add_to_obj() explicitly increments the data generation                                |
++-----------+---------------+---------------------------------------------------------------------------------------+
 """
 __author__ = 'Jack Consoli'
 __copyright__ = 'Copyright 2024, 2025, 2026 Jack Consoli'
-__date__ = '20 Feb 2026'
+__date__ = '18 Oct 2026'
 __license__ = 'Apache License, Version 2.0'
 __email__ = 'jack_consoli@yahoo.com'
 __maintainer__ = 'Jack Consoli'
 __status__ = 'Released'
-__version__ = '4.0.7'
+__version__ = '4.1.0'
 
 import re
 import datetime
@@ -340,10 +346,7 @@ def has_alert(obj, al_num, key, p0, p1):
     :return: True if alert already exists in object
     :rtype: bool
     """
-    for alert_obj in obj.r_alert_objects():
-        if alert_obj.alert_num() == al_num and alert_obj.key() == key and alert_obj.p0() == p0 and alert_obj.p1() == p1:
-            return True
-    return False
+    return obj.r_project_obj().r_alert_tbl().r_has_alert(obj, al_num, key, p0, p1)
 
 
 ##################################################################
@@ -507,6 +510,8 @@ def add_to_obj(obj, k, v):
         brcdapi_log.exception('Invalid object type: ' + str(type(obj)) + '. k = ' + k + ', v type: ' + str(type(v)),
                               echo=True)
     else:
+        class_util.check_frozen(obj, k)  # Nested keys are updated in place so s_new_key() isn't always called
+        class_util.s_data_gen(obj, k)
         key = key_list.pop(0)
         if len(key_list) == 0:
             obj.s_new_key(key, v, f=True)